@@ -0,0 +1,88 @@
+"""
+Benchmark de importação - tempo de partida de main.py em cada modo
+
+Executa `python -X importtime main.py` em subprocessos e mostra o tempo total,
+os imports mais caros (tempo cumulativo) e quais dependências pesadas cada
+modo carregou.
+
+Uso: python benchmarks/bench_importtime.py [--repeat N] [--top N] [--modes help simulate ...]
+"""
+
+import argparse
+import re
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+ROOT = Path(__file__).parent.parent
+
+HEAVY_PACKAGES = ("pandas", "matplotlib", "seaborn", "scipy", "sklearn")
+
+# Argumentos pequenos: o objetivo é medir a partida, não o trabalho do modo
+MODE_ARGS = {
+    "help": ["--help"],
+    "simulate": ["--mode", "simulate", "--simulations", "1"],
+    "analyze": ["--mode", "analyze", "--simulations", "1", "--workers", "1"],
+    "optimize": ["--mode", "optimize", "--population", "4", "--generations", "1"],
+    "demo": ["--mode", "demo"],
+}
+
+IMPORT_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)")
+
+
+def parse_importtime(stderr: str) -> List[Tuple[str, int, int]]:
+    """(módulo, microssegundos cumulativos, profundidade) de cada import"""
+    imports = []
+    for line in stderr.splitlines():
+        match = IMPORT_LINE.match(line)
+        if match:
+            depth = (len(match.group(3)) - 1) // 2
+            imports.append((match.group(4), int(match.group(2)), depth))
+    return imports
+
+
+def run_mode(mode: str, output_dir: str) -> Dict:
+    """Executa um modo uma vez e coleta tempo total e imports"""
+    command = [sys.executable, "-X", "importtime", str(ROOT / "main.py"), *MODE_ARGS[mode], "--output", output_dir]
+
+    start = time.perf_counter()
+    completed = subprocess.run(command, cwd=ROOT, capture_output=True, text=True)
+    wall_time = time.perf_counter() - start
+
+    imports = parse_importtime(completed.stderr)
+    top_level = [(name, micros) for name, micros, depth in imports if depth == 0]
+
+    return {
+        "wall_time": wall_time,
+        "import_time": sum(micros for _, micros in top_level) / 1e6,
+        "top_imports": sorted(top_level, key=lambda item: item[1], reverse=True),
+        "heavy": [package for package in HEAVY_PACKAGES if any(name == package for name, _, _ in imports)],
+        "returncode": completed.returncode,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de importação por modo")
+    parser.add_argument("--repeat", type=int, default=3, help="Execuções por modo (mostra a melhor)")
+    parser.add_argument("--top", type=int, default=5, help="Imports mais caros exibidos por modo")
+    parser.add_argument("--modes", nargs="+", choices=list(MODE_ARGS), default=list(MODE_ARGS))
+    args = parser.parse_args()
+
+    print("Partida de main.py (melhor de {} execuções):".format(args.repeat))
+    for mode in args.modes:
+        with tempfile.TemporaryDirectory(prefix="bench_importtime_") as output_dir:
+            result = min((run_mode(mode, output_dir) for _ in range(args.repeat)), key=lambda r: r["wall_time"])
+
+        status = "" if result["returncode"] == 0 else f"  (código de saída {result['returncode']})"
+        print(f"\n  {mode:<10} total {result['wall_time'] * 1000:8.1f} ms | "
+              f"imports {result['import_time'] * 1000:8.1f} ms{status}")
+        print(f"    pesados: {', '.join(result['heavy']) or 'nenhum'}")
+        for name, micros in result["top_imports"][:args.top]:
+            print(f"    {name:<40} {micros / 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Benchmark de inicialização - construção de Pokémon, base de dados e Elite Four
+
+Uso: python benchmarks/bench_startup.py [--repeat N]
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Adiciona o diretório raiz ao path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from pokemon_elite_four.core.pokemon import Pokemon, PokemonType, PokemonStats
+from pokemon_elite_four.core.elite_four import EliteFour
+from pokemon_elite_four.analysis.data_processor import DataProcessor
+
+
+def best_of(function, repeat: int) -> float:
+    """Menor tempo (s) entre `repeat` execuções"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de inicialização")
+    parser.add_argument("--repeat", type=int, default=5, help="Repetições por medida")
+    args = parser.parse_args()
+
+    data_processor = DataProcessor("data/processed")
+    data_processor.load_pokemon_data("pokemon_processed.csv")
+    stats = PokemonStats(78, 84, 78, 109, 85, 100)
+
+    with tempfile.TemporaryDirectory(prefix="bench_startup_") as cache_dir:
+        data_processor.load_pokemon_database(level=50, cache_dir=cache_dir)  # primeira leitura grava o cache
+
+        results = {
+            "pokemon_x1000": best_of(
+                lambda: [Pokemon("Charizard", 6, PokemonType.FIRE, PokemonType.FLYING, stats) for _ in range(1000)],
+                args.repeat
+            ),
+            "pokemon_database": best_of(lambda: list(data_processor.create_pokemon_database(level=50)), args.repeat),
+            "database_csv_parse": best_of(
+                lambda: DataProcessor("data/processed").load_pokemon_database(level=50, cache_dir=None), args.repeat
+            ),
+            "database_cached": best_of(
+                lambda: DataProcessor("data/processed").load_pokemon_database(level=50, cache_dir=cache_dir),
+                args.repeat
+            ),
+            "elite_four": best_of(EliteFour, args.repeat),
+        }
+
+    print("Inicialização (melhor de {} execuções):".format(args.repeat))
+    for name, seconds in results.items():
+        print(f"  {name:<18} {seconds * 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
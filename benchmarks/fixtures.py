@@ -0,0 +1,51 @@
+"""
+Fixtures reprodutíveis dos benchmarks
+
+Tudo deriva de SEED e do CSV processado: as mesmas equipes, os mesmos
+adversários e as mesmas sementes em qualquer máquina. Cada chamada monta
+objetos novos (os otimizadores alteram níveis dos Pokémon da base).
+"""
+
+import random
+import sys
+from pathlib import Path
+from typing import List, Tuple
+
+# Adiciona o diretório raiz ao path
+ROOT = Path(__file__).parent.parent
+sys.path.append(str(ROOT))
+
+from pokemon_elite_four.core.pokemon import Pokemon, PokemonTeam
+from pokemon_elite_four.core.elite_four import EliteFour
+from pokemon_elite_four.core.pokemon_database import PokemonDatabase, load_pokemon_database
+
+SEED = 1234
+DATA_DIR = ROOT / "data" / "processed"
+CSV_PATH = DATA_DIR / "pokemon_processed.csv"
+TEAM_NAMES = ("Charizard", "Blastoise", "Venusaur", "Pikachu", "Alakazam", "Dragonite")
+
+
+def pokemon_database(level: int = 50) -> PokemonDatabase:
+    """Base de dados nova (lida do CSV, sem cache em disco)"""
+    return load_pokemon_database(CSV_PATH, level=level)
+
+
+def benchmark_team(database: PokemonDatabase) -> PokemonTeam:
+    """Equipe fixa usada nas medidas de batalha e de relatório"""
+    return PokemonTeam([database.by_name(name) for name in TEAM_NAMES])
+
+
+def random_teams(database: PokemonDatabase, count: int, seed: int = SEED) -> List[PokemonTeam]:
+    """`count` equipes de 6 sorteadas com semente fixa"""
+    rng = random.Random(seed)
+    pool = list(database)
+    return [PokemonTeam(rng.sample(pool, 6)) for _ in range(count)]
+
+
+def pokemon_pair(database: PokemonDatabase) -> Tuple[Pokemon, Pokemon]:
+    """Par fixo para o confronto 1x1"""
+    return database.by_name("Blastoise"), database.by_name("Arcanine")
+
+
+def elite_four() -> EliteFour:
+    return EliteFour()
@@ -0,0 +1,348 @@
+"""
+Suíte de benchmarks - vazão dos motores, otimizadores e carga de dados
+
+Cada caso monta suas fixtures (benchmarks/fixtures.py) fora da medição e
+executa uma unidade de trabalho `repeat` vezes; o JSON de saída guarda os
+tempos, a vazão (unidades/s) e os metadados da máquina. `compare` aponta
+os casos que ficaram mais lentos que o limite entre dois arquivos.
+
+Uso:
+    python benchmarks/run_suite.py run [--only caso ...] [--repeat N] [--scale N] [--output arquivo.json]
+    python benchmarks/run_suite.py compare base.json novo.json [--threshold 0.10]
+    python benchmarks/run_suite.py list
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+import fixtures
+from fixtures import ROOT, SEED
+
+from pokemon_elite_four.core.battle_system import BattleSystem
+from pokemon_elite_four.core.smart_battle_system import SmartBattleSystem, MoveStrategy, MovePolicyCache
+from pokemon_elite_four.analysis.data_processor import DataProcessor
+from pokemon_elite_four.analysis.battle_analyzer import BattleAnalyzer
+from pokemon_elite_four.analysis.team_optimizer import TeamOptimizer
+from pokemon_elite_four.analysis.advanced_team_optimizer import AdvancedTeamOptimizer
+
+RESULTS_VERSION = 1
+DEFAULT_OUTPUT_DIR = ROOT / "output" / "benchmarks"
+
+# Caso: (scale) -> (trabalho medido, unidades por execução, nome da unidade)
+Case = Callable[[int], Tuple[Callable[[], object], int, str]]
+CASES: Dict[str, Case] = {}
+
+# Diretórios temporários dos casos, removidos ao fim de cada medida
+_scratch = contextlib.ExitStack()
+
+
+def case(name: str):
+    """Registra um caso da suíte"""
+    def register(function: Case) -> Case:
+        CASES[name] = function
+        return function
+    return register
+
+
+def scratch_dir() -> str:
+    """Diretório temporário que dura até o fim da medida do caso"""
+    return _scratch.enter_context(tempfile.TemporaryDirectory(prefix="bench_suite_"))
+
+
+@case("battle_pokemon")
+def bench_battle_pokemon(scale: int):
+    pokemon1, pokemon2 = fixtures.pokemon_pair(fixtures.pokemon_database())
+    battle_system = BattleSystem(rng=random.Random(SEED))
+    battles = 500 * scale
+
+    def run():
+        for _ in range(battles):
+            pokemon1.restore_full_health()
+            pokemon2.restore_full_health()
+            battle_system.battle_pokemon(pokemon1, pokemon2, turn_sink="none")
+    return run, battles, "batalhas"
+
+
+@case("battle_teams")
+def bench_battle_teams(scale: int):
+    teams = fixtures.random_teams(fixtures.pokemon_database(), 25 * scale)
+    opponents = [member.pokemon_team for member in fixtures.elite_four().get_all_members()]
+    battle_system = BattleSystem(rng=random.Random(SEED))
+
+    def run():
+        for team in teams:
+            for opponent in opponents:
+                battle_system.battle_teams(team, opponent, turn_sink="none")
+    return run, len(teams) * len(opponents), "batalhas"
+
+
+@case("battle_teams_smart")
+def bench_battle_teams_smart(scale: int):
+    teams = fixtures.random_teams(fixtures.pokemon_database(), 25 * scale)
+    opponents = [member.pokemon_team for member in fixtures.elite_four().get_all_members()]
+    battle_system = SmartBattleSystem(rng=random.Random(SEED), policy_cache=MovePolicyCache())
+
+    def run():
+        for team in teams:
+            for opponent in opponents:
+                battle_system.battle_teams_smart(
+                    team, opponent, MoveStrategy.BALANCED, MoveStrategy.BALANCED, turn_sink="none"
+                )
+    return run, len(teams) * len(opponents), "batalhas"
+
+
+def _simulate_case(engine: str):
+    def setup(scale: int):
+        team = fixtures.benchmark_team(fixtures.pokemon_database())
+        opponent = fixtures.elite_four().get_member_by_name("Lance").pokemon_team
+        battle_system = BattleSystem(rng=random.Random(SEED))
+        simulations = 500 * scale
+
+        def run():
+            battle_system.simulate_battle(team, opponent, simulations, engine=engine, n_workers=1, seed=SEED)
+        return run, simulations, "batalhas"
+    return setup
+
+
+case("simulate_battle")(_simulate_case("scalar"))
+case("simulate_battle_vectorized")(_simulate_case("vectorized"))
+
+
+def _reset_levels(pool, level: int = 50):
+    """Os otimizadores sobem os níveis da base; cada execução parte do mesmo estado"""
+    for pokemon in pool:
+        pokemon.level = level
+
+
+@case("team_optimizer_generation")
+def bench_team_optimizer(scale: int):
+    pool = list(fixtures.pokemon_database())
+    elite_four = fixtures.elite_four()
+    generations = 2 * scale
+
+    def run():
+        _reset_levels(pool)
+        optimizer = TeamOptimizer(
+            pool, elite_four, population_size=10, max_generations=generations, elite_size=2, seed=SEED
+        )
+        optimizer.optimize_team()
+    return run, generations, "gerações"
+
+
+@case("advanced_optimizer_generation")
+def bench_advanced_optimizer(scale: int):
+    pool = list(fixtures.pokemon_database())
+    elite_four = fixtures.elite_four()
+    generations = 2 * scale
+
+    def run():
+        _reset_levels(pool)
+        optimizer = AdvancedTeamOptimizer(
+            pool, elite_four, population_size=10, max_generations=generations, elite_size=2, seed=SEED
+        )
+        optimizer.simulations_per_strategy = 1
+        optimizer.optimize_team_advanced()
+    # A geração 0 também é avaliada
+    return run, generations + 1, "gerações"
+
+
+@case("data_processor_load")
+def bench_data_processor_load(scale: int):
+    def run():
+        DataProcessor(str(fixtures.DATA_DIR)).load_pokemon_database(level=50, cache_dir=None)
+    return run, 1, "cargas"
+
+
+@case("data_processor_load_cached")
+def bench_data_processor_load_cached(scale: int):
+    cache_dir = scratch_dir()
+    DataProcessor(str(fixtures.DATA_DIR)).load_pokemon_database(level=50, cache_dir=cache_dir)
+
+    def run():
+        DataProcessor(str(fixtures.DATA_DIR)).load_pokemon_database(level=50, cache_dir=cache_dir)
+    return run, 1, "cargas"
+
+
+@case("elite_four_init")
+def bench_elite_four_init(scale: int):
+    return fixtures.elite_four, 1, "construções"
+
+
+@case("battle_report")
+def bench_battle_report(scale: int):
+    team = fixtures.benchmark_team(fixtures.pokemon_database())
+    elite_four = fixtures.elite_four()
+    simulations = 10 * scale
+
+    def run():
+        battle_system = BattleSystem(rng=random.Random(SEED))
+        analyzer = BattleAnalyzer(battle_system, elite_four, n_workers=1)
+        analyzer.generate_battle_report(team, simulations)
+    return run, 1, "relatórios"
+
+
+def measure(name: str, repeat: int, scale: int) -> Dict:
+    """Executa um caso e resume os tempos (saída dos módulos é descartada)"""
+    with _scratch, contextlib.redirect_stdout(io.StringIO()):
+        work, units, unit = CASES[name](scale)
+        work()  # Aquecimento: imports tardios, caches de spec e de tabelas
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            work()
+            timings.append(time.perf_counter() - start)
+
+    best = min(timings)
+    return {
+        "units": units,
+        "unit": unit,
+        "repeat": repeat,
+        "min": best,
+        "median": statistics.median(timings),
+        "mean": statistics.mean(timings),
+        "throughput": units / best if best > 0 else float("inf"),
+    }
+
+
+def git_commit() -> str:
+    try:
+        completed = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True, timeout=10
+        )
+    except (OSError, subprocess.SubprocessError):
+        return "desconhecido"
+    return completed.stdout.strip() or "desconhecido"
+
+
+def machine_metadata() -> Dict:
+    """Dados da máquina e do ambiente gravados junto com os resultados"""
+    import numpy as np
+
+    return {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "git_commit": git_commit(),
+        "hostname": platform.node(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "numpy": np.__version__,
+    }
+
+
+def run_suite(names: List[str], repeat: int, scale: int) -> Dict:
+    results = {}
+    for name in names:
+        result = results[name] = measure(name, repeat, scale)
+        print(f"  {name:<32} {result['min'] * 1000:10.2f} ms  "
+              f"{result['throughput']:12.1f} {result['unit']}/s")
+
+    metadata = machine_metadata()
+    metadata.update({"repeat": repeat, "scale": scale, "seed": SEED})
+    return {"version": RESULTS_VERSION, "metadata": metadata, "results": results}
+
+
+def compare_results(base: Dict, new: Dict, threshold: float) -> List[Tuple[str, float, str]]:
+    """(caso, razão novo/base do menor tempo, situação) dos casos em comum"""
+    rows = []
+    for name, base_result in base["results"].items():
+        new_result = new["results"].get(name)
+        if new_result is None or base_result["min"] <= 0:
+            continue
+        # Razão por unidade: arquivos com `scale` diferentes continuam comparáveis
+        ratio = (new_result["min"] / new_result["units"]) / (base_result["min"] / base_result["units"])
+        if ratio > 1 + threshold:
+            status = "REGRESSÃO"
+        elif ratio < 1 - threshold:
+            status = "melhora"
+        else:
+            status = "ok"
+        rows.append((name, ratio, status))
+    return rows
+
+
+def command_run(args) -> int:
+    unknown = [name for name in args.only if name not in CASES]
+    if unknown:
+        print(f"Casos desconhecidos: {', '.join(unknown)}")
+        return 2
+
+    names = args.only or list(CASES)
+    print(f"Suíte de benchmarks (melhor de {args.repeat}, escala {args.scale}):")
+    results = run_suite(names, args.repeat, args.scale)
+
+    output = Path(args.output) if args.output else (
+        DEFAULT_OUTPUT_DIR / f"bench-{datetime.now():%Y%m%d-%H%M%S}-{results['metadata']['git_commit']}.json"
+    )
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(results, indent=2, ensure_ascii=False), encoding="utf-8")
+    print(f"\nResultados salvos em {output}")
+    return 0
+
+
+def command_compare(args) -> int:
+    base = json.loads(Path(args.base).read_text(encoding="utf-8"))
+    new = json.loads(Path(args.new).read_text(encoding="utf-8"))
+
+    for key in ("hostname", "cpu_count", "python"):
+        if base["metadata"].get(key) != new["metadata"].get(key):
+            print(f"Aviso: {key} diferente ({base['metadata'].get(key)} x {new['metadata'].get(key)})")
+
+    rows = compare_results(base, new, args.threshold)
+    print(f"{base['metadata'].get('git_commit')} -> {new['metadata'].get('git_commit')} "
+          f"(limite {args.threshold:.0%}):")
+    for name, ratio, status in rows:
+        print(f"  {name:<32} {ratio:6.2f}x  {status}")
+
+    regressions = [name for name, _, status in rows if status == "REGRESSÃO"]
+    if regressions:
+        print(f"\n{len(regressions)} regressão(ões): {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Suíte de benchmarks de vazão")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="Executa a suíte e grava o JSON")
+    run_parser.add_argument("--only", nargs="+", default=[], metavar="CASO", help="Subconjunto de casos")
+    run_parser.add_argument("--repeat", type=int, default=5, help="Execuções medidas por caso")
+    run_parser.add_argument("--scale", type=int, default=1, help="Multiplicador do tamanho de cada caso")
+    run_parser.add_argument("--output", help="Arquivo JSON de saída (padrão: output/benchmarks/)")
+
+    compare_parser = subparsers.add_parser("compare", help="Compara dois arquivos de resultados")
+    compare_parser.add_argument("base")
+    compare_parser.add_argument("new")
+    compare_parser.add_argument("--threshold", type=float, default=0.10,
+                                help="Piora relativa tolerada antes de acusar regressão")
+
+    subparsers.add_parser("list", help="Lista os casos disponíveis")
+
+    args = parser.parse_args()
+    if args.command == "run":
+        return command_run(args)
+    if args.command == "compare":
+        return command_compare(args)
+    for name in CASES:
+        print(name)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
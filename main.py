@@ -13,25 +13,24 @@ MBA em Engenharia de Dados - Universidade Presbiteriana Mackenzie
 
 import sys
 import argparse
+from contextlib import ExitStack, nullcontext
 from pathlib import Path
-from typing import List, Optional
-
-# Configura matplotlib para usar backend não-interativo
-import matplotlib
-matplotlib.use('Agg')
 
 # Adiciona o diretório do projeto ao path
 sys.path.append(str(Path(__file__).parent))
 
-from pokemon_elite_four.core.pokemon import Pokemon, PokemonTeam
+from pokemon_elite_four.core.pokemon import PokemonTeam
 from pokemon_elite_four.core.battle_system import BattleSystem
 from pokemon_elite_four.core.elite_four import EliteFour
-from pokemon_elite_four.analysis.data_processor import DataProcessor
-from pokemon_elite_four.analysis.team_optimizer import TeamOptimizer
-from pokemon_elite_four.analysis.battle_analyzer import BattleAnalyzer
+from pokemon_elite_four.core.rng import derive_seed
+from pokemon_elite_four.core.racing import RacingConfig
+from pokemon_elite_four.core.pokemon_database import PokemonDatabase, load_pokemon_database as load_database
 from pokemon_elite_four.utils.config import config
 from pokemon_elite_four.utils.logger import setup_logger
-from pokemon_elite_four.utils.visualization import save_all_visualizations
+from pokemon_elite_four.utils.instrumentation import instrumentation, Profiler
+
+# Módulos de análise (pandas/scikit-learn) são importados dentro de cada
+# modo: simulate e --help não pagam por dependências que não usam.
 
 
 def main():
@@ -70,6 +69,62 @@ def main():
         help="Tamanho da população para otimização"
     )
     
+    parser.add_argument(
+        "--engine",
+        choices=["scalar", "vectorized"],
+        default="scalar",
+        help="Motor de simulação em lote (modo simulate)"
+    )
+    
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=config.get_n_workers(),
+        help="Processos para simulações (padrão: seção performance do config.yaml)"
+    )
+    
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=None,
+        help="Semente mestre para simulações reprodutíveis"
+    )
+    
+    parser.add_argument(
+        "--crn",
+        action="store_true",
+        help="Números aleatórios comuns ao comparar equipes (modo optimize)"
+    )
+    
+    parser.add_argument(
+        "--precision",
+        type=float,
+        default=config.TARGET_PRECISION,
+        help="Meia-largura alvo do intervalo da taxa de vitória (avaliação sequencial)"
+    )
+    
+    parser.add_argument(
+        "--surrogate",
+        type=float,
+        default=config.SURROGATE_FRACTION,
+        metavar="FRAÇÃO",
+        help="Pré-triagem por modelo substituto: fração dos filhos novos simulada (modo optimize)"
+    )
+    
+    parser.add_argument(
+        "--search",
+        choices=["ga", "beam", "bnb"],
+        default="ga",
+        help="Busca no modo optimize: algoritmo genético, beam search ou branch-and-bound"
+    )
+    
+    parser.add_argument(
+        "--max-nodes",
+        type=int,
+        default=200_000,
+        help="Nós expandidos pelo branch-and-bound antes de parar com diferença limitada"
+    )
+    
     parser.add_argument(
         "--output",
         type=str,
@@ -77,49 +132,92 @@ def main():
         help="Diretório de saída"
     )
     
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        default=config.ENABLE_PROFILING,
+        help="Executa o modo sob cProfile e tracemalloc (padrão: development.enable_profiling)"
+    )
+    
+    parser.add_argument(
+        "--no-profile",
+        dest="profile",
+        action="store_false",
+        help="Desativa o perfil mesmo com development.enable_profiling ligado"
+    )
+    
+    parser.add_argument(
+        "--profile-output",
+        type=str,
+        default=config.PROFILE_OUTPUT,
+        help="Arquivo de estatísticas do perfil (pstats)"
+    )
+    
+    parser.add_argument(
+        "--counters",
+        action="store_true",
+        help="Conta batalhas, turnos, cálculos de dano e acessos a caches"
+    )
+    
     args = parser.parse_args()
     
     # Configura logger
     logger = setup_logger()
     logger.info("Iniciando Pokémon Elite Four - Sistema de Análise")
     
+    # Contadores e perfil são independentes: os invólucros dos contadores
+    # apareceriam no perfil
+    if args.counters:
+        instrumentation.enable()
+    profiler = Profiler(args.profile_output) if args.profile else None
+    
     try:
-        if args.mode == "demo":
-            run_demo()
-        elif args.mode == "optimize":
-            run_optimization(args)
-        elif args.mode == "analyze":
-            run_analysis(args)
-        elif args.mode == "simulate":
-            run_simulation(args)
-        else:
-            logger.error(f"Modo inválido: {args.mode}")
-            return 1
+        with profiler or nullcontext(), instrumentation.phase(f"total ({args.mode})"):
+            if args.mode == "demo":
+                run_demo()
+            elif args.mode == "optimize":
+                run_optimization(args)
+            elif args.mode == "analyze":
+                run_analysis(args)
+            elif args.mode == "simulate":
+                run_simulation(args)
+            else:
+                logger.error(f"Modo inválido: {args.mode}")
+                return 1
             
     except Exception as e:
         logger.error(f"Erro durante execução: {e}")
         return 1
     
+    finally:
+        if instrumentation.enabled:
+            print(instrumentation.summary())
+        if profiler is not None and profiler.profile is not None:
+            print(profiler.summary())
+    
     logger.info("Execução concluída com sucesso!")
     return 0
 
 
 def run_demo():
     """Executa demonstração do sistema"""
+    from pokemon_elite_four.analysis.data_processor import DataProcessor
     
     print("🎮 POKÉMON ELITE FOUR - DEMONSTRAÇÃO")
     print("=" * 50)
     
     # Inicializa componentes
     print("\n📊 Carregando dados...")
-    data_processor = DataProcessor()
-    pokemon_database = data_processor.create_pokemon_database(level=50)
+    data_processor = DataProcessor(config.DATA_DIR)
+    with instrumentation.phase("carregar dados"):
+        pokemon_database = load_pokemon_database()
     
     print(f"✅ {len(pokemon_database)} Pokémon carregados")
     
     # Cria Elite Four
     print("\n👑 Criando Elite Four...")
-    elite_four = EliteFour()
+    with instrumentation.phase("criar Elite Four"):
+        elite_four = EliteFour()
     print(f"✅ {len(elite_four.get_all_members())} membros da Elite Four criados")
     
     # Cria sistema de batalhas
@@ -139,7 +237,8 @@ def run_demo():
     lorelei = elite_four.get_member_by_name("Lorelei")
     if lorelei:
         print(f"\n⚔️ Batalhando contra {lorelei.name}...")
-        battle_log = battle_system.battle_teams(demo_team, lorelei.pokemon_team)
+        with instrumentation.phase("batalha"):
+            battle_log = battle_system.battle_teams(demo_team, lorelei.pokemon_team)
         
         print(f"Resultado: {battle_log.battle_result.value}")
         print(f"Turnos: {battle_log.total_turns}")
@@ -151,7 +250,8 @@ def run_demo():
     
     # Análise rápida
     print("\n📈 Análise rápida da equipe...")
-    team_analysis = data_processor.create_team_analysis(demo_team.pokemon)
+    with instrumentation.phase("análise da equipe"):
+        team_analysis = data_processor.create_team_analysis(demo_team.pokemon)
     print(f"Score da equipe: {team_analysis['team_score']:.3f}")
     print(f"Eficiência média: {team_analysis['avg_efficiency']:.3f}")
     print(f"Tipos únicos: {team_analysis['unique_types']}")
@@ -161,29 +261,40 @@ def run_demo():
 
 def run_optimization(args):
     """Executa otimização de equipe"""
+    if args.search != "ga":
+        return run_team_search(args)
+    
+    from pokemon_elite_four.analysis.team_optimizer import TeamOptimizer
+    from pokemon_elite_four.analysis.surrogate import SurrogateConfig
     
     print("🧬 OTIMIZAÇÃO DE EQUIPE")
     print("=" * 30)
     
     # Carrega dados
-    data_processor = DataProcessor()
-    pokemon_database = data_processor.create_pokemon_database(level=50)
+    with instrumentation.phase("carregar dados"):
+        pokemon_database = load_pokemon_database()
     
     # Cria Elite Four
-    elite_four = EliteFour()
+    with instrumentation.phase("criar Elite Four"):
+        elite_four = EliteFour()
     
     # Cria otimizador
     optimizer = TeamOptimizer(
         pokemon_database=pokemon_database,
         elite_four=elite_four,
         population_size=args.population,
-        max_generations=args.generations
+        max_generations=args.generations,
+        seed=args.seed,
+        common_random_numbers=args.crn,
+        racing=RacingConfig(args.precision, config.CONFIDENCE_LEVEL) if args.precision else None,
+        surrogate=SurrogateConfig(simulate_fraction=args.surrogate) if args.surrogate else None
     )
     
     print(f"🔍 Otimizando com {args.population} indivíduos por {args.generations} gerações...")
     
     # Executa otimização
-    result = optimizer.optimize_team()
+    with instrumentation.phase("otimização"):
+        result = optimizer.optimize_team()
     
     print(f"\n🏆 MELHOR EQUIPE ENCONTRADA:")
     print(f"Score: {result.best_score:.4f}")
@@ -194,26 +305,90 @@ def run_optimization(args):
         print(f"  {i}. {pokemon.name} (Lv.{pokemon.level}) - {pokemon.stats.total} total")
     
     # Salva resultados
-    save_optimization_results(result, args.output)
+    with instrumentation.phase("salvar resultados"):
+        save_optimization_results(result, args.output)
     
     print(f"\n✅ Otimização concluída! Resultados salvos em {args.output}")
 
 
+def run_team_search(args):
+    """Busca exata/anytime da equipe sobre os confrontos 1x1 do atlas"""
+    import tempfile
+    from pokemon_elite_four.analysis.matchup_atlas import MatchupAtlas
+    from pokemon_elite_four.analysis.team_search import TeamSearch, member_matchup_matrix
+    
+    print("🔎 BUSCA DE EQUIPE")
+    print("=" * 30)
+    
+    # Carrega dados (mesmo nível competitivo do algoritmo genético)
+    with instrumentation.phase("carregar dados"):
+        pokemon_database = load_pokemon_database()
+        species = list(pokemon_database)
+        for pokemon in species:
+            pokemon.level = 60
+    
+    # Cria Elite Four
+    with instrumentation.phase("criar Elite Four"):
+        elite_four = EliteFour()
+    
+    # Probabilidades 1x1 de cada espécie contra cada Pokémon da Elite Four
+    # (sem cache configurado, o atlas vive em um diretório temporário)
+    with instrumentation.phase("atlas de confrontos"), ExitStack() as scratch:
+        cache_dir = config.get_cache_dir("matchup_atlas")
+        if cache_dir is None:
+            cache_dir = scratch.enter_context(tempfile.TemporaryDirectory(prefix="matchup_atlas_"))
+        
+        opponents = [pokemon for member in elite_four.get_all_members() for pokemon in member.pokemon_team.pokemon]
+        atlas = MatchupAtlas(
+            cache_dir=cache_dir,
+            seed=args.seed or 0,
+            n_workers=args.workers
+        ).build(species, opponents)
+        matrix = member_matchup_matrix(atlas, species, elite_four)
+    
+    search = TeamSearch(species, matrix, [member.name for member in elite_four.get_all_members()])
+    
+    print(f"🔍 Buscando entre {len(species)} espécies ({args.search})...")
+    with instrumentation.phase("busca"):
+        if args.search == "beam":
+            result = search.beam_search()
+        else:
+            result = search.branch_and_bound(max_nodes=args.max_nodes)
+    
+    print(f"\n🏆 MELHOR EQUIPE ENCONTRADA:")
+    print(f"Score: {result.best_score:.4f} (limite superior {result.upper_bound:.4f}, "
+          f"{'ótimo provado' if result.proven_optimal else f'diferença ≤ {result.gap:.4f}'})")
+    print(f"Nós explorados: {result.nodes_explored:,} - podados: {result.nodes_pruned:,} "
+          f"({result.prune_rate:.1%}) em {result.seconds:.2f} s")
+    
+    print(f"\n👥 Equipe:")
+    for i, pokemon in enumerate(result.best_team.pokemon, 1):
+        print(f"  {i}. {pokemon.name} (Lv.{pokemon.level}) - {pokemon.stats.total} total")
+    
+    # Salva resultados
+    with instrumentation.phase("salvar resultados"):
+        save_search_results(result, args.output)
+    
+    print(f"\n✅ Busca concluída! Resultados salvos em {args.output}")
+
+
 def run_analysis(args):
     """Executa análise de equipe"""
+    from pokemon_elite_four.analysis.battle_analyzer import BattleAnalyzer
     
     print("📊 ANÁLISE DE EQUIPE")
     print("=" * 25)
     
     # Carrega dados
-    data_processor = DataProcessor()
-    pokemon_database = data_processor.create_pokemon_database(level=50)
+    with instrumentation.phase("carregar dados"):
+        pokemon_database = load_pokemon_database()
     
     # Cria Elite Four
-    elite_four = EliteFour()
+    with instrumentation.phase("criar Elite Four"):
+        elite_four = EliteFour()
     
     # Cria sistema de batalhas
-    battle_system = BattleSystem()
+    battle_system = BattleSystem(n_workers=args.workers)
     
     # Cria analisador
     analyzer = BattleAnalyzer(battle_system, elite_four)
@@ -225,7 +400,8 @@ def run_analysis(args):
     print(f"📈 Executando {args.simulations} simulações...")
     
     # Executa análise
-    analysis = analyzer.generate_battle_report(team, args.simulations)
+    with instrumentation.phase("relatório de batalhas"):
+        analysis = analyzer.generate_battle_report(team, args.simulations, seed=args.seed)
     
     # Mostra resultados
     print(f"\n📊 RESULTADOS DA ANÁLISE:")
@@ -237,7 +413,8 @@ def run_analysis(args):
         print(f"  {member}: {stats.win_rate:.1%} vitórias")
     
     # Salva análise
-    analyzer.export_analysis_to_csv(analysis, f"{args.output}/battle_analysis")
+    with instrumentation.phase("salvar resultados"):
+        analyzer.export_analysis_to_csv(analysis, f"{args.output}/battle_analysis")
     
     print(f"\n✅ Análise concluída! Resultados salvos em {args.output}")
 
@@ -249,33 +426,52 @@ def run_simulation(args):
     print("=" * 30)
     
     # Carrega dados
-    data_processor = DataProcessor()
-    pokemon_database = data_processor.create_pokemon_database(level=50)
+    with instrumentation.phase("carregar dados"):
+        pokemon_database = load_pokemon_database()
     
     # Cria Elite Four
-    elite_four = EliteFour()
+    with instrumentation.phase("criar Elite Four"):
+        elite_four = EliteFour()
     
     # Cria sistema de batalhas
-    battle_system = BattleSystem()
+    battle_system = BattleSystem(simulation_engine=args.engine, n_workers=args.workers)
     
     # Cria equipe de demonstração
     team = create_demo_team(pokemon_database)
     
-    print(f"🎯 Simulando {args.simulations} batalhas...")
+    print(f"🎯 Simulando {args.simulations} batalhas (motor {args.engine})...")
     
     # Simula contra cada membro
-    for member in elite_four.get_all_members():
+    for index, member in enumerate(elite_four.get_all_members()):
         print(f"\n⚔️ Batalhando contra {member.name}...")
         
-        stats = battle_system.simulate_battle(team, member.pokemon_team, args.simulations)
+        seed = derive_seed(args.seed, index) if args.seed is not None else None
+        with instrumentation.phase("simulação"):
+            stats = battle_system.simulate_battle(
+                team, member.pokemon_team, args.simulations, seed=seed,
+                target_precision=args.precision, confidence=config.CONFIDENCE_LEVEL
+            )
         
         print(f"  Taxa de vitória: {stats['win_rate']:.1%}")
+        if args.precision:
+            print(f"  Intervalo ({config.CONFIDENCE_LEVEL:.0%}): "
+                  f"{stats['win_rate_ci_low']:.1%} - {stats['win_rate_ci_high']:.1%} "
+                  f"em {stats['num_simulations']} batalhas")
         print(f"  Turnos médios: {stats['avg_turns']:.1f}")
     
     print(f"\n✅ Simulação concluída!")
 
 
-def create_demo_team(pokemon_database: List[Pokemon]) -> PokemonTeam:
+def load_pokemon_database():
+    """Carrega a base de Pokémon (cache binário reaproveitado enquanto o CSV não mudar)"""
+    return load_database(
+        Path(config.DATA_DIR) / config.POKEMON_DATA_FILE,
+        level=50,
+        cache_dir=config.get_cache_dir("pokemon_database")
+    )
+
+
+def create_demo_team(pokemon_database: PokemonDatabase) -> PokemonTeam:
     """Cria equipe de demonstração"""
     
     # Pokémon populares para demonstração
@@ -283,7 +479,7 @@ def create_demo_team(pokemon_database: List[Pokemon]) -> PokemonTeam:
     
     demo_pokemon = []
     for name in demo_names:
-        pokemon = next((p for p in pokemon_database if p.name == name), None)
+        pokemon = pokemon_database.by_name(name)
         if pokemon:
             # Ajusta nível para competir com Elite Four
             pokemon.level = 60
@@ -326,7 +522,50 @@ def save_optimization_results(result, output_dir: str):
         f.write("=" * 25 + "\n\n")
         
         for member, win_rate in result.team_performance.items():
-            f.write(f"{member}: {win_rate:.1%}\n")
+            interval = result.confidence_intervals.get(member)
+            if interval:
+                f.write(f"{member}: {win_rate:.1%} (IC: {interval[0]:.1%} - {interval[1]:.1%})\n")
+            else:
+                f.write(f"{member}: {win_rate:.1%}\n")
+        
+        if result.surrogate_stats:
+            stats = result.surrogate_stats
+            f.write("\nMODELO SUBSTITUTO\n")
+            f.write(f"Equipes simuladas: {stats['teams_simulated']}\n")
+            f.write(f"Equipes não simuladas: {stats['teams_skipped']}\n")
+            f.write(f"Batalhas economizadas: {stats['simulations_saved']}\n")
+            f.write(f"Erro absoluto médio: {stats['mae']:.4f}\n")
+            f.write(f"Correlação de postos: {stats['rank_correlation']:.2f}\n")
+    
+    print(f"Resultados salvos em {output_path}")
+
+
+def save_search_results(result, output_dir: str):
+    """Salva a equipe da busca com o limite e as estatísticas da árvore"""
+    
+    output_path = Path(output_dir)
+    output_path.mkdir(parents=True, exist_ok=True)
+    
+    team_file = output_path / "best_team.txt"
+    with open(team_file, 'w', encoding='utf-8') as f:
+        f.write("MELHOR EQUIPE ENCONTRADA\n")
+        f.write("=" * 30 + "\n\n")
+        f.write(f"Busca: {result.method}\n")
+        f.write(f"Score: {result.best_score:.4f}\n")
+        f.write(f"Limite superior: {result.upper_bound:.4f}\n")
+        f.write(f"Ótimo provado: {'sim' if result.proven_optimal else 'não'}\n")
+        f.write(f"Nós explorados: {result.nodes_explored}\n")
+        f.write(f"Nós podados: {result.nodes_pruned} ({result.prune_rate:.1%})\n\n")
+        
+        f.write("Equipe:\n")
+        for i, pokemon in enumerate(result.best_team.pokemon, 1):
+            f.write(f"{i}. {pokemon.name} (Lv.{pokemon.level})\n")
+            f.write(f"   Tipos: {'/'.join([t.value for t in pokemon.get_types()])}\n")
+            f.write(f"   Total: {pokemon.stats.total}\n\n")
+        
+        f.write("Score por membro:\n")
+        for member, score in result.member_scores.items():
+            f.write(f"{member}: {score:.3f}\n")
     
     print(f"Resultados salvos em {output_path}")
 
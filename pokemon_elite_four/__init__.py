@@ -14,12 +14,19 @@ __version__ = "2.0.0"
 __author__ = "Adriano Carvalho dos Santos"
 __email__ = "adriano.carvalho@mackenzie.br"
 
-# Imports principais
-from .core.pokemon import Pokemon, PokemonTeam
-from .core.battle_system import BattleSystem, BattleResult
-from .core.elite_four import EliteFour
-from .analysis.team_optimizer import TeamOptimizer
-from .analysis.data_processor import DataProcessor
+from ._lazy import lazy_exports
+
+# Imports principais, carregados no primeiro acesso (PEP 562): importar o
+# pacote não traz pandas, otimizadores nem a pilha de gráficos
+_LAZY_IMPORTS = {
+    "Pokemon": ".core.pokemon",
+    "PokemonTeam": ".core.pokemon",
+    "BattleSystem": ".core.battle_system",
+    "BattleResult": ".core.battle_system",
+    "EliteFour": ".core.elite_four",
+    "TeamOptimizer": ".analysis.team_optimizer",
+    "DataProcessor": ".analysis.data_processor",
+}
 
 __all__ = [
     "Pokemon",
@@ -30,3 +37,6 @@ __all__ = [
     "TeamOptimizer",
     "DataProcessor"
 ]
+
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY_IMPORTS)
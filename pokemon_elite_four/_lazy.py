@@ -0,0 +1,29 @@
+"""
+Exportações preguiçosas dos pacotes (PEP 562)
+"""
+
+import importlib
+import sys
+from typing import Callable, Dict, List, Tuple
+
+
+def lazy_exports(module_name: str, mapping: Dict[str, str]) -> Tuple[Callable, Callable]:
+    """(__getattr__, __dir__) que importam cada símbolo público no primeiro acesso
+
+    mapping: nome do símbolo -> módulo relativo ao pacote `module_name`
+    """
+    module = sys.modules[module_name]
+
+    def __getattr__(name: str):
+        """Importa o símbolo público no primeiro acesso"""
+        source = mapping.get(name)
+        if source is None:
+            raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(source, module_name), name)
+        setattr(module, name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(module)) | set(mapping))
+
+    return __getattr__, __dir__
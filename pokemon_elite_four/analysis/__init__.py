@@ -2,12 +2,25 @@
 Módulo de Análise - Otimização e processamento de dados
 """
 
-from .data_processor import DataProcessor
-from .team_optimizer import TeamOptimizer
-from .battle_analyzer import BattleAnalyzer
+from .._lazy import lazy_exports
+
+# Carregados no primeiro acesso (PEP 562): pandas e os otimizadores só
+# entram quando algum símbolo é usado
+_LAZY_IMPORTS = {
+    "DataProcessor": ".data_processor",
+    "TeamOptimizer": ".team_optimizer",
+    "BattleAnalyzer": ".battle_analyzer",
+    "TeamFitnessCache": ".fitness_cache",
+    "MatchupAtlas": ".matchup_atlas",
+}
 
 __all__ = [
     "DataProcessor",
     "TeamOptimizer", 
-    "BattleAnalyzer"
+    "BattleAnalyzer",
+    "TeamFitnessCache",
+    "MatchupAtlas"
 ]
+
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY_IMPORTS)
@@ -3,13 +3,25 @@ Otimizador Avançado de Equipes - Melhorias significativas no sistema de otimiza
 """
 
 import random
+import time
 import numpy as np
-from typing import List, Tuple, Dict, Optional, Callable
-from dataclasses import dataclass
+from typing import List, Tuple, Dict, Optional, Callable, Union
+from dataclasses import dataclass, field
 from ..core.pokemon import Pokemon, PokemonTeam, PokemonType, PokemonStats
 from ..core.smart_battle_system import SmartBattleSystem, MoveStrategy
 from ..core.elite_four import EliteFour
+from ..core.pokemon_database import PokemonDatabase
 from .data_processor import DataProcessor
+from .fitness_cache import TeamFitnessCache, FitnessEntry
+from .static_scorer import (
+    StaticScorer, IMPORTANT_TYPES, ELITE_FOUR_TYPES, is_resistant, is_weak
+)
+from .evaluators import (
+    SerialEvaluator, EvaluationContext, EvaluationTask,
+    make_evaluator, describe_team, simulate_smart_battles
+)
+from .surrogate import SurrogateConfig, FitnessSurrogate
+from ..core.rng import derive_seed, CommonRandomNumbers
 
 
 @dataclass
@@ -23,6 +35,7 @@ class AdvancedOptimizationResult:
     move_strategy_performance: Dict[str, float]
     individual_performance: Dict[str, float]
     optimization_metrics: Dict[str, float]
+    surrogate_stats: Dict[str, float] = field(default_factory=dict)
 
 
 class AdvancedTeamOptimizer:
@@ -36,13 +49,58 @@ class AdvancedTeamOptimizer:
         max_generations: int = 100,
         mutation_rate: float = 0.15,
         crossover_rate: float = 0.8,
-        elite_size: int = 10
+        elite_size: int = 10,
+        fitness_cache: Optional[TeamFitnessCache] = None,
+        fitness_refine_limit: int = 0,
+        evaluator: Union[str, SerialEvaluator] = "serial",
+        n_workers: int = 1,
+        seed: Optional[int] = None,
+        rng: Optional[random.Random] = None,
+        common_random_numbers: bool = False,
+        surrogate: Optional[SurrogateConfig] = None
     ):
         self.pokemon_database = pokemon_database
         self.elite_four = elite_four
-        self.smart_battle_system = SmartBattleSystem()
+        
+        # Gerador dos operadores genéticos e das batalhas locais; com `seed`
+        # e sem `rng` explícito, toda a otimização é reprodutível
+        if rng is None:
+            rng = random.Random(seed) if seed is not None else random
+        self.rng = rng
+        self.smart_battle_system = SmartBattleSystem(rng=self.rng)
         self.data_processor = DataProcessor()
         
+        # Cache de fitness compartilhável (elites reavaliadas a cada geração)
+        self.fitness_cache = fitness_cache if fitness_cache is not None else TeamFitnessCache()
+        self.fitness_refine_limit = fitness_refine_limit
+        self.simulations_per_strategy = 3
+        
+        # Features por espécie para os termos estáticos em lote
+        self.static_scorer = StaticScorer(pokemon_database)
+        
+        # Avaliação da população por geração (serial, threads ou processos);
+        # cada equipe usa um fluxo aleatório derivado de `seed`
+        if isinstance(evaluator, str):
+            evaluator = make_evaluator(evaluator, n_workers)
+        self.evaluator = evaluator
+        self.seed = seed
+        self.throughput_history = []
+        
+        # Números aleatórios comuns: todas as equipes enfrentam cada membro
+        # com os mesmos fluxos (membro, estratégia, réplica)
+        self.crn = None
+        if common_random_numbers:
+            self.crn = CommonRandomNumbers(seed if seed is not None else self.rng.getrandbits(64))
+        
+        # Modelo substituto: só a fração mais promissora dos filhos novos
+        # vai ao avaliador; as demais ficam com o fitness previsto
+        self.surrogate = None
+        if surrogate is not None:
+            self.surrogate = FitnessSurrogate(
+                surrogate, [member.pokemon_team for member in elite_four.get_all_members()],
+                seed if seed is not None else 0
+            )
+        
         # Parâmetros do algoritmo genético
         self.population_size = population_size
         self.max_generations = max_generations
@@ -73,10 +131,13 @@ class AdvancedTeamOptimizer:
         
         # Adiciona Pokémon de tipos prioritários
         for pokemon_type in priority_types:
-            candidates = [p for p in self.pokemon_database 
-                         if p.type1 == pokemon_type or p.type2 == pokemon_type]
+            if isinstance(self.pokemon_database, PokemonDatabase):
+                candidates = self.pokemon_database.by_type(pokemon_type)
+            else:
+                candidates = [p for p in self.pokemon_database 
+                             if p.type1 == pokemon_type or p.type2 == pokemon_type]
             if candidates:
-                pokemon = random.choice(candidates)
+                pokemon = self.rng.choice(candidates)
                 if pokemon not in team_pokemon:
                     team_pokemon.append(pokemon)
         
@@ -84,7 +145,7 @@ class AdvancedTeamOptimizer:
         while len(team_pokemon) < 6:
             available = [p for p in self.pokemon_database if p not in team_pokemon]
             if available:
-                team_pokemon.append(random.choice(available))
+                team_pokemon.append(self.rng.choice(available))
             else:
                 break
         
@@ -108,7 +169,7 @@ class AdvancedTeamOptimizer:
     
     def create_random_team(self) -> PokemonTeam:
         """Cria uma equipe aleatória"""
-        team_pokemon = random.sample(self.pokemon_database, min(6, len(self.pokemon_database)))
+        team_pokemon = self.rng.sample(self.pokemon_database, min(6, len(self.pokemon_database)))
         return PokemonTeam(team_pokemon)
     
     def calculate_advanced_fitness(self, team: PokemonTeam) -> float:
@@ -118,66 +179,183 @@ class AdvancedTeamOptimizer:
         for pokemon in team.pokemon:
             pokemon.level = 60
         
-        # 1. Performance em batalhas (peso maior - 50%)
-        battle_score = self._calculate_advanced_battle_performance(team)
-        
-        # 2. Análise de tipos e cobertura (20%)
-        type_score = self._calculate_type_coverage_score(team)
-        
-        # 3. Balanceamento estatístico (15%)
-        balance_score = self._calculate_stat_balance_score(team)
-        
-        # 4. Diversidade de estratégias (10%)
-        strategy_score = self._calculate_strategy_diversity_score(team)
+        signature = self.fitness_cache.team_signature(team, self._fitness_config())
+        entry = self.fitness_cache.get(signature)
         
-        # 5. Resistências e fraquezas (5%)
-        resistance_score = self._calculate_resistance_score(team)
+        if entry is None:
+            wins, battles = self._simulate_advanced_battles(team)
+            entry = self.fitness_cache.put(
+                signature, FitnessEntry(wins, battles, self._calculate_static_score(team))
+            )
+        elif entry.battles < self.fitness_refine_limit:
+            wins, battles = self._simulate_advanced_battles(team, self._replicates_done(entry))
+            entry = self.fitness_cache.refine(signature, wins, battles)
         
-        # Score final ponderado
-        total_score = (
-            battle_score * 0.50 +
-            type_score * 0.20 +
-            balance_score * 0.15 +
-            strategy_score * 0.10 +
-            resistance_score * 0.05
+        # 1. Performance em batalhas (peso maior - 50%) + termos estáticos
+        return entry.win_rate * 0.50 + entry.static_score
+    
+    def _fitness_config(self) -> Tuple:
+        """Configuração do motor que compõe a assinatura no cache"""
+        return (
+            "AdvancedTeamOptimizer",
+            self.smart_battle_system.max_turns,
+            tuple(strategy.value for strategy in self.move_strategies),
+            self.simulations_per_strategy,
+            self.crn.master_seed if self.crn is not None else None
         )
+    
+    def _replicates_done(self, entry: Optional[FitnessEntry]) -> int:
+        """Réplicas por (membro, estratégia) já acumuladas na entrada do cache"""
+        if entry is None:
+            return 0
+        return entry.battles // (len(self.elite_four.get_all_members()) * len(self.move_strategies))
+    
+    def _calculate_static_score(self, team: PokemonTeam) -> float:
+        """Termos do fitness que não dependem de batalhas (já ponderados)
         
-        return total_score
+        Cobertura de tipos (20%), balanceamento (15%), diversidade de
+        estratégias (10%) e resistências (5%), via StaticScorer.
+        """
+        return float(self.static_scorer.score_teams([team])[0])
     
     def _calculate_advanced_battle_performance(self, team: PokemonTeam) -> float:
         """Calcula performance avançada em batalhas"""
         
-        total_wins = 0
-        total_battles = 0
-        strategy_performance = {}
+        total_wins, total_battles = self._simulate_advanced_battles(team)
+        
+        return total_wins / total_battles if total_battles > 0 else 0
+    
+    def _simulate_advanced_battles(self, team: PokemonTeam, first_replicate: int = 0) -> Tuple[int, int]:
+        """Simula batalhas com cada estratégia e retorna (vitórias, batalhas)"""
+        
+        return simulate_smart_battles(
+            team, self.elite_four, self.smart_battle_system,
+            self.move_strategies, self.simulations_per_strategy,
+            crn=self.crn, first_replicate=first_replicate
+        )
+    
+    def _evaluation_context(self) -> EvaluationContext:
+        """Contexto enviado aos avaliadores (reconstrução das equipes por id)"""
+        return EvaluationContext(
+            species={pokemon.pokemon_id: pokemon for pokemon in self.pokemon_database},
+            elite_four=self.elite_four,
+            strategies=tuple(self.move_strategies),
+            simulations_per_strategy=self.simulations_per_strategy,
+            max_turns=self.smart_battle_system.max_turns,
+            common_random_numbers=self.crn is not None
+        )
+    
+    def evaluate_population(
+        self,
+        population: List[PokemonTeam],
+        generation_seed: int,
+        context: Optional[EvaluationContext] = None
+    ):
+        """Avalia uma geração inteira, definindo `team.fitness`
+        
+        Acertos do cache são resolvidos localmente; as equipes restantes
+        (sem repetição) vão ao avaliador como descritores com semente própria
+        (no modo CRN, a semente comum e a réplica onde cada uma continua).
+        Com modelo substituto, as equipes novas fora da fração escolhida não
+        são simuladas e ficam com o fitness previsto (`team.fitness_predicted`).
+        """
+        
+        start_time = time.perf_counter()
+        context = context or self._evaluation_context()
+        config = self._fitness_config()
         
-        # Testa contra cada membro da Elite Four
-        for member in self.elite_four.get_all_members():
-            member_wins = 0
-            member_battles = 0
+        signatures = []
+        entries = {}
+        pending = {}  # assinatura -> equipe representante
+        
+        for team in population:
+            # Ajusta níveis para competir com Elite Four
+            for pokemon in team.pokemon:
+                pokemon.level = 60
             
-            # Testa múltiplas estratégias
-            for strategy in self.move_strategies:
-                for _ in range(3):  # 3 simulações por estratégia
-                    battle_log = self.smart_battle_system.battle_teams_smart(
-                        team, member.pokemon_team, strategy, MoveStrategy.BALANCED
-                    )
-                    
-                    total_battles += 1
-                    member_battles += 1
-                    
-                    if battle_log.battle_result.value == "Win":
-                        total_wins += 1
-                        member_wins += 1
-                
-                # Performance por estratégia
-                strategy_key = f"{member.name}_{strategy.value}"
-                strategy_performance[strategy_key] = member_wins / member_battles if member_battles > 0 else 0
+            signature = self.fitness_cache.team_signature(team, config)
+            signatures.append(signature)
+            if signature in entries or signature in pending:
+                continue
             
-            # Performance por membro
-            member_performance = member_wins / member_battles if member_battles > 0 else 0
-        
-        return total_wins / total_battles if total_battles > 0 else 0
+            entry = self.fitness_cache.get(signature)
+            if entry is not None:
+                entries[signature] = entry
+            if entry is None or entry.battles < self.fitness_refine_limit:
+                pending[signature] = team
+        
+        predicted = {}
+        simulated_predictions = None
+        if self.surrogate is not None:
+            battles_per_team = (
+                self.simulations_per_strategy * len(self.move_strategies) *
+                len(self.elite_four.get_all_members())
+            )
+            predicted, simulated_predictions = self.surrogate.screen_candidates(
+                {signature: team for signature, team in pending.items() if signature not in entries},
+                battles_per_team
+            )
+            for signature in predicted:
+                del pending[signature]
+        
+        if self.crn is not None:
+            tasks = [
+                EvaluationTask(
+                    describe_team(team), self.crn.master_seed,
+                    self._replicates_done(entries.get(signature))
+                )
+                for signature, team in pending.items()
+            ]
+        else:
+            tasks = [
+                EvaluationTask(describe_team(team), derive_seed(generation_seed, index))
+                for index, team in enumerate(pending.values())
+            ]
+        results = self.evaluator.evaluate(context, tasks) if tasks else []
+        
+        # Termos estáticos de todas as equipes novas em uma única chamada
+        new_signatures = [signature for signature in pending if signature not in entries]
+        new_teams = [pending[signature] for signature in new_signatures]
+        static_scores = iter(self.static_scorer.score_teams(new_teams).tolist())
+        
+        battles_simulated = 0
+        for (signature, team), (wins, battles) in zip(pending.items(), results):
+            battles_simulated += battles
+            if signature in entries:
+                entries[signature] = self.fitness_cache.refine(signature, wins, battles)
+            else:
+                entries[signature] = self.fitness_cache.put(
+                    signature, FitnessEntry(wins, battles, next(static_scores))
+                )
+        
+        for team, signature in zip(population, signatures):
+            if signature in predicted:
+                team.fitness = predicted[signature]
+                team.fitness_predicted = True
+                continue
+            entry = entries[signature]
+            team.fitness = entry.win_rate * 0.50 + entry.static_score
+            team.fitness_predicted = False
+        
+        if self.surrogate is not None:
+            self.surrogate.observe(
+                new_teams,
+                [entries[signature].win_rate * 0.50 + entries[signature].static_score
+                 for signature in new_signatures],
+                simulated_predictions
+            )
+            self.surrogate.fit()
+        
+        elapsed = time.perf_counter() - start_time
+        throughput = {
+            "evaluator": self.evaluator.name,
+            "teams_evaluated": len(tasks),
+            "battles": battles_simulated,
+            "seconds": elapsed,
+            "battles_per_second": battles_simulated / elapsed if elapsed > 0 else 0.0
+        }
+        self.throughput_history.append(throughput)
+        return throughput
     
     def _calculate_type_coverage_score(self, team: PokemonTeam) -> float:
         """Calcula score de cobertura de tipos"""
@@ -192,13 +370,7 @@ class AdvancedTeamOptimizer:
         type_diversity = len(all_types) / 18  # 18 tipos possíveis
         
         # Bonus por tipos importantes
-        important_types = {
-            PokemonType.WATER, PokemonType.FIRE, PokemonType.GRASS,
-            PokemonType.ELECTRIC, PokemonType.PSYCHIC, PokemonType.DRAGON,
-            PokemonType.GROUND, PokemonType.FLYING, PokemonType.ICE
-        }
-        
-        important_coverage = len(all_types.intersection(important_types)) / len(important_types)
+        important_coverage = len(all_types.intersection(IMPORTANT_TYPES)) / len(IMPORTANT_TYPES)
         
         return (type_diversity * 0.6) + (important_coverage * 0.4)
     
@@ -256,17 +428,11 @@ class AdvancedTeamOptimizer:
         if not team.pokemon:
             return 0
         
-        # Tipos comuns da Elite Four
-        elite_four_types = {
-            PokemonType.ICE, PokemonType.FIGHTING, PokemonType.GHOST,
-            PokemonType.DRAGON, PokemonType.PSYCHIC, PokemonType.NORMAL
-        }
-        
         resistances = 0
         weaknesses = 0
         
         for pokemon in team.pokemon:
-            for elite_type in elite_four_types:
+            for elite_type in ELITE_FOUR_TYPES:
                 # Simplificado - pode ser expandido com matriz de efetividade
                 if self._is_resistant(pokemon, elite_type):
                     resistances += 1
@@ -281,37 +447,11 @@ class AdvancedTeamOptimizer:
     
     def _is_resistant(self, pokemon: Pokemon, attack_type: PokemonType) -> bool:
         """Verifica se o Pokémon é resistente ao tipo de ataque"""
-        # Implementação simplificada - pode ser expandida
-        resistances = {
-            PokemonType.WATER: [PokemonType.WATER, PokemonType.GRASS, PokemonType.DRAGON],
-            PokemonType.FIRE: [PokemonType.FIRE, PokemonType.WATER, PokemonType.DRAGON],
-            PokemonType.ELECTRIC: [PokemonType.ELECTRIC, PokemonType.GRASS, PokemonType.DRAGON],
-            PokemonType.PSYCHIC: [PokemonType.PSYCHIC, PokemonType.DARK],
-            PokemonType.DRAGON: [PokemonType.STEEL],
-            PokemonType.ICE: [PokemonType.ICE, PokemonType.WATER, PokemonType.STEEL]
-        }
-        
-        if attack_type in resistances:
-            return pokemon.type1 in resistances[attack_type] or pokemon.type2 in resistances[attack_type]
-        
-        return False
+        return is_resistant(pokemon, attack_type)
     
     def _is_weak(self, pokemon: Pokemon, attack_type: PokemonType) -> bool:
         """Verifica se o Pokémon é fraco ao tipo de ataque"""
-        # Implementação simplificada - pode ser expandida
-        weaknesses = {
-            PokemonType.WATER: [PokemonType.FIRE, PokemonType.GROUND, PokemonType.ROCK],
-            PokemonType.FIRE: [PokemonType.GRASS, PokemonType.ICE, PokemonType.BUG, PokemonType.STEEL],
-            PokemonType.ELECTRIC: [PokemonType.WATER, PokemonType.FLYING],
-            PokemonType.PSYCHIC: [PokemonType.FIGHTING, PokemonType.POISON],
-            PokemonType.DRAGON: [PokemonType.DRAGON],
-            PokemonType.ICE: [PokemonType.GRASS, PokemonType.GROUND, PokemonType.FLYING, PokemonType.DRAGON]
-        }
-        
-        if attack_type in weaknesses:
-            return pokemon.type1 in weaknesses[attack_type] or pokemon.type2 in weaknesses[attack_type]
-        
-        return False
+        return is_weak(pokemon, attack_type)
     
     def optimize_team_advanced(self) -> AdvancedOptimizationResult:
         """Executa otimização avançada da equipe"""
@@ -319,14 +459,17 @@ class AdvancedTeamOptimizer:
         # Cria população inicial
         population = self.create_initial_population()
         
+        master_seed = self.seed if self.seed is not None else self.rng.getrandbits(64)
+        context = self._evaluation_context()
+        
         # Avalia fitness inicial
-        for team in population:
-            team.fitness = self.calculate_advanced_fitness(team)
+        throughput = self.evaluate_population(population, derive_seed(master_seed, 0), context)
         
         best_team = max(population, key=lambda t: t.fitness)
         best_score = best_team.fitness
         
-        print(f"Geração 0 - Melhor Fitness: {best_score:.4f}")
+        print(f"Geração 0 - Melhor Fitness: {best_score:.4f} "
+              f"({throughput['battles_per_second']:.0f} batalhas/s)")
         
         # Evolução
         for generation in range(1, self.max_generations + 1):
@@ -334,11 +477,13 @@ class AdvancedTeamOptimizer:
             new_population = self._evolve_population(population)
             
             # Avalia nova população
-            for team in new_population:
-                team.fitness = self.calculate_advanced_fitness(team)
+            throughput = self.evaluate_population(
+                new_population, derive_seed(master_seed, generation), context
+            )
             
-            # Atualiza melhor equipe
-            generation_best = max(new_population, key=lambda t: t.fitness)
+            # Atualiza melhor equipe (só entre as simuladas)
+            simulated = [team for team in new_population if not team.fitness_predicted] or new_population
+            generation_best = max(simulated, key=lambda t: t.fitness)
             if generation_best.fitness > best_score:
                 best_team = generation_best
                 best_score = generation_best.fitness
@@ -348,17 +493,27 @@ class AdvancedTeamOptimizer:
             
             # Log de progresso
             if generation % 10 == 0 or generation == 1:
-                print(f"Geração {generation} - Melhor Fitness: {best_score:.4f}")
+                print(f"Geração {generation} - Melhor Fitness: {best_score:.4f} "
+                      f"({throughput['battles_per_second']:.0f} batalhas/s)")
             
             # Atualiza população
             population = new_population
         
+        self.evaluator.close()
+        
         # Calcula métricas finais
         team_performance = self._calculate_team_performance_metrics(best_team)
         move_strategy_performance = self._calculate_strategy_performance_metrics(best_team)
         individual_performance = self._calculate_individual_performance_metrics(best_team)
         optimization_metrics = self._calculate_optimization_metrics()
         
+        surrogate_stats = {}
+        if self.surrogate is not None:
+            surrogate_stats = self.surrogate.stats()
+            print(f"Modelo substituto: {surrogate_stats['teams_skipped']} equipes não simuladas "
+                  f"({surrogate_stats['simulations_saved']} batalhas economizadas), "
+                  f"MAE {surrogate_stats['mae']:.4f}, correlação de postos {surrogate_stats['rank_correlation']:.2f}")
+        
         return AdvancedOptimizationResult(
             best_team=best_team,
             best_score=best_score,
@@ -367,7 +522,8 @@ class AdvancedTeamOptimizer:
             team_performance=team_performance,
             move_strategy_performance=move_strategy_performance,
             individual_performance=individual_performance,
-            optimization_metrics=optimization_metrics
+            optimization_metrics=optimization_metrics,
+            surrogate_stats=surrogate_stats
         )
     
     def _evolve_population(self, population: List[PokemonTeam]) -> List[PokemonTeam]:
@@ -386,15 +542,15 @@ class AdvancedTeamOptimizer:
             parent2 = self._tournament_selection(population)
             
             # Cruzamento
-            if random.random() < self.crossover_rate:
+            if self.rng.random() < self.crossover_rate:
                 child1, child2 = self._crossover(parent1, parent2)
             else:
                 child1, child2 = parent1, parent2
             
             # Mutação
-            if random.random() < self.mutation_rate:
+            if self.rng.random() < self.mutation_rate:
                 child1 = self._mutate(child1)
-            if random.random() < self.mutation_rate:
+            if self.rng.random() < self.mutation_rate:
                 child2 = self._mutate(child2)
             
             new_population.extend([child1, child2])
@@ -403,7 +559,7 @@ class AdvancedTeamOptimizer:
     
     def _tournament_selection(self, population: List[PokemonTeam], tournament_size: int = 3) -> PokemonTeam:
         """Seleção por torneio"""
-        tournament = random.sample(population, min(tournament_size, len(population)))
+        tournament = self.rng.sample(population, min(tournament_size, len(population)))
         return max(tournament, key=lambda t: t.fitness)
     
     def _crossover(self, parent1: PokemonTeam, parent2: PokemonTeam) -> Tuple[PokemonTeam, PokemonTeam]:
@@ -413,7 +569,7 @@ class AdvancedTeamOptimizer:
         
         # Cruzamento uniforme
         for i in range(6):
-            if random.random() < 0.5:
+            if self.rng.random() < 0.5:
                 if i < len(parent1.pokemon):
                     child1_pokemon.append(parent1.pokemon[i])
                 if i < len(parent2.pokemon):
@@ -436,12 +592,12 @@ class AdvancedTeamOptimizer:
             return team
         
         # Seleciona Pokémon aleatório para substituir
-        replace_index = random.randint(0, len(team.pokemon) - 1)
+        replace_index = self.rng.randint(0, len(team.pokemon) - 1)
         
         # Encontra substituto que não está na equipe
         available = [p for p in self.pokemon_database if p not in team.pokemon]
         if available:
-            team.pokemon[replace_index] = random.choice(available)
+            team.pokemon[replace_index] = self.rng.choice(available)
         
         return team
     
@@ -459,7 +615,7 @@ class AdvancedTeamOptimizer:
         while len(unique_pokemon) < 6:
             available = [p for p in self.pokemon_database if p not in seen]
             if available:
-                pokemon = random.choice(available)
+                pokemon = self.rng.choice(available)
                 unique_pokemon.append(pokemon)
                 seen.add(pokemon)
             else:
@@ -510,5 +666,14 @@ class AdvancedTeamOptimizer:
             "convergence_rate": convergence_rate,
             "improvement_rate": improvement_rate,
             "final_fitness": self.fitness_history[-1],
-            "generations": len(self.fitness_history)
+            "generations": len(self.fitness_history),
+            "fitness_cache_hit_rate": self.fitness_cache.hit_rate,
+            "fitness_evaluations": self.fitness_cache.misses,
+            "battles_per_second": self._average_throughput()
         }
+    
+    def _average_throughput(self) -> float:
+        """Batalhas por segundo somando todas as gerações avaliadas"""
+        battles = sum(t["battles"] for t in self.throughput_history)
+        seconds = sum(t["seconds"] for t in self.throughput_history)
+        return battles / seconds if seconds > 0 else 0.0
@@ -9,6 +9,8 @@ from dataclasses import dataclass
 from ..core.pokemon import Pokemon, PokemonTeam
 from ..core.battle_system import BattleSystem, BattleLog, BattleResult
 from ..core.elite_four import EliteFour, EliteFourMember
+from ..core.parallel import ParallelSimulator, SimulationTotals, merge_totals
+from ..core.rng import derive_seed
 
 
 @dataclass
@@ -41,16 +43,30 @@ class PokemonPerformance:
 class BattleAnalyzer:
     """Analisador de batalhas e performance"""
     
-    def __init__(self, battle_system: BattleSystem, elite_four: EliteFour):
+    def __init__(
+        self,
+        battle_system: BattleSystem,
+        elite_four: EliteFour,
+        n_workers: Optional[int] = None
+    ):
         self.battle_system = battle_system
         self.elite_four = elite_four
+        self.n_workers = n_workers or battle_system.n_workers
     
     def analyze_team_performance(
         self, 
         team: PokemonTeam, 
-        num_simulations: int = 100
+        num_simulations: int = 100,
+        seed: Optional[int] = None
     ) -> Dict[str, BattleStatistics]:
-        """Analisa performance da equipe contra Elite Four"""
+        """Analisa performance da equipe contra Elite Four
+        
+        Com mais de um worker ou semente explícita, as simulações de todos os
+        membros são fragmentadas e executadas juntas no pool de processos.
+        """
+        
+        if self.n_workers > 1 or seed is not None:
+            return self._analyze_team_performance_sharded(team, num_simulations, seed)
         
         results = {}
         
@@ -69,6 +85,55 @@ class BattleAnalyzer:
         
         return results
     
+    def _analyze_team_performance_sharded(
+        self,
+        team: PokemonTeam,
+        num_simulations: int,
+        seed: Optional[int]
+    ) -> Dict[str, BattleStatistics]:
+        """Versão fragmentada: um fluxo aleatório por membro e por fragmento"""
+        
+        if seed is None:
+            seed = self.battle_system.rng.getrandbits(64)
+        
+        simulator = ParallelSimulator(self.n_workers)
+        members = self.elite_four.get_all_members()
+        
+        # Planeja todos os fragmentos antes de executar para ocupar todo o pool
+        shards = []
+        member_slices = []
+        for index, member in enumerate(members):
+            print(f"Analisando performance contra {member.name}...")
+            member_shards = simulator.plan_shards(
+                team, member.pokemon_team, num_simulations,
+                derive_seed(seed, index), max_turns=self.battle_system.max_turns
+            )
+            member_slices.append((member.name, len(shards), len(shards) + len(member_shards)))
+            shards.extend(member_shards)
+        
+        shard_results = simulator.run(shards)
+        
+        return {
+            name: self._statistics_from_totals(merge_totals(shard_results[start:end]))
+            for name, start, end in member_slices
+        }
+    
+    def _statistics_from_totals(self, totals: SimulationTotals) -> BattleStatistics:
+        """Converte contagens agregadas em estatísticas de batalha"""
+        
+        total_battles = totals.battles
+        
+        return BattleStatistics(
+            total_battles=total_battles,
+            wins=totals.wins,
+            losses=totals.losses,
+            draws=totals.draws,
+            win_rate=totals.wins / total_battles if total_battles > 0 else 0,
+            avg_turns=totals.total_turns / total_battles if total_battles > 0 else 0,
+            avg_damage_dealt=totals.total_damage_dealt / total_battles if total_battles > 0 else 0,
+            avg_damage_taken=0
+        )
+    
     def _calculate_battle_statistics(self, battle_logs: List[BattleLog]) -> BattleStatistics:
         """Calcula estatísticas de uma lista de batalhas"""
         
@@ -250,14 +315,15 @@ class BattleAnalyzer:
     def generate_battle_report(
         self, 
         team: PokemonTeam, 
-        num_simulations: int = 100
+        num_simulations: int = 100,
+        seed: Optional[int] = None
     ) -> Dict[str, any]:
         """Gera relatório completo de batalhas"""
         
         print("Gerando relatório de batalhas...")
         
         # Análise geral da equipe
-        team_performance = self.analyze_team_performance(team, num_simulations)
+        team_performance = self.analyze_team_performance(team, num_simulations, seed=seed)
         
         # Análise individual de cada Pokémon
         individual_performance = {}
@@ -3,11 +3,22 @@ Processador de Dados - Carregamento e preparação de dados Pokémon
 """
 
 import pandas as pd
-import numpy as np
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Optional, Tuple, TYPE_CHECKING
 from pathlib import Path
-from ..core.pokemon import Pokemon, PokemonType, PokemonStats
+from ..core.pokemon import Pokemon, PokemonType, PokemonStats, STAT_NAMES
 from ..core.moves import create_default_moveset
+from ..core.pokemon_database import PokemonDatabase, load_pokemon_database
+from .team_metrics import TeamMetrics, species_profile
+
+if TYPE_CHECKING:
+    from .matchup_atlas import MatchupAtlas
+
+
+# Nome do tipo no CSV -> PokemonType
+TYPE_BY_NAME = {pokemon_type.value: pokemon_type for pokemon_type in PokemonType}
+
+# Cache binário da base de dados processada
+DEFAULT_DATABASE_CACHE_DIR = "output/.cache/pokemon_database"
 
 
 class DataProcessor:
@@ -42,28 +53,8 @@ class DataProcessor:
         """Cria objeto Pokemon a partir de dados CSV"""
         
         # Mapeia tipos
-        type_mapping = {
-            'Normal': PokemonType.NORMAL,
-            'Fire': PokemonType.FIRE,
-            'Water': PokemonType.WATER,
-            'Electric': PokemonType.ELECTRIC,
-            'Grass': PokemonType.GRASS,
-            'Ice': PokemonType.ICE,
-            'Fighting': PokemonType.FIGHTING,
-            'Poison': PokemonType.POISON,
-            'Ground': PokemonType.GROUND,
-            'Flying': PokemonType.FLYING,
-            'Psychic': PokemonType.PSYCHIC,
-            'Bug': PokemonType.BUG,
-            'Rock': PokemonType.ROCK,
-            'Ghost': PokemonType.GHOST,
-            'Dragon': PokemonType.DRAGON,
-            'Steel': PokemonType.STEEL,
-            'Dark': PokemonType.DARK
-        }
-        
-        type1 = type_mapping.get(row['type1'], PokemonType.NORMAL)
-        type2 = type_mapping.get(row['type2'], None) if pd.notna(row['type2']) else None
+        type1 = TYPE_BY_NAME.get(row['type1'], PokemonType.NORMAL)
+        type2 = TYPE_BY_NAME.get(row['type2'], None) if pd.notna(row['type2']) else None
         
         # Cria estatísticas
         stats = PokemonStats(
@@ -90,56 +81,34 @@ class DataProcessor:
         
         return pokemon
     
-    def create_pokemon_database(self, level: int = 50) -> List[Pokemon]:
-        """Cria base de dados de Pokémon"""
+    def create_pokemon_database(self, level: int = 50) -> PokemonDatabase:
+        """Cria base de dados de Pokémon (colunar; entrega objetos Pokemon como uma lista)"""
         if self.pokemon_data is None:
             self.load_pokemon_data()
         
-        pokemon_list = []
-        for _, row in self.pokemon_data.iterrows():
-            try:
-                pokemon = self.create_pokemon_from_data(row, level)
-                pokemon_list.append(pokemon)
-            except Exception as e:
-                print(f"Erro ao criar Pokémon {row['name']}: {e}")
-                continue
-        
-        return pokemon_list
+        return PokemonDatabase.from_dataframe(self.pokemon_data, level=level)
+    
+    def load_pokemon_database(
+        self,
+        filename: str = "pokemon_processed.csv",
+        level: int = 50,
+        cache_dir: Optional[str] = DEFAULT_DATABASE_CACHE_DIR
+    ) -> PokemonDatabase:
+        """Carrega a base de dados usando o cache binário quando o CSV não mudou
+        
+        Em caso de leitura do CSV, o DataFrame fica em `pokemon_data`;
+        cache_dir=None desativa o cache.
+        """
+        return load_pokemon_database(
+            self.data_path / filename,
+            level=level,
+            cache_dir=cache_dir,
+            read_csv=lambda path: self.load_pokemon_data(filename)
+        )
     
     def calculate_pokemon_metrics(self, pokemon: Pokemon) -> Dict[str, float]:
-        """Calcula métricas de um Pokémon"""
-        
-        # Métricas básicas
-        total_stats = pokemon.stats.total
-        combat_avg = (pokemon.attack + pokemon.defense + pokemon.sp_attack + 
-                     pokemon.sp_defense + pokemon.speed) / 5
-        defense_avg = (pokemon.stats.hp + pokemon.defense + pokemon.sp_defense) / 3
-        offense_avg = (pokemon.attack + pokemon.sp_attack + pokemon.speed) / 3
-        
-        # Balanceamento
-        balance = 1 - (abs(pokemon.attack - pokemon.defense) + 
-                      abs(pokemon.sp_attack - pokemon.sp_defense)) / total_stats
-        
-        # Eficiência
-        efficiency = total_stats / 600
-        
-        # Categoria de poder
-        if total_stats >= 500:
-            power_category = "Alto"
-        elif total_stats >= 400:
-            power_category = "Médio"
-        else:
-            power_category = "Baixo"
-        
-        return {
-            'total_stats': total_stats,
-            'combat_avg': combat_avg,
-            'defense_avg': defense_avg,
-            'offense_avg': offense_avg,
-            'balance': balance,
-            'efficiency': efficiency,
-            'power_category': power_category
-        }
+        """Calcula métricas de um Pokémon (perfil calculado uma vez por espécie/nível)"""
+        return species_profile(pokemon).as_dict()
     
     def analyze_type_coverage(self, pokemon_list: List[Pokemon]) -> Dict[str, int]:
         """Analisa cobertura de tipos"""
@@ -156,12 +125,24 @@ class DataProcessor:
         self, 
         target_pokemon: Pokemon, 
         pokemon_database: List[Pokemon],
-        top_n: int = 5
+        top_n: int = 5,
+        atlas: Optional["MatchupAtlas"] = None
     ) -> List[Tuple[Pokemon, float]]:
-        """Encontra melhores contadores para um Pokémon"""
+        """Encontra melhores contadores para um Pokémon
+        
+        Com um MatchupAtlas que cubra todos os confrontos, o score é a
+        probabilidade de vitória 1x1 tabelada; caso contrário usa a heurística
+        de vantagem de tipo e estatísticas.
+        """
         
         from ..core.battle_system import TypeEffectiveness
         
+        candidates = [p for p in pokemon_database if p.pokemon_id != target_pokemon.pokemon_id]
+        if atlas is not None and all(atlas.has(p, target_pokemon) for p in candidates):
+            counters = [(p, atlas.win_probability(p, target_pokemon)) for p in candidates]
+            counters.sort(key=lambda x: x[1], reverse=True)
+            return counters[:top_n]
+        
         counters = []
         
         for pokemon in pokemon_database:
@@ -172,9 +153,9 @@ class DataProcessor:
             advantage = 1.0
             for move in pokemon.move_set.moves:
                 if move.category.value != "Status":
-                    effectiveness = TypeEffectiveness.get_effectiveness(
+                    effectiveness = TypeEffectiveness.get_effectiveness_against(
                         move.move_type, 
-                        target_pokemon.get_types()
+                        target_pokemon
                     )
                     advantage = max(advantage, effectiveness)
             
@@ -189,69 +170,16 @@ class DataProcessor:
         return counters[:top_n]
     
     def create_team_analysis(self, team: List[Pokemon]) -> Dict[str, any]:
-        """Cria análise completa de uma equipe"""
+        """Cria análise completa de uma equipe (redução sobre os perfis dos membros)"""
         
         if len(team) == 0:
             return {}
         
-        # Métricas individuais
-        individual_metrics = []
-        for pokemon in team:
-            metrics = self.calculate_pokemon_metrics(pokemon)
-            individual_metrics.append(metrics)
-        
-        # Métricas da equipe
-        total_stats = sum(pokemon.stats.total for pokemon in team)
-        avg_efficiency = np.mean([m['efficiency'] for m in individual_metrics])
-        avg_balance = np.mean([m['balance'] for m in individual_metrics])
-        
-        # Cobertura de tipos
-        type_coverage = self.analyze_type_coverage(team)
-        unique_types = len(type_coverage)
-        
-        # Análise de fraquezas
-        weaknesses = self._analyze_team_weaknesses(team)
-        
-        # Score geral da equipe
-        team_score = (avg_efficiency * 0.4 + 
-                     unique_types / 15 * 0.3 + 
-                     avg_balance * 0.3)
-        
-        return {
-            'team_size': len(team),
-            'total_stats': total_stats,
-            'avg_efficiency': avg_efficiency,
-            'avg_balance': avg_balance,
-            'type_coverage': type_coverage,
-            'unique_types': unique_types,
-            'weaknesses': weaknesses,
-            'team_score': team_score,
-            'individual_metrics': individual_metrics
-        }
+        return TeamMetrics.from_pokemon(team).analysis()
     
     def _analyze_team_weaknesses(self, team: List[Pokemon]) -> Dict[str, List[str]]:
-        """Analisa fraquezas da equipe"""
-        
-        from ..core.battle_system import TypeEffectiveness
-        
-        weaknesses = {}
-        
-        # Tipos que são super efetivos contra a equipe
-        for pokemon in team:
-            for pokemon_type in pokemon.get_types():
-                for attack_type in PokemonType:
-                    effectiveness = TypeEffectiveness.get_effectiveness(
-                        attack_type, 
-                        [pokemon_type]
-                    )
-                    
-                    if effectiveness > 1.0:
-                        type_name = attack_type.value
-                        if type_name not in weaknesses:
-                            weaknesses[type_name] = []
-                        weaknesses[type_name].append(pokemon.name)
-        
-        return weaknesses
+        """Analisa fraquezas da equipe (tipo de ataque -> membros afetados)"""
+        return TeamMetrics.from_pokemon(team).weaknesses()
     
     def export_analysis_to_csv(self, analysis: Dict[str, any], filename: str) -> None:
         """Exporta análise para CSV"""
@@ -277,6 +205,8 @@ class DataProcessor:
     
     def get_pokemon_by_name(self, name: str, pokemon_database: List[Pokemon]) -> Optional[Pokemon]:
         """Busca Pokémon por nome"""
+        if isinstance(pokemon_database, PokemonDatabase):
+            return pokemon_database.by_name(name)
         for pokemon in pokemon_database:
             if pokemon.name.lower() == name.lower():
                 return pokemon
@@ -284,11 +214,16 @@ class DataProcessor:
     
     def get_pokemon_by_type(self, pokemon_type: PokemonType, pokemon_database: List[Pokemon]) -> List[Pokemon]:
         """Busca Pokémon por tipo"""
+        if isinstance(pokemon_database, PokemonDatabase):
+            return pokemon_database.by_type(pokemon_type)
         return [pokemon for pokemon in pokemon_database if pokemon.has_type(pokemon_type)]
     
     def get_top_pokemon_by_stat(self, stat: str, pokemon_database: List[Pokemon], top_n: int = 10) -> List[Pokemon]:
         """Retorna top Pokémon por estatística"""
         
+        if isinstance(pokemon_database, PokemonDatabase) and stat in STAT_NAMES + ("total",):
+            return pokemon_database.top_by_stat(stat, top_n)
+        
         stat_values = []
         for pokemon in pokemon_database:
             if hasattr(pokemon.stats, stat):
@@ -0,0 +1,230 @@
+"""
+Avaliadores de População - Avaliação de gerações inteiras em série, threads ou processos
+"""
+
+import copy
+import random
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+from ..core.pokemon import Pokemon, PokemonTeam
+from ..core.elite_four import EliteFour
+from ..core.smart_battle_system import SmartBattleSystem, MoveStrategy
+from ..core.rng import CommonRandomNumbers
+
+
+# Descritor compacto e serializável de uma equipe: ((pokemon_id, nível), ...)
+TeamDescriptor = Tuple[Tuple[int, int], ...]
+
+
+def describe_team(team: PokemonTeam) -> TeamDescriptor:
+    """Descritor (pokemon_id, nível) de cada membro, na ordem da equipe"""
+    return tuple((pokemon.pokemon_id, pokemon.level) for pokemon in team.pokemon)
+
+
+@dataclass
+class EvaluationContext:
+    """Tudo que um worker precisa para reconstruir e avaliar equipes"""
+    species: Dict[int, Pokemon]
+    elite_four: EliteFour
+    strategies: Tuple[MoveStrategy, ...]
+    simulations_per_strategy: int
+    max_turns: int = 100
+    common_random_numbers: bool = False
+    _leveled: Dict[Tuple[int, int], Pokemon] = field(default_factory=dict, repr=False, compare=False)
+
+    def species_at_level(self, pokemon_id: int, level: int) -> Pokemon:
+        """Pokémon compartilhado da espécie no nível pedido
+        
+        As batalhas rodam sobre BattleState e não alteram os Pokémon, então as
+        equipes reaproveitam os mesmos objetos (e os mesmos specs, chaves dos
+        caches de política e de dano). Só um nível diferente gera uma cópia,
+        criada uma vez por (espécie, nível).
+        """
+        pokemon = self.species[pokemon_id]
+        if pokemon.level == level:
+            return pokemon
+        leveled = self._leveled.get((pokemon_id, level))
+        if leveled is None:
+            leveled = copy.deepcopy(pokemon)
+            leveled.level = level
+            leveled = self._leveled.setdefault((pokemon_id, level), leveled)
+        return leveled
+
+    def build_team(self, descriptor: TeamDescriptor) -> PokemonTeam:
+        """Reconstrói uma equipe a partir das espécies do contexto"""
+        return PokemonTeam([self.species_at_level(pokemon_id, level) for pokemon_id, level in descriptor])
+
+
+@dataclass
+class EvaluationTask:
+    """Equipe a avaliar e a semente do seu fluxo aleatório
+    
+    No modo CRN a semente é a mesma para todas as equipes e `first_replicate`
+    indica a partir de qual réplica continuar (refinamento de estimativas).
+    """
+    descriptor: TeamDescriptor
+    seed: int
+    first_replicate: int = 0
+
+
+def simulate_smart_battles(
+    team: PokemonTeam,
+    elite_four: EliteFour,
+    battle_system: SmartBattleSystem,
+    strategies: Sequence[MoveStrategy],
+    simulations_per_strategy: int,
+    crn: Optional[CommonRandomNumbers] = None,
+    first_replicate: int = 0
+) -> Tuple[int, int]:
+    """Simula a equipe com cada estratégia contra cada membro; retorna (vitórias, batalhas)
+    
+    Com `crn`, cada batalha usa o fluxo (membro, estratégia, réplica), o mesmo
+    para qualquer equipe avaliada com o mesmo gerador de números comuns.
+    """
+
+    total_wins = 0
+    total_battles = 0
+    shared_rng = battle_system.rng
+
+    for member_index, member in enumerate(elite_four.get_all_members()):
+        for strategy_index, strategy in enumerate(strategies):
+            for replicate in range(first_replicate, first_replicate + simulations_per_strategy):
+                if crn is not None:
+                    battle_system.rng = crn.stream(member_index, strategy_index, replicate)
+                battle_log = battle_system.battle_teams_smart(
+                    team, member.pokemon_team, strategy, MoveStrategy.BALANCED, turn_sink="none"
+                )
+
+                total_battles += 1
+                if battle_log.battle_result.value == "Win":
+                    total_wins += 1
+
+    battle_system.rng = shared_rng
+    return total_wins, total_battles
+
+
+def evaluate_task(context: EvaluationContext, task: EvaluationTask) -> Tuple[int, int]:
+    """Avalia uma equipe com um gerador dedicado (resultado depende só da semente)"""
+    battle_system = SmartBattleSystem(rng=random.Random(task.seed))
+    battle_system.max_turns = context.max_turns
+    crn = CommonRandomNumbers(task.seed) if context.common_random_numbers else None
+
+    return simulate_smart_battles(
+        context.build_team(task.descriptor),
+        context.elite_four,
+        battle_system,
+        context.strategies,
+        context.simulations_per_strategy,
+        crn=crn,
+        first_replicate=task.first_replicate
+    )
+
+
+class SerialEvaluator:
+    """Avalia as tarefas uma a uma no processo atual"""
+
+    name = "serial"
+
+    def __init__(self, n_workers: int = 1):
+        self.n_workers = 1
+
+    def evaluate(
+        self,
+        context: EvaluationContext,
+        tasks: Sequence[EvaluationTask]
+    ) -> List[Tuple[int, int]]:
+        """Resultados (vitórias, batalhas) na mesma ordem das tarefas"""
+        return [evaluate_task(context, task) for task in tasks]
+
+    def close(self):
+        """Libera recursos do avaliador"""
+        pass
+
+
+class ThreadEvaluator(SerialEvaluator):
+    """Avalia em um pool de threads (o contexto é compartilhado, as batalhas não o alteram)"""
+
+    name = "thread"
+
+    def __init__(self, n_workers: int = 4):
+        self.n_workers = max(1, n_workers)
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def evaluate(
+        self,
+        context: EvaluationContext,
+        tasks: Sequence[EvaluationTask]
+    ) -> List[Tuple[int, int]]:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.n_workers)
+
+        return list(self._executor.map(
+            lambda task: evaluate_task(context, task), tasks
+        ))
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+
+# Contexto do worker de processo (enviado uma vez pelo initializer do pool)
+_worker_context: Optional[EvaluationContext] = None
+
+
+def _init_process_worker(context: EvaluationContext):
+    global _worker_context
+    _worker_context = context
+
+
+def _evaluate_in_worker(task: EvaluationTask) -> Tuple[int, int]:
+    return evaluate_task(_worker_context, task)
+
+
+class ProcessEvaluator(SerialEvaluator):
+    """Avalia em um pool de processos; o contexto é serializado uma vez por pool"""
+
+    name = "process"
+
+    def __init__(self, n_workers: int = 4):
+        self.n_workers = max(1, n_workers)
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._context: Optional[EvaluationContext] = None
+
+    def evaluate(
+        self,
+        context: EvaluationContext,
+        tasks: Sequence[EvaluationTask]
+    ) -> List[Tuple[int, int]]:
+        if self._executor is None or self._context is not context:
+            self.close()
+            self._context = context
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.n_workers,
+                initializer=_init_process_worker,
+                initargs=(context,)
+            )
+
+        chunksize = max(1, len(tasks) // (self.n_workers * 4))
+        return list(self._executor.map(_evaluate_in_worker, tasks, chunksize=chunksize))
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+            self._context = None
+
+
+EVALUATORS = {
+    "serial": SerialEvaluator,
+    "thread": ThreadEvaluator,
+    "process": ProcessEvaluator
+}
+
+
+def make_evaluator(kind: str = "serial", n_workers: int = 1) -> SerialEvaluator:
+    """Cria o avaliador pelo nome ("serial", "thread" ou "process")"""
+    if kind not in EVALUATORS:
+        raise ValueError(f"Avaliador inválido: {kind}")
+    return EVALUATORS[kind](n_workers)
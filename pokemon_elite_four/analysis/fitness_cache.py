@@ -0,0 +1,113 @@
+"""
+Cache de Fitness - Memoização de avaliações de equipes entre gerações
+"""
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Hashable, Optional, Tuple
+from ..core.pokemon import PokemonTeam
+
+
+@dataclass
+class FitnessEntry:
+    """Amostras acumuladas da avaliação de uma equipe"""
+    wins: int
+    battles: int
+    static_score: float  # Termos que não dependem de sorteio (tipos, stats...)
+
+    @property
+    def win_rate(self) -> float:
+        """Taxa de vitória estimada com todas as amostras"""
+        return self.wins / self.battles if self.battles > 0 else 0.0
+
+
+class TeamFitnessCache:
+    """Cache LRU de fitness indexado pela assinatura canônica da equipe
+
+    A assinatura usa os ids das espécies ordenados com seus níveis e a
+    configuração do motor de avaliação, então o mesmo cache pode ser
+    compartilhado por otimizadores diferentes sem colisões. A ordem dos
+    Pokémon na equipe é ignorada por padrão (`order_sensitive=False`).
+    """
+
+    def __init__(self, max_size: int = 10_000, order_sensitive: bool = False):
+        if max_size <= 0:
+            raise ValueError("max_size deve ser positivo")
+        self.max_size = max_size
+        self.order_sensitive = order_sensitive
+        self._entries: "OrderedDict[Hashable, FitnessEntry]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.refinements = 0
+
+    def team_signature(self, team: PokemonTeam, engine_config: Tuple = ()) -> Tuple:
+        """Assinatura canônica: (ids, níveis) dos membros + configuração do motor"""
+        members = tuple((pokemon.pokemon_id, pokemon.level) for pokemon in team.pokemon)
+        if not self.order_sensitive:
+            members = tuple(sorted(members))
+        return members, tuple(engine_config)
+
+    def get(self, signature: Hashable) -> Optional[FitnessEntry]:
+        """Retorna a entrada (marcando como usada recentemente) ou None"""
+        entry = self._entries.get(signature)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self._entries.move_to_end(signature)
+        return entry
+
+    def put(self, signature: Hashable, entry: FitnessEntry) -> FitnessEntry:
+        """Armazena uma entrada, descartando a menos usada se necessário"""
+        self._entries[signature] = entry
+        self._entries.move_to_end(signature)
+
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+        return entry
+
+    def refine(self, signature: Hashable, wins: int, battles: int) -> Optional[FitnessEntry]:
+        """Acrescenta novas amostras a uma entrada existente"""
+        entry = self._entries.get(signature)
+        if entry is None:
+            return None
+
+        entry.wins += wins
+        entry.battles += battles
+        self.refinements += 1
+        return entry
+
+    def clear(self):
+        """Remove todas as entradas e zera os contadores"""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.refinements = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fração de consultas atendidas pelo cache"""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups > 0 else 0.0
+
+    def stats(self) -> Dict[str, float]:
+        """Contadores de uso do cache"""
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hit_rate,
+            "evictions": self.evictions,
+            "refinements": self.refinements
+        }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, signature: Hashable) -> bool:
+        return signature in self._entries
@@ -0,0 +1,347 @@
+"""
+Atlas de Confrontos - Probabilidades de vitória 1x1 pré-calculadas e salvas em disco
+Cada célula (espécie@nível, oponente@nível) guarda probabilidade de vitória,
+turnos esperados e dano esperado em arrays mapeados em memória (.npy).
+"""
+
+import copy
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+import numpy as np
+from ..core.pokemon import Pokemon, PokemonTeam
+from ..core.battle_system import ENGINE_VERSION
+from ..core.elite_four import EliteFour
+from ..core.rng import derive_seed
+from ..core.vectorized_battle import (
+    VectorizedBattleEngine, CompiledTeam, compile_pokemon, build_matchup_tables, _damaging_moves
+)
+from ..core.exact_solver import ExactDuelSolver
+
+
+# Versão do formato dos arquivos do atlas
+ATLAS_FORMAT_VERSION = 1
+
+# "monte_carlo": motor vetorizado com `samples` batalhas por célula;
+# "exact": programação dinâmica sobre estados de HP (sem ruído)
+ATLAS_METHODS = ("monte_carlo", "exact")
+
+METRICS = ("win_probability", "expected_turns", "expected_damage", "expected_damage_taken")
+
+# Chave de consulta de um Pokémon no atlas
+MatchupKey = Tuple[int, int]
+
+
+def matchup_key(pokemon: Pokemon) -> MatchupKey:
+    """Chave (pokemon_id, nível) usada nas consultas"""
+    return pokemon.pokemon_id, pokemon.level
+
+
+def pokemon_fingerprint(pokemon: Pokemon) -> str:
+    """Impressão digital de tudo que afeta um confronto (stats, tipos, nível, movimentos)"""
+    moves = tuple(
+        (move.name, move.type_index, move.category.value, move.power, move.accuracy)
+        for move in _damaging_moves(pokemon)
+    )
+    data = (
+        pokemon.pokemon_id, pokemon.name, pokemon.level, pokemon.type_indices,
+        tuple(getattr(pokemon.stats, name) for name in ("hp", "attack", "defense", "sp_attack", "sp_defense", "speed")),
+        moves
+    )
+    return hashlib.sha256(repr(data).encode("utf-8")).hexdigest()
+
+
+def _unique_by_key(pokemon_list: Sequence[Pokemon]) -> List[Pokemon]:
+    """Remove repetições de (id, nível), mantendo a primeira ocorrência"""
+    unique = {}
+    for pokemon in pokemon_list:
+        unique.setdefault(matchup_key(pokemon), pokemon)
+    return list(unique.values())
+
+
+# Estado do worker (enviado uma vez pelo initializer do pool)
+_worker_state = None
+
+
+def _init_atlas_worker(species: CompiledTeam, opponents: CompiledTeam, max_turns: int):
+    global _worker_state
+    tables = (build_matchup_tables(species, opponents), build_matchup_tables(opponents, species))
+    _worker_state = (species, opponents, tables, max_turns)
+
+
+def _compute_row(task: Tuple[int, np.ndarray, int, int]) -> Tuple[int, np.ndarray, np.ndarray]:
+    """Simula uma linha do atlas (uma espécie contra as colunas pedidas)"""
+    row, columns, seed, samples = task
+    species, opponents, tables, max_turns = _worker_state
+
+    if samples == 0:
+        return _solve_row(row, columns)
+
+    engine = VectorizedBattleEngine(max_turns=max_turns, rng=np.random.default_rng(seed))
+    results = engine.run_duels(
+        species, opponents,
+        np.full(columns.size * samples, row, dtype=np.intp),
+        np.repeat(columns, samples),
+        tables
+    )
+
+    values = np.stack([
+        results["won"].reshape(columns.size, samples).mean(axis=1),
+        results["turns"].reshape(columns.size, samples).mean(axis=1),
+        results["damage_dealt"].reshape(columns.size, samples).mean(axis=1),
+        results["damage_taken"].reshape(columns.size, samples).mean(axis=1)
+    ])
+    return row, columns, values
+
+
+def _solve_row(row: int, columns: np.ndarray) -> Tuple[int, np.ndarray, np.ndarray]:
+    """Resolve uma linha do atlas com o solucionador exato"""
+    species, opponents, tables, max_turns = _worker_state
+    solver = ExactDuelSolver(max_turns=max_turns)
+
+    values = np.empty((len(METRICS), columns.size))
+    for k, col in enumerate(columns):
+        solution = solver.solve_tables(
+            tables[0], tables[1], row, col,
+            species.max_hp[row], opponents.max_hp[col],
+            species.max_hp[row], opponents.max_hp[col],
+            species.speed[row] >= opponents.speed[col]
+        )
+        values[:, k] = (
+            solution.win_probability,
+            solution.expected_turns,
+            solution.expected_damage_dealt,
+            solution.expected_damage_taken
+        )
+    return row, columns, values
+
+
+class MatchupAtlas:
+    """Atlas de confrontos 1x1 com cache em disco e reconstrução incremental"""
+
+    def __init__(
+        self,
+        cache_dir: str = "output/.cache/matchup_atlas",
+        samples: int = 1000,
+        seed: int = 0,
+        n_workers: int = 1,
+        max_turns: int = 100,
+        method: str = "monte_carlo"
+    ):
+        if method not in ATLAS_METHODS:
+            raise ValueError(f"Método de cálculo inválido: {method}")
+        self.cache_dir = Path(cache_dir)
+        self.method = method
+        # O método exato não usa amostras (0 = sem amostragem)
+        self.samples = samples if method == "monte_carlo" else 0
+        self.seed = seed
+        self.n_workers = max(1, n_workers)
+        self.max_turns = max_turns
+
+        self.row_index: Dict[MatchupKey, int] = {}
+        self.col_index: Dict[MatchupKey, int] = {}
+        self.arrays: Dict[str, np.ndarray] = {}
+        self.build_stats: Dict[str, float] = {}
+
+    # ------------------------------------------------------------------
+    # Construção
+    # ------------------------------------------------------------------
+
+    def _settings(self) -> Dict[str, int]:
+        """Parâmetros que, se mudarem, invalidam todo o atlas"""
+        return {
+            "format_version": ATLAS_FORMAT_VERSION,
+            "engine_version": ENGINE_VERSION,
+            "method": self.method,
+            "samples": self.samples,
+            "seed": self.seed,
+            "max_turns": self.max_turns
+        }
+
+    def _read_manifest(self) -> Optional[Dict]:
+        manifest_path = self.cache_dir / "manifest.json"
+        if not manifest_path.exists():
+            return None
+        with open(manifest_path, encoding="utf-8") as f:
+            return json.load(f)
+
+    def build(self, species: Sequence[Pokemon], opponents: Sequence[Pokemon]) -> "MatchupAtlas":
+        """Carrega o atlas do disco, recalculando só as células que mudaram"""
+
+        start_time = time.perf_counter()
+        species = _unique_by_key(species)
+        opponents = _unique_by_key(opponents)
+
+        row_keys = [pokemon_fingerprint(p) for p in species]
+        col_keys = [pokemon_fingerprint(p) for p in opponents]
+        data_hash = hashlib.sha256("|".join(row_keys + ["/"] + col_keys).encode("utf-8")).hexdigest()
+
+        manifest = self._read_manifest()
+        settings = self._settings()
+        reusable = manifest is not None and manifest["settings"] == settings
+
+        self.row_index = {matchup_key(p): i for i, p in enumerate(species)}
+        self.col_index = {matchup_key(p): j for j, p in enumerate(opponents)}
+
+        if reusable and manifest["data_hash"] == data_hash:
+            self._open_arrays()
+            self.build_stats = {
+                "computed_pairs": 0,
+                "reused_pairs": len(species) * len(opponents),
+                "seconds": time.perf_counter() - start_time
+            }
+            return self
+
+        shape = (len(species), len(opponents))
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        new_arrays = {
+            name: np.lib.format.open_memmap(
+                self.cache_dir / f"{name}.tmp.npy", mode="w+", dtype=np.float64, shape=shape
+            )
+            for name in METRICS
+        }
+        missing = np.ones(shape, dtype=bool)
+
+        # Reaproveita células cujas duas impressões digitais não mudaram
+        if reusable:
+            old_rows = {key: i for i, key in enumerate(manifest["row_keys"])}
+            old_cols = {key: j for j, key in enumerate(manifest["col_keys"])}
+            row_map = np.array([old_rows.get(key, -1) for key in row_keys], dtype=np.intp)
+            col_map = np.array([old_cols.get(key, -1) for key in col_keys], dtype=np.intp)
+            rows = np.flatnonzero(row_map >= 0)
+            cols = np.flatnonzero(col_map >= 0)
+
+            if rows.size and cols.size:
+                for name in METRICS:
+                    old = np.load(self.cache_dir / f"{name}.npy", mmap_mode="r")
+                    new_arrays[name][np.ix_(rows, cols)] = old[np.ix_(row_map[rows], col_map[cols])]
+                missing[np.ix_(rows, cols)] = False
+
+        self._compute_missing(species, opponents, row_keys, missing, new_arrays)
+
+        for array in new_arrays.values():
+            array.flush()
+        new_arrays.clear()
+        # Sem manifesto, um build interrompido nunca é tomado como válido
+        (self.cache_dir / "manifest.json").unlink(missing_ok=True)
+        for name in METRICS:
+            os.replace(self.cache_dir / f"{name}.tmp.npy", self.cache_dir / f"{name}.npy")
+
+        # O manifesto é gravado por último: só descreve arquivos completos
+        with open(self.cache_dir / "manifest.json", "w", encoding="utf-8") as f:
+            json.dump({
+                "settings": settings,
+                "data_hash": data_hash,
+                "row_keys": row_keys,
+                "col_keys": col_keys,
+                "rows": [list(matchup_key(p)) + [p.name] for p in species],
+                "cols": [list(matchup_key(p)) + [p.name] for p in opponents]
+            }, f)
+
+        self._open_arrays()
+        computed = int(missing.sum())
+        self.build_stats = {
+            "computed_pairs": computed,
+            "reused_pairs": missing.size - computed,
+            "seconds": time.perf_counter() - start_time
+        }
+        return self
+
+    def _compute_missing(
+        self,
+        species: List[Pokemon],
+        opponents: List[Pokemon],
+        row_keys: List[str],
+        missing: np.ndarray,
+        arrays: Dict[str, np.ndarray]
+    ):
+        """Simula as células pendentes, uma tarefa por linha"""
+
+        tasks = []
+        for row in np.flatnonzero(missing.any(axis=1)):
+            # Semente ligada à espécie (não à posição) para reconstruções estáveis
+            seed = derive_seed(self.seed, int(row_keys[row][:15], 16))
+            tasks.append((int(row), np.flatnonzero(missing[row]), seed, self.samples))
+
+        if not tasks:
+            return
+
+        compiled = (compile_pokemon(species), compile_pokemon(opponents), self.max_turns)
+
+        if self.n_workers == 1:
+            _init_atlas_worker(*compiled)
+            results = map(_compute_row, tasks)
+            self._store_rows(results, arrays)
+            return
+
+        with ProcessPoolExecutor(
+            max_workers=self.n_workers,
+            initializer=_init_atlas_worker,
+            initargs=compiled
+        ) as executor:
+            self._store_rows(executor.map(_compute_row, tasks), arrays)
+
+    def _store_rows(self, results, arrays: Dict[str, np.ndarray]):
+        for row, columns, values in results:
+            for name, metric_values in zip(METRICS, values):
+                arrays[name][row, columns] = metric_values
+
+    def _open_arrays(self):
+        self.arrays = {
+            name: np.load(self.cache_dir / f"{name}.npy", mmap_mode="r")
+            for name in METRICS
+        }
+
+    # ------------------------------------------------------------------
+    # Consultas O(1)
+    # ------------------------------------------------------------------
+
+    def has(self, pokemon: Pokemon, opponent: Pokemon) -> bool:
+        """Verifica se o confronto está no atlas"""
+        return matchup_key(pokemon) in self.row_index and matchup_key(opponent) in self.col_index
+
+    def lookup(self, pokemon: Pokemon, opponent: Pokemon) -> Dict[str, float]:
+        """Todas as métricas de um confronto"""
+        row = self.row_index[matchup_key(pokemon)]
+        col = self.col_index[matchup_key(opponent)]
+        return {name: float(self.arrays[name][row, col]) for name in METRICS}
+
+    def win_probability(self, pokemon: Pokemon, opponent: Pokemon) -> float:
+        """Probabilidade de `pokemon` vencer `opponent` no 1x1"""
+        return float(self.arrays["win_probability"][
+            self.row_index[matchup_key(pokemon)], self.col_index[matchup_key(opponent)]
+        ])
+
+    def screen_team(self, team: PokemonTeam, opponent_team: PokemonTeam) -> float:
+        """Triagem rápida: média das probabilidades 1x1 entre os membros das equipes"""
+        rows = [self.row_index[matchup_key(p)] for p in team.pokemon]
+        cols = [self.col_index[matchup_key(p)] for p in opponent_team.pokemon]
+        return float(self.arrays["win_probability"][np.ix_(rows, cols)].mean())
+
+
+def build_elite_four_atlas(
+    pokemon_database: Sequence[Pokemon],
+    elite_four: Optional[EliteFour] = None,
+    level: int = 60,
+    **atlas_options
+) -> MatchupAtlas:
+    """Atlas das espécies no nível dado contra elas mesmas e os times da Elite Four"""
+
+    species = []
+    for pokemon in pokemon_database:
+        species_copy = copy.deepcopy(pokemon)
+        species_copy.level = level
+        species_copy.restore_full_health()
+        species.append(species_copy)
+
+    # Pokémon da Elite Four primeiro: na mesma chave (id, nível), vale o moveset do treinador
+    elite_four = elite_four or EliteFour()
+    opponents = [
+        pokemon for member in elite_four.get_all_members() for pokemon in member.pokemon_team.pokemon
+    ] + species
+
+    return MatchupAtlas(**atlas_options).build(species, opponents)
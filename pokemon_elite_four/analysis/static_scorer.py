@@ -0,0 +1,208 @@
+"""
+Pontuação Estática em Lote - Termos do fitness avançado para a população inteira
+
+Cada espécie vira uma linha de features (bitmasks de tipos e de movimentos,
+stats base, contagens de resistências/fraquezas contra a Elite Four); uma
+população vira uma matriz P x 6 de linhas e os quatro termos estáticos de
+AdvancedTeamOptimizer saem de operações sobre arrays, com os mesmos valores
+dos métodos por equipe.
+"""
+
+from typing import Dict, List, Sequence
+import numpy as np
+from ..core.pokemon import Pokemon, PokemonTeam, PokemonType, NUM_TYPES, type_index
+from ..core.moves import MoveCategory
+
+
+# Tipos que rendem bônus de cobertura
+IMPORTANT_TYPES = frozenset({
+    PokemonType.WATER, PokemonType.FIRE, PokemonType.GRASS,
+    PokemonType.ELECTRIC, PokemonType.PSYCHIC, PokemonType.DRAGON,
+    PokemonType.GROUND, PokemonType.FLYING, PokemonType.ICE
+})
+
+# Tipos comuns da Elite Four
+ELITE_FOUR_TYPES = frozenset({
+    PokemonType.ICE, PokemonType.FIGHTING, PokemonType.GHOST,
+    PokemonType.DRAGON, PokemonType.PSYCHIC, PokemonType.NORMAL
+})
+
+# Tabelas simplificadas: tipo de ataque -> tipos de defensor resistentes/fracos
+RESISTANCES = {
+    PokemonType.WATER: (PokemonType.WATER, PokemonType.GRASS, PokemonType.DRAGON),
+    PokemonType.FIRE: (PokemonType.FIRE, PokemonType.WATER, PokemonType.DRAGON),
+    PokemonType.ELECTRIC: (PokemonType.ELECTRIC, PokemonType.GRASS, PokemonType.DRAGON),
+    PokemonType.PSYCHIC: (PokemonType.PSYCHIC, PokemonType.DARK),
+    PokemonType.DRAGON: (PokemonType.STEEL,),
+    PokemonType.ICE: (PokemonType.ICE, PokemonType.WATER, PokemonType.STEEL)
+}
+
+WEAKNESSES = {
+    PokemonType.WATER: (PokemonType.FIRE, PokemonType.GROUND, PokemonType.ROCK),
+    PokemonType.FIRE: (PokemonType.GRASS, PokemonType.ICE, PokemonType.BUG, PokemonType.STEEL),
+    PokemonType.ELECTRIC: (PokemonType.WATER, PokemonType.FLYING),
+    PokemonType.PSYCHIC: (PokemonType.FIGHTING, PokemonType.POISON),
+    PokemonType.DRAGON: (PokemonType.DRAGON,),
+    PokemonType.ICE: (PokemonType.GRASS, PokemonType.GROUND, PokemonType.FLYING, PokemonType.DRAGON)
+}
+
+# Pesos dos termos estáticos no fitness avançado
+STATIC_WEIGHTS = {"type": 0.20, "balance": 0.15, "strategy": 0.10, "resistance": 0.05}
+
+_CATEGORY_BIT = {category: 1 << i for i, category in enumerate(MoveCategory)}
+_IMPORTANT_MASK = sum(1 << type_index(t) for t in IMPORTANT_TYPES)
+_MASK_BITS = NUM_TYPES + 1  # Inclui a posição de tipos desconhecidos
+
+
+def is_resistant(pokemon: Pokemon, attack_type: PokemonType) -> bool:
+    """Verifica se o Pokémon é resistente ao tipo de ataque (tabela simplificada)"""
+    defenders = RESISTANCES.get(attack_type)
+    return defenders is not None and (pokemon.type1 in defenders or pokemon.type2 in defenders)
+
+
+def is_weak(pokemon: Pokemon, attack_type: PokemonType) -> bool:
+    """Verifica se o Pokémon é fraco ao tipo de ataque (tabela simplificada)"""
+    defenders = WEAKNESSES.get(attack_type)
+    return defenders is not None and (pokemon.type1 in defenders or pokemon.type2 in defenders)
+
+
+def _popcount(masks: np.ndarray) -> np.ndarray:
+    """Número de bits ligados em cada elemento"""
+    counts = np.zeros(masks.shape, dtype=np.int64)
+    for bit in range(_MASK_BITS):
+        counts += (masks >> bit) & 1
+    return counts
+
+
+class StaticScorer:
+    """Tabela de features por espécie e pontuação vetorizada de populações
+
+    As linhas são registradas pela identidade do objeto Pokémon (os do GA
+    vêm da base de dados); o nível não afeta nenhum termo. Se os tipos,
+    stats ou movimentos de um Pokémon forem alterados depois de registrado,
+    crie um novo scorer.
+    """
+
+    def __init__(self, pokemon: Sequence[Pokemon] = ()):
+        self._rows: Dict[int, int] = {}
+        self._members: List[Pokemon] = []
+        self._features: List[tuple] = []
+        self._arrays = None
+        for member in pokemon:
+            self.row_of(member)
+
+    def __len__(self) -> int:
+        return len(self._members)
+
+    def row_of(self, pokemon: Pokemon) -> int:
+        """Linha da espécie (registra na primeira consulta)"""
+        row = self._rows.get(id(pokemon))
+        if row is None:
+            row = self._rows[id(pokemon)] = len(self._members)
+            self._members.append(pokemon)
+            self._features.append(self._extract(pokemon))
+            self._arrays = None
+        return row
+
+    @staticmethod
+    def _extract(pokemon: Pokemon) -> tuple:
+        type_mask = 1 << type_index(pokemon.type1)
+        if pokemon.type2:
+            type_mask |= 1 << type_index(pokemon.type2)
+
+        move_type_mask = category_mask = 0
+        if pokemon.move_set:
+            for move in pokemon.move_set.moves:
+                move_type_mask |= 1 << type_index(move.move_type)
+                category_mask |= _CATEGORY_BIT[move.category]
+
+        resistances = weaknesses = 0
+        for elite_type in ELITE_FOUR_TYPES:
+            if is_resistant(pokemon, elite_type):
+                resistances += 1
+            elif is_weak(pokemon, elite_type):
+                weaknesses += 1
+
+        stats = pokemon.stats
+        base_stats = (stats.hp, stats.attack, stats.defense, stats.sp_attack, stats.sp_defense, stats.speed)
+        return type_mask, move_type_mask, category_mask, resistances, weaknesses, base_stats
+
+    def _feature_arrays(self) -> Dict[str, np.ndarray]:
+        if self._arrays is None:
+            columns = list(zip(*self._features)) if self._features else [()] * 6
+            self._arrays = {
+                "type_mask": np.array(columns[0], dtype=np.int64),
+                "move_type_mask": np.array(columns[1], dtype=np.int64),
+                "category_mask": np.array(columns[2], dtype=np.int64),
+                "resistances": np.array(columns[3], dtype=np.int64),
+                "weaknesses": np.array(columns[4], dtype=np.int64),
+                "base_stats": np.array(columns[5], dtype=np.float64).reshape(-1, 6),
+            }
+        return self._arrays
+
+    def team_rows(self, teams: Sequence[PokemonTeam]) -> np.ndarray:
+        """Matriz P x k de linhas (todas as equipes com o mesmo tamanho k)"""
+        return np.array([[self.row_of(p) for p in team.pokemon] for team in teams], dtype=np.intp)
+
+    def terms(self, rows: np.ndarray) -> Dict[str, np.ndarray]:
+        """Os quatro termos (sem pesos) para uma matriz P x k de linhas"""
+        rows = np.asarray(rows, dtype=np.intp)
+        population = rows.shape[0]
+        if rows.shape[1] == 0:
+            zeros = np.zeros(population)
+            return {"type": zeros, "balance": zeros, "strategy": zeros, "resistance": zeros}
+
+        features = self._feature_arrays()
+
+        # Cobertura de tipos
+        type_mask = np.bitwise_or.reduce(features["type_mask"][rows], axis=1)
+        type_diversity = _popcount(type_mask) / 18  # 18 tipos possíveis
+        important_coverage = _popcount(type_mask & _IMPORTANT_MASK) / len(IMPORTANT_TYPES)
+        type_score = (type_diversity * 0.6) + (important_coverage * 0.4)
+
+        # Balanceamento: média dos coeficientes de variação das 6 stats base
+        values = features["base_stats"][rows]  # P x k x 6
+        means = values.mean(axis=1)
+        stds = values.std(axis=1)
+        cvs = np.divide(stds, means, out=np.ones_like(stds), where=means != 0)
+        balance_score = np.maximum(0, 1 - cvs.mean(axis=1))
+
+        # Diversidade de movimentos
+        move_types = np.bitwise_or.reduce(features["move_type_mask"][rows], axis=1)
+        categories = np.bitwise_or.reduce(features["category_mask"][rows], axis=1)
+        strategy_score = (_popcount(move_types) / 18 + _popcount(categories) / 3) / 2
+
+        # Resistências x fraquezas contra os tipos da Elite Four
+        resistances = features["resistances"][rows].sum(axis=1)
+        total = resistances + features["weaknesses"][rows].sum(axis=1)
+        resistance_score = np.divide(
+            resistances, total, out=np.full(population, 0.5), where=total != 0
+        )
+
+        return {
+            "type": type_score,
+            "balance": balance_score,
+            "strategy": strategy_score,
+            "resistance": resistance_score,
+        }
+
+    def score_rows(self, rows: np.ndarray) -> np.ndarray:
+        """Score estático ponderado (vetor de tamanho P)"""
+        terms = self.terms(rows)
+        return (
+            terms["type"] * STATIC_WEIGHTS["type"] +
+            terms["balance"] * STATIC_WEIGHTS["balance"] +
+            terms["strategy"] * STATIC_WEIGHTS["strategy"] +
+            terms["resistance"] * STATIC_WEIGHTS["resistance"]
+        )
+
+    def score_teams(self, teams: Sequence[PokemonTeam]) -> np.ndarray:
+        """Score estático de cada equipe (agrupa por tamanho de equipe)"""
+        scores = np.zeros(len(teams))
+        by_size: Dict[int, List[int]] = {}
+        for index, team in enumerate(teams):
+            by_size.setdefault(len(team.pokemon), []).append(index)
+
+        for indices in by_size.values():
+            scores[indices] = self.score_rows(self.team_rows([teams[i] for i in indices]))
+        return scores
@@ -0,0 +1,305 @@
+"""
+Modelo Substituto - Pré-triagem dos filhos do GA por fitness previsto
+
+Um regressor treinado online com as equipes já simuladas prevê o fitness
+dos filhos novos; só a fração mais promissora vai à simulação e as demais
+ficam com o valor previsto. As features de cada espécie (stats base, tipos
+e efetividades contra cada membro da Elite Four) são calculadas uma vez e
+agregadas por equipe com operações sobre arrays.
+
+O scikit-learn (árvores extremamente aleatórias ou floresta aleatória) é
+importado só no primeiro treino; sem ele, o modelo cai para uma regressão
+ridge em NumPy.
+"""
+
+import math
+from dataclasses import dataclass
+from typing import Dict, Hashable, List, Optional, Sequence, Set, Tuple
+import numpy as np
+from ..core.pokemon import Pokemon, PokemonTeam, NUM_TYPES
+from ..core.battle_system import TypeEffectiveness
+
+SURROGATE_MODELS = ("random_forest", "extra_trees", "ridge")
+
+
+@dataclass(frozen=True)
+class SurrogateConfig:
+    """Pré-triagem por modelo substituto
+
+    simulate_fraction: fração dos filhos novos (pelo fitness previsto) que é simulada
+    min_samples: equipes simuladas antes de a triagem começar
+    model: "random_forest"/"extra_trees" (scikit-learn) ou "ridge" (NumPy)
+    n_estimators: árvores do conjunto
+    """
+    simulate_fraction: float = 0.3
+    min_samples: int = 30
+    model: str = "random_forest"
+    n_estimators: int = 30
+
+    def __post_init__(self):
+        if not 0 < self.simulate_fraction <= 1:
+            raise ValueError(f"Fração simulada inválida: {self.simulate_fraction}")
+        if self.min_samples < 2:
+            raise ValueError(f"Mínimo de amostras inválido: {self.min_samples}")
+        if self.model not in SURROGATE_MODELS:
+            raise ValueError(f"Modelo substituto inválido: {self.model}")
+
+
+class TeamFeaturizer:
+    """Features por espécie (registradas pela identidade) e por equipe
+
+    Por espécie: as 6 stats base, a máscara de tipos e, para cada oponente,
+    a melhor efetividade ofensiva média e a pior ameaça sofrida média.
+    Por equipe: média e máximo das stats, contagem de tipos e média/máximo
+    (ofensa) e média/mínimo (ameaça) contra cada oponente.
+    """
+
+    def __init__(self, opponents: Sequence[PokemonTeam]):
+        self.opponents = [
+            [(pokemon.type_indices, [move.type_index for move in pokemon.spec.moves]) for pokemon in team.pokemon]
+            for team in opponents
+        ]
+        self._rows: Dict[int, int] = {}
+        self._members: List[Pokemon] = []
+        self._features: List[np.ndarray] = []
+        self._array: Optional[np.ndarray] = None
+
+    def row_of(self, pokemon: Pokemon) -> int:
+        row = self._rows.get(id(pokemon))
+        if row is None:
+            row = self._rows[id(pokemon)] = len(self._members)
+            self._members.append(pokemon)
+            self._features.append(self._extract(pokemon))
+            self._array = None
+        return row
+
+    def _extract(self, pokemon: Pokemon) -> np.ndarray:
+        stats = pokemon.stats
+        base_stats = [stats.hp, stats.attack, stats.defense, stats.sp_attack, stats.sp_defense, stats.speed]
+
+        type_mask = [0.0] * NUM_TYPES
+        for index in pokemon.type_indices:
+            if index < NUM_TYPES:
+                type_mask[index] = 1.0
+
+        move_types = [move.type_index for move in pokemon.spec.moves]
+        matchups = []
+        for team in self.opponents:
+            offense = threat = 0.0
+            for opponent_types, opponent_moves in team:
+                offense += max(
+                    (TypeEffectiveness.get_effectiveness_by_index(move_type, *opponent_types)
+                     for move_type in move_types),
+                    default=0.0
+                )
+                threat += max(
+                    (TypeEffectiveness.get_effectiveness_by_index(move_type, *pokemon.type_indices)
+                     for move_type in opponent_moves),
+                    default=0.0
+                )
+            size = max(len(team), 1)
+            matchups.extend((offense / size, threat / size))
+
+        return np.array(base_stats + type_mask + matchups, dtype=np.float64)
+
+    def species_array(self) -> np.ndarray:
+        if self._array is None:
+            self._array = np.vstack(self._features) if self._features else np.zeros((0, 0))
+        return self._array
+
+    def transform(self, teams: Sequence[PokemonTeam]) -> np.ndarray:
+        """Matriz P x F de features das equipes (todas com o mesmo tamanho)"""
+        rows = np.array([[self.row_of(pokemon) for pokemon in team.pokemon] for team in teams], dtype=np.intp)
+        values = self.species_array()[rows]  # P x k x F
+
+        stats = values[:, :, :6]
+        types = values[:, :, 6:6 + NUM_TYPES]
+        offense = values[:, :, 6 + NUM_TYPES::2]
+        threat = values[:, :, 7 + NUM_TYPES::2]
+        return np.hstack([
+            stats.mean(axis=1), stats.max(axis=1),
+            types.sum(axis=1),
+            offense.mean(axis=1), offense.max(axis=1),
+            threat.mean(axis=1), threat.min(axis=1)
+        ])
+
+
+class RidgeModel:
+    """Regressão ridge com features padronizadas (substituto sem scikit-learn)"""
+
+    def __init__(self, alpha: float = 1.0):
+        self.alpha = alpha
+        self.mean = self.scale = self.coef = None
+        self.intercept = 0.0
+
+    def fit(self, X: np.ndarray, y: np.ndarray) -> "RidgeModel":
+        self.mean = X.mean(axis=0)
+        self.scale = X.std(axis=0)
+        self.scale[self.scale == 0] = 1.0
+        Z = (X - self.mean) / self.scale
+        self.intercept = float(y.mean())
+        self.coef = np.linalg.solve(Z.T @ Z + self.alpha * np.eye(Z.shape[1]), Z.T @ (y - self.intercept))
+        return self
+
+    def predict(self, X: np.ndarray) -> np.ndarray:
+        return ((X - self.mean) / self.scale) @ self.coef + self.intercept
+
+
+def _make_model(config: SurrogateConfig, seed: int):
+    """Regressor do modelo escolhido (ridge se o scikit-learn não estiver instalado)"""
+    if config.model == "ridge":
+        return RidgeModel()
+    try:
+        from sklearn.ensemble import ExtraTreesRegressor, RandomForestRegressor
+    except ImportError:  # pragma: no cover - scikit-learn é opcional
+        return RidgeModel()
+    estimator = ExtraTreesRegressor if config.model == "extra_trees" else RandomForestRegressor
+    return estimator(n_estimators=config.n_estimators, min_samples_leaf=2, random_state=seed)
+
+
+def _ranks(values: np.ndarray) -> np.ndarray:
+    ranks = np.empty(len(values))
+    ranks[np.argsort(values, kind="stable")] = np.arange(len(values))
+    return ranks
+
+
+class FitnessSurrogate:
+    """Regressor online do fitness com triagem e medidas de acerto
+
+    `observe` acumula as equipes simuladas (e, se houver, compara com o que
+    foi previsto para elas); `fit` retreina com tudo o que foi observado;
+    `screen` escolhe quais filhos simular. Os otimizadores usam
+    `screen_candidates`/`observe_skipped`, que mantêm a economia por equipe
+    (cada chave pulada conta uma vez).
+    """
+
+    def __init__(self, config: SurrogateConfig, opponents: Sequence[PokemonTeam], seed: int = 0):
+        self.config = config
+        self.seed = seed
+        self.featurizer = TeamFeaturizer(opponents)
+        self.model = None
+        self._X: List[np.ndarray] = []
+        self._y: List[float] = []
+        self._errors: List[float] = []
+        # (previsto, real) de cada geração, para a correlação de postos
+        self._pairs: List[Tuple[np.ndarray, np.ndarray]] = []
+        self.generations_screened = 0
+        self.teams_simulated = 0
+        self.teams_skipped = 0
+        self.simulations_saved = 0
+        self._skipped: Set[Hashable] = set()  # Chaves com fitness previsto contadas na economia
+
+    @property
+    def samples(self) -> int:
+        return len(self._y)
+
+    @property
+    def ready(self) -> bool:
+        return self.model is not None and self.samples >= self.config.min_samples
+
+    def observe(
+        self,
+        teams: Sequence[PokemonTeam],
+        fitness: Sequence[float],
+        predictions: Optional[Sequence[float]] = None
+    ) -> None:
+        """Acrescenta equipes simuladas ao treino"""
+        if not teams:
+            return
+        self._X.extend(self.featurizer.transform(teams))
+        self._y.extend(float(value) for value in fitness)
+        self.teams_simulated += len(teams)
+        if predictions is not None:
+            self._errors.extend(abs(float(p) - float(f)) for p, f in zip(predictions, fitness))
+            self._pairs.append((np.asarray(predictions, dtype=np.float64), np.asarray(fitness, dtype=np.float64)))
+
+    def fit(self) -> None:
+        """Retreina com todas as amostras (nada a fazer abaixo do mínimo)"""
+        if self.samples < self.config.min_samples:
+            return
+        self.model = _make_model(self.config, self.seed)
+        self.model.fit(np.vstack(self._X), np.array(self._y))
+
+    def predict(self, teams: Sequence[PokemonTeam]) -> np.ndarray:
+        return np.asarray(self.model.predict(self.featurizer.transform(teams)), dtype=np.float64)
+
+    def screen(self, teams: Sequence[PokemonTeam], battles_per_team: int) -> Tuple[List[int], np.ndarray]:
+        """(índices a simular, previsões de todas as equipes)
+
+        Simula as ceil(fração * n) de maior fitness previsto; as outras
+        contam como simulações economizadas.
+        """
+        predictions = self.predict(teams)
+        keep = max(1, math.ceil(self.config.simulate_fraction * len(teams)))
+        order = np.argsort(-predictions, kind="stable")
+        selected = sorted(order[:keep].tolist())
+
+        skipped = len(teams) - len(selected)
+        self.generations_screened += 1
+        self.teams_skipped += skipped
+        self.simulations_saved += skipped * battles_per_team
+        return selected, predictions
+
+    def screen_candidates(
+        self,
+        candidates: Dict[Hashable, PokemonTeam],
+        battles_per_team: int
+    ) -> Tuple[Dict[Hashable, float], Optional[List[float]]]:
+        """Triagem das equipes fora do cache de uma geração (chave -> equipe)
+        
+        Retorna (chave -> fitness previsto das puladas, previsões das
+        simuladas na ordem de `candidates`; None antes de o modelo ficar
+        pronto). Uma chave pulada antes que volta à triagem sai da economia
+        já contada; se for pulada de novo, a triagem a conta outra vez.
+        """
+        predicted = {}
+        simulated_predictions = None
+        if self.ready and candidates:
+            selected, predictions = self.screen(list(candidates.values()), battles_per_team)
+            selected_set = set(selected)
+            predicted = {
+                key: float(prediction)
+                for index, (key, prediction) in enumerate(zip(candidates, predictions))
+                if index not in selected_set
+            }
+            simulated_predictions = [predictions[index] for index in selected]
+        
+        self._settle(self._skipped.intersection(candidates), battles_per_team)
+        self._skipped.update(predicted)
+        return predicted, simulated_predictions
+    
+    def observe_skipped(
+        self,
+        key: Hashable,
+        team: PokemonTeam,
+        fitness: float,
+        prediction: float,
+        battles_per_team: int
+    ) -> None:
+        """Equipe pulada que acabou simulada: entra no treino e sai da economia"""
+        self.observe([team], [fitness], [prediction])
+        self._settle(self._skipped.intersection((key,)), battles_per_team)
+    
+    def _settle(self, keys: Set[Hashable], battles_per_team: int) -> None:
+        """Retira da economia as chaves puladas que voltaram à triagem ou foram simuladas"""
+        if keys:
+            self.teams_skipped -= len(keys)
+            self.simulations_saved -= len(keys) * battles_per_team
+            self._skipped -= keys
+
+    def stats(self) -> Dict[str, float]:
+        """Acerto das previsões (nas equipes que foram simuladas) e economia"""
+        correlations = [
+            float(np.corrcoef(_ranks(predicted), _ranks(actual))[0, 1])
+            for predicted, actual in self._pairs
+            if len(actual) > 2 and np.ptp(predicted) > 0 and np.ptp(actual) > 0
+        ]
+        return {
+            "samples": self.samples,
+            "generations_screened": self.generations_screened,
+            "teams_simulated": self.teams_simulated,
+            "teams_skipped": self.teams_skipped,
+            "simulations_saved": self.simulations_saved,
+            "mae": float(np.mean(self._errors)) if self._errors else float("nan"),
+            "rank_correlation": float(np.mean(correlations)) if correlations else float("nan"),
+        }
@@ -0,0 +1,182 @@
+"""
+Métricas de Equipe - Vetores por espécie e bitmasks de fraquezas/resistências
+
+Cada combinação (stats base, nível, tipos) é analisada uma única vez; a
+análise de uma equipe vira uma redução sobre até 6 linhas.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List, Sequence, Tuple
+from ..core.pokemon import Pokemon, TYPE_ORDER, NUM_TYPES, NO_TYPE_INDEX
+from ..core.battle_system import TypeEffectiveness
+
+
+METRIC_NAMES: Tuple[str, ...] = (
+    "total_stats", "combat_avg", "defense_avg", "offense_avg", "balance", "efficiency"
+)
+
+
+def mask_ordinals(mask: int) -> Tuple[int, ...]:
+    """Ordinais dos tipos presentes em uma bitmask (na ordem de PokemonType)"""
+    return tuple(i for i in range(NUM_TYPES) if mask >> i & 1)
+
+
+def _weakness_mask(type_ordinal: int) -> int:
+    """Fraquezas de um tipo isolado como bitmask de tipos de ataque"""
+    column = TypeEffectiveness.DUAL_TYPE_TABLE[:NUM_TYPES, type_ordinal, NO_TYPE_INDEX]
+    weak = 0
+    for attack_ordinal, effectiveness in enumerate(column):
+        if effectiveness > 1.0:
+            weak |= 1 << attack_ordinal
+    return weak
+
+
+@dataclass(frozen=True)
+class SpeciesProfile:
+    """Linha pré-calculada de uma espécie em um nível"""
+    metrics: Tuple[float, ...]        # Na ordem de METRIC_NAMES
+    power_category: str
+    type_ordinals: Tuple[int, ...]    # Tipos presentes, na ordem de get_types()
+    type_names: Tuple[str, ...]
+    # Ataques super efetivos contra cada tipo, com repetição (um por tipo afetado)
+    weakness_names: Tuple[str, ...]
+
+    def as_dict(self) -> Dict[str, float]:
+        """Mesmo formato de DataProcessor.calculate_pokemon_metrics"""
+        metrics = dict(zip(METRIC_NAMES, self.metrics))
+        metrics["power_category"] = self.power_category
+        return metrics
+
+
+_PROFILES: Dict[Tuple, SpeciesProfile] = {}
+
+
+def _profile_key(pokemon: Pokemon) -> Tuple:
+    stats = pokemon.stats
+    return (
+        stats.hp, stats.attack, stats.defense, stats.sp_attack, stats.sp_defense, stats.speed,
+        pokemon.level, pokemon.type_indices
+    )
+
+
+def species_profile(pokemon: Pokemon) -> SpeciesProfile:
+    """Perfil da espécie (calculado na primeira consulta de cada stats/nível/tipos)"""
+    key = _profile_key(pokemon)
+    profile = _PROFILES.get(key)
+    if profile is None:
+        profile = _PROFILES[key] = _build_profile(pokemon)
+    return profile
+
+
+def _build_profile(pokemon: Pokemon) -> SpeciesProfile:
+    # Métricas básicas
+    total_stats = pokemon.stats.total
+    combat_avg = (pokemon.attack + pokemon.defense + pokemon.sp_attack +
+                  pokemon.sp_defense + pokemon.speed) / 5
+    defense_avg = (pokemon.stats.hp + pokemon.defense + pokemon.sp_defense) / 3
+    offense_avg = (pokemon.attack + pokemon.sp_attack + pokemon.speed) / 3
+
+    # Balanceamento e eficiência
+    balance = 1 - (abs(pokemon.attack - pokemon.defense) +
+                   abs(pokemon.sp_attack - pokemon.sp_defense)) / total_stats
+    efficiency = total_stats / 600
+
+    # Categoria de poder
+    if total_stats >= 500:
+        power_category = "Alto"
+    elif total_stats >= 400:
+        power_category = "Médio"
+    else:
+        power_category = "Baixo"
+
+    type1_index, type2_index = pokemon.type_indices
+    type_ordinals = (type1_index, type2_index) if pokemon.type2 else (type1_index,)
+    weakness_ordinals = [i for ordinal in type_ordinals for i in mask_ordinals(_weakness_mask(ordinal))]
+
+    return SpeciesProfile(
+        metrics=(total_stats, combat_avg, defense_avg, offense_avg, balance, efficiency),
+        power_category=power_category,
+        type_ordinals=type_ordinals,
+        type_names=tuple(TYPE_ORDER[ordinal].value for ordinal in type_ordinals),
+        weakness_names=tuple(TYPE_ORDER[i].value for i in weakness_ordinals)
+    )
+
+
+class TeamMetrics:
+    """Redução dos perfis de uma equipe (médias e contagens sobre até 6 linhas)"""
+
+    __slots__ = ("names", "profiles", "type_counts")
+
+    def __init__(self, names: Sequence[str], profiles: Sequence[SpeciesProfile]):
+        self.names = list(names)
+        self.profiles = list(profiles)
+        self.type_counts = [0] * (NUM_TYPES + 1)
+        for profile in self.profiles:
+            for ordinal in profile.type_ordinals:
+                self.type_counts[ordinal] += 1
+
+    @classmethod
+    def from_pokemon(cls, team: Sequence[Pokemon]) -> "TeamMetrics":
+        return cls([pokemon.name for pokemon in team], [species_profile(pokemon) for pokemon in team])
+
+    @property
+    def size(self) -> int:
+        return len(self.profiles)
+
+    def mean(self, metric: str) -> float:
+        """Média de uma métrica entre os membros"""
+        column = METRIC_NAMES.index(metric)
+        total = 0.0
+        for profile in self.profiles:
+            total += profile.metrics[column]
+        return total / len(self.profiles) if self.profiles else 0.0
+
+    @property
+    def total_stats(self) -> int:
+        return sum(profile.metrics[0] for profile in self.profiles)
+
+    @property
+    def unique_types(self) -> int:
+        return sum(1 for count in self.type_counts[:NUM_TYPES] if count > 0)
+
+    def type_coverage(self) -> Dict[str, int]:
+        """Contagem por tipo (mesmo formato de DataProcessor.analyze_type_coverage)"""
+        coverage = {}
+        for profile in self.profiles:
+            for name in profile.type_names:
+                coverage[name] = coverage.get(name, 0) + 1
+        return coverage
+
+    def weaknesses(self) -> Dict[str, List[str]]:
+        """Tipo de ataque -> membros fracos (um nome por tipo do membro afetado)"""
+        weaknesses = {}
+        for name, profile in zip(self.names, self.profiles):
+            for type_name in profile.weakness_names:
+                weaknesses.setdefault(type_name, []).append(name)
+        return weaknesses
+
+    def analysis(self, individual_metrics: bool = True) -> Dict[str, object]:
+        """Dicionário completo de DataProcessor.create_team_analysis"""
+        if not self.profiles:
+            return {}
+
+        avg_efficiency = self.mean("efficiency")
+        avg_balance = self.mean("balance")
+        type_coverage = self.type_coverage()
+        unique_types = len(type_coverage)
+
+        analysis = {
+            'team_size': self.size,
+            'total_stats': self.total_stats,
+            'avg_efficiency': avg_efficiency,
+            'avg_balance': avg_balance,
+            'type_coverage': type_coverage,
+            'unique_types': unique_types,
+            'weaknesses': self.weaknesses(),
+            'team_score': (avg_efficiency * 0.4 +
+                           unique_types / 15 * 0.3 +
+                           avg_balance * 0.3),
+        }
+        if individual_metrics:
+            analysis['individual_metrics'] = [profile.as_dict() for profile in self.profiles]
+        return analysis
@@ -5,11 +5,16 @@ Otimizador de Equipes - Algoritmos Genéticos para encontrar o melhor sexteto
 import random
 import numpy as np
 from typing import List, Tuple, Dict, Optional, Callable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from ..core.pokemon import Pokemon, PokemonTeam
 from ..core.battle_system import BattleSystem, BattleResult
 from ..core.elite_four import EliteFour
 from .data_processor import DataProcessor
+from .team_metrics import TeamMetrics
+from .fitness_cache import TeamFitnessCache, FitnessEntry
+from ..core.rng import CommonRandomNumbers
+from ..core.racing import RacingConfig, WinRateInterval, race_win_rate
+from .surrogate import SurrogateConfig, FitnessSurrogate
 
 
 @dataclass
@@ -20,6 +25,10 @@ class OptimizationResult:
     generation: int
     fitness_history: List[float]
     team_performance: Dict[str, float]
+    cache_stats: Dict[str, float] = field(default_factory=dict)
+    confidence_intervals: Dict[str, Tuple[float, float]] = field(default_factory=dict)
+    racing_stats: Dict[str, int] = field(default_factory=dict)
+    surrogate_stats: Dict[str, float] = field(default_factory=dict)
 
 
 class TeamOptimizer:
@@ -33,13 +42,53 @@ class TeamOptimizer:
         max_generations: int = 100,
         mutation_rate: float = 0.1,
         crossover_rate: float = 0.8,
-        elite_size: int = 5
+        elite_size: int = 5,
+        fitness_cache: Optional[TeamFitnessCache] = None,
+        fitness_refine_limit: int = 0,
+        seed: Optional[int] = None,
+        rng: Optional[random.Random] = None,
+        common_random_numbers: bool = False,
+        racing: Optional[RacingConfig] = None,
+        surrogate: Optional[SurrogateConfig] = None
     ):
         self.pokemon_database = pokemon_database
         self.elite_four = elite_four
-        self.battle_system = BattleSystem()
+        
+        # Gerador único para operadores genéticos e batalhas (padrão: `random` global)
+        if rng is None:
+            rng = random.Random(seed) if seed is not None else random
+        self.rng = rng
+        self.battle_system = BattleSystem(rng=self.rng)
         self.data_processor = DataProcessor()
         
+        # Cache de fitness (pode ser compartilhado com outros otimizadores);
+        # com fitness_refine_limit > 0, cada acerto acrescenta uma rodada de
+        # batalhas à entrada até esse total de amostras
+        self.fitness_cache = fitness_cache if fitness_cache is not None else TeamFitnessCache()
+        self.fitness_refine_limit = fitness_refine_limit
+        self.battles_per_member = 5
+        
+        # Números aleatórios comuns: a batalha (membro, réplica) usa o mesmo
+        # fluxo para todas as equipes, reduzindo o ruído da comparação
+        self.crn = None
+        if common_random_numbers:
+            self.crn = CommonRandomNumbers(seed if seed is not None else self.rng.getrandbits(64))
+        
+        # Avaliação sequencial (racing): rodadas até a precisão-alvo, com
+        # descarte de equipes que não alcançam mais o corte da elite
+        self.racing = racing
+        self.racing_threshold: Optional[float] = None
+        self.racing_stats = {"precision": 0, "dropped": 0, "budget": 0}
+        
+        # Modelo substituto: treinado com as equipes simuladas, decide quais
+        # filhos novos valem a simulação (os demais ficam com o previsto)
+        self.surrogate = None
+        if surrogate is not None:
+            self.surrogate = FitnessSurrogate(
+                surrogate, [member.pokemon_team for member in elite_four.get_all_members()],
+                seed if seed is not None else 0
+            )
+        
         # Parâmetros do algoritmo genético
         self.population_size = population_size
         self.max_generations = max_generations
@@ -52,7 +101,7 @@ class TeamOptimizer:
     
     def create_random_team(self) -> PokemonTeam:
         """Cria uma equipe aleatória de 6 Pokémon"""
-        team_pokemon = random.sample(self.pokemon_database, min(6, len(self.pokemon_database)))
+        team_pokemon = self.rng.sample(self.pokemon_database, min(6, len(self.pokemon_database)))
         return PokemonTeam(team_pokemon)
     
     def create_initial_population(self) -> List[PokemonTeam]:
@@ -70,41 +119,185 @@ class TeamOptimizer:
         for pokemon in team.pokemon:
             pokemon.level = 60  # Nível competitivo
         
-        # Análise da equipe
-        team_analysis = self.data_processor.create_team_analysis(team.pokemon)
+        signature = self.fitness_cache.team_signature(team, self._fitness_config())
+        entry = self.fitness_cache.get(signature)
+        
+        if entry is None:
+            static_score = self._calculate_static_score(team)
+            if self.racing is not None:
+                wins, battles = self._race_against_elite_four(team, static_score)
+            else:
+                wins, battles = self._simulate_against_elite_four(team)
+            entry = self.fitness_cache.put(signature, FitnessEntry(wins, battles, static_score))
+        elif entry.battles < self.fitness_refine_limit:
+            # Refina a estimativa em vez de recalcular do zero
+            replicates_done = entry.battles // len(self.elite_four.get_all_members())
+            wins, battles = self._simulate_against_elite_four(team, replicates_done)
+            entry = self.fitness_cache.refine(signature, wins, battles)
         
-        # Score de batalha contra Elite Four (peso maior)
-        battle_score = self._calculate_battle_performance(team)
+        # Score final (foco na vitória real)
+        battle_score = self._battle_score_from_win_rate(entry.win_rate)
+        return battle_score * 0.7 + entry.static_score
+    
+    def _evaluate_generation(self, population: List[PokemonTeam]) -> List[float]:
+        """Fitness de uma geração
+        
+        Com modelo substituto, as equipes fora do cache são ordenadas pelo
+        fitness previsto e só a fração configurada é simulada; o modelo é
+        retreinado ao fim de cada geração com as equipes simuladas. Cada
+        equipe guarda o valor em `team.fitness` (`team.fitness_predicted`
+        marca as não simuladas), usado pela seleção e pela escolha final.
+        """
+        if self.surrogate is None:
+            return [self.calculate_team_fitness(team) for team in population]
+        
+        config = self._fitness_config()
+        signatures = []
+        candidates = {}  # assinatura -> equipe representante (fora do cache)
+        for team in population:
+            for pokemon in team.pokemon:
+                pokemon.level = 60
+            signature = self.fitness_cache.team_signature(team, config)
+            signatures.append(signature)
+            if signature not in self.fitness_cache:
+                candidates.setdefault(signature, team)
+        
+        predicted, simulated_predictions = self.surrogate.screen_candidates(candidates, self._battles_per_team())
+        
+        fitness_by_signature = dict(predicted)
+        fitness_scores = []
+        for team, signature in zip(population, signatures):
+            fitness = fitness_by_signature.get(signature)
+            if fitness is None:
+                fitness = fitness_by_signature[signature] = self.calculate_team_fitness(team)
+            team.fitness = fitness
+            team.fitness_predicted = signature in predicted
+            fitness_scores.append(fitness)
+        
+        simulated = [signature for signature in candidates if signature not in predicted]
+        self.surrogate.observe(
+            [candidates[signature] for signature in simulated],
+            [fitness_by_signature[signature] for signature in simulated],
+            simulated_predictions
+        )
+        self.surrogate.fit()
+        return fitness_scores
+    
+    def _select_final_best(self, population: List[PokemonTeam]) -> Tuple[PokemonTeam, float]:
+        """Melhor equipe da última população com modelo substituto
+        
+        A população é triada como as demais; enquanto a melhor tiver fitness
+        previsto, ela é simulada (e entra no treino) e a escolha é refeita.
+        """
+        config = self._fitness_config()
+        final_fitness = self._evaluate_generation(population)
+        
+        while True:
+            best_index = int(np.argmax(final_fitness))
+            best_team = population[best_index]
+            if not best_team.fitness_predicted:
+                return best_team, final_fitness[best_index]
+            
+            prediction = best_team.fitness
+            signature = self.fitness_cache.team_signature(best_team, config)
+            fitness = self.calculate_team_fitness(best_team)
+            self.surrogate.observe_skipped(signature, best_team, fitness, prediction, self._battles_per_team())
+            
+            for index, team in enumerate(population):
+                if team.fitness_predicted and self.fitness_cache.team_signature(team, config) == signature:
+                    team.fitness = final_fitness[index] = fitness
+                    team.fitness_predicted = False
+    
+    def _battles_per_team(self) -> int:
+        """Batalhas da avaliação completa de uma equipe"""
+        return self.battles_per_member * len(self.elite_four.get_all_members())
+    
+    def _fitness_config(self) -> Tuple:
+        """Configuração do motor que compõe a assinatura no cache"""
+        return (
+            "TeamOptimizer",
+            self.battle_system.simulation_engine,
+            self.battle_system.max_turns,
+            self.battles_per_member,
+            self.racing,
+            self.crn.master_seed if self.crn is not None else None
+        )
+    
+    def _calculate_static_score(self, team: PokemonTeam) -> float:
+        """Score baseado em métricas da equipe (peso menor, sem sorteio)"""
         
-        # Score baseado em métricas da equipe (peso menor)
-        efficiency_score = team_analysis.get('avg_efficiency', 0) * 0.1
-        balance_score = team_analysis.get('avg_balance', 0) * 0.1
-        type_coverage_score = (team_analysis.get('unique_types', 0) / 15) * 0.1
+        if not team.pokemon:
+            return 0.0
         
-        # Score final (foco na vitória real)
-        total_score = battle_score * 0.7 + efficiency_score + balance_score + type_coverage_score
+        metrics = TeamMetrics.from_pokemon(team.pokemon)
         
-        return total_score
+        efficiency_score = metrics.mean("efficiency") * 0.1
+        balance_score = metrics.mean("balance") * 0.1
+        type_coverage_score = (metrics.unique_types / 15) * 0.1
+        
+        return efficiency_score + balance_score + type_coverage_score
     
-    def _calculate_battle_performance(self, team: PokemonTeam) -> float:
-        """Calcula performance em batalhas contra Elite Four"""
+    def _simulate_against_elite_four(
+        self,
+        team: PokemonTeam,
+        first_replicate: int = 0,
+        battles_per_member: Optional[int] = None
+    ) -> Tuple[int, int]:
+        """Simula batalhas contra cada membro e retorna (vitórias, batalhas)"""
         
+        battles_per_member = battles_per_member or self.battles_per_member
         total_wins = 0
         total_battles = 0
         
         # Testa contra cada membro da Elite Four
-        for member in self.elite_four.get_all_members():
+        for member_index, member in enumerate(self.elite_four.get_all_members()):
             # Simula múltiplas batalhas
-            for _ in range(5):  # 5 simulações por membro (mais rápido)
-                battle_log = self.battle_system.battle_teams(team, member.pokemon_team)
+            for replicate in range(first_replicate, first_replicate + battles_per_member):
+                if self.crn is not None:
+                    self.battle_system.rng = self.crn.stream(member_index, replicate)
+                battle_log = self.battle_system.battle_teams(team, member.pokemon_team, turn_sink="none")
                 total_battles += 1
                 
                 if battle_log.battle_result == BattleResult.WIN:
                     total_wins += 1
         
+        self.battle_system.rng = self.rng
+        return total_wins, total_battles
+    
+    def _race_against_elite_four(self, team: PokemonTeam, static_score: float) -> Tuple[int, int]:
+        """Rodadas contra a Elite Four até a precisão-alvo ou o descarte da equipe"""
+        
+        battles_per_round = self.racing.battles_per_round
+        
+        def simulate_round(round_index: int) -> Tuple[int, int]:
+            return self._simulate_against_elite_four(
+                team, round_index * battles_per_round, battles_per_round
+            )
+        
+        # Nem com a taxa do limite superior a equipe entraria na elite
+        can_qualify = None
+        if self.racing_threshold is not None:
+            can_qualify = lambda high: (
+                self._battle_score_from_win_rate(high) * 0.7 + static_score >= self.racing_threshold
+            )
+        
+        estimate = race_win_rate(simulate_round, self.racing, can_qualify)
+        self.racing_stats[estimate.stop_reason] += 1
+        return estimate.wins, estimate.battles
+    
+    def _calculate_battle_performance(self, team: PokemonTeam) -> float:
+        """Calcula performance em batalhas contra Elite Four"""
+        
+        total_wins, total_battles = self._simulate_against_elite_four(team)
+        
         # Taxa de vitória
         win_rate = total_wins / total_battles if total_battles > 0 else 0
         
+        return self._battle_score_from_win_rate(win_rate)
+    
+    def _battle_score_from_win_rate(self, win_rate: float) -> float:
+        """Converte taxa de vitória em score de batalha"""
+        
         # Bonus por vitórias contra membros difíceis
         difficulty_bonus = 0
         if win_rate > 0.5:  # Se ganha mais de 50%
@@ -116,24 +309,30 @@ class TeamOptimizer:
     
     def tournament_selection(self, population: List[PokemonTeam], tournament_size: int = 3) -> PokemonTeam:
         """Seleção por torneio"""
-        tournament = random.sample(population, min(tournament_size, len(population)))
+        tournament = self.rng.sample(population, min(tournament_size, len(population)))
         
         # Encontra o melhor do torneio
         best_team = tournament[0]
-        best_fitness = self.calculate_team_fitness(best_team)
+        best_fitness = self._selection_fitness(best_team)
         
         for team in tournament[1:]:
-            fitness = self.calculate_team_fitness(team)
+            fitness = self._selection_fitness(team)
             if fitness > best_fitness:
                 best_team = team
                 best_fitness = fitness
         
         return best_team
     
+    def _selection_fitness(self, team: PokemonTeam) -> float:
+        """Fitness da seleção: com modelo substituto, o da geração (inclusive previsto)"""
+        if self.surrogate is not None:
+            return team.fitness
+        return self.calculate_team_fitness(team)
+    
     def crossover(self, parent1: PokemonTeam, parent2: PokemonTeam) -> Tuple[PokemonTeam, PokemonTeam]:
         """Crossover entre duas equipes"""
         
-        if random.random() > self.crossover_rate:
+        if self.rng.random() > self.crossover_rate:
             return parent1, parent2
         
         # Combina Pokémon dos pais
@@ -149,20 +348,20 @@ class TeamOptimizer:
         
         # Cria filhos
         if len(unique_pokemon) >= 6:
-            child1_pokemon = random.sample(unique_pokemon, 6)
-            child2_pokemon = random.sample(unique_pokemon, 6)
+            child1_pokemon = self.rng.sample(unique_pokemon, 6)
+            child2_pokemon = self.rng.sample(unique_pokemon, 6)
         else:
             # Se não há Pokémon suficientes, completa com aleatórios
             child1_pokemon = unique_pokemon[:]
             child2_pokemon = unique_pokemon[:]
             
             while len(child1_pokemon) < 6:
-                random_pokemon = random.choice(self.pokemon_database)
+                random_pokemon = self.rng.choice(self.pokemon_database)
                 if random_pokemon not in child1_pokemon:
                     child1_pokemon.append(random_pokemon)
             
             while len(child2_pokemon) < 6:
-                random_pokemon = random.choice(self.pokemon_database)
+                random_pokemon = self.rng.choice(self.pokemon_database)
                 if random_pokemon not in child2_pokemon:
                     child2_pokemon.append(random_pokemon)
         
@@ -174,21 +373,21 @@ class TeamOptimizer:
     def mutate(self, team: PokemonTeam) -> PokemonTeam:
         """Mutação de uma equipe"""
         
-        if random.random() > self.mutation_rate:
+        if self.rng.random() > self.mutation_rate:
             return team
         
         # Escolhe um Pokémon aleatório para substituir
         if len(team.pokemon) == 0:
             return team
         
-        mutation_index = random.randint(0, len(team.pokemon) - 1)
+        mutation_index = self.rng.randint(0, len(team.pokemon) - 1)
         
         # Escolhe um novo Pokémon
-        new_pokemon = random.choice(self.pokemon_database)
+        new_pokemon = self.rng.choice(self.pokemon_database)
         
         # Verifica se não é duplicata
         while new_pokemon in team.pokemon:
-            new_pokemon = random.choice(self.pokemon_database)
+            new_pokemon = self.rng.choice(self.pokemon_database)
         
         # Cria nova equipe
         new_pokemon_list = team.pokemon[:]
@@ -211,7 +410,7 @@ class TeamOptimizer:
         for generation in range(self.max_generations):
             
             # Calcula fitness de toda a população
-            fitness_scores = [self.calculate_team_fitness(team) for team in population]
+            fitness_scores = self._evaluate_generation(population)
             
             # Registra melhor fitness
             best_fitness = max(fitness_scores)
@@ -219,6 +418,10 @@ class TeamOptimizer:
             
             print(f"Geração {generation + 1}/{self.max_generations} - Melhor Fitness: {best_fitness:.4f}")
             
+            # Corte da elite desta geração: filhos abaixo dele são descartados cedo
+            if self.racing is not None:
+                self.racing_threshold = sorted(fitness_scores)[-min(self.elite_size, len(fitness_scores))]
+            
             # Seleciona elite
             elite_indices = np.argsort(fitness_scores)[-self.elite_size:]
             elite_teams = [population[i] for i in elite_indices]
@@ -245,35 +448,85 @@ class TeamOptimizer:
             population = new_population[:self.population_size]
         
         # Encontra melhor equipe
-        final_fitness = [self.calculate_team_fitness(team) for team in population]
-        best_index = np.argmax(final_fitness)
-        best_team = population[best_index]
-        best_score = final_fitness[best_index]
+        if self.surrogate is not None:
+            best_team, best_score = self._select_final_best(population)
+        else:
+            final_fitness = [self.calculate_team_fitness(team) for team in population]
+            best_index = np.argmax(final_fitness)
+            best_team = population[best_index]
+            best_score = final_fitness[best_index]
         
-        # Calcula performance da melhor equipe
-        team_performance = self._analyze_team_performance(best_team)
+        # Calcula performance da melhor equipe (com intervalos de confiança)
+        team_performance, confidence_intervals = self._analyze_team_performance_with_intervals(best_team)
+        
+        best_entry = self.fitness_cache.get(
+            self.fitness_cache.team_signature(best_team, self._fitness_config())
+        )
+        if best_entry is not None:
+            overall = WinRateInterval.from_counts(best_entry.wins, best_entry.battles, self._confidence())
+            confidence_intervals["overall"] = (overall.low, overall.high)
         
         print(f"Otimização concluída! Melhor Score: {best_score:.4f}")
+        cache_stats = self.fitness_cache.stats()
+        print(f"Cache de fitness: {cache_stats['hits']} acertos, "
+              f"{cache_stats['misses']} avaliações ({cache_stats['hit_rate']:.1%})")
+        
+        surrogate_stats = {}
+        if self.surrogate is not None:
+            surrogate_stats = self.surrogate.stats()
+            print(f"Modelo substituto: {surrogate_stats['teams_skipped']} equipes não simuladas "
+                  f"({surrogate_stats['simulations_saved']} batalhas economizadas), "
+                  f"MAE {surrogate_stats['mae']:.4f}, correlação de postos {surrogate_stats['rank_correlation']:.2f}")
         
         return OptimizationResult(
             best_team=best_team,
             best_score=best_score,
             generation=self.max_generations,
             fitness_history=fitness_history,
-            team_performance=team_performance
+            team_performance=team_performance,
+            cache_stats=cache_stats,
+            confidence_intervals=confidence_intervals,
+            racing_stats=dict(self.racing_stats) if self.racing is not None else {},
+            surrogate_stats=surrogate_stats
         )
     
+    def _confidence(self) -> float:
+        """Nível de confiança dos intervalos reportados"""
+        return self.racing.confidence if self.racing is not None else 0.95
+    
     def _analyze_team_performance(self, team: PokemonTeam) -> Dict[str, float]:
         """Analisa performance da equipe contra Elite Four"""
         
+        performance, _ = self._analyze_team_performance_with_intervals(team)
+        return performance
+    
+    def _analyze_team_performance_with_intervals(
+        self, team: PokemonTeam
+    ) -> Tuple[Dict[str, float], Dict[str, Tuple[float, float]]]:
+        """Taxa de vitória e intervalo de confiança contra cada membro"""
+        
         performance = {}
+        intervals = {}
         
         for member in self.elite_four.get_all_members():
-            # Simula 50 batalhas contra cada membro
-            battle_stats = self.battle_system.simulate_battle(team, member.pokemon_team, 50)
+            if self.racing is not None:
+                # Até 50 batalhas, parando quando o intervalo fica estreito
+                battle_stats = self.battle_system.simulate_battle(
+                    team, member.pokemon_team, 50,
+                    target_precision=self.racing.target_precision,
+                    confidence=self.racing.confidence
+                )
+                interval = (battle_stats['win_rate_ci_low'], battle_stats['win_rate_ci_high'])
+            else:
+                # Simula 50 batalhas contra cada membro
+                battle_stats = self.battle_system.simulate_battle(team, member.pokemon_team, 50)
+                estimate = WinRateInterval.from_counts(round(battle_stats['win_rate'] * 50), 50)
+                interval = (estimate.low, estimate.high)
+            
             performance[member.name] = battle_stats['win_rate']
+            intervals[member.name] = interval
         
-        return performance
+        return performance, intervals
     
     def optimize_with_constraints(
         self,
@@ -343,8 +596,7 @@ class TeamOptimizer:
         recommendations = []
         
         # Analisa fraquezas da equipe
-        team_analysis = self.data_processor.create_team_analysis(current_team.pokemon)
-        weaknesses = team_analysis.get('weaknesses', {})
+        weaknesses = TeamMetrics.from_pokemon(current_team.pokemon).weaknesses()
         
         # Encontra Pokémon que cobrem fraquezas
         for weakness_type, weak_pokemon in weaknesses.items():
@@ -0,0 +1,297 @@
+"""
+Busca de Equipes - Beam search e branch-and-bound sobre scores de confronto
+
+Com uma matriz espécie x membro da Elite Four (por exemplo, a média das
+probabilidades de vitória 1x1 do MatchupAtlas contra o time de cada membro),
+o score de uma equipe é, para cada membro, uma mistura do melhor contador e
+da média da equipe:
+
+    score = soma_j peso_j * (best_weight * max_s M[s, j] + (1 - best_weight) * media_s M[s, j])
+
+Cada termo se decompõe por membro, então um limite superior admissível de
+qualquer equipe parcial sai de tabelas de sufixo (o máximo e a soma dos r
+maiores valores restantes de cada coluna). As espécies são enumeradas como
+combinações em ordem decrescente de valor individual; o branch-and-bound
+expande a fronteira pelo maior limite (best-first) e termina com o ótimo
+provado ou, no limite de nós, com a diferença máxima para o ótimo.
+"""
+
+import heapq
+import itertools
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+import numpy as np
+from ..core.pokemon import Pokemon, PokemonTeam
+from ..core.elite_four import EliteFour
+
+SEARCH_METHODS = ("beam", "bnb")
+
+
+def member_matchup_matrix(atlas, species: Sequence[Pokemon], elite_four: EliteFour) -> np.ndarray:
+    """Matriz S x J: probabilidade média de vitória 1x1 de cada espécie contra o time de cada membro"""
+    members = elite_four.get_all_members()
+    matrix = np.empty((len(species), len(members)))
+    for j, member in enumerate(members):
+        for s, pokemon in enumerate(species):
+            matrix[s, j] = np.mean([
+                atlas.win_probability(pokemon, opponent) for opponent in member.pokemon_team.pokemon
+            ])
+    return matrix
+
+
+@dataclass
+class SearchResult:
+    """Melhor equipe encontrada e o quanto ela pode estar longe do ótimo"""
+    best_team: PokemonTeam
+    best_score: float
+    upper_bound: float  # Limite provado para o score ótimo
+    method: str
+    nodes_explored: int
+    nodes_pruned: int
+    seconds: float
+    member_scores: Dict[str, float] = field(default_factory=dict)
+
+    @property
+    def gap(self) -> float:
+        return max(0.0, self.upper_bound - self.best_score)
+
+    @property
+    def proven_optimal(self) -> bool:
+        return self.gap <= 1e-12
+
+    @property
+    def prune_rate(self) -> float:
+        generated = self.nodes_explored + self.nodes_pruned
+        return self.nodes_pruned / generated if generated else 0.0
+
+
+class TeamSearch:
+    """Busca exata/anytime da equipe de maior score sobre uma matriz de confrontos
+
+    species: Pokémon candidatos (linhas da matriz)
+    matrix: scores espécie x membro, S x J
+    member_names: nomes das colunas (para o detalhamento por membro)
+    member_weights: peso de cada membro (padrão: 1/J)
+    best_weight: peso do melhor contador contra a média da equipe
+    """
+
+    def __init__(
+        self,
+        species: Sequence[Pokemon],
+        matrix: np.ndarray,
+        member_names: Optional[Sequence[str]] = None,
+        team_size: int = 6,
+        best_weight: float = 0.5,
+        member_weights: Optional[Sequence[float]] = None
+    ):
+        matrix = np.asarray(matrix, dtype=np.float64)
+        if matrix.ndim != 2 or matrix.shape[0] != len(species):
+            raise ValueError("A matriz deve ter uma linha por espécie")
+        if not 0 < team_size <= len(species):
+            raise ValueError(f"Tamanho de equipe inválido: {team_size}")
+        if not 0 <= best_weight <= 1:
+            raise ValueError(f"Peso do melhor contador inválido: {best_weight}")
+
+        members = matrix.shape[1]
+        weights = np.full(members, 1 / members) if member_weights is None else np.asarray(member_weights, float)
+        if weights.shape != (members,) or np.any(weights < 0):
+            raise ValueError("Os pesos dos membros devem ser não negativos, um por coluna")
+
+        self.team_size = team_size
+        self.best_weight = best_weight
+        self.member_names = list(member_names) if member_names is not None else [str(j) for j in range(members)]
+        self.weights = weights
+        self._max_weights = weights * best_weight
+        self._sum_weights = weights * (1 - best_weight) / team_size
+
+        # Ordem decrescente de valor individual: os sufixos perdem valor rápido
+        value = matrix @ (self._max_weights + self._sum_weights)
+        self.order = np.argsort(-value, kind="stable")
+        self.species = [species[i] for i in self.order]
+        self.matrix = matrix[self.order]
+        self._build_suffix_tables()
+
+    def _build_suffix_tables(self):
+        """top[i, j, r]: soma dos r maiores valores de matrix[i:, j] (r = 0..team_size)"""
+        count, members = self.matrix.shape
+        k = self.team_size
+        best = np.full((count + 1, members, k), -np.inf)
+        for i in range(count - 1, -1, -1):
+            merged = np.concatenate([self.matrix[i][:, None], best[i + 1]], axis=1)
+            best[i] = -np.sort(-merged, axis=1)[:, :k]
+        self.suffix_top = np.concatenate([np.zeros((count + 1, members, 1)), np.cumsum(best, axis=2)], axis=2)
+        self.suffix_max = best[:, :, 0]
+
+    # ------------------------------------------------------------------
+    # Score e limites
+    # ------------------------------------------------------------------
+
+    def score_rows(self, rows: Sequence[int]) -> float:
+        """Score de uma equipe completa (linhas na ordem interna)"""
+        values = self.matrix[list(rows)]
+        return float(values.max(axis=0) @ self._max_weights + values.sum(axis=0) @ self._sum_weights)
+
+    def score_team(self, team: PokemonTeam) -> float:
+        """Score de uma equipe formada por espécies da busca"""
+        position = {id(pokemon): i for i, pokemon in enumerate(self.species)}
+        return self.score_rows([position[id(pokemon)] for pokemon in team.pokemon])
+
+    def _children(self, rows: Tuple[int, ...]) -> Tuple[np.ndarray, np.ndarray]:
+        """(próximas linhas, limites): filhos de um nó com a combinação em ordem crescente"""
+        remaining = self.team_size - len(rows) - 1  # Vagas depois do filho
+        first = rows[-1] + 1 if rows else 0
+        candidates = np.arange(first, self.matrix.shape[0] - remaining)
+
+        values = self.matrix[candidates]  # C x J
+        if rows:
+            current = self.matrix[list(rows)]
+            best = np.maximum(current.max(axis=0), values)
+            total = current.sum(axis=0) + values
+        else:
+            best, total = values, values.copy()
+
+        if remaining > 0:
+            best = np.maximum(best, self.suffix_max[candidates + 1])
+            total = total + self.suffix_top[candidates + 1, :, remaining]
+        return candidates, best @ self._max_weights + total @ self._sum_weights
+
+    def root_bound(self) -> float:
+        return float(self._children(())[1].max())
+
+    # ------------------------------------------------------------------
+    # Buscas
+    # ------------------------------------------------------------------
+
+    def beam_search(self, beam_width: int = 64) -> SearchResult:
+        """Beam search guiada pelo limite: mantém os `beam_width` melhores nós por nível
+
+        O limite superior reportado é o maior entre o melhor score e os
+        limites de todos os nós descartados (válido, mas não necessariamente justo).
+        """
+        start = time.perf_counter()
+        beam: List[Tuple[int, ...]] = [()]
+        explored = pruned = 0
+        discarded_bound = -np.inf
+        best_rows, best_score = None, -np.inf
+
+        for depth in range(self.team_size):
+            children_rows = []
+            children_bounds = []
+            for rows in beam:
+                explored += 1
+                candidates, bounds = self._children(rows)
+                children_rows.extend(rows + (int(c),) for c in candidates)
+                children_bounds.append(bounds)
+            bounds = np.concatenate(children_bounds)
+
+            if depth == self.team_size - 1:
+                # Folhas: o limite é o score exato
+                index = int(np.argmax(bounds))
+                best_rows, best_score = children_rows[index], float(bounds[index])
+                pruned += len(children_rows) - 1
+                break
+
+            keep = np.argsort(-bounds, kind="stable")[:beam_width]
+            if len(keep) < len(bounds):
+                mask = np.ones(len(bounds), dtype=bool)
+                mask[keep] = False
+                discarded_bound = max(discarded_bound, float(bounds[mask].max()))
+                pruned += int(mask.sum())
+            beam = [children_rows[i] for i in keep]
+
+        return self._result(
+            best_rows, best_score, max(best_score, discarded_bound), "beam",
+            explored, pruned, time.perf_counter() - start
+        )
+
+    def branch_and_bound(
+        self,
+        max_nodes: int = 200_000,
+        gap_tolerance: float = 0.0,
+        beam_width: int = 64
+    ) -> SearchResult:
+        """Branch-and-bound best-first, iniciado com a equipe do beam search
+
+        Nós cujo limite não supera o melhor score + `gap_tolerance` são
+        podados. Sem atingir `max_nodes`, o resultado é ótimo (a menos da
+        tolerância); caso contrário, o limite superior é o maior limite que
+        restou na fronteira. Com tolerância, os limites podados também entram
+        no limite superior (podem superar o melhor score).
+        """
+        start = time.perf_counter()
+        if beam_width > 0:
+            warm = self.beam_search(beam_width)
+            best_rows, best_score = self._rows_of(warm.best_team), warm.best_score
+        else:
+            # Sem beam: as espécies de maior valor individual
+            best_rows = tuple(range(self.team_size))
+            best_score = self.score_rows(best_rows)
+
+        counter = itertools.count()
+        frontier = [(-np.inf, next(counter), ())]
+        explored = pruned = 0
+        exhausted = True
+        pruned_bound = -np.inf  # Maior limite descartado pela tolerância
+
+        while frontier and -frontier[0][0] > best_score + gap_tolerance:
+            if explored >= max_nodes:
+                exhausted = False
+                break
+            _, _, rows = heapq.heappop(frontier)
+            explored += 1
+
+            candidates, bounds = self._children(rows)
+            promising = bounds > best_score + gap_tolerance
+            pruned += int((~promising).sum())
+
+            if len(rows) + 1 == self.team_size:
+                # Folhas: o limite é o score exato
+                index = int(np.argmax(bounds))
+                if bounds[index] > best_score:
+                    best_rows, best_score = rows + (int(candidates[index]),), float(bounds[index])
+                continue
+
+            if not promising.all():
+                pruned_bound = max(pruned_bound, float(bounds[~promising].max()))
+            for candidate, child_bound in zip(candidates[promising].tolist(), bounds[promising].tolist()):
+                heapq.heappush(frontier, (-child_bound, next(counter), rows + (candidate,)))
+
+        # O que sobrou na fronteira limita o ótimo; sem esgotar o orçamento,
+        # os nós restantes não superam o melhor score + tolerância (podados)
+        open_bound = -frontier[0][0] if frontier else -np.inf
+        if exhausted:
+            pruned += len(frontier)
+
+        return self._result(
+            best_rows, best_score, max(best_score, open_bound, pruned_bound), "bnb",
+            explored, pruned, time.perf_counter() - start
+        )
+
+    def search(self, method: str = "bnb", **options) -> SearchResult:
+        if method not in SEARCH_METHODS:
+            raise ValueError(f"Método de busca inválido: {method}")
+        if method == "beam":
+            return self.beam_search(**options)
+        return self.branch_and_bound(**options)
+
+    def _rows_of(self, team: PokemonTeam) -> Tuple[int, ...]:
+        position = {id(pokemon): i for i, pokemon in enumerate(self.species)}
+        return tuple(sorted(position[id(pokemon)] for pokemon in team.pokemon))
+
+    def _result(self, rows, score, upper_bound, method, explored, pruned, seconds) -> SearchResult:
+        values = self.matrix[list(rows)]
+        member_scores = {
+            name: float(self.best_weight * values[:, j].max() + (1 - self.best_weight) * values[:, j].mean())
+            for j, name in enumerate(self.member_names)
+        }
+        return SearchResult(
+            best_team=PokemonTeam([self.species[i] for i in rows]),
+            best_score=score,
+            upper_bound=float(upper_bound),
+            method=method,
+            nodes_explored=explored,
+            nodes_pruned=pruned,
+            seconds=seconds,
+            member_scores=member_scores
+        )
@@ -3,16 +3,21 @@ Módulo Core - Classes principais do sistema Pokémon
 """
 
 from .pokemon import Pokemon, PokemonTeam
+from .battle_state import SpeciesSpec, BattleState
 from .battle_system import BattleSystem, BattleResult
 from .elite_four import EliteFour
 from .moves import Move, MoveSet
+from .pokemon_database import PokemonDatabase
 
 __all__ = [
     "Pokemon",
     "PokemonTeam",
+    "SpeciesSpec",
+    "BattleState",
     "BattleSystem", 
     "BattleResult",
     "EliteFour",
     "Move",
-    "MoveSet"
+    "MoveSet",
+    "PokemonDatabase"
 ]
@@ -0,0 +1,132 @@
+"""
+Estado de Batalha - Espécies imutáveis e estado mutável por batalha
+
+Os motores não alteram mais os objetos Pokemon/PokemonTeam (compartilhados
+entre a base de dados, as equipes do GA e a Elite Four): leem um SpeciesSpec
+congelado de cada membro e guardam HP, Pokémon ativo e desmaios em um
+BattleState criado para cada batalha.
+"""
+
+from dataclasses import dataclass
+from typing import Optional, Sequence, Tuple
+from .pokemon import Pokemon, PokemonTeam, PokemonType, STAT_NAMES
+from .moves import Move, MoveCategory, create_realistic_moveset
+
+
+@dataclass(frozen=True)
+class SpeciesSpec:
+    """Tudo que uma batalha lê de um Pokémon, congelado em um nível"""
+    name: str
+    pokemon_id: int
+    type1: PokemonType
+    type2: Optional[PokemonType]
+    level: int
+    max_hp: int
+    attack: int
+    defense: int
+    sp_attack: int
+    sp_defense: int
+    speed: int
+    type_indices: Tuple[int, int]
+    moves: Tuple[Move, ...]  # Apenas movimentos de dano
+
+    @classmethod
+    def from_pokemon(cls, pokemon: Pokemon) -> "SpeciesSpec":
+        """Fotografia do Pokémon (nível, estatísticas derivadas e movimentos)"""
+        move_set = pokemon.move_set
+        if move_set is None:
+            move_set = create_realistic_moveset(pokemon.name)
+        moves = tuple(move for move in move_set.moves if move.category != MoveCategory.STATUS)
+
+        derived = tuple(getattr(pokemon, name) for name in ("max_hp",) + STAT_NAMES[1:])
+        return cls(
+            pokemon.name, pokemon.pokemon_id, pokemon.type1, pokemon.type2, pokemon.level,
+            *derived, pokemon.type_indices, moves
+        )
+
+
+class BattleState:
+    """Estado mutável de uma equipe durante uma batalha
+
+    hp: HP atual por posição; active: posição do Pokémon em campo;
+    fainted: bitmask das posições desmaiadas. `members` guarda os objetos
+    de origem apenas para identificar atacante/defensor nos registros de turno.
+    """
+
+    __slots__ = ("specs", "members", "hp", "active", "fainted", "_all_fainted")
+
+    def __init__(
+        self,
+        specs: Sequence[SpeciesSpec],
+        members: Optional[Sequence[object]] = None,
+        hp: Optional[Sequence[int]] = None,
+        active: int = 0
+    ):
+        self.specs = tuple(specs)
+        self.members = tuple(members) if members is not None else self.specs
+        self.hp = list(hp) if hp is not None else [spec.max_hp for spec in self.specs]
+        self.active = active
+        self.fainted = 0
+        for slot, value in enumerate(self.hp):
+            if value <= 0:
+                self.fainted |= 1 << slot
+        self._all_fainted = (1 << len(self.specs)) - 1
+
+    @classmethod
+    def from_team(cls, team: PokemonTeam) -> "BattleState":
+        """Estado inicial (HP cheio) de uma equipe, sem alterar seus Pokémon"""
+        return cls([pokemon.spec for pokemon in team.pokemon], team.pokemon)
+
+    @classmethod
+    def from_pokemon(cls, pokemon: Pokemon) -> "BattleState":
+        """Estado de um único Pokémon a partir do HP atual dele"""
+        return cls((pokemon.spec,), (pokemon,), (pokemon.current_hp,))
+
+    @property
+    def active_spec(self) -> SpeciesSpec:
+        return self.specs[self.active]
+
+    @property
+    def active_fainted(self) -> bool:
+        return bool(self.fainted >> self.active & 1)
+
+    @property
+    def is_defeated(self) -> bool:
+        """Todas as posições desmaiadas (equipe vazia conta como derrotada)"""
+        return self.fainted == self._all_fainted
+
+    @property
+    def alive_count(self) -> int:
+        return len(self.specs) - bin(self.fainted).count("1")
+
+    def is_fainted(self, slot: int) -> bool:
+        return bool(self.fainted >> slot & 1)
+
+    def take_damage(self, slot: int, damage: int) -> bool:
+        """Aplica dano a uma posição; retorna se ela desmaiou"""
+        hp = self.hp[slot] - damage
+        if hp <= 0:
+            self.hp[slot] = 0
+            self.fainted |= 1 << slot
+            return True
+        self.hp[slot] = hp
+        return False
+
+    def auto_switch(self) -> bool:
+        """Troca para o próximo vivo após o ativo (ou o primeiro vivo), como PokemonTeam.auto_switch"""
+        if self.is_defeated:
+            return False
+        for slot in range(self.active + 1, len(self.specs)):
+            if not self.fainted >> slot & 1:
+                self.active = slot
+                return True
+        for slot in range(len(self.specs)):
+            if not self.fainted >> slot & 1:
+                self.active = slot
+                return True
+        return False
+
+    def write_back(self) -> None:
+        """Copia o HP final para os Pokémon de origem (API de fachada 1x1)"""
+        for pokemon, hp in zip(self.members, self.hp):
+            pokemon.current_hp = hp
@@ -5,11 +5,24 @@ Baseado no sistema de FireRed/LeafGreen com precisão máxima
 
 import random
 import math
-from typing import List, Optional, Tuple, Dict
+from typing import List, Optional, Tuple, Dict, Callable, Union, TYPE_CHECKING
 from dataclasses import dataclass
 from enum import Enum
-from .pokemon import Pokemon, PokemonTeam, PokemonType
+import numpy as np
+from .pokemon import (
+    Pokemon, PokemonTeam, PokemonType,
+    TYPE_INDEX, NUM_TYPES, NO_TYPE_INDEX, type_index
+)
 from .moves import Move, MoveCategory, MoveTarget
+from .battle_state import BattleState
+
+if TYPE_CHECKING:
+    from .damage_table import DamageRow, DamageTable
+    from .parallel import SimulationTotals
+
+
+# Versão das regras de batalha: altere quando a mecânica mudar (invalida caches em disco)
+ENGINE_VERSION = 1
 
 
 class BattleResult(Enum):
@@ -33,6 +46,126 @@ class BattleTurn:
     defender_fainted: bool
 
 
+class TurnSink:
+    """Destino dos turnos de uma batalha (base: descarta tudo)
+    
+    `record` recebe os valores crus do turno; só os destinos que precisam
+    de um `BattleTurn` o constroem. O HP vive no BattleState da batalha,
+    por isso o desmaio do defensor chega como argumento.
+    """
+    
+    def record(
+        self,
+        turn_number: int,
+        attacker: Pokemon,
+        defender: Pokemon,
+        move: Move,
+        damage_dealt: int,
+        critical_hit: bool,
+        effectiveness: float,
+        defender_fainted: bool = False
+    ):
+        pass
+
+
+class TurnLogSink(TurnSink):
+    """Guarda todos os turnos como `BattleTurn` (comportamento padrão)"""
+    
+    def __init__(self):
+        self.turns: List[BattleTurn] = []
+    
+    def record(self, turn_number, attacker, defender, move, damage_dealt, critical_hit, effectiveness,
+               defender_fainted=False):
+        self.turns.append(BattleTurn(
+            turn_number=turn_number,
+            attacker=attacker,
+            defender=defender,
+            move_used=move,
+            damage_dealt=damage_dealt,
+            critical_hit=critical_hit,
+            effectiveness=effectiveness,
+            attacker_fainted=False,  # Quem ataca está sempre de pé
+            defender_fainted=defender_fainted
+        ))
+
+
+class TurnCounterSink(TurnSink):
+    """Acumula apenas contadores (entre batalhas, até `reset`)"""
+    
+    def __init__(self):
+        self.reset()
+    
+    def reset(self):
+        """Zera os contadores"""
+        self.attacks = 0
+        self.hits = 0
+        self.critical_hits = 0
+        self.total_damage = 0
+        self.knockouts = 0
+    
+    def record(self, turn_number, attacker, defender, move, damage_dealt, critical_hit, effectiveness,
+               defender_fainted=False):
+        self.attacks += 1
+        if damage_dealt > 0:
+            self.hits += 1
+        if critical_hit:
+            self.critical_hits += 1
+        self.total_damage += damage_dealt
+        if defender_fainted:
+            self.knockouts += 1
+    
+    def as_dict(self) -> Dict[str, int]:
+        """Contadores em formato de dicionário"""
+        return {
+            "attacks": self.attacks,
+            "hits": self.hits,
+            "critical_hits": self.critical_hits,
+            "total_damage": self.total_damage,
+            "knockouts": self.knockouts
+        }
+
+
+class CallbackTurnSink(TurnSink):
+    """Repassa cada turno (como `BattleTurn`) para uma função do usuário"""
+    
+    def __init__(self, callback: Callable[[BattleTurn], None]):
+        self.callback = callback
+    
+    def record(self, turn_number, attacker, defender, move, damage_dealt, critical_hit, effectiveness,
+               defender_fainted=False):
+        self.callback(BattleTurn(
+            turn_number=turn_number,
+            attacker=attacker,
+            defender=defender,
+            move_used=move,
+            damage_dealt=damage_dealt,
+            critical_hit=critical_hit,
+            effectiveness=effectiveness,
+            attacker_fainted=False,  # Quem ataca está sempre de pé
+            defender_fainted=defender_fainted
+        ))
+
+
+# Modos aceitos em `turn_sink`: nome, instância de TurnSink ou função
+TurnSinkSpec = Union[str, TurnSink, Callable[[BattleTurn], None], None]
+TURN_SINK_MODES = ("none", "counters", "full")
+
+
+def resolve_turn_sink(turn_sink: TurnSinkSpec) -> Optional[TurnSink]:
+    """Converte a especificação em um destino (None = sem registro algum)"""
+    if turn_sink is None or turn_sink == "none":
+        return None
+    if turn_sink == "full":
+        return TurnLogSink()
+    if turn_sink == "counters":
+        return TurnCounterSink()
+    if isinstance(turn_sink, TurnSink):
+        return turn_sink
+    if callable(turn_sink):
+        return CallbackTurnSink(turn_sink)
+    raise ValueError(f"Modo de registro de turnos inválido: {turn_sink}")
+
+
 @dataclass
 class BattleLog:
     """Log completo de uma batalha"""
@@ -40,6 +173,8 @@ class BattleLog:
     winner: Optional[PokemonTeam]
     total_turns: int
     battle_result: BattleResult
+    turn_sink: Optional[TurnSink] = None  # Destino usado quando não é o log completo
+    final_states: Optional[Tuple[BattleState, BattleState]] = None  # HP/desmaios ao fim da batalha
 
 
 class TypeEffectiveness:
@@ -192,25 +327,109 @@ class TypeEffectiveness:
         }
     }
     
+    # Tabelas indexadas por ordinal (preenchidas por _build_tables)
+    # EFFECTIVENESS_TABLE[atacante, defensor] -> 17x17
+    # DUAL_TYPE_TABLE[atacante, tipo1, tipo2] -> 18x18x18, com o índice
+    # NO_TYPE_INDEX representando "sem tipo" (multiplicador neutro)
+    EFFECTIVENESS_TABLE: np.ndarray = None
+    DUAL_TYPE_TABLE: np.ndarray = None
+    _DUAL_TYPE_ROWS: List[List[List[float]]] = None
+    
+    @classmethod
+    def _build_tables(cls) -> None:
+        """Compila a matriz de efetividade em tabelas NumPy indexadas por ordinal"""
+        table = np.ones((NUM_TYPES, NUM_TYPES))
+        for attack_type, row in cls.EFFECTIVENESS_MATRIX.items():
+            for defender_type, multiplier in row.items():
+                table[TYPE_INDEX[attack_type], TYPE_INDEX[defender_type]] = multiplier
+        
+        # Linha/coluna extra neutra para tipos ausentes ou desconhecidos
+        padded = np.ones((NUM_TYPES + 1, NUM_TYPES + 1))
+        padded[:NUM_TYPES, :NUM_TYPES] = table
+        
+        cls.EFFECTIVENESS_TABLE = table
+        cls.DUAL_TYPE_TABLE = padded[:, :, None] * padded[:, None, :]
+        # Cópia em listas aninhadas: indexação escalar sem overhead do NumPy
+        cls._DUAL_TYPE_ROWS = cls.DUAL_TYPE_TABLE.tolist()
+    
     @classmethod
     def get_effectiveness(cls, attack_type: PokemonType, defender_types: List[PokemonType]) -> float:
         """Calcula efetividade do ataque contra os tipos do defensor"""
-        effectiveness = 1.0
+        attack_row = cls._DUAL_TYPE_ROWS[type_index(attack_type)]
         
-        for defender_type in defender_types:
-            if attack_type in cls.EFFECTIVENESS_MATRIX:
-                type_effect = cls.EFFECTIVENESS_MATRIX[attack_type].get(defender_type, 1.0)
-                effectiveness *= type_effect
+        if len(defender_types) <= 2:
+            indices = [type_index(t) for t in defender_types]
+            indices += [NO_TYPE_INDEX] * (2 - len(indices))
+            return attack_row[indices[0]][indices[1]]
         
+        effectiveness = 1.0
+        for defender_type in defender_types:
+            effectiveness *= attack_row[type_index(defender_type)][NO_TYPE_INDEX]
         return effectiveness
+    
+    @classmethod
+    def get_effectiveness_by_index(
+        cls,
+        attack_index: int,
+        type1_index: int,
+        type2_index: int = NO_TYPE_INDEX
+    ) -> float:
+        """Efetividade a partir de ordinais (uma única consulta indexada)"""
+        return cls._DUAL_TYPE_ROWS[attack_index][type1_index][type2_index]
+    
+    @classmethod
+    def get_effectiveness_against(cls, attack_type: PokemonType, defender: Pokemon) -> float:
+        """Efetividade de um tipo de ataque contra um Pokémon (caminho rápido)"""
+        type1_index, type2_index = defender.type_indices
+        return cls._DUAL_TYPE_ROWS[type_index(attack_type)][type1_index][type2_index]
+    
+    @classmethod
+    def get_effectiveness_array(
+        cls,
+        attack_indices,
+        type1_indices,
+        type2_indices=None
+    ) -> np.ndarray:
+        """Versão vetorizada: efetividade para arrays de ordinais"""
+        attack_indices = np.asarray(attack_indices, dtype=np.intp)
+        type1_indices = np.asarray(type1_indices, dtype=np.intp)
+        if type2_indices is None:
+            type2_indices = np.full_like(type1_indices, NO_TYPE_INDEX)
+        else:
+            type2_indices = np.asarray(type2_indices, dtype=np.intp)
+        return cls.DUAL_TYPE_TABLE[attack_indices, type1_indices, type2_indices]
+
+
+TypeEffectiveness._build_tables()
 
 
 class BattleSystem:
     """Sistema principal de batalhas"""
     
-    def __init__(self):
+    SIMULATION_ENGINES = ("scalar", "vectorized")
+    
+    # Lote entre verificações de precisão no modo sequencial de simulate_battle
+    SEQUENTIAL_BATCH_SIZES = {"scalar": 25, "vectorized": 1000}
+    
+    def __init__(
+        self,
+        simulation_engine: str = "scalar",
+        rng: Optional[random.Random] = None,
+        n_workers: int = 1,
+        damage_table: Optional["DamageTable"] = None
+    ):
+        if simulation_engine not in self.SIMULATION_ENGINES:
+            raise ValueError(f"Motor de simulação inválido: {simulation_engine}")
         self.battle_log = []
         self.max_turns = 100  # Evita loops infinitos
+        self.simulation_engine = simulation_engine
+        # Gerador usado em todos os sorteios (padrão: módulo `random` global)
+        self.rng = rng if rng is not None else random
+        self.n_workers = n_workers
+        # Termos fixos de dano por confronto (padrão: tabela compartilhada)
+        if damage_table is None:
+            from .damage_table import DEFAULT_DAMAGE_TABLE as damage_table
+        self.damage_table = damage_table
     
     def calculate_damage(
         self,
@@ -221,6 +440,19 @@ class BattleSystem:
     ) -> int:
         """Calcula dano baseado na fórmula do GBA (FireRed/LeafGreen)"""
         
+        effectiveness = TypeEffectiveness.get_effectiveness_against(move.move_type, defender)
+        return self._calculate_damage(attacker, defender, move, critical_hit, effectiveness)
+    
+    def _calculate_damage(
+        self,
+        attacker: Pokemon,
+        defender: Pokemon,
+        move: Move,
+        critical_hit: bool,
+        effectiveness: float
+    ) -> int:
+        """Fórmula de dano com a efetividade já calculada"""
+        
         # Determina se é ataque físico ou especial
         if move.category == MoveCategory.PHYSICAL:
             attack_stat = attacker.attack
@@ -237,17 +469,11 @@ class BattleSystem:
         # Cálculo base do dano (fórmula Pokémon real)
         base_damage = ((2 * attacker.level + 10) * move.power * attack_stat / defense_stat / 50) + 2
         
-        # Modificador de efetividade
-        effectiveness = TypeEffectiveness.get_effectiveness(
-            move.move_type, 
-            defender.get_types()
-        )
-        
         # Modificador de golpe crítico
         critical_modifier = 2.0 if critical_hit else 1.0
         
         # Modificador de variação (85-100%)
-        variation = random.uniform(0.85, 1.0)
+        variation = self.rng.uniform(0.85, 1.0)
         
         # Cálculo final
         damage = int(base_damage * effectiveness * critical_modifier * variation)
@@ -269,7 +495,7 @@ class BattleSystem:
         # Taxa final
         crit_rate = base_crit_rate * (1 + speed_modifier)
         
-        return random.random() * 100 < crit_rate
+        return self.rng.random() * 100 < crit_rate
     
     def does_move_hit(self, move: Move, attacker: Pokemon, defender: Pokemon) -> bool:
         """Determina se o movimento acerta"""
@@ -283,7 +509,7 @@ class BattleSystem:
         # Taxa de acerto final
         hit_rate = move.accuracy * accuracy_modifier
         
-        return random.random() * 100 < hit_rate
+        return self.rng.random() * 100 < hit_rate
     
     def execute_turn(
         self,
@@ -292,215 +518,386 @@ class BattleSystem:
         move: Move,
         turn_number: int
     ) -> BattleTurn:
-        """Executa um turno de batalha"""
+        """Executa um turno de batalha (aplica o dano ao `defender`)"""
+        
+        sink = TurnLogSink()
+        attacker_state = BattleState.from_pokemon(attacker)
+        defender_state = BattleState.from_pokemon(defender)
+        self._resolve_attack(attacker_state, defender_state, move, turn_number, sink)
+        defender_state.write_back()
+        return sink.turns[0]
+    
+    def _resolve_attack(
+        self,
+        attacker_state: BattleState,
+        defender_state: BattleState,
+        move: Move,
+        turn_number: int,
+        sink: Optional[TurnSink]
+    ):
+        """Resolve um ataque do ativo de `attacker_state` no ativo de `defender_state`
+        
+        O dano vai para o HP do estado da batalha; sem destino, nada é
+        alocado para o turno.
+        """
+        attacker = attacker_state.specs[attacker_state.active]
+        slot = defender_state.active
+        defender = defender_state.specs[slot]
         
         # Verifica se o movimento acerta
         if not self.does_move_hit(move, attacker, defender):
-            return BattleTurn(
-                turn_number=turn_number,
-                attacker=attacker,
-                defender=defender,
-                move_used=move,
-                damage_dealt=0,
-                critical_hit=False,
-                effectiveness=1.0,
-                attacker_fainted=attacker.is_fainted,
-                defender_fainted=defender.is_fainted
-            )
+            if sink is not None:
+                sink.record(
+                    turn_number, attacker_state.members[attacker_state.active], defender_state.members[slot],
+                    move, 0, False, 1.0, False
+                )
+            return
         
         # Verifica golpe crítico
         critical_hit = self.is_critical_hit(attacker, move)
         
+        # Efetividade (uma única consulta, reaproveitada no dano e no log)
+        effectiveness = TypeEffectiveness.get_effectiveness_against(move.move_type, defender)
+        
         # Calcula dano
-        damage = self.calculate_damage(attacker, defender, move, critical_hit)
+        damage = self._calculate_damage(attacker, defender, move, critical_hit, effectiveness)
         
         # Aplica dano
-        defender.take_damage(damage)
+        fainted = defender_state.take_damage(slot, damage)
         
-        # Calcula efetividade
-        effectiveness = TypeEffectiveness.get_effectiveness(
-            move.move_type, 
-            defender.get_types()
-        )
+        if sink is not None:
+            sink.record(
+                turn_number, attacker_state.members[attacker_state.active], defender_state.members[slot],
+                move, damage, critical_hit, effectiveness, fainted
+            )
+    
+    def _resolve_table_attack(
+        self,
+        attacker_state: BattleState,
+        defender_state: BattleState,
+        row: "DamageRow",
+        turn_number: int,
+        sink: Optional[TurnSink]
+    ) -> Optional[int]:
+        """_resolve_attack com os termos fixos de uma linha da DamageTable
+        
+        Mesmos sorteios, na mesma ordem, e mesmo dano do caminho escalar.
+        Retorna o dano aplicado (None se errou).
+        """
+        rng = self.rng
+        slot = defender_state.active
+        
+        # Acerto (precisão 0 acerta sem sorteio)
+        if row.hit_rate is not None and not rng.random() * 100 < row.hit_rate:
+            if sink is not None:
+                sink.record(
+                    turn_number, attacker_state.members[attacker_state.active], defender_state.members[slot],
+                    row.move, 0, False, 1.0, False
+                )
+            return None
+        
+        critical_hit = rng.random() * 100 < row.crit_rate
+        
+        # Variação e limites (movimentos de status não sorteiam a variação)
+        if row.damage is None:
+            damage = 0
+        else:
+            damage = int(row.damage * (2.0 if critical_hit else 1.0) * rng.uniform(0.85, 1.0))
+            damage = max(1, min(damage, row.max_damage))
         
-        # Cria turno
-        turn = BattleTurn(
-            turn_number=turn_number,
-            attacker=attacker,
-            defender=defender,
-            move_used=move,
-            damage_dealt=damage,
-            critical_hit=critical_hit,
-            effectiveness=effectiveness,
-            attacker_fainted=attacker.is_fainted,
-            defender_fainted=defender.is_fainted
-        )
+        fainted = defender_state.take_damage(slot, damage)
         
-        return turn
+        if sink is not None:
+            sink.record(
+                turn_number, attacker_state.members[attacker_state.active], defender_state.members[slot],
+                row.move, damage, critical_hit, row.effectiveness, fainted
+            )
+        return damage
     
     def battle_pokemon(
         self,
         pokemon1: Pokemon,
         pokemon2: Pokemon,
         pokemon1_moves: Optional[List[Move]] = None,
-        pokemon2_moves: Optional[List[Move]] = None
+        pokemon2_moves: Optional[List[Move]] = None,
+        turn_sink: TurnSinkSpec = "full"
     ) -> BattleLog:
-        """Batalha entre dois Pokémon"""
+        """Batalha entre dois Pokémon, a partir do HP atual de cada um
         
-        # Movimentos padrão se não fornecidos
-        if pokemon1_moves is None:
-            if pokemon1.move_set is not None:
-                pokemon1_moves = [move for move in pokemon1.move_set.moves if move.category != MoveCategory.STATUS]
-            else:
-                # Move set realista baseado no nome do Pokémon
-                from .moves import create_realistic_moveset
-                pokemon1.move_set = create_realistic_moveset(pokemon1.name)
-                pokemon1_moves = [move for move in pokemon1.move_set.moves if move.category != MoveCategory.STATUS]
-        
-        if pokemon2_moves is None:
-            if pokemon2.move_set is not None:
-                pokemon2_moves = [move for move in pokemon2.move_set.moves if move.category != MoveCategory.STATUS]
-            else:
-                # Move set realista baseado no nome do Pokémon
-                from .moves import create_realistic_moveset
-                pokemon2.move_set = create_realistic_moveset(pokemon2.name)
-                pokemon2_moves = [move for move in pokemon2.move_set.moves if move.category != MoveCategory.STATUS]
-        
-        turns = []
-        turn_number = 1
+        O HP final é copiado de volta para os dois objetos.
+        turn_sink: "full" (log completo, padrão), "counters", "none" ou um
+        TurnSink/função que recebe cada turno.
+        """
         
-        # Loop principal da batalha
-        while (not pokemon1.is_fainted and not pokemon2.is_fainted and 
-               turn_number <= self.max_turns):
-            
-            # Determina ordem de ataque (velocidade)
-            if pokemon1.speed >= pokemon2.speed:
-                first_attacker, second_attacker = pokemon1, pokemon2
-                first_moves, second_moves = pokemon1_moves, pokemon2_moves
-            else:
-                first_attacker, second_attacker = pokemon2, pokemon1
-                first_moves, second_moves = pokemon2_moves, pokemon1_moves
-            
-            # Primeiro ataque
-            if not first_attacker.is_fainted and not second_attacker.is_fainted:
-                move = random.choice(first_moves)
-                turn = self.execute_turn(first_attacker, second_attacker, move, turn_number)
-                turns.append(turn)
-                
-                if second_attacker.is_fainted:
-                    break
-            
-            # Segundo ataque (se o segundo ainda estiver vivo)
-            if not first_attacker.is_fainted and not second_attacker.is_fainted:
-                move = random.choice(second_moves)
-                turn = self.execute_turn(second_attacker, first_attacker, move, turn_number)
-                turns.append(turn)
-            
-            turn_number += 1
+        sink = resolve_turn_sink(turn_sink)
+        state1 = BattleState.from_pokemon(pokemon1)
+        state2 = BattleState.from_pokemon(pokemon2)
+        total_turns = self._run_pokemon_battle(state1, state2, pokemon1_moves, pokemon2_moves, sink)
+        state1.write_back()
+        state2.write_back()
         
         # Determina vencedor
-        if pokemon1.is_fainted and pokemon2.is_fainted:
+        if state1.is_defeated and state2.is_defeated:
             result = BattleResult.DRAW
             winner = None
-        elif pokemon1.is_fainted:
+        elif state1.is_defeated:
             result = BattleResult.LOSS
             winner = None  # pokemon2 venceu
         else:
             result = BattleResult.WIN
             winner = None  # pokemon1 venceu
         
+        return self._make_log(sink, winner, total_turns, result, (state1, state2))
+    
+    def _make_log(
+        self,
+        sink: Optional[TurnSink],
+        winner: Optional[PokemonTeam],
+        total_turns: int,
+        result: BattleResult,
+        final_states: Optional[Tuple[BattleState, BattleState]] = None
+    ) -> BattleLog:
+        """Monta o BattleLog conforme o destino de turnos usado"""
+        if isinstance(sink, TurnLogSink):
+            return BattleLog(
+                turns=sink.turns, winner=winner, total_turns=total_turns, battle_result=result,
+                final_states=final_states
+            )
+        
         return BattleLog(
-            turns=turns,
+            turns=[],
             winner=winner,
-            total_turns=turn_number - 1,
-            battle_result=result
+            total_turns=total_turns,
+            battle_result=result,
+            turn_sink=sink,
+            final_states=final_states
         )
     
+    def _run_pokemon_battle(
+        self,
+        state1: BattleState,
+        state2: BattleState,
+        pokemon1_moves: Optional[List[Move]],
+        pokemon2_moves: Optional[List[Move]],
+        sink: Optional[TurnSink]
+    ) -> int:
+        """Executa o confronto 1x1 entre os ativos e retorna o número de turnos completos"""
+        
+        if state1.active_fainted or state2.active_fainted:
+            return 0
+        
+        spec1 = state1.specs[state1.active]
+        spec2 = state2.specs[state2.active]
+        
+        # Movimentos padrão se não fornecidos: linhas da tabela de dano, na
+        # ordem de spec.moves (o sorteio com choice consome o mesmo número)
+        if pokemon1_moves is None:
+            moves1, attack1 = self.damage_table.matchup(spec1, spec2).rows, self._resolve_table_attack
+        else:
+            moves1, attack1 = pokemon1_moves, self._resolve_attack
+        if pokemon2_moves is None:
+            moves2, attack2 = self.damage_table.matchup(spec2, spec1).rows, self._resolve_table_attack
+        else:
+            moves2, attack2 = pokemon2_moves, self._resolve_attack
+        
+        # Ordem de ataque (velocidade não muda durante o confronto)
+        if spec1.speed >= spec2.speed:
+            first, second = state1, state2
+            first_moves, second_moves = moves1, moves2
+            first_attack, second_attack = attack1, attack2
+        else:
+            first, second = state2, state1
+            first_moves, second_moves = moves2, moves1
+            first_attack, second_attack = attack2, attack1
+        
+        turn_number = 1
+        
+        # Loop principal da batalha
+        while turn_number <= self.max_turns:
+            
+            # Primeiro ataque
+            first_attack(first, second, self.rng.choice(first_moves), turn_number, sink)
+            
+            if second.active_fainted:
+                break
+            
+            # Segundo ataque (o segundo ainda está vivo)
+            second_attack(second, first, self.rng.choice(second_moves), turn_number, sink)
+            
+            turn_number += 1
+            
+            if first.active_fainted:
+                break
+        
+        return turn_number - 1
+    
     def battle_teams(
         self,
         team1: PokemonTeam,
         team2: PokemonTeam,
-        auto_switch: bool = True
+        auto_switch: bool = True,
+        turn_sink: TurnSinkSpec = "full"
     ) -> BattleLog:
-        """Batalha entre duas equipes"""
+        """Batalha entre duas equipes
         
-        # Restaura equipes
-        team1.restore_team()
-        team2.restore_team()
+        Cada batalha começa com HP cheio em um BattleState próprio; os
+        Pokémon das equipes não são alterados (o estado final fica em
+        `BattleLog.final_states`).
+        turn_sink: "full" (log completo, padrão), "counters", "none" ou um
+        TurnSink/função que recebe cada turno.
+        """
+        
+        sink = resolve_turn_sink(turn_sink)
+        state1 = BattleState.from_team(team1)
+        state2 = BattleState.from_team(team2)
         
-        turns = []
         turn_number = 1
         
         # Loop principal da batalha
-        while (not team1.is_defeated and not team2.is_defeated and 
+        while (not state1.is_defeated and not state2.is_defeated and 
                turn_number <= self.max_turns):
             
-            # Pokémon ativos
-            pokemon1 = team1.active_pokemon
-            pokemon2 = team2.active_pokemon
-            
-            if pokemon1 is None or pokemon2 is None:
-                break
-            
             # Batalha entre os Pokémon ativos
-            pokemon_battle = self.battle_pokemon(pokemon1, pokemon2)
-            turns.extend(pokemon_battle.turns)
+            self._run_pokemon_battle(state1, state2, None, None, sink)
             
             # Troca automática se necessário
             if auto_switch:
-                if pokemon1.is_fainted:
-                    team1.auto_switch()
-                if pokemon2.is_fainted:
-                    team2.auto_switch()
+                if state1.active_fainted:
+                    state1.auto_switch()
+                if state2.active_fainted:
+                    state2.auto_switch()
             
             turn_number += 1
         
         # Determina vencedor
-        if team1.is_defeated and team2.is_defeated:
+        if state1.is_defeated and state2.is_defeated:
             result = BattleResult.DRAW
             winner = None
-        elif team1.is_defeated:
+        elif state1.is_defeated:
             result = BattleResult.LOSS
             winner = team2
         else:
             result = BattleResult.WIN
             winner = team1
         
-        return BattleLog(
-            turns=turns,
-            winner=winner,
-            total_turns=turn_number - 1,
-            battle_result=result
-        )
+        return self._make_log(sink, winner, turn_number - 1, result, (state1, state2))
     
     def simulate_battle(
         self,
         team1: PokemonTeam,
         team2: PokemonTeam,
-        num_simulations: int = 100
+        num_simulations: int = 100,
+        engine: Optional[str] = None,
+        n_workers: Optional[int] = None,
+        seed: Optional[int] = None,
+        target_precision: Optional[float] = None,
+        confidence: float = 0.95
     ) -> Dict[str, float]:
-        """Simula múltiplas batalhas e retorna estatísticas"""
+        """Simula múltiplas batalhas e retorna estatísticas
+        
+        engine: "scalar" (uma batalha por vez) ou "vectorized" (lote NumPy);
+        por padrão usa o motor configurado na instância.
+        n_workers/seed: com mais de um worker ou com semente explícita, as
+        simulações são divididas em fragmentos com fluxos aleatórios próprios
+        (resultado idêntico para a mesma semente, qualquer que seja n_workers).
+        target_precision: modo sequencial - simula em lotes até a meia-largura
+        do intervalo de Wilson ficar abaixo do alvo (num_simulations vira o
+        máximo) e inclui o intervalo e o total de batalhas no resultado.
+        """
+        engine = engine or self.simulation_engine
+        if engine not in self.SIMULATION_ENGINES:
+            raise ValueError(f"Motor de simulação inválido: {engine}")
+        n_workers = n_workers or self.n_workers
+        
+        if target_precision is not None:
+            return self._simulate_until_precise(
+                team1, team2, num_simulations, target_precision, confidence,
+                engine, n_workers, seed
+            )
+        
+        return self._simulate_totals(team1, team2, num_simulations, engine, n_workers, seed).as_rates()
+    
+    def _simulate_totals(
+        self,
+        team1: PokemonTeam,
+        team2: PokemonTeam,
+        num_simulations: int,
+        engine: str,
+        n_workers: int,
+        seed: Optional[int]
+    ) -> "SimulationTotals":
+        """Contagens inteiras de um lote (fragmentado, vetorizado ou escalar)"""
+        from .parallel import ParallelSimulator, SimulationTotals
+        
+        if n_workers > 1 or seed is not None:
+            if seed is None:
+                seed = self.rng.getrandbits(64)
+            return ParallelSimulator(n_workers).simulate(
+                team1, team2, num_simulations, seed,
+                engine=engine, max_turns=self.max_turns
+            )
         
-        wins = 0
-        losses = 0
-        draws = 0
-        total_turns = 0
+        if engine == "vectorized":
+            from .vectorized_battle import VectorizedBattleEngine
+            engine_rng = np.random.default_rng(self.rng.getrandbits(64))
+            results = VectorizedBattleEngine(max_turns=self.max_turns, rng=engine_rng).run(
+                team1, team2, num_simulations
+            )
+            return SimulationTotals.from_vectorized(results, num_simulations)
         
+        totals = SimulationTotals(battles=num_simulations)
         for _ in range(num_simulations):
-            battle_log = self.battle_teams(team1, team2)
+            battle_log = self.battle_teams(team1, team2, turn_sink="none")
             
             if battle_log.battle_result == BattleResult.WIN:
-                wins += 1
+                totals.wins += 1
             elif battle_log.battle_result == BattleResult.LOSS:
-                losses += 1
+                totals.losses += 1
             else:
-                draws += 1
+                totals.draws += 1
             
-            total_turns += battle_log.total_turns
+            totals.total_turns += battle_log.total_turns
         
-        return {
-            "win_rate": wins / num_simulations,
-            "loss_rate": losses / num_simulations,
-            "draw_rate": draws / num_simulations,
-            "avg_turns": total_turns / num_simulations
-        }
+        return totals
+    
+    def _simulate_until_precise(
+        self,
+        team1: PokemonTeam,
+        team2: PokemonTeam,
+        max_simulations: int,
+        target_precision: float,
+        confidence: float,
+        engine: str,
+        n_workers: int,
+        seed: Optional[int]
+    ) -> Dict[str, float]:
+        """Simulação sequencial em lotes, parando pela precisão do intervalo"""
+        from .parallel import SimulationTotals
+        from .racing import wilson_interval
+        from .rng import derive_seed
+        
+        if seed is None and n_workers > 1:
+            seed = self.rng.getrandbits(64)
+        
+        batch_size = self.SEQUENTIAL_BATCH_SIZES[engine]
+        totals = SimulationTotals()
+        low, high = 0.0, 1.0
+        batch_index = 0
+        
+        while totals.battles < max_simulations:
+            batch = min(batch_size, max_simulations - totals.battles)
+            batch_seed = derive_seed(seed, batch_index) if seed is not None else None
+            totals = totals.merge(self._simulate_totals(team1, team2, batch, engine, n_workers, batch_seed))
+            batch_index += 1
+            
+            low, high = wilson_interval(totals.wins, totals.battles, confidence)
+            if (high - low) / 2 <= target_precision:
+                break
+        
+        stats = totals.as_rates()
+        stats.update({
+            "num_simulations": totals.battles,
+            "win_rate_ci_low": low,
+            "win_rate_ci_high": high
+        })
+        return stats
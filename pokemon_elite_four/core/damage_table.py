@@ -0,0 +1,225 @@
+"""
+Tabela de Dano - Termos fixos de cada confronto atacante x defensor x movimento
+
+Em BattleSystem._calculate_damage só a variação (random.uniform(0.85, 1.0)) e
+o crítico mudam entre golpes do mesmo confronto. A tabela guarda, por par de
+espécies (nível, stats, tipos e movimentos), o dano base já multiplicado pela
+efetividade, as taxas de acerto e de crítico e o limite de 4x HP; o turno vira
+uma consulta mais os sorteios de sempre, na mesma ordem e com o mesmo valor
+do caminho escalar. As distribuições discretas do dano (normal e crítico) são
+calculadas sob demanda a partir dos limiares exatos da variação.
+"""
+
+import math
+from bisect import bisect_right
+from typing import Dict, List, Optional, Tuple
+from .battle_state import SpeciesSpec
+from .battle_system import TypeEffectiveness
+from .moves import Move, MoveCategory
+
+VARIATION_MIN = 0.85
+VARIATION_MAX = 1.0
+
+
+def species_key(spec: SpeciesSpec) -> Tuple:
+    """Chave de uma espécie na tabela (id, nível, stats, tipos e movimentos)"""
+    return (
+        spec.pokemon_id, spec.name, spec.level, spec.max_hp, spec.attack, spec.defense,
+        spec.sp_attack, spec.sp_defense, spec.speed, spec.type_indices,
+        tuple((move.name, move.type_index, move.category, move.power, move.accuracy) for move in spec.moves)
+    )
+
+
+class DamageRow:
+    """Termos fixos de um movimento de um atacante contra um defensor"""
+
+    __slots__ = ("move", "hit_rate", "crit_rate", "effectiveness", "damage", "max_damage", "_cuts")
+
+    def __init__(self, attacker: SpeciesSpec, defender: SpeciesSpec, move: Move):
+        self.move = move
+
+        # does_move_hit: precisão 0 acerta sem sorteio
+        if move.accuracy == 0:
+            self.hit_rate = None
+        else:
+            speed_modifier = attacker.speed / (attacker.speed + defender.speed)
+            accuracy_modifier = 1.0 + (speed_modifier - 0.5) * 0.1
+            self.hit_rate = move.accuracy * accuracy_modifier
+
+        # is_critical_hit
+        self.crit_rate = 6.25 * (1 + min(attacker.speed / 512, 1.0))
+
+        # _calculate_damage até a efetividade (None = movimento de status, dano 0)
+        self.effectiveness = TypeEffectiveness.get_effectiveness_by_index(move.type_index, *defender.type_indices)
+        if move.category == MoveCategory.PHYSICAL:
+            attack_stat, defense_stat = attacker.attack, defender.defense
+        elif move.category == MoveCategory.SPECIAL:
+            attack_stat, defense_stat = attacker.sp_attack, defender.sp_defense
+        else:
+            attack_stat = defense_stat = None
+
+        if attack_stat is None:
+            self.damage = None
+        else:
+            base_damage = ((2 * attacker.level + 10) * move.power * attack_stat / defense_stat / 50) + 2
+            self.damage = base_damage * self.effectiveness
+        self.max_damage = defender.max_hp * 4
+        self._cuts = {}
+
+    def roll(self, critical: bool, variation: float) -> int:
+        """Dano para um crítico/variação sorteados (mesma conta do motor escalar)"""
+        damage = int(self.damage * (2.0 if critical else 1.0) * variation)
+        return max(1, min(damage, self.max_damage))
+
+    def thresholds(self, critical: bool = False) -> Tuple[int, Tuple[float, ...]]:
+        """(menor dano, limiares): o dano é o menor mais o número de limiares <= variação"""
+        cuts = self._cuts.get(critical)
+        if cuts is not None:
+            return cuts
+
+        scaled = self.damage * (2.0 if critical else 1.0)
+        low = self.roll(critical, VARIATION_MIN)
+        high = self.roll(critical, VARIATION_MAX)
+
+        thresholds = []
+        for value in range(low + 1, high + 1):
+            # Menor variação com dano >= value (a conta é monótona na variação)
+            variation = value / scaled
+            while variation > VARIATION_MIN and self.roll(critical, variation) >= value:
+                variation = math.nextafter(variation, -math.inf)
+            while self.roll(critical, variation) < value:
+                variation = math.nextafter(variation, math.inf)
+            thresholds.append(variation)
+
+        cuts = self._cuts[critical] = (low, tuple(thresholds))
+        return cuts
+
+    def distribution(self, critical: bool = False) -> List[Tuple[int, float]]:
+        """Distribuição discreta do dano quando acerta: [(dano, probabilidade)]"""
+        if self.damage is None:
+            return [(0, 1.0)]
+        low, thresholds = self.thresholds(critical)
+        edges = (VARIATION_MIN,) + thresholds + (VARIATION_MAX,)
+        width = VARIATION_MAX - VARIATION_MIN
+        return [
+            (low + k, (edges[k + 1] - edges[k]) / width)
+            for k in range(len(edges) - 1)
+            if edges[k + 1] > edges[k]
+        ]
+
+    def lookup(self, critical: bool, variation: float) -> int:
+        """Dano pela distribuição discretizada (igual a `roll`)"""
+        if self.damage is None:
+            return 0
+        low, thresholds = self.thresholds(critical)
+        return low + bisect_right(thresholds, variation)
+
+    @property
+    def hit_probability(self) -> float:
+        if self.hit_rate is None:
+            return 1.0
+        return min(max(self.hit_rate / 100, 0.0), 1.0)
+
+    @property
+    def crit_probability(self) -> float:
+        return min(self.crit_rate / 100, 1.0)
+
+    def expected_damage(self) -> float:
+        """Dano esperado por uso (acerto x mistura normal/crítico)"""
+        if self.damage is None:
+            return 0.0
+        normal = sum(value * probability for value, probability in self.distribution(False))
+        critical = sum(value * probability for value, probability in self.distribution(True))
+        crit = self.crit_probability
+        return self.hit_probability * ((1 - crit) * normal + crit * critical)
+
+
+class MatchupDamage:
+    """Linhas de todos os movimentos de dano de um atacante contra um defensor"""
+
+    __slots__ = ("rows", "by_name")
+
+    def __init__(self, attacker: SpeciesSpec, defender: SpeciesSpec):
+        self.rows = tuple(DamageRow(attacker, defender, move) for move in attacker.moves)
+        self.by_name = {}
+        for row in self.rows:
+            self.by_name.setdefault(row.move.name, row)
+
+    def row_for(self, move: Move) -> Optional[DamageRow]:
+        """Linha de um movimento do atacante (None se ele não está na tabela)"""
+        row = self.by_name.get(move.name)
+        if row is None or (row.move is not move and row.move != move):
+            return None
+        return row
+
+
+class DamageTable:
+    """Cache limitado (atacante, defensor) -> MatchupDamage
+
+    As chaves são por valor (species_key), então equipes diferentes com as
+    mesmas espécies compartilham as linhas; os pares de specs já vistos são
+    resolvidos pela identidade, sem montar a chave. Ao atingir `max_size` a
+    tabela é esvaziada.
+    """
+
+    def __init__(self, max_size: int = 50_000):
+        self.max_size = max_size
+        self._entries: Dict[Tuple, MatchupDamage] = {}
+        self._pairs: Dict[Tuple[int, int], Tuple[SpeciesSpec, SpeciesSpec, MatchupDamage]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, attacker: SpeciesSpec, defender: SpeciesSpec) -> Optional[MatchupDamage]:
+        pair = (id(attacker), id(defender))
+        cached = self._pairs.get(pair)
+        if cached is not None and cached[0] is attacker and cached[1] is defender:
+            self.hits += 1
+            return cached[2]
+
+        entry = self._entries.get((species_key(attacker), species_key(defender)))
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._remember(pair, attacker, defender, entry)
+        return entry
+
+    def matchup(self, attacker: SpeciesSpec, defender: SpeciesSpec) -> MatchupDamage:
+        """Linhas do confronto (calculadas no primeiro uso)"""
+        entry = self.get(attacker, defender)
+        if entry is None:
+            if len(self._entries) >= self.max_size:
+                self._entries.clear()
+            entry = MatchupDamage(attacker, defender)
+            self._entries[(species_key(attacker), species_key(defender))] = entry
+            self._remember((id(attacker), id(defender)), attacker, defender, entry)
+        return entry
+
+    def _remember(self, pair: Tuple[int, int], attacker: SpeciesSpec, defender: SpeciesSpec,
+                  entry: MatchupDamage) -> None:
+        """Atalho por identidade (guarda os specs para a conferência)"""
+        if len(self._pairs) >= self.max_size:
+            self._pairs.clear()
+        self._pairs[pair] = (attacker, defender, entry)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._pairs.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> Dict[str, float]:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+# Compartilhada pelos motores (uma otimização cria muitos BattleSystem)
+DEFAULT_DAMAGE_TABLE = DamageTable()
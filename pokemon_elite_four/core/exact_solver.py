@@ -0,0 +1,223 @@
+"""
+Solucionador Exato de Confrontos 1x1 - Programação dinâmica sobre estados de HP
+Reproduz as regras de BattleSystem.battle_pokemon (movimento uniforme, acerto,
+crítico, variação de 85-100%, ordem por velocidade e limite de turnos) sem
+amostragem: as probabilidades saem diretamente da cadeia de Markov.
+"""
+
+import math
+from dataclasses import dataclass, asdict
+from typing import Dict, List, Optional
+import numpy as np
+from .pokemon import Pokemon
+from .moves import Move
+from .vectorized_battle import MatchupTables, compile_pokemon, build_matchup_tables
+
+
+# Faixa da variação de dano: random.uniform(0.85, 1.0)
+VARIATION_MIN = 0.85
+VARIATION_WIDTH = 1.0 - VARIATION_MIN
+
+
+@dataclass
+class DuelSolution:
+    """Resultado exato de um confronto (do ponto de vista de pokemon1)"""
+    win_probability: float
+    loss_probability: float
+    draw_probability: float
+    timeout_probability: float  # Limite de turnos (contado como vitória, como no motor)
+    expected_turns: float
+    expected_damage_dealt: float
+    expected_damage_taken: float
+
+    def as_dict(self) -> Dict[str, float]:
+        return asdict(self)
+
+
+def _roll_distribution(damage: float, max_damage: int, out: np.ndarray, weight: float):
+    """Acumula em `out` a distribuição de max(1, min(int(damage * v), max_damage)), v ~ U[0.85, 1)"""
+    if damage <= 0:
+        out[1] += weight
+        return
+
+    values = np.arange(math.floor(damage * VARIATION_MIN), math.ceil(damage))
+    low = np.maximum(values / damage, VARIATION_MIN)
+    high = np.minimum((values + 1) / damage, 1.0)
+    probabilities = np.clip(high - low, 0.0, None) / VARIATION_WIDTH
+
+    np.add.at(out, np.clip(values, 1, max_damage), weight * probabilities)
+
+
+def damage_distribution(tables: MatchupTables, attacker: int, defender: int) -> np.ndarray:
+    """P(dano = d) de um ataque, d = 0 (erro) até o limite de 4x HP do defensor"""
+    max_damage = int(tables.max_damage[defender])
+    distribution = np.zeros(max_damage + 1)
+
+    num_moves = int(tables.num_moves[attacker])
+    crit_probability = min(max(tables.crit_rate[attacker] / 100, 0.0), 1.0)
+
+    for move in range(num_moves):
+        hit_probability = min(max(tables.hit_rate[attacker, defender, move] / 100, 0.0), 1.0)
+        base_damage = tables.base_damage[attacker, defender, move]
+        weight = 1.0 / num_moves
+
+        distribution[0] += weight * (1.0 - hit_probability)
+        _roll_distribution(base_damage, max_damage, distribution,
+                           weight * hit_probability * (1.0 - crit_probability))
+        _roll_distribution(base_damage * 2.0, max_damage, distribution,
+                           weight * hit_probability * crit_probability)
+
+    return distribution
+
+
+def transition_matrix(distribution: np.ndarray, max_hp: int) -> np.ndarray:
+    """Matriz T[h, h'] de HP antes/depois de um ataque (linha 0 fica vazia)"""
+    size = max_hp + 1
+    matrix = np.zeros((size, size))
+    hp = np.arange(1, size)
+
+    for damage in np.flatnonzero(distribution):
+        matrix[hp, np.maximum(0, hp - damage)] += distribution[damage]
+
+    return matrix
+
+
+class ExactDuelSolver:
+    """Calcula probabilidades exatas de confrontos 1x1
+
+    Como cada ataque depende só do HP do defensor, a massa de probabilidade
+    das batalhas em andamento é sempre um produto f(hp_primeiro) x g(hp_segundo):
+    basta propagar dois vetores, sem a matriz conjunta de estados.
+    """
+
+    def __init__(self, max_turns: int = 100):
+        self.max_turns = max_turns
+
+    def solve(
+        self,
+        pokemon1: Pokemon,
+        pokemon2: Pokemon,
+        pokemon1_moves: Optional[List[Move]] = None,
+        pokemon2_moves: Optional[List[Move]] = None
+    ) -> DuelSolution:
+        """Resolve pokemon1 x pokemon2 a partir do HP atual de cada um"""
+        roster1 = [pokemon1]
+        roster2 = [pokemon2]
+
+        if pokemon1_moves is not None or pokemon2_moves is not None:
+            roster1 = [_with_moves(pokemon1, pokemon1_moves)]
+            roster2 = [_with_moves(pokemon2, pokemon2_moves)]
+
+        compiled1 = compile_pokemon(roster1)
+        compiled2 = compile_pokemon(roster2)
+        return self.solve_tables(
+            build_matchup_tables(compiled1, compiled2),
+            build_matchup_tables(compiled2, compiled1),
+            0, 0,
+            pokemon1.current_hp, pokemon2.current_hp,
+            pokemon1.max_hp, pokemon2.max_hp,
+            pokemon1.speed >= pokemon2.speed
+        )
+
+    def solve_tables(
+        self,
+        tables_12: MatchupTables,
+        tables_21: MatchupTables,
+        index1: int,
+        index2: int,
+        hp1: int,
+        hp2: int,
+        max_hp1: int,
+        max_hp2: int,
+        pokemon1_first: bool
+    ) -> DuelSolution:
+        """Resolve a partir de tabelas pré-compiladas (usado em lote pelo atlas)"""
+
+        # Algum já desmaiado: o loop do motor nem começa
+        if hp1 <= 0 or hp2 <= 0:
+            win = float(hp1 > 0)
+            draw = float(hp1 <= 0 and hp2 <= 0)
+            return DuelSolution(win, 1.0 - win - draw, draw, 0.0, 0.0, 0.0, 0.0)
+
+        damage_12 = damage_distribution(tables_12, index1, index2)
+        damage_21 = damage_distribution(tables_21, index2, index1)
+
+        if pokemon1_first:
+            first_damage, second_damage = damage_12, damage_21
+            first_hp, second_hp, first_max, second_max = hp1, hp2, max_hp1, max_hp2
+        else:
+            first_damage, second_damage = damage_21, damage_12
+            first_hp, second_hp, first_max, second_max = hp2, hp1, max_hp2, max_hp1
+
+        # Ataque do primeiro altera o HP do segundo e vice-versa
+        hits_second = transition_matrix(first_damage, second_max)
+        hits_first = transition_matrix(second_damage, first_max)
+
+        first = np.zeros(first_max + 1)
+        second = np.zeros(second_max + 1)
+        first[min(first_hp, first_max)] = 1.0
+        second[min(second_hp, second_max)] = 1.0
+
+        second_fainted = 0.0
+        first_fainted = 0.0
+        expected_turns = 0.0
+        first_attacks = 0.0
+        second_attacks = 0.0
+
+        for turn in range(1, self.max_turns + 1):
+            first_mass = first.sum()
+            alive = first_mass * second.sum()
+            if alive == 0.0:
+                break
+
+            # Primeiro ataque; nocaute encerra sem completar o turno
+            first_attacks += alive
+            second = second @ hits_second
+            knocked_out = first_mass * second[0]
+            second[0] = 0.0
+            second_fainted += knocked_out
+            expected_turns += knocked_out * (turn - 1)
+
+            # Segundo ataque (se o segundo ainda estiver vivo)
+            second_mass = second.sum()
+            second_attacks += first_mass * second_mass
+            first = first @ hits_first
+            knocked_out = first[0] * second_mass
+            first[0] = 0.0
+            first_fainted += knocked_out
+            expected_turns += knocked_out * turn
+
+        timeout = first.sum() * second.sum()
+        expected_turns += timeout * self.max_turns
+
+        mean_first_damage = float(np.arange(first_damage.size) @ first_damage)
+        mean_second_damage = float(np.arange(second_damage.size) @ second_damage)
+
+        if pokemon1_first:
+            win, loss = second_fainted + timeout, first_fainted
+            dealt = first_attacks * mean_first_damage
+            taken = second_attacks * mean_second_damage
+        else:
+            win, loss = first_fainted + timeout, second_fainted
+            dealt = second_attacks * mean_second_damage
+            taken = first_attacks * mean_first_damage
+
+        return DuelSolution(
+            win_probability=float(win),
+            loss_probability=float(loss),
+            draw_probability=0.0,  # Um nocaute sempre encerra o 1x1 antes do contra-ataque
+            timeout_probability=float(timeout),
+            expected_turns=float(expected_turns),
+            expected_damage_dealt=float(dealt),
+            expected_damage_taken=float(taken)
+        )
+
+
+def _with_moves(pokemon: Pokemon, moves: Optional[List[Move]]) -> Pokemon:
+    """Cópia rasa do Pokémon com a lista de movimentos dada"""
+    if moves is None:
+        return pokemon
+    from .moves import MoveSet
+    clone = Pokemon(pokemon.name, pokemon.pokemon_id, pokemon.type1, pokemon.type2, pokemon.stats, pokemon.level)
+    clone.move_set = MoveSet(list(moves))
+    return clone
@@ -3,10 +3,10 @@ Sistema de Movimentos Pokémon - Game Boy Advanced
 Baseado no sistema de FireRed/LeafGreen
 """
 
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Sequence, Tuple
 from dataclasses import dataclass
 from enum import Enum
-from .pokemon import PokemonType
+from .pokemon import PokemonType, type_index
 
 
 class MoveCategory(Enum):
@@ -46,35 +46,61 @@ class Move:
             raise ValueError("Accuracy deve estar entre 0 e 100")
         if self.pp <= 0:
             raise ValueError("PP deve ser maior que 0")
+    
+    @property
+    def type_index(self) -> int:
+        """Ordinal do tipo do movimento nas tabelas de efetividade"""
+        return type_index(self.move_type)
 
 
 class MoveSet:
-    """Conjunto de movimentos de um Pokémon"""
+    """Conjunto de movimentos de um Pokémon
+    
+    A lista de movimentos pode ser compartilhada (tuplas do registro de
+    movesets); o PP é estado de batalha de cada instância, criado só no
+    primeiro uso - construir um MoveSet não copia nada.
+    """
     
-    def __init__(self, moves: List[Move]):
+    __slots__ = ("moves", "_current_pp")
+    
+    def __init__(self, moves: Sequence[Move]):
         if len(moves) > 4:
             raise ValueError("Um Pokémon pode ter no máximo 4 movimentos")
         self.moves = moves
-        self.current_pp = [move.pp for move in moves]
+        self._current_pp: Optional[List[int]] = None  # None = PP cheio
+    
+    @property
+    def current_pp(self) -> List[int]:
+        """PP restante de cada movimento"""
+        if self._current_pp is None:
+            self._current_pp = [move.pp for move in self.moves]
+        return self._current_pp
+    
+    @current_pp.setter
+    def current_pp(self, value: List[int]) -> None:
+        self._current_pp = value
     
     def get_available_moves(self) -> List[Move]:
         """Retorna movimentos com PP disponível"""
-        return [move for i, move in enumerate(self.moves) if self.current_pp[i] > 0]
+        if self._current_pp is None:
+            return list(self.moves)
+        return [move for i, move in enumerate(self.moves) if self._current_pp[i] > 0]
     
     def use_move(self, move_index: int) -> bool:
         """Usa um movimento (consome PP)"""
-        if 0 <= move_index < len(self.moves) and self.current_pp[move_index] > 0:
-            self.current_pp[move_index] -= 1
+        current_pp = self.current_pp
+        if 0 <= move_index < len(self.moves) and current_pp[move_index] > 0:
+            current_pp[move_index] -= 1
             return True
         return False
     
     def restore_pp(self, move_index: Optional[int] = None) -> None:
         """Restaura PP de um movimento ou todos"""
         if move_index is not None:
-            if 0 <= move_index < len(self.moves):
-                self.current_pp[move_index] = self.moves[move_index].pp
+            if 0 <= move_index < len(self.moves) and self._current_pp is not None:
+                self._current_pp[move_index] = self.moves[move_index].pp
         else:
-            self.current_pp = [move.pp for move in self.moves]
+            self._current_pp = None
     
     def get_move_by_name(self, name: str) -> Optional[Move]:
         """Busca movimento por nome"""
@@ -172,6 +198,11 @@ def get_move_by_name(name: str) -> Optional[Move]:
 
 def create_default_moveset(pokemon_type: PokemonType) -> MoveSet:
     """Cria um conjunto de movimentos padrão baseado no tipo"""
+    return MoveSet(get_moveset_registry().default_moves(pokemon_type))
+
+
+def _build_default_moves(pokemon_type: PokemonType) -> Tuple[Move, ...]:
+    """Movimentos padrão do tipo (calculado uma vez por tipo pelo registro)"""
     moves = []
     
     # Movimento básico baseado no tipo
@@ -223,11 +254,11 @@ def create_default_moveset(pokemon_type: PokemonType) -> MoveSet:
                 moves.append(move)
                 break
     
-    return MoveSet(moves[:4])
+    return tuple(moves[:4])
 
 
-def load_pokemon_movesets() -> dict:
-    """Carrega movesets reais dos Pokémon baseado em dados hardcoded"""
+def _build_pokemon_movesets() -> Dict[str, Tuple[Move, ...]]:
+    """Movesets reais dos Pokémon (dados hardcoded), como tuplas imutáveis"""
     movesets = {}
     
     # Movesets específicos para Pokémon populares
@@ -298,18 +329,63 @@ def load_pokemon_movesets() -> dict:
                 moves.append(move)
         
         if moves:
-            movesets[pokemon_name] = MoveSet(moves)
+            movesets[pokemon_name] = tuple(moves)
     
     return movesets
 
 
+class MovesetRegistry:
+    """Registro construído uma única vez com os movesets imutáveis
+    
+    Os movesets por nome são montados no primeiro acesso e os padrões por
+    tipo sob demanda; cada Pokémon recebe um MoveSet novo (PP próprio) que
+    apenas referencia a tupla compartilhada.
+    """
+    
+    def __init__(self):
+        self._movesets: Optional[Dict[str, Tuple[Move, ...]]] = None
+        self._defaults: Dict[PokemonType, Tuple[Move, ...]] = {}
+    
+    @property
+    def movesets(self) -> Dict[str, Tuple[Move, ...]]:
+        """Movesets reais por nome de Pokémon"""
+        if self._movesets is None:
+            self._movesets = _build_pokemon_movesets()
+        return self._movesets
+    
+    def default_moves(self, pokemon_type: PokemonType) -> Tuple[Move, ...]:
+        """Movimentos padrão de um tipo"""
+        moves = self._defaults.get(pokemon_type)
+        if moves is None:
+            moves = self._defaults[pokemon_type] = _build_default_moves(pokemon_type)
+        return moves
+    
+    def moves_for(self, pokemon_name: str) -> Tuple[Move, ...]:
+        """Moveset real do Pokémon, ou o padrão Normal se não houver"""
+        moves = self.movesets.get(pokemon_name)
+        if moves is None:
+            moves = self.default_moves(PokemonType.NORMAL)
+        return moves
+
+
+_registry: Optional[MovesetRegistry] = None
+
+
+def get_moveset_registry() -> MovesetRegistry:
+    """Registro global de movesets (criado no primeiro uso)"""
+    global _registry
+    if _registry is None:
+        _registry = MovesetRegistry()
+    return _registry
+
+
+def load_pokemon_movesets() -> dict:
+    """Carrega movesets reais dos Pokémon baseado em dados hardcoded"""
+    return {
+        name: MoveSet(moves) for name, moves in get_moveset_registry().movesets.items()
+    }
+
+
 def create_realistic_moveset(pokemon_name: str) -> MoveSet:
     """Cria moveset realista baseado no nome do Pokémon"""
-    movesets = load_pokemon_movesets()
-    
-    if pokemon_name in movesets:
-        return movesets[pokemon_name]
-    else:
-        # Fallback para tipo genérico se não encontrar
-        from .pokemon import PokemonType
-        return create_default_moveset(PokemonType.NORMAL)
+    return MoveSet(get_moveset_registry().moves_for(pokemon_name))
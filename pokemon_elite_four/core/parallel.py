@@ -0,0 +1,168 @@
+"""
+Execução Paralela - Simulações fragmentadas em um pool de processos
+Cada fragmento recebe um fluxo aleatório próprio derivado da semente mestre,
+então o resultado é idêntico para a mesma semente com qualquer número de workers.
+"""
+
+import random
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Sequence
+from dataclasses import dataclass
+import numpy as np
+from .pokemon import PokemonTeam
+from .rng import derive_seed
+
+
+# Tamanho fixo dos fragmentos: depende só do motor, nunca do número de workers
+SHARD_SIZES = {
+    "scalar": 250,
+    "vectorized": 20_000
+}
+
+
+@dataclass
+class SimulationTotals:
+    """Contagens acumuladas de um conjunto de batalhas"""
+    battles: int = 0
+    wins: int = 0
+    losses: int = 0
+    draws: int = 0
+    total_turns: int = 0
+    total_damage_dealt: int = 0
+
+    @classmethod
+    def from_vectorized(cls, results: Dict[str, np.ndarray], battles: int) -> "SimulationTotals":
+        """Contagens de um lote de VectorizedBattleEngine.run"""
+        outcome = results["outcome"]
+        return cls(
+            battles=battles,
+            wins=int(np.count_nonzero(outcome == 0)),
+            losses=int(np.count_nonzero(outcome == 1)),
+            draws=int(np.count_nonzero(outcome == 2)),
+            total_turns=int(results["turns"].sum()),
+            total_damage_dealt=int(results["damage_dealt"].sum())
+        )
+
+    def merge(self, other: "SimulationTotals") -> "SimulationTotals":
+        """Soma as contagens de outro fragmento"""
+        return SimulationTotals(
+            battles=self.battles + other.battles,
+            wins=self.wins + other.wins,
+            losses=self.losses + other.losses,
+            draws=self.draws + other.draws,
+            total_turns=self.total_turns + other.total_turns,
+            total_damage_dealt=self.total_damage_dealt + other.total_damage_dealt
+        )
+
+    def as_rates(self) -> Dict[str, float]:
+        """Mesmo formato de BattleSystem.simulate_battle"""
+        return {
+            "win_rate": self.wins / self.battles,
+            "loss_rate": self.losses / self.battles,
+            "draw_rate": self.draws / self.battles,
+            "avg_turns": self.total_turns / self.battles
+        }
+
+
+@dataclass
+class SimulationShard:
+    """Fragmento de simulações enviado a um worker"""
+    team1: PokemonTeam
+    team2: PokemonTeam
+    num_battles: int
+    seed: int
+    engine: str = "scalar"
+    max_turns: int = 100
+
+
+def run_shard(shard: SimulationShard) -> SimulationTotals:
+    """Executa um fragmento com seu próprio gerador (função de nível de módulo para o pickle)"""
+    from .battle_system import BattleSystem, BattleResult, TurnCounterSink
+
+    if shard.engine == "vectorized":
+        from .vectorized_battle import VectorizedBattleEngine
+        engine = VectorizedBattleEngine(
+            max_turns=shard.max_turns,
+            rng=np.random.default_rng(shard.seed)
+        )
+        results = engine.run(shard.team1, shard.team2, shard.num_battles)
+        return SimulationTotals.from_vectorized(results, shard.num_battles)
+
+    battle_system = BattleSystem(rng=random.Random(shard.seed))
+    battle_system.max_turns = shard.max_turns
+
+    counters = TurnCounterSink()
+    totals = SimulationTotals(battles=shard.num_battles)
+    for _ in range(shard.num_battles):
+        battle_log = battle_system.battle_teams(shard.team1, shard.team2, turn_sink=counters)
+
+        if battle_log.battle_result == BattleResult.WIN:
+            totals.wins += 1
+        elif battle_log.battle_result == BattleResult.LOSS:
+            totals.losses += 1
+        else:
+            totals.draws += 1
+
+        totals.total_turns += battle_log.total_turns
+
+    totals.total_damage_dealt = counters.total_damage
+    return totals
+
+
+class ParallelSimulator:
+    """Distribui fragmentos de simulação entre processos"""
+
+    def __init__(self, n_workers: int = 1):
+        self.n_workers = max(1, int(n_workers))
+
+    def plan_shards(
+        self,
+        team1: PokemonTeam,
+        team2: PokemonTeam,
+        num_simulations: int,
+        seed: int,
+        engine: str = "scalar",
+        max_turns: int = 100
+    ) -> List[SimulationShard]:
+        """Divide as simulações em fragmentos de tamanho fixo, um fluxo por fragmento"""
+        shard_size = SHARD_SIZES[engine]
+        shards = []
+        for index, start in enumerate(range(0, num_simulations, shard_size)):
+            shards.append(SimulationShard(
+                team1=team1,
+                team2=team2,
+                num_battles=min(shard_size, num_simulations - start),
+                seed=derive_seed(seed, index),
+                engine=engine,
+                max_turns=max_turns
+            ))
+        return shards
+
+    def run(self, shards: Sequence[SimulationShard]) -> List[SimulationTotals]:
+        """Executa fragmentos (em ordem de entrada) no pool ou no processo atual"""
+        if self.n_workers == 1 or len(shards) <= 1:
+            return [run_shard(shard) for shard in shards]
+
+        with ProcessPoolExecutor(max_workers=min(self.n_workers, len(shards))) as executor:
+            return list(executor.map(run_shard, shards))
+
+    def simulate(
+        self,
+        team1: PokemonTeam,
+        team2: PokemonTeam,
+        num_simulations: int,
+        seed: int,
+        engine: str = "scalar",
+        max_turns: int = 100
+    ) -> SimulationTotals:
+        """Simula e combina todos os fragmentos"""
+        shards = self.plan_shards(team1, team2, num_simulations, seed, engine, max_turns)
+        return merge_totals(self.run(shards))
+
+
+def merge_totals(results: Sequence[SimulationTotals]) -> SimulationTotals:
+    """Combina resultados de fragmentos na ordem dada"""
+    totals = SimulationTotals()
+    for result in results:
+        totals = totals.merge(result)
+    return totals
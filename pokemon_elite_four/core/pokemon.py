@@ -4,10 +4,13 @@ Baseado no sistema Game Boy Advanced (FireRed/LeafGreen)
 """
 
 import random
-from typing import List, Optional, Dict, Tuple
+from typing import List, Optional, Dict, Tuple, TYPE_CHECKING
 from dataclasses import dataclass
 from enum import Enum
 
+if TYPE_CHECKING:
+    from .battle_state import SpeciesSpec
+
 
 class PokemonType(Enum):
     """Tipos de Pokémon - Geração 1 + Steel e Dark (GBA)"""
@@ -30,9 +33,33 @@ class PokemonType(Enum):
     DARK = "Dark"    # Adicionado em GBA
 
 
+# Ordinais dos tipos - usados pelas tabelas indexadas de efetividade
+TYPE_ORDER: Tuple[PokemonType, ...] = tuple(PokemonType)
+NUM_TYPES = len(TYPE_ORDER)
+NO_TYPE_INDEX = NUM_TYPES  # Posição extra para "sem tipo" (ex.: type2 ausente)
+TYPE_INDEX: Dict[PokemonType, int] = {t: i for i, t in enumerate(TYPE_ORDER)}
+
+# Aceita também o nome do tipo ("Water") além do membro do Enum
+_TYPE_LOOKUP: Dict[object, int] = dict(TYPE_INDEX)
+_TYPE_LOOKUP.update({t.value: i for t, i in TYPE_INDEX.items()})
+
+
+def type_index(pokemon_type) -> int:
+    """Retorna o ordinal de um tipo (aceita PokemonType, nome do tipo ou None)"""
+    try:
+        return _TYPE_LOOKUP.get(pokemon_type, NO_TYPE_INDEX)
+    except TypeError:
+        return NO_TYPE_INDEX
+
+
+STAT_NAMES: Tuple[str, ...] = ("hp", "attack", "defense", "sp_attack", "sp_defense", "speed")
+
+
 @dataclass
 class PokemonStats:
     """Estatísticas base de um Pokémon"""
+    __slots__ = STAT_NAMES
+    
     hp: int
     attack: int
     defense: int
@@ -57,6 +84,13 @@ class PokemonStats:
 class Pokemon:
     """Classe principal do Pokémon"""
     
+    # Slots reduzem memória da base de 151 espécies e das populações do GA
+    __slots__ = (
+        "name", "pokemon_id", "_type1", "_type2", "_stats", "_level",
+        "current_hp", "status_conditions", "_move_set",
+        "_derived_stats", "_type_indices", "_spec",
+    )
+    
     def __init__(
         self,
         name: str,
@@ -68,6 +102,9 @@ class Pokemon:
     ):
         self.name = name
         self.pokemon_id = pokemon_id
+        self._derived_stats = None
+        self._type_indices = None
+        self._spec = None
         self.type1 = type1
         self.type2 = type2
         self.stats = stats or PokemonStats(0, 0, 0, 0, 0, 0)
@@ -77,36 +114,131 @@ class Pokemon:
         self.move_set = None
         # Carrega moveset realista se disponível
         self._load_realistic_moveset()  # Será inicializado depois
-        
+    
+    @property
+    def level(self) -> int:
+        """Nível atual"""
+        return self._level
+    
+    @level.setter
+    def level(self, value: int) -> None:
+        if getattr(self, "_level", None) == value:
+            return
+        self._level = value
+        self._derived_stats = None
+        self._spec = None
+    
+    @property
+    def stats(self) -> PokemonStats:
+        """Estatísticas base"""
+        return self._stats
+    
+    @stats.setter
+    def stats(self, value: PokemonStats) -> None:
+        self._stats = value
+        self._derived_stats = None
+        self._spec = None
+    
+    @property
+    def type1(self) -> PokemonType:
+        """Tipo primário"""
+        return self._type1
+    
+    @type1.setter
+    def type1(self, value: PokemonType) -> None:
+        self._type1 = value
+        self._type_indices = None
+        self._spec = None
+    
+    @property
+    def type2(self) -> Optional[PokemonType]:
+        """Tipo secundário"""
+        return self._type2
+    
+    @type2.setter
+    def type2(self, value: Optional[PokemonType]) -> None:
+        self._type2 = value
+        self._type_indices = None
+        self._spec = None
+    
+    @property
+    def move_set(self):
+        """Conjunto de movimentos"""
+        return self._move_set
+    
+    @move_set.setter
+    def move_set(self, value) -> None:
+        self._move_set = value
+        self._spec = None
+    
+    def invalidate_stat_cache(self) -> None:
+        """Descarta estatísticas em cache (use após alterar `stats` ou os movimentos in-place)"""
+        self._derived_stats = None
+        self._spec = None
+    
+    @property
+    def spec(self) -> "SpeciesSpec":
+        """Dados imutáveis lidos pelos motores de batalha (recriados quando nível, stats, tipos ou movimentos mudam)"""
+        spec = self._spec
+        if spec is None:
+            from .battle_state import SpeciesSpec
+            spec = self._spec = SpeciesSpec.from_pokemon(self)
+        return spec
+    
+    def _compute_derived_stats(self) -> Tuple[int, ...]:
+        """Calcula e guarda as estatísticas no nível atual"""
+        stats, level = self._stats, self._level
+        derived = tuple(stats.get_stat_at_level(name, level) for name in STAT_NAMES)
+        self._derived_stats = derived
+        return derived
+    
     @property
     def max_hp(self) -> int:
         """HP máximo no nível atual"""
-        return self.stats.get_stat_at_level("hp", self.level)
+        derived = self._derived_stats
+        if derived is None:
+            derived = self._compute_derived_stats()
+        return derived[0]
     
     @property
     def attack(self) -> int:
         """Ataque no nível atual"""
-        return self.stats.get_stat_at_level("attack", self.level)
+        derived = self._derived_stats
+        if derived is None:
+            derived = self._compute_derived_stats()
+        return derived[1]
     
     @property
     def defense(self) -> int:
         """Defesa no nível atual"""
-        return self.stats.get_stat_at_level("defense", self.level)
+        derived = self._derived_stats
+        if derived is None:
+            derived = self._compute_derived_stats()
+        return derived[2]
     
     @property
     def sp_attack(self) -> int:
         """Ataque especial no nível atual"""
-        return self.stats.get_stat_at_level("sp_attack", self.level)
+        derived = self._derived_stats
+        if derived is None:
+            derived = self._compute_derived_stats()
+        return derived[3]
     
     @property
     def sp_defense(self) -> int:
         """Defesa especial no nível atual"""
-        return self.stats.get_stat_at_level("sp_defense", self.level)
+        derived = self._derived_stats
+        if derived is None:
+            derived = self._compute_derived_stats()
+        return derived[4]
     
     @property
     def speed(self) -> int:
         """Velocidade no nível atual"""
-        return self.stats.get_stat_at_level("speed", self.level)
+        derived = self._derived_stats
+        if derived is None:
+            derived = self._compute_derived_stats()
+        return derived[5]
     
     @property
     def is_fainted(self) -> bool:
@@ -143,6 +275,14 @@ class Pokemon:
             types.append(self.type2)
         return types
     
+    @property
+    def type_indices(self) -> Tuple[int, int]:
+        """Ordinais (type1, type2) usados nas tabelas de efetividade"""
+        indices = self._type_indices
+        if indices is None:
+            indices = self._type_indices = (type_index(self._type1), type_index(self._type2))
+        return indices
+    
     def has_type(self, pokemon_type: PokemonType) -> bool:
         """Verifica se o Pokémon tem um tipo específico"""
         return pokemon_type in self.get_types()
@@ -0,0 +1,316 @@
+"""
+Base de Dados de Pokémon - Colunas NumPy com índices e escalonamento vetorizado
+Os objetos Pokemon continuam disponíveis como visões criadas sob demanda.
+"""
+
+import hashlib
+import os
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Union
+import numpy as np
+from .pokemon import (
+    Pokemon, PokemonStats, PokemonType, STAT_NAMES, TYPE_ORDER, NO_TYPE_INDEX, type_index
+)
+from .moves import MoveSet, get_moveset_registry
+
+
+# Colunas ordenáveis: estatísticas base e o total
+SORTABLE_STATS = STAT_NAMES + ("total",)
+
+# Colunas obrigatórias do CSV processado
+REQUIRED_COLUMNS = ("id", "name", "type1", "type2") + STAT_NAMES
+
+# Versão do layout do cache binário (.npz); mudar invalida caches antigos
+DATABASE_SCHEMA_VERSION = 1
+
+
+def file_sha256(path: Union[str, Path]) -> str:
+    """Hash SHA-256 do conteúdo de um arquivo"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def load_pokemon_database(
+    csv_path: Union[str, Path],
+    level: int = 50,
+    cache_dir: Optional[Union[str, Path]] = None,
+    read_csv: Optional[Callable[[Path], object]] = None
+) -> "PokemonDatabase":
+    """Carrega a base de dados usando o cache binário quando o CSV não mudou
+
+    O cache (.npz) guarda as colunas já validadas junto com o SHA-256 do CSV
+    e a versão do esquema; qualquer divergência força nova leitura. pandas só
+    é importado nesse caso (read_csv padrão), nunca em um acerto do cache.
+    """
+    csv_path = Path(csv_path)
+    if not csv_path.exists():
+        raise FileNotFoundError(f"Arquivo não encontrado: {csv_path}")
+
+    cache_path = source_hash = None
+    if cache_dir is not None:
+        source_hash = file_sha256(csv_path)
+        cache_path = Path(cache_dir) / f"{csv_path.stem}.npz"
+        database = PokemonDatabase.load(cache_path, level=level, source_hash=source_hash)
+        if database is not None:
+            return database
+
+    if read_csv is None:
+        import pandas as pd
+        read_csv = pd.read_csv
+
+    database = PokemonDatabase.from_dataframe(read_csv(csv_path), level=level)
+    if cache_path is not None:
+        database.save(cache_path, source_hash)
+    return database
+
+
+class PokemonDatabase(Sequence):
+    """Espécies em colunas NumPy, com índices por id, nome, tipo e estatística
+
+    Colunas: ids, base_stats (n x 6, ordem de STAT_NAMES), type1/type2
+    (ordinais; NO_TYPE_INDEX = sem tipo), generation e moveset_ids (ordinal
+    do tipo cujo moveset padrão a espécie usa). Indexar, iterar ou buscar
+    devolve sempre o mesmo objeto Pokemon por linha, como a lista anterior.
+    """
+
+    def __init__(
+        self,
+        ids: Iterable[int],
+        names: Iterable[str],
+        base_stats: np.ndarray,
+        type1: Iterable[int],
+        type2: Iterable[int],
+        generation: Optional[Iterable[int]] = None,
+        moveset_ids: Optional[Iterable[int]] = None,
+        level: int = 50
+    ):
+        self.ids = np.asarray(list(ids), dtype=np.int32)
+        self.names: List[str] = list(names)
+        self.base_stats = np.asarray(base_stats, dtype=np.int32).reshape(len(self.ids), len(STAT_NAMES))
+        self.type1 = np.asarray(list(type1), dtype=np.int8)
+        self.type2 = np.asarray(list(type2), dtype=np.int8)
+        self.generation = (
+            np.ones(len(self.ids), dtype=np.int8) if generation is None
+            else np.asarray(list(generation), dtype=np.int8)
+        )
+        self.moveset_ids = (
+            self.type1.copy() if moveset_ids is None
+            else np.asarray(list(moveset_ids), dtype=np.int8)
+        )
+        self.level = level
+
+        # Índices de busca
+        self._by_id: Dict[int, int] = {int(pokemon_id): row for row, pokemon_id in enumerate(self.ids)}
+        self._by_name: Dict[str, int] = {name.lower(): row for row, name in enumerate(self.names)}
+        self._by_type: Dict[int, np.ndarray] = {
+            index: np.flatnonzero((self.type1 == index) | (self.type2 == index))
+            for index in range(len(TYPE_ORDER))
+        }
+        self._stat_order: Dict[str, np.ndarray] = {}
+
+        # Visões Pokemon (criadas no primeiro acesso a cada linha)
+        self._views: List[Optional[Pokemon]] = [None] * len(self.ids)
+
+    @classmethod
+    def from_dataframe(cls, data, level: int = 50) -> "PokemonDatabase":
+        """Constrói a base a partir do CSV processado (colunas id, name, type1, ...)"""
+        missing = [column for column in REQUIRED_COLUMNS if column not in data.columns]
+        if missing:
+            raise ValueError(f"Colunas ausentes nos dados de Pokémon: {missing}")
+        
+        type1 = [type_index(name) for name in data["type1"]]
+        type1 = [index if index != NO_TYPE_INDEX else type_index(PokemonType.NORMAL) for index in type1]
+        type2 = [type_index(name) if isinstance(name, str) else NO_TYPE_INDEX for name in data["type2"]]
+        generation = data["generation"] if "generation" in data.columns else None
+
+        database = cls(
+            ids=data["id"].astype(int),
+            names=data["name"].astype(str),
+            base_stats=data[list(STAT_NAMES)].to_numpy(dtype=np.int32),
+            type1=type1,
+            type2=type2,
+            generation=generation,
+            level=level
+        )
+        database.validate()
+        return database
+
+    @classmethod
+    def from_pokemon(cls, pokemon_list: Iterable[Pokemon], level: Optional[int] = None) -> "PokemonDatabase":
+        """Constrói a base a partir de objetos Pokemon (que viram as visões)"""
+        pokemon_list = list(pokemon_list)
+        database = cls(
+            ids=[p.pokemon_id for p in pokemon_list],
+            names=[p.name for p in pokemon_list],
+            base_stats=np.array(
+                [[getattr(p.stats, stat) for stat in STAT_NAMES] for p in pokemon_list], dtype=np.int32
+            ),
+            type1=[type_index(p.type1) for p in pokemon_list],
+            type2=[type_index(p.type2) for p in pokemon_list],
+            level=level if level is not None else (pokemon_list[0].level if pokemon_list else 50)
+        )
+        database._views = pokemon_list
+        return database
+
+    def validate(self) -> None:
+        """Verifica ids únicos e estatísticas base positivas"""
+        if len(self._by_id) != len(self.ids):
+            raise ValueError("Ids de Pokémon repetidos na base de dados")
+        if len(self.ids) and self.base_stats.min() <= 0:
+            row = int(np.argwhere(self.base_stats <= 0)[0][0])
+            raise ValueError(f"Estatística base inválida para {self.names[row]}")
+
+    # Cache binário
+
+    def save(self, path: Union[str, Path], source_hash: str = "") -> None:
+        """Grava as colunas em .npz (sem pickle), com hash da fonte e versão do esquema"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_name(path.stem + ".tmp.npz")
+
+        np.savez(
+            temp_path,
+            schema_version=np.int32(DATABASE_SCHEMA_VERSION),
+            source_hash=np.array(source_hash),
+            ids=self.ids,
+            names=np.array(self.names, dtype=str),
+            base_stats=self.base_stats,
+            type1=self.type1,
+            type2=self.type2,
+            generation=self.generation,
+            moveset_ids=self.moveset_ids
+        )
+        os.replace(temp_path, path)
+
+    @classmethod
+    def load(
+        cls,
+        path: Union[str, Path],
+        level: int = 50,
+        source_hash: Optional[str] = None
+    ) -> Optional["PokemonDatabase"]:
+        """Lê um cache gravado por `save`; None se ilegível, de outro esquema ou de outra fonte"""
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                if int(data["schema_version"]) != DATABASE_SCHEMA_VERSION:
+                    return None
+                if source_hash is not None and str(data["source_hash"]) != source_hash:
+                    return None
+                return cls(
+                    ids=data["ids"],
+                    names=data["names"].tolist(),
+                    base_stats=data["base_stats"],
+                    type1=data["type1"],
+                    type2=data["type2"],
+                    generation=data["generation"],
+                    moveset_ids=data["moveset_ids"],
+                    level=level
+                )
+        except (OSError, KeyError, ValueError):
+            return None
+
+    # Protocolo de sequência (compatível com List[Pokemon])
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Pokemon, List[Pokemon]]:
+        if isinstance(index, slice):
+            return [self._view(row) for row in range(len(self))[index]]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("Índice fora da base de dados")
+        return self._view(index)
+
+    def __iter__(self):
+        for row in range(len(self)):
+            yield self._view(row)
+
+    def __contains__(self, pokemon: object) -> bool:
+        row = self._by_id.get(getattr(pokemon, "pokemon_id", None))
+        return row is not None and self._views[row] is pokemon
+
+    def _view(self, row: int) -> Pokemon:
+        """Objeto Pokemon da linha (criado uma vez)"""
+        pokemon = self._views[row]
+        if pokemon is None:
+            pokemon = self._views[row] = self._materialize(row)
+        return pokemon
+
+    def _materialize(self, row: int) -> Pokemon:
+        """Cria o Pokemon da linha com o moveset padrão registrado"""
+        type2 = int(self.type2[row])
+        pokemon = Pokemon(
+            name=self.names[row],
+            pokemon_id=int(self.ids[row]),
+            type1=TYPE_ORDER[self.type1[row]],
+            type2=TYPE_ORDER[type2] if type2 != NO_TYPE_INDEX else None,
+            stats=PokemonStats(*(int(value) for value in self.base_stats[row])),
+            level=self.level
+        )
+        pokemon.move_set = MoveSet(get_moveset_registry().default_moves(TYPE_ORDER[self.moveset_ids[row]]))
+        return pokemon
+
+    # Buscas indexadas
+
+    def row_of(self, pokemon_id: int) -> Optional[int]:
+        """Linha da espécie pelo id"""
+        return self._by_id.get(pokemon_id)
+
+    def by_id(self, pokemon_id: int) -> Optional[Pokemon]:
+        """Pokémon pelo número da Pokédex"""
+        row = self._by_id.get(pokemon_id)
+        return self._view(row) if row is not None else None
+
+    def by_name(self, name: str) -> Optional[Pokemon]:
+        """Pokémon pelo nome (sem diferenciar maiúsculas)"""
+        row = self._by_name.get(name.lower())
+        return self._view(row) if row is not None else None
+
+    def rows_of_type(self, pokemon_type: PokemonType) -> np.ndarray:
+        """Linhas das espécies que têm o tipo (primário ou secundário)"""
+        return self._by_type.get(type_index(pokemon_type), np.empty(0, dtype=np.intp))
+
+    def by_type(self, pokemon_type: PokemonType) -> List[Pokemon]:
+        """Pokémon com o tipo, na ordem da base"""
+        return [self._view(row) for row in self.rows_of_type(pokemon_type)]
+
+    def stat_order(self, stat: str) -> np.ndarray:
+        """Linhas em ordem decrescente da estatística base (estável, calculada uma vez)"""
+        order = self._stat_order.get(stat)
+        if order is None:
+            if stat not in SORTABLE_STATS:
+                raise ValueError(f"Estatística inválida: {stat}")
+            values = self.base_totals() if stat == "total" else self.base_stats[:, STAT_NAMES.index(stat)]
+            order = self._stat_order[stat] = np.argsort(-values, kind="stable")
+        return order
+
+    def top_by_stat(self, stat: str, top_n: int = 10) -> List[Pokemon]:
+        """Top N espécies por estatística base"""
+        return [self._view(row) for row in self.stat_order(stat)[:top_n]]
+
+    # Estatísticas vetorizadas
+
+    def base_totals(self) -> np.ndarray:
+        """Soma das estatísticas base de cada espécie"""
+        return self.base_stats.sum(axis=1)
+
+    def stats_at_level(self, level: Union[int, np.ndarray], rows: Optional[np.ndarray] = None) -> np.ndarray:
+        """Estatísticas (n x 6) no nível dado, mesma fórmula de PokemonStats.get_stat_at_level
+
+        `level` pode ser um inteiro ou um array com um nível por linha.
+        """
+        base = self.base_stats if rows is None else self.base_stats[rows]
+        level = np.asarray(level, dtype=np.int64)
+        if level.ndim == 1:
+            level = level[:, None]
+
+        scaled = (base.astype(np.int64) * 2 + 31) * level // 100
+        scaled[:, 1:] += 5
+        scaled[:, :1] += level + 10
+        return scaled
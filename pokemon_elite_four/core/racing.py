@@ -0,0 +1,112 @@
+"""
+Avaliação Sequencial - Intervalos de confiança e orçamentos adaptativos de simulação
+"""
+
+import math
+from dataclasses import dataclass, asdict
+from statistics import NormalDist
+from typing import Callable, Dict, Optional, Tuple
+
+
+def z_score(confidence: float) -> float:
+    """Quantil bilateral da normal para o nível de confiança"""
+    return NormalDist().inv_cdf(0.5 + confidence / 2)
+
+
+def wilson_interval(wins: int, battles: int, confidence: float = 0.95) -> Tuple[float, float]:
+    """Intervalo de Wilson para a taxa de vitória (válido também perto de 0 e 1)"""
+    if battles <= 0:
+        return 0.0, 1.0
+
+    z = z_score(confidence)
+    p = wins / battles
+    denominator = 1 + z * z / battles
+    center = (p + z * z / (2 * battles)) / denominator
+    margin = z * math.sqrt(p * (1 - p) / battles + z * z / (4 * battles * battles)) / denominator
+    low = 0.0 if wins == 0 else max(0.0, center - margin)
+    high = 1.0 if wins == battles else min(1.0, center + margin)
+    return low, high
+
+
+@dataclass
+class WinRateInterval:
+    """Estimativa da taxa de vitória com seu intervalo de confiança"""
+    wins: int
+    battles: int
+    low: float
+    high: float
+    stop_reason: str = "fixed"  # "precision", "dropped", "budget" ou "fixed"
+
+    @classmethod
+    def from_counts(cls, wins: int, battles: int, confidence: float = 0.95, stop_reason: str = "fixed"):
+        low, high = wilson_interval(wins, battles, confidence)
+        return cls(wins, battles, low, high, stop_reason)
+
+    @property
+    def win_rate(self) -> float:
+        return self.wins / self.battles if self.battles > 0 else 0.0
+
+    @property
+    def half_width(self) -> float:
+        return (self.high - self.low) / 2
+
+    def as_dict(self) -> Dict[str, float]:
+        return asdict(self)
+
+
+@dataclass(frozen=True)
+class RacingConfig:
+    """Orçamento adaptativo: precisão-alvo em vez de número fixo de batalhas
+
+    target_precision: meia-largura máxima do intervalo da taxa de vitória
+    battles_per_round: batalhas por membro da Elite Four em cada rodada
+    min_rounds/max_rounds: limites de rodadas por equipe
+    """
+    target_precision: float = 0.1
+    confidence: float = 0.95
+    battles_per_round: int = 1
+    min_rounds: int = 1
+    max_rounds: int = 10
+
+    def __post_init__(self):
+        if not 0 < self.target_precision < 0.5:
+            raise ValueError(f"Precisão-alvo inválida: {self.target_precision}")
+        if not 0 < self.confidence < 1:
+            raise ValueError(f"Nível de confiança inválido: {self.confidence}")
+
+
+def race_win_rate(
+    simulate_round: Callable[[int], Tuple[int, int]],
+    config: RacingConfig,
+    can_qualify: Optional[Callable[[float], bool]] = None,
+    wins: int = 0,
+    battles: int = 0,
+    first_round: int = 0
+) -> WinRateInterval:
+    """Simula rodadas até o intervalo ficar estreito ou a equipe ser descartada
+
+    simulate_round(índice) devolve (vitórias, batalhas) de uma rodada.
+    can_qualify(limite_superior) diz se a equipe ainda pode alcançar o corte
+    (elite/torneio); quando não pode, a corrida termina com "dropped".
+    """
+    rounds = 0
+    stop_reason = "budget"
+
+    while rounds < config.max_rounds:
+        round_wins, round_battles = simulate_round(first_round + rounds)
+        wins += round_wins
+        battles += round_battles
+        rounds += 1
+
+        if rounds < config.min_rounds:
+            continue
+
+        low, high = wilson_interval(wins, battles, config.confidence)
+        if (high - low) / 2 <= config.target_precision:
+            stop_reason = "precision"
+            break
+        if can_qualify is not None and not can_qualify(high):
+            stop_reason = "dropped"
+            break
+
+    return WinRateInterval.from_counts(wins, battles, config.confidence, stop_reason)
@@ -4,12 +4,17 @@ Sistema de Batalhas Inteligente - Seleção estratégica de movimentos
 
 import random
 import math
-from typing import List, Optional, Tuple, Dict
+from typing import Iterable, List, Optional, Sequence, Tuple, Dict
 from dataclasses import dataclass
 from enum import Enum
 from .pokemon import Pokemon, PokemonTeam, PokemonType
 from .moves import Move, MoveCategory, MoveTarget
-from .battle_system import BattleSystem, BattleResult, BattleLog, BattleTurn
+from .battle_system import (
+    BattleSystem, BattleResult, BattleLog, BattleTurn, TypeEffectiveness,
+    TurnSink, TurnSinkSpec, resolve_turn_sink
+)
+from .battle_state import BattleState, SpeciesSpec
+from .damage_table import DamageTable, MatchupDamage
 
 
 class MoveStrategy(Enum):
@@ -31,11 +36,75 @@ class MoveChoice:
     confidence: float
 
 
+# Estratégias que não sorteiam nada quando só há movimentos de dano (caso dos
+# SpeciesSpec): a escolha depende apenas do par atacante/defensor
+DETERMINISTIC_STRATEGIES = frozenset({
+    MoveStrategy.HIGHEST_DAMAGE, MoveStrategy.TYPE_EFFECTIVE,
+    MoveStrategy.STATUS_FIRST, MoveStrategy.BALANCED
+})
+
+
+class MovePolicyCache:
+    """Tabela (atacante, defensor, estratégia) -> MoveChoice
+    
+    As chaves usam a identidade dos SpeciesSpec (Move não é hashable); cada
+    entrada guarda os próprios specs, o que impede a reutilização de um id
+    por outro objeto. Ao atingir `max_size` a tabela é esvaziada.
+    """
+    
+    def __init__(self, max_size: int = 65536):
+        self.max_size = max_size
+        self._entries: Dict[Tuple[int, int, MoveStrategy], Tuple[SpeciesSpec, SpeciesSpec, MoveChoice]] = {}
+        self.hits = 0
+        self.misses = 0
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def get(self, attacker: SpeciesSpec, defender: SpeciesSpec, strategy: MoveStrategy) -> Optional[MoveChoice]:
+        entry = self._entries.get((id(attacker), id(defender), strategy))
+        if entry is not None and entry[0] is attacker and entry[1] is defender:
+            self.hits += 1
+            return entry[2]
+        self.misses += 1
+        return None
+    
+    def put(self, attacker: SpeciesSpec, defender: SpeciesSpec, strategy: MoveStrategy, choice: MoveChoice) -> MoveChoice:
+        if len(self._entries) >= self.max_size:
+            self._entries.clear()
+        self._entries[(id(attacker), id(defender), strategy)] = (attacker, defender, choice)
+        return choice
+    
+    def clear(self) -> None:
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+    
+    def stats(self) -> Dict[str, float]:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+# Compartilhada pelas instâncias (evaluate_task cria um sistema por tarefa)
+DEFAULT_POLICY_CACHE = MovePolicyCache()
+
+
 class SmartBattleSystem(BattleSystem):
     """Sistema de batalhas com seleção inteligente de movimentos"""
     
-    def __init__(self):
-        super().__init__()
+    def __init__(
+        self,
+        rng: Optional[random.Random] = None,
+        policy_cache: Optional[MovePolicyCache] = None,
+        damage_table: Optional[DamageTable] = None
+    ):
+        super().__init__(rng=rng, damage_table=damage_table)
+        self.policy_cache = policy_cache if policy_cache is not None else DEFAULT_POLICY_CACHE
         self.move_strategies = {
             MoveStrategy.RANDOM: self._select_random_move,
             MoveStrategy.HIGHEST_DAMAGE: self._select_highest_damage_move,
@@ -80,9 +149,43 @@ class SmartBattleSystem(BattleSystem):
             confidence=confidence
         )
     
+    def policy_choice(
+        self,
+        attacker: SpeciesSpec,
+        defender: SpeciesSpec,
+        strategy: MoveStrategy
+    ) -> MoveChoice:
+        """Escolha de uma estratégia determinística para o par (consulta a tabela)
+        
+        Usa os movimentos de dano do spec, os mesmos que a batalha oferece.
+        """
+        choice = self.policy_cache.get(attacker, defender, strategy)
+        if choice is None:
+            choice = self.policy_cache.put(
+                attacker, defender, strategy,
+                self.select_optimal_move(attacker, defender, list(attacker.moves), strategy)
+            )
+        return choice
+    
+    def precompute_policies(
+        self,
+        attackers: Sequence[SpeciesSpec],
+        defenders: Sequence[SpeciesSpec],
+        strategies: Iterable[MoveStrategy] = DETERMINISTIC_STRATEGIES
+    ) -> int:
+        """Preenche a tabela para todos os pares; retorna o número de entradas novas"""
+        before = self.policy_cache.misses
+        for strategy in strategies:
+            if strategy not in DETERMINISTIC_STRATEGIES:
+                continue
+            for attacker in attackers:
+                for defender in defenders:
+                    self.policy_choice(attacker, defender, strategy)
+        return self.policy_cache.misses - before
+    
     def _select_random_move(self, attacker: Pokemon, defender: Pokemon, moves: List[Move]) -> Move:
         """Seleção aleatória (comportamento original)"""
-        return random.choice(moves)
+        return self.rng.choice(moves)
     
     def _select_highest_damage_move(self, attacker: Pokemon, defender: Pokemon, moves: List[Move]) -> Move:
         """Seleciona movimento com maior dano esperado"""
@@ -122,11 +225,11 @@ class SmartBattleSystem(BattleSystem):
         damage_moves = [move for move in moves if move.category != MoveCategory.STATUS]
         
         if status_moves and not self._has_status_advantage(attacker, defender):
-            return random.choice(status_moves)
+            return self.rng.choice(status_moves)
         elif damage_moves:
             return self._select_type_effective_move(attacker, defender, damage_moves)
         else:
-            return random.choice(moves)
+            return self.rng.choice(moves)
     
     def _select_balanced_move(self, attacker: Pokemon, defender: Pokemon, moves: List[Move]) -> Move:
         """Seleção balanceada considerando múltiplos fatores"""
@@ -186,8 +289,7 @@ class SmartBattleSystem(BattleSystem):
     
     def _calculate_type_effectiveness(self, move: Move, defender: Pokemon) -> float:
         """Calcula efetividade do movimento contra o defensor"""
-        from .battle_system import TypeEffectiveness
-        return TypeEffectiveness.get_effectiveness(move.move_type, defender.get_types())
+        return TypeEffectiveness.get_effectiveness_against(move.move_type, defender)
     
     def _calculate_critical_chance(self, attacker: Pokemon, move: Move) -> float:
         """Calcula chance de golpe crítico"""
@@ -217,134 +319,165 @@ class SmartBattleSystem(BattleSystem):
         pokemon1: Pokemon,
         pokemon2: Pokemon,
         pokemon1_strategy: MoveStrategy = MoveStrategy.BALANCED,
-        pokemon2_strategy: MoveStrategy = MoveStrategy.BALANCED
+        pokemon2_strategy: MoveStrategy = MoveStrategy.BALANCED,
+        turn_sink: TurnSinkSpec = "full"
     ) -> BattleLog:
-        """Batalha entre dois Pokémon com seleção inteligente de movimentos"""
+        """Batalha entre dois Pokémon com seleção inteligente de movimentos
         
-        # Carrega movesets se necessário
-        if pokemon1.move_set is None:
-            from .moves import create_realistic_moveset
-            pokemon1.move_set = create_realistic_moveset(pokemon1.name)
+        Parte do HP atual de cada um e copia o HP final de volta.
+        """
         
-        if pokemon2.move_set is None:
-            from .moves import create_realistic_moveset
-            pokemon2.move_set = create_realistic_moveset(pokemon2.name)
+        sink = resolve_turn_sink(turn_sink)
+        state1 = BattleState.from_pokemon(pokemon1)
+        state2 = BattleState.from_pokemon(pokemon2)
+        total_turns = self._run_smart_pokemon_battle(
+            state1, state2, pokemon1_strategy, pokemon2_strategy, sink
+        )
+        state1.write_back()
+        state2.write_back()
         
-        # Movimentos disponíveis
-        pokemon1_moves = [move for move in pokemon1.move_set.moves if move.category != MoveCategory.STATUS]
-        pokemon2_moves = [move for move in pokemon2.move_set.moves if move.category != MoveCategory.STATUS]
+        # Determina vencedor
+        if state1.is_defeated and state2.is_defeated:
+            result = BattleResult.DRAW
+            winner = None
+        elif state1.is_defeated:
+            result = BattleResult.LOSS
+            winner = None
+        else:
+            result = BattleResult.WIN
+            winner = None
+        
+        return self._make_log(sink, winner, total_turns, result, (state1, state2))
+    
+    def _run_smart_pokemon_battle(
+        self,
+        state1: BattleState,
+        state2: BattleState,
+        pokemon1_strategy: MoveStrategy,
+        pokemon2_strategy: MoveStrategy,
+        sink: Optional[TurnSink]
+    ) -> int:
+        """Executa o confronto 1x1 inteligente entre os ativos e retorna o número de turnos completos"""
+        
+        if state1.active_fainted or state2.active_fainted:
+            return 0
+        
+        spec1 = state1.specs[state1.active]
+        spec2 = state2.specs[state2.active]
+        
+        # Determina ordem de ataque (velocidade não muda durante o confronto)
+        if spec1.speed >= spec2.speed:
+            first, second = state1, state2
+            first_spec, second_spec = spec1, spec2
+            first_strategy, second_strategy = pokemon1_strategy, pokemon2_strategy
+        else:
+            first, second = state2, state1
+            first_spec, second_spec = spec2, spec1
+            first_strategy, second_strategy = pokemon2_strategy, pokemon1_strategy
+        
+        first_moves = list(first_spec.moves)
+        second_moves = list(second_spec.moves)
+        
+        # Stats não mudam no confronto: estratégias determinísticas escolhem
+        # sempre o mesmo movimento, resolvido uma vez pela tabela de políticas
+        first_move = second_move = None
+        if first_strategy in DETERMINISTIC_STRATEGIES:
+            first_move = self.policy_choice(first_spec, second_spec, first_strategy).move
+        if second_strategy in DETERMINISTIC_STRATEGIES:
+            second_move = self.policy_choice(second_spec, first_spec, second_strategy).move
+        
+        # Termos fixos de dano dos movimentos de cada lado
+        first_table = self.damage_table.matchup(first_spec, second_spec)
+        second_table = self.damage_table.matchup(second_spec, first_spec)
         
-        turns = []
         turn_number = 1
         
         # Loop principal da batalha
-        while (not pokemon1.is_fainted and not pokemon2.is_fainted and 
-               turn_number <= self.max_turns):
-            
-            # Determina ordem de ataque
-            if pokemon1.speed >= pokemon2.speed:
-                first_attacker, second_attacker = pokemon1, pokemon2
-                first_moves, second_moves = pokemon1_moves, pokemon2_moves
-                first_strategy, second_strategy = pokemon1_strategy, pokemon2_strategy
-            else:
-                first_attacker, second_attacker = pokemon2, pokemon1
-                first_moves, second_moves = pokemon2_moves, pokemon1_moves
-                first_strategy, second_strategy = pokemon2_strategy, pokemon1_strategy
+        while turn_number <= self.max_turns:
             
             # Primeiro ataque
-            if not first_attacker.is_fainted and not second_attacker.is_fainted:
-                move_choice = self.select_optimal_move(
-                    first_attacker, second_attacker, first_moves, first_strategy
-                )
-                turn = self.execute_turn(first_attacker, second_attacker, move_choice.move, turn_number)
-                turns.append(turn)
-                
-                if second_attacker.is_fainted:
-                    break
+            move = first_move if first_move is not None else self.select_optimal_move(
+                first_spec, second_spec, first_moves, first_strategy
+            ).move
+            self._attack_with_table(first, second, first_table, move, turn_number, sink)
+            
+            if second.active_fainted:
+                break
             
             # Segundo ataque
-            if not first_attacker.is_fainted and not second_attacker.is_fainted:
-                move_choice = self.select_optimal_move(
-                    second_attacker, first_attacker, second_moves, second_strategy
-                )
-                turn = self.execute_turn(second_attacker, first_attacker, move_choice.move, turn_number)
-                turns.append(turn)
+            move = second_move if second_move is not None else self.select_optimal_move(
+                second_spec, first_spec, second_moves, second_strategy
+            ).move
+            self._attack_with_table(second, first, second_table, move, turn_number, sink)
             
             turn_number += 1
+            
+            if first.active_fainted:
+                break
         
-        # Determina vencedor
-        if pokemon1.is_fainted and pokemon2.is_fainted:
-            result = BattleResult.DRAW
-            winner = None
-        elif pokemon1.is_fainted:
-            result = BattleResult.LOSS
-            winner = None
+        return turn_number - 1
+    
+    def _attack_with_table(
+        self,
+        attacker_state: BattleState,
+        defender_state: BattleState,
+        table: MatchupDamage,
+        move: Move,
+        turn_number: int,
+        sink: Optional[TurnSink]
+    ) -> None:
+        """Ataque pela linha da tabela (movimentos fora dela, como o Tackle, seguem o caminho escalar)"""
+        row = table.row_for(move)
+        if row is None:
+            self._resolve_attack(attacker_state, defender_state, move, turn_number, sink)
         else:
-            result = BattleResult.WIN
-            winner = None
-        
-        return BattleLog(
-            turns=turns,
-            winner=winner,
-            total_turns=turn_number - 1,
-            battle_result=result
-        )
+            self._resolve_table_attack(attacker_state, defender_state, row, turn_number, sink)
     
     def battle_teams_smart(
         self,
         team1: PokemonTeam,
         team2: PokemonTeam,
         team1_strategy: MoveStrategy = MoveStrategy.BALANCED,
-        team2_strategy: MoveStrategy = MoveStrategy.BALANCED
+        team2_strategy: MoveStrategy = MoveStrategy.BALANCED,
+        turn_sink: TurnSinkSpec = "full"
     ) -> BattleLog:
-        """Batalha entre equipes com seleção inteligente de movimentos"""
+        """Batalha entre equipes com seleção inteligente de movimentos
+        
+        Como em battle_teams, o HP fica em BattleStates próprios da batalha.
+        """
         
-        # Restaura equipes
-        team1.restore_team()
-        team2.restore_team()
+        sink = resolve_turn_sink(turn_sink)
+        state1 = BattleState.from_team(team1)
+        state2 = BattleState.from_team(team2)
         
-        turns = []
         turn_number = 1
         
         # Loop principal da batalha
-        while (not team1.is_defeated and not team2.is_defeated and 
+        while (not state1.is_defeated and not state2.is_defeated and 
                turn_number <= self.max_turns):
             
-            # Pokémon ativos
-            pokemon1 = team1.active_pokemon
-            pokemon2 = team2.active_pokemon
-            
-            if pokemon1 is None or pokemon2 is None:
-                break
-            
             # Batalha inteligente entre os Pokémon ativos
-            pokemon_battle = self.battle_pokemon_smart(
-                pokemon1, pokemon2, team1_strategy, team2_strategy
+            self._run_smart_pokemon_battle(
+                state1, state2, team1_strategy, team2_strategy, sink
             )
-            turns.extend(pokemon_battle.turns)
             
             # Troca automática se necessário
-            if pokemon1.is_fainted:
-                team1.auto_switch()
-            if pokemon2.is_fainted:
-                team2.auto_switch()
+            if state1.active_fainted:
+                state1.auto_switch()
+            if state2.active_fainted:
+                state2.auto_switch()
             
             turn_number += 1
         
         # Determina vencedor
-        if team1.is_defeated and team2.is_defeated:
+        if state1.is_defeated and state2.is_defeated:
             result = BattleResult.DRAW
             winner = None
-        elif team1.is_defeated:
+        elif state1.is_defeated:
             result = BattleResult.LOSS
             winner = team2
         else:
             result = BattleResult.WIN
             winner = team1
         
-        return BattleLog(
-            turns=turns,
-            winner=winner,
-            total_turns=turn_number - 1,
-            battle_result=result
-        )
+        return self._make_log(sink, winner, turn_number - 1, result, (state1, state2))
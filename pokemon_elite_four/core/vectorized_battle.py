@@ -0,0 +1,544 @@
+"""
+Motor Vetorizado de Monte Carlo - Batalhas de equipe em lote com NumPy
+Avança N batalhas independentes em lockstep, reproduzindo as regras de
+BattleSystem.battle_teams (fórmula de dano, ordem por velocidade, troca automática)
+"""
+
+import math
+import random
+from typing import Dict, List, Optional, Tuple
+from dataclasses import dataclass
+import numpy as np
+from .pokemon import Pokemon, PokemonTeam
+from .moves import MoveCategory
+from .battle_system import BattleSystem, BattleResult, TypeEffectiveness
+
+
+MAX_MOVES = 4
+
+
+@dataclass
+class CompiledTeam:
+    """Equipe compilada em arrays (uma linha por membro)"""
+    size: int
+    level: np.ndarray
+    attack: np.ndarray
+    defense: np.ndarray
+    sp_attack: np.ndarray
+    sp_defense: np.ndarray
+    speed: np.ndarray
+    max_hp: np.ndarray
+    type1: np.ndarray
+    type2: np.ndarray
+    num_moves: np.ndarray
+    move_power: np.ndarray      # (size, MAX_MOVES)
+    move_special: np.ndarray    # (size, MAX_MOVES) True = especial
+    move_type: np.ndarray       # (size, MAX_MOVES) ordinais
+    move_accuracy: np.ndarray   # (size, MAX_MOVES)
+
+
+def _damaging_moves(pokemon: Pokemon):
+    """Movimentos de dano usados pelo motor escalar (sem movimentos de status)"""
+    return list(pokemon.spec.moves)
+
+
+def compile_team(team: PokemonTeam) -> CompiledTeam:
+    """Converte uma equipe em arrays NumPy para o motor vetorizado"""
+    return compile_pokemon(team.pokemon)
+
+
+def compile_pokemon(members: List[Pokemon]) -> CompiledTeam:
+    """Converte uma lista qualquer de Pokémon (sem limite de 6) em arrays NumPy"""
+    size = len(members)
+
+    def column(values, dtype=np.int64):
+        return np.array(values, dtype=dtype).reshape(size)
+
+    move_power = np.zeros((size, MAX_MOVES), dtype=np.int64)
+    move_special = np.zeros((size, MAX_MOVES), dtype=bool)
+    move_type = np.zeros((size, MAX_MOVES), dtype=np.intp)
+    move_accuracy = np.zeros((size, MAX_MOVES), dtype=np.int64)
+    num_moves = np.zeros(size, dtype=np.int64)
+
+    for i, pokemon in enumerate(members):
+        moves = _damaging_moves(pokemon)
+        if not moves:
+            raise ValueError(f"{pokemon.name} não possui movimentos de dano")
+        num_moves[i] = len(moves)
+        for m, move in enumerate(moves):
+            move_power[i, m] = move.power
+            move_special[i, m] = move.category == MoveCategory.SPECIAL
+            move_type[i, m] = move.type_index
+            move_accuracy[i, m] = move.accuracy
+
+    return CompiledTeam(
+        size=size,
+        level=column([p.level for p in members]),
+        attack=column([p.attack for p in members]),
+        defense=column([p.defense for p in members]),
+        sp_attack=column([p.sp_attack for p in members]),
+        sp_defense=column([p.sp_defense for p in members]),
+        speed=column([p.speed for p in members]),
+        max_hp=column([p.max_hp for p in members]),
+        type1=column([p.type_indices[0] for p in members], np.intp),
+        type2=column([p.type_indices[1] for p in members], np.intp),
+        num_moves=num_moves,
+        move_power=move_power,
+        move_special=move_special,
+        move_type=move_type,
+        move_accuracy=move_accuracy
+    )
+
+
+# Lote de ataques: as funções abaixo recebem índices (atacante, defensor,
+# movimento) em equipes compiladas - arrays de mesmo formato ou que se
+# combinam por broadcasting - e repetem, elemento a elemento, as operações de
+# BattleSystem.does_move_hit, is_critical_hit e calculate_damage na mesma ordem.
+
+
+@dataclass
+class AttackBatch:
+    """Resultado de um lote de ataques (uma posição por ataque)"""
+    damage: np.ndarray         # int64; 0 nos ataques que erraram
+    hit: np.ndarray
+    critical: np.ndarray
+    effectiveness: np.ndarray
+
+
+def effectiveness_array(
+    attackers: CompiledTeam,
+    defenders: CompiledTeam,
+    attacker_index: np.ndarray,
+    defender_index: np.ndarray,
+    move_index: np.ndarray
+) -> np.ndarray:
+    """Efetividade do movimento contra os tipos do defensor"""
+    return TypeEffectiveness.DUAL_TYPE_TABLE[
+        attackers.move_type[attacker_index, move_index],
+        defenders.type1[defender_index],
+        defenders.type2[defender_index]
+    ]
+
+
+def base_damage_array(
+    attackers: CompiledTeam,
+    defenders: CompiledTeam,
+    attacker_index: np.ndarray,
+    defender_index: np.ndarray,
+    move_index: np.ndarray
+) -> np.ndarray:
+    """((2 * Level + 10) * Power * Attack / Defense / 50) + 2, sem modificadores"""
+    special = attackers.move_special[attacker_index, move_index]
+    attack_stat = np.where(special, attackers.sp_attack[attacker_index], attackers.attack[attacker_index])
+    defense_stat = np.where(special, defenders.sp_defense[defender_index], defenders.defense[defender_index])
+    level = attackers.level[attacker_index]
+    power = attackers.move_power[attacker_index, move_index]
+    return ((2 * level + 10) * power * attack_stat / defense_stat / 50) + 2
+
+
+def hit_rate_array(
+    attackers: CompiledTeam,
+    defenders: CompiledTeam,
+    attacker_index: np.ndarray,
+    defender_index: np.ndarray,
+    move_index: np.ndarray
+) -> np.ndarray:
+    """Taxa de acerto em % modificada pela razão de velocidades (inf = sempre acerta)"""
+    attacker_speed = attackers.speed[attacker_index]
+    speed_modifier = attacker_speed / (attacker_speed + defenders.speed[defender_index])
+    accuracy_modifier = 1.0 + (speed_modifier - 0.5) * 0.1
+    accuracy = attackers.move_accuracy[attacker_index, move_index]
+    return np.where(accuracy == 0, np.inf, accuracy * accuracy_modifier)
+
+
+def critical_rate_array(attackers: CompiledTeam, attacker_index: np.ndarray) -> np.ndarray:
+    """Taxa de crítico em % por atacante"""
+    return 6.25 * (1 + np.minimum(attackers.speed[attacker_index] / 512, 1.0))
+
+
+def does_move_hit_array(
+    attackers: CompiledTeam,
+    defenders: CompiledTeam,
+    attacker_index: np.ndarray,
+    defender_index: np.ndarray,
+    move_index: np.ndarray,
+    draws: np.ndarray
+) -> np.ndarray:
+    """Versão em lote de BattleSystem.does_move_hit (`draws` em [0, 1))"""
+    return draws * 100 < hit_rate_array(attackers, defenders, attacker_index, defender_index, move_index)
+
+
+def is_critical_hit_array(attackers: CompiledTeam, attacker_index: np.ndarray, draws: np.ndarray) -> np.ndarray:
+    """Versão em lote de BattleSystem.is_critical_hit (`draws` em [0, 1))"""
+    return draws * 100 < critical_rate_array(attackers, attacker_index)
+
+
+def clamp_damage(damage: np.ndarray, max_damage: np.ndarray) -> np.ndarray:
+    """int(...) e limite max(1, min(dano, 4x HP)) do motor escalar"""
+    return np.maximum(1, np.minimum(damage.astype(np.int64), max_damage))
+
+
+def calculate_damage_array(
+    attackers: CompiledTeam,
+    defenders: CompiledTeam,
+    attacker_index: np.ndarray,
+    defender_index: np.ndarray,
+    move_index: np.ndarray,
+    critical: np.ndarray,
+    variation_draws: np.ndarray,
+    effectiveness: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """Versão em lote de BattleSystem.calculate_damage
+    
+    variation_draws em [0, 1) viram a variação 0.85-1.0 exatamente como
+    random.uniform(0.85, 1.0).
+    """
+    if effectiveness is None:
+        effectiveness = effectiveness_array(attackers, defenders, attacker_index, defender_index, move_index)
+    base_damage = base_damage_array(attackers, defenders, attacker_index, defender_index, move_index)
+    variation = 0.85 + (1.0 - 0.85) * variation_draws
+    damage = base_damage * effectiveness * np.where(critical, 2.0, 1.0) * variation
+    return clamp_damage(damage, defenders.max_hp[defender_index] * 4)
+
+
+def resolve_attacks(
+    attackers: CompiledTeam,
+    defenders: CompiledTeam,
+    attacker_index: np.ndarray,
+    defender_index: np.ndarray,
+    move_index: np.ndarray,
+    draws: Optional[np.ndarray] = None,
+    rng: Optional[np.random.Generator] = None
+) -> AttackBatch:
+    """Acerto, crítico, efetividade e dano de um lote de ataques em uma chamada
+    
+    draws: array (3, ...) com os sorteios de acerto, crítico e variação na
+    ordem do motor escalar; sem ele, os sorteios vêm de `rng` (padrão:
+    semente derivada do `random` global). Diferente do motor escalar, todo
+    ataque consome os três sorteios, mesmo os que erram.
+    """
+    attacker_index, defender_index, move_index = np.broadcast_arrays(
+        np.asarray(attacker_index, dtype=np.intp),
+        np.asarray(defender_index, dtype=np.intp),
+        np.asarray(move_index, dtype=np.intp)
+    )
+    if draws is None:
+        if rng is None:
+            rng = np.random.default_rng(random.getrandbits(64))
+        draws = rng.random((3,) + attacker_index.shape)
+
+    hit = does_move_hit_array(attackers, defenders, attacker_index, defender_index, move_index, draws[0])
+    critical = is_critical_hit_array(attackers, attacker_index, draws[1])
+    effectiveness = effectiveness_array(attackers, defenders, attacker_index, defender_index, move_index)
+    damage = calculate_damage_array(
+        attackers, defenders, attacker_index, defender_index, move_index,
+        critical, draws[2], effectiveness
+    )
+    return AttackBatch(
+        damage=np.where(hit, damage, 0),
+        hit=hit,
+        critical=hit & critical,
+        effectiveness=effectiveness
+    )
+
+
+@dataclass
+class MatchupTables:
+    """Termos fixos de dano de uma equipe atacando outra: [atacante, defensor, movimento]"""
+    base_damage: np.ndarray   # dano base já multiplicado pela efetividade
+    hit_rate: np.ndarray      # taxa de acerto em % (inf = sempre acerta)
+    crit_rate: np.ndarray     # taxa de crítico em % por atacante
+    max_damage: np.ndarray    # limite de 4x HP por defensor
+    num_moves: np.ndarray
+
+
+def build_matchup_tables(attackers: CompiledTeam, defenders: CompiledTeam) -> MatchupTables:
+    """Pré-calcula tudo que não depende de sorteio (funções em lote sobre a grade completa)"""
+    attacker_index = np.arange(attackers.size)[:, None, None]
+    defender_index = np.arange(defenders.size)[None, :, None]
+    move_index = np.arange(MAX_MOVES)[None, None, :]
+    indices = (attackers, defenders, attacker_index, defender_index, move_index)
+
+    return MatchupTables(
+        base_damage=base_damage_array(*indices) * effectiveness_array(*indices),
+        hit_rate=hit_rate_array(*indices),
+        crit_rate=critical_rate_array(attackers, np.arange(attackers.size)),
+        max_damage=defenders.max_hp * 4,
+        num_moves=attackers.num_moves
+    )
+
+
+class VectorizedBattleEngine:
+    """Simula lotes de batalhas de equipe avançando todas em lockstep"""
+
+    def __init__(
+        self,
+        max_turns: int = 100,
+        rng: Optional[np.random.Generator] = None,
+        batch_size: int = 100_000
+    ):
+        self.max_turns = max_turns
+        # Sem gerador explícito, deriva a semente do `random` global (respeita random.seed)
+        self.rng = rng if rng is not None else np.random.default_rng(random.getrandbits(64))
+        self.batch_size = batch_size
+
+    def _roll_damage(
+        self,
+        tables: MatchupTables,
+        attacker: np.ndarray,
+        defender: np.ndarray,
+        draws: np.ndarray
+    ) -> np.ndarray:
+        """Escolha de movimento, acerto, crítico e variação para um lado"""
+        move = (draws[0] * tables.num_moves[attacker]).astype(np.intp)
+        hit = draws[1] * 100 < tables.hit_rate[attacker, defender, move]
+        critical = draws[2] * 100 < tables.crit_rate[attacker]
+        variation = 0.85 + (1.0 - 0.85) * draws[3]  # random.uniform(0.85, 1.0)
+
+        damage = tables.base_damage[attacker, defender, move] * np.where(critical, 2.0, 1.0) * variation
+        return np.where(hit, clamp_damage(damage, tables.max_damage[defender]), 0)
+
+    def _run_batch(
+        self,
+        team1: CompiledTeam,
+        team2: CompiledTeam,
+        tables_12: MatchupTables,
+        tables_21: MatchupTables,
+        num_battles: int
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Executa um lote e retorna (ativo1, ativo2, rodadas, dano causado) finais"""
+        hp1 = np.tile(team1.max_hp, (num_battles, 1))
+        hp2 = np.tile(team2.max_hp, (num_battles, 1))
+        active1 = np.zeros(num_battles, dtype=np.intp)
+        active2 = np.zeros(num_battles, dtype=np.intp)
+        rounds = np.zeros(num_battles, dtype=np.int64)
+        inner_turns = np.zeros(num_battles, dtype=np.int64)
+        damage_dealt = np.zeros(num_battles, dtype=np.int64)
+
+        running = np.arange(num_battles)
+        if team1.size == 0 or team2.size == 0:
+            running = running[:0]
+
+        while running.size:
+            i = active1[running]
+            j = active2[running]
+            draws = self.rng.random((8, running.size))
+
+            damage_12 = self._roll_damage(tables_12, i, j, draws[:4])
+            damage_21 = self._roll_damage(tables_21, j, i, draws[4:])
+
+            h1 = hp1[running, i]
+            h2 = hp2[running, j]
+
+            # Ordem de ataque: pokemon1 primeiro em caso de empate de velocidade
+            team1_first = team1.speed[i] >= team2.speed[j]
+            h2 = np.where(team1_first, np.maximum(0, h2 - damage_12), h2)
+            h1 = np.where(team1_first, h1, np.maximum(0, h1 - damage_21))
+            second_alive = np.where(team1_first, h2 > 0, h1 > 0)
+            h1 = np.where(team1_first & second_alive, np.maximum(0, h1 - damage_21), h1)
+            h2 = np.where(~team1_first & second_alive, np.maximum(0, h2 - damage_12), h2)
+
+            hp1[running, i] = h1
+            hp2[running, j] = h2
+            # Dano registrado de cada ataque executado (como em BattleTurn.damage_dealt)
+            damage_dealt[running] += (
+                np.where(team1_first | second_alive, damage_12, 0) +
+                np.where(~team1_first | second_alive, damage_21, 0)
+            )
+            inner_turns[running] += 1
+
+            # Fim do confronto: desmaio ou limite de turnos do 1x1
+            fainted1 = h1 <= 0
+            fainted2 = h2 <= 0
+            ended = fainted1 | fainted2 | (inner_turns[running] >= self.max_turns)
+
+            ended_battles = running[ended]
+            rounds[ended_battles] += 1
+            inner_turns[ended_battles] = 0
+            active1[ended_battles] += fainted1[ended]
+            active2[ended_battles] += fainted2[ended]
+
+            finished = (
+                (active1[running] >= team1.size) |
+                (active2[running] >= team2.size) |
+                (rounds[running] >= self.max_turns)
+            )
+            running = running[~finished]
+
+        return active1, active2, rounds, damage_dealt
+
+    def run(self, team1: PokemonTeam, team2: PokemonTeam, num_battles: int) -> Dict[str, np.ndarray]:
+        """Simula `num_battles` batalhas e retorna resultados por batalha"""
+        compiled1 = compile_team(team1)
+        compiled2 = compile_team(team2)
+        tables_12 = build_matchup_tables(compiled1, compiled2)
+        tables_21 = build_matchup_tables(compiled2, compiled1)
+
+        outcomes = []
+        turns = []
+        damage = []
+        remaining = num_battles
+        while remaining > 0:
+            batch = min(remaining, self.batch_size)
+            active1, active2, rounds, damage_dealt = self._run_batch(compiled1, compiled2, tables_12, tables_21, batch)
+
+            defeated1 = active1 >= compiled1.size
+            defeated2 = active2 >= compiled2.size
+            outcome = np.full(batch, 0, dtype=np.int8)  # 0 = vitória
+            outcome[defeated1 & ~defeated2] = 1          # 1 = derrota
+            outcome[defeated1 & defeated2] = 2           # 2 = empate
+
+            outcomes.append(outcome)
+            turns.append(rounds)
+            damage.append(damage_dealt)
+            remaining -= batch
+
+        return {
+            "outcome": np.concatenate(outcomes) if outcomes else np.zeros(0, dtype=np.int8),
+            "turns": np.concatenate(turns) if turns else np.zeros(0, dtype=np.int64),
+            "damage_dealt": np.concatenate(damage) if damage else np.zeros(0, dtype=np.int64)
+        }
+
+    def run_duels(
+        self,
+        attackers: CompiledTeam,
+        defenders: CompiledTeam,
+        attacker_index: np.ndarray,
+        defender_index: np.ndarray,
+        tables: Optional[Tuple[MatchupTables, MatchupTables]] = None
+    ) -> Dict[str, np.ndarray]:
+        """Simula confrontos 1x1 (regras de BattleSystem.battle_pokemon) entre pares arbitrários
+        
+        Cada posição k é um confronto attackers[attacker_index[k]] x
+        defenders[defender_index[k]]. Retorna por confronto: vitória do atacante
+        (inclui limite de turnos, como no motor escalar), turnos completos e
+        dano causado/recebido pelo atacante.
+        """
+        if tables is None:
+            tables = (build_matchup_tables(attackers, defenders), build_matchup_tables(defenders, attackers))
+        tables_ad, tables_da = tables
+
+        i = np.asarray(attacker_index, dtype=np.intp)
+        j = np.asarray(defender_index, dtype=np.intp)
+        hp_a = attackers.max_hp[i].copy()
+        hp_d = defenders.max_hp[j].copy()
+        attacker_first = attackers.speed[i] >= defenders.speed[j]
+        turns = np.zeros(i.size, dtype=np.int64)
+        damage_dealt = np.zeros(i.size, dtype=np.int64)
+        damage_taken = np.zeros(i.size, dtype=np.int64)
+
+        running = np.arange(i.size)
+        while running.size:
+            ii = i[running]
+            jj = j[running]
+            first = attacker_first[running]
+            draws = self.rng.random((8, running.size))
+
+            damage_ad = self._roll_damage(tables_ad, ii, jj, draws[:4])
+            damage_da = self._roll_damage(tables_da, jj, ii, draws[4:])
+
+            ha = hp_a[running]
+            hd = hp_d[running]
+            hd = np.where(first, np.maximum(0, hd - damage_ad), hd)
+            ha = np.where(first, ha, np.maximum(0, ha - damage_da))
+            second_alive = np.where(first, hd > 0, ha > 0)
+            ha = np.where(first & second_alive, np.maximum(0, ha - damage_da), ha)
+            hd = np.where(~first & second_alive, np.maximum(0, hd - damage_ad), hd)
+
+            damage_dealt[running] += np.where(first | second_alive, damage_ad, 0)
+            damage_taken[running] += np.where(~first | second_alive, damage_da, 0)
+            hp_a[running] = ha
+            hp_d[running] = hd
+
+            # Nocaute pelo primeiro atacante encerra sem completar o turno
+            turns[running] += second_alive
+            ended = ~second_alive | (ha <= 0) | (hd <= 0) | (turns[running] >= self.max_turns)
+            running = running[~ended]
+
+        return {
+            "won": hp_a > 0,
+            "turns": turns,
+            "damage_dealt": damage_dealt,
+            "damage_taken": damage_taken
+        }
+
+    def simulate(self, team1: PokemonTeam, team2: PokemonTeam, num_simulations: int = 100) -> Dict[str, float]:
+        """Mesmo formato de BattleSystem.simulate_battle"""
+        results = self.run(team1, team2, num_simulations)
+        outcome = results["outcome"]
+
+        return {
+            "win_rate": int(np.count_nonzero(outcome == 0)) / num_simulations,
+            "loss_rate": int(np.count_nonzero(outcome == 1)) / num_simulations,
+            "draw_rate": int(np.count_nonzero(outcome == 2)) / num_simulations,
+            "avg_turns": float(results["turns"].sum()) / num_simulations
+        }
+
+
+def _chi2_sf(statistic: float, dof: int) -> float:
+    """Sobrevivência da qui-quadrado para 1 ou 2 graus de liberdade"""
+    if dof <= 0:
+        return 1.0
+    if dof == 1:
+        return math.erfc(math.sqrt(statistic / 2))
+    return math.exp(-statistic / 2)
+
+
+def check_statistical_equivalence(
+    team1: PokemonTeam,
+    team2: PokemonTeam,
+    num_simulations: int = 1000,
+    battle_system: Optional[BattleSystem] = None,
+    engine: Optional[VectorizedBattleEngine] = None,
+    alpha: float = 0.01
+) -> Dict[str, object]:
+    """Compara o motor vetorizado com o escalar (qui-quadrado nos resultados, Welch nos turnos)"""
+    battle_system = battle_system or BattleSystem()
+    engine = engine or VectorizedBattleEngine(max_turns=battle_system.max_turns)
+
+    # Amostras do motor escalar
+    scalar_counts = np.zeros(3)
+    scalar_turns = np.zeros(num_simulations)
+    result_index = {BattleResult.WIN: 0, BattleResult.LOSS: 1, BattleResult.DRAW: 2}
+    for k in range(num_simulations):
+        battle_log = battle_system.battle_teams(team1, team2, turn_sink="none")
+        scalar_counts[result_index[battle_log.battle_result]] += 1
+        scalar_turns[k] = battle_log.total_turns
+
+    # Amostras do motor vetorizado
+    vectorized = engine.run(team1, team2, num_simulations)
+    vector_counts = np.bincount(vectorized["outcome"], minlength=3).astype(float)
+    vector_turns = vectorized["turns"].astype(float)
+
+    # Teste qui-quadrado de homogeneidade (2 x categorias observadas)
+    observed = np.vstack([scalar_counts, vector_counts])
+    observed = observed[:, observed.sum(axis=0) > 0]
+    expected = observed.sum(axis=1, keepdims=True) * observed.sum(axis=0) / observed.sum()
+    chi2 = float(((observed - expected) ** 2 / expected).sum())
+    outcome_p_value = _chi2_sf(chi2, observed.shape[1] - 1)
+
+    # Teste de Welch para turnos médios (aproximação normal)
+    standard_error = math.sqrt(scalar_turns.var(ddof=1) / num_simulations + vector_turns.var(ddof=1) / num_simulations)
+    turn_difference = abs(scalar_turns.mean() - vector_turns.mean())
+    if standard_error > 0:
+        turns_p_value = math.erfc(turn_difference / standard_error / math.sqrt(2))
+    else:
+        turns_p_value = 1.0 if turn_difference == 0 else 0.0
+
+    return {
+        "scalar": {
+            "win_rate": float(scalar_counts[0]) / num_simulations,
+            "loss_rate": float(scalar_counts[1]) / num_simulations,
+            "draw_rate": float(scalar_counts[2]) / num_simulations,
+            "avg_turns": float(scalar_turns.mean())
+        },
+        "vectorized": {
+            "win_rate": float(vector_counts[0]) / num_simulations,
+            "loss_rate": float(vector_counts[1]) / num_simulations,
+            "draw_rate": float(vector_counts[2]) / num_simulations,
+            "avg_turns": float(vector_turns.mean())
+        },
+        "outcome_p_value": outcome_p_value,
+        "turns_p_value": turns_p_value,
+        "equivalent": outcome_p_value >= alpha and turns_p_value >= alpha
+    }
@@ -2,9 +2,15 @@
 Módulo de Utilitários - Funções auxiliares e configurações
 """
 
+from .._lazy import lazy_exports
 from .config import Config
 from .logger import setup_logger
-from .visualization import create_team_radar, create_performance_chart
+
+# Gráficos (matplotlib, seaborn, pandas) carregados só no primeiro uso (PEP 562)
+_LAZY_IMPORTS = {
+    "create_team_radar": ".visualization",
+    "create_performance_chart": ".visualization",
+}
 
 __all__ = [
     "Config",
@@ -12,3 +18,6 @@ __all__ = [
     "create_team_radar",
     "create_performance_chart"
 ]
+
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY_IMPORTS)
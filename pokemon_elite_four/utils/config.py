@@ -5,7 +5,12 @@ Configurações do Projeto Pokémon Elite Four
 import os
 from pathlib import Path
 from dataclasses import dataclass
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+
+try:
+    import yaml
+except ImportError:  # pragma: no cover - PyYAML é opcional
+    yaml = None
 
 
 @dataclass
@@ -28,12 +33,19 @@ class Config:
     MAX_BATTLE_TURNS: int = 100
     DEFAULT_SIMULATIONS: int = 100
     
+    # Avaliação sequencial: meia-largura alvo do intervalo da taxa de vitória
+    # (None = número fixo de simulações)
+    TARGET_PRECISION: Optional[float] = None
+    CONFIDENCE_LEVEL: float = 0.95
+    
     # Configurações de otimização
     POPULATION_SIZE: int = 50
     MAX_GENERATIONS: int = 100
     MUTATION_RATE: float = 0.1
     CROSSOVER_RATE: float = 0.8
     ELITE_SIZE: int = 5
+    # Modelo substituto: fração dos filhos novos que é simulada (None = todos)
+    SURROGATE_FRACTION: Optional[float] = None
     
     # Configurações de visualização
     PLOT_WIDTH: int = 10
@@ -44,9 +56,60 @@ class Config:
     LOG_LEVEL: str = "INFO"
     LOG_FORMAT: str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
     
+    # Configurações de performance (seção `performance` do config.yaml)
+    CONFIG_FILE: str = "config.yaml"
+    USE_MULTIPROCESSING: bool = False
+    N_PROCESSES: int = 4
+    ENABLE_CACHE: bool = True
+    CACHE_DIR: str = "output/.cache"
+    
+    # Perfil de execução (seção `development` do config.yaml)
+    ENABLE_PROFILING: bool = False
+    PROFILE_OUTPUT: str = "output/profile.stats"
+    
     def __post_init__(self):
-        """Cria diretórios necessários"""
+        """Cria diretórios necessários e lê config.yaml se disponível"""
         self._create_directories()
+        self._load_yaml_settings()
+    
+    def _load_yaml_settings(self):
+        """Carrega as configurações de performance, batalha, GA e perfil do arquivo YAML"""
+        if yaml is None or not Path(self.CONFIG_FILE).exists():
+            return
+        
+        with open(self.CONFIG_FILE, encoding="utf-8") as f:
+            settings = yaml.safe_load(f) or {}
+        
+        performance = settings.get("performance") or {}
+        self.USE_MULTIPROCESSING = bool(performance.get("use_multiprocessing", self.USE_MULTIPROCESSING))
+        self.N_PROCESSES = int(performance.get("n_processes", self.N_PROCESSES))
+        self.ENABLE_CACHE = bool(performance.get("enable_cache", self.ENABLE_CACHE))
+        self.CACHE_DIR = str(performance.get("cache_dir", self.CACHE_DIR))
+        
+        development = settings.get("development") or {}
+        self.ENABLE_PROFILING = bool(development.get("enable_profiling", self.ENABLE_PROFILING))
+        self.PROFILE_OUTPUT = str(development.get("profile_output", self.PROFILE_OUTPUT))
+        
+        battle = settings.get("battle") or {}
+        if battle.get("target_precision") is not None:
+            self.TARGET_PRECISION = float(battle["target_precision"])
+        self.CONFIDENCE_LEVEL = float(battle.get("confidence_level", self.CONFIDENCE_LEVEL))
+        
+        genetic_algorithm = settings.get("genetic_algorithm") or {}
+        if genetic_algorithm.get("surrogate_fraction") is not None:
+            self.SURROGATE_FRACTION = float(genetic_algorithm["surrogate_fraction"])
+    
+    def get_n_workers(self) -> int:
+        """Número de processos para simulações (1 = execução serial)"""
+        if not self.USE_MULTIPROCESSING:
+            return 1
+        return max(1, self.N_PROCESSES)
+    
+    def get_cache_dir(self, name: str) -> Optional[str]:
+        """Diretório de um cache em disco (None se os caches estão desativados)"""
+        if not self.ENABLE_CACHE:
+            return None
+        return os.path.join(self.CACHE_DIR, name)
     
     def _create_directories(self):
         """Cria diretórios de saída se não existirem"""
@@ -78,11 +141,20 @@ class Config:
             'output_dir': self.OUTPUT_DIR,
             'max_battle_turns': self.MAX_BATTLE_TURNS,
             'default_simulations': self.DEFAULT_SIMULATIONS,
+            'target_precision': self.TARGET_PRECISION,
+            'confidence_level': self.CONFIDENCE_LEVEL,
             'population_size': self.POPULATION_SIZE,
             'max_generations': self.MAX_GENERATIONS,
             'mutation_rate': self.MUTATION_RATE,
             'crossover_rate': self.CROSSOVER_RATE,
-            'elite_size': self.ELITE_SIZE
+            'elite_size': self.ELITE_SIZE,
+            'surrogate_fraction': self.SURROGATE_FRACTION,
+            'use_multiprocessing': self.USE_MULTIPROCESSING,
+            'n_processes': self.N_PROCESSES,
+            'enable_cache': self.ENABLE_CACHE,
+            'cache_dir': self.CACHE_DIR,
+            'enable_profiling': self.ENABLE_PROFILING,
+            'profile_output': self.PROFILE_OUTPUT
         }
 
 
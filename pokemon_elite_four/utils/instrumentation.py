@@ -0,0 +1,234 @@
+"""
+Instrumentação - Contadores dos caminhos críticos, fases e perfil de execução
+
+Os contadores são instalados como invólucros nos métodos dos motores apenas
+quando habilitados: desligados, os métodos originais ficam intactos e o custo
+é zero. Batalhas executadas em processos filhos (--workers > 1) não entram
+nas contagens do processo principal.
+"""
+
+import cProfile
+import functools
+import importlib
+import io
+import pstats
+import time
+import tracemalloc
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+COUNTER_NAMES = ("battles", "turns", "damage_calculations", "damage_estimates", "type_lookups")
+
+COUNTER_LABELS = {
+    "battles": "Batalhas simuladas",
+    "turns": "Turnos executados (motores escalares)",
+    "damage_calculations": "Cálculos de dano",
+    "damage_estimates": "Estimativas de dano (estratégias)",
+    "type_lookups": "Consultas de efetividade",
+}
+
+
+def _one(result, args) -> int:
+    return 1
+
+
+def _returned(result, args) -> int:
+    return result
+
+
+def _resolved(result, args) -> int:
+    return int(result is not None)
+
+
+def _batch_size(result, args) -> int:
+    return len(result["outcome"])
+
+
+# (módulo, classe, método, contador, incremento a partir do resultado/argumentos)
+COUNTER_HOOKS: Tuple[Tuple[str, str, str, str, Callable], ...] = (
+    ("pokemon_elite_four.core.battle_system", "BattleSystem", "battle_pokemon", "battles", _one),
+    ("pokemon_elite_four.core.battle_system", "BattleSystem", "battle_teams", "battles", _one),
+    ("pokemon_elite_four.core.smart_battle_system", "SmartBattleSystem", "battle_pokemon_smart", "battles", _one),
+    ("pokemon_elite_four.core.smart_battle_system", "SmartBattleSystem", "battle_teams_smart", "battles", _one),
+    ("pokemon_elite_four.core.vectorized_battle", "VectorizedBattleEngine", "run", "battles", _batch_size),
+    ("pokemon_elite_four.core.battle_system", "BattleSystem", "_run_pokemon_battle", "turns", _returned),
+    ("pokemon_elite_four.core.smart_battle_system", "SmartBattleSystem", "_run_smart_pokemon_battle", "turns",
+     _returned),
+    ("pokemon_elite_four.core.battle_system", "BattleSystem", "_calculate_damage", "damage_calculations", _one),
+    ("pokemon_elite_four.core.battle_system", "BattleSystem", "_resolve_table_attack", "damage_calculations",
+     _resolved),
+    ("pokemon_elite_four.core.smart_battle_system", "SmartBattleSystem", "_calculate_expected_damage",
+     "damage_estimates", _one),
+    ("pokemon_elite_four.core.battle_system", "TypeEffectiveness", "get_effectiveness", "type_lookups", _one),
+    ("pokemon_elite_four.core.battle_system", "TypeEffectiveness", "get_effectiveness_by_index", "type_lookups",
+     _one),
+    ("pokemon_elite_four.core.battle_system", "TypeEffectiveness", "get_effectiveness_against", "type_lookups",
+     _one),
+)
+
+# (módulo, classe, método de consulta, nome do cache): resultado None = falta
+CACHE_HOOKS: Tuple[Tuple[str, str, str, str], ...] = (
+    ("pokemon_elite_four.analysis.fitness_cache", "TeamFitnessCache", "get", "fitness"),
+    ("pokemon_elite_four.core.smart_battle_system", "MovePolicyCache", "get", "move_policy"),
+    ("pokemon_elite_four.core.damage_table", "DamageTable", "get", "damage_table"),
+    ("pokemon_elite_four.core.pokemon_database", "PokemonDatabase", "load", "pokemon_database"),
+)
+
+
+def _wrap(owner: type, name: str, after: Callable) -> object:
+    """Invólucro de `owner.name` que chama `after(resultado, args)` (preserva classmethod/staticmethod)"""
+    raw = owner.__dict__[name]
+    function = raw.__func__ if isinstance(raw, (classmethod, staticmethod)) else raw
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        result = function(*args, **kwargs)
+        after(result, args)
+        return result
+
+    if isinstance(raw, classmethod):
+        return classmethod(wrapper)
+    if isinstance(raw, staticmethod):
+        return staticmethod(wrapper)
+    return wrapper
+
+
+class Instrumentation:
+    """Contadores, caches e tempos de fase de uma execução"""
+
+    def __init__(self):
+        self.counters: Dict[str, int] = dict.fromkeys(COUNTER_NAMES, 0)
+        self.caches: Dict[str, List[int]] = {}
+        self.phases: Dict[str, float] = {}
+        self._originals: List[Tuple[type, str, object]] = []
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self._originals)
+
+    def enable(self) -> None:
+        """Instala os invólucros de contagem (idempotente)"""
+        if self.enabled:
+            return
+        for module_name, class_name, method, counter, increment in COUNTER_HOOKS:
+            self._install(module_name, class_name, method, self._counter_hook(counter, increment))
+        for module_name, class_name, method, cache in CACHE_HOOKS:
+            self._install(module_name, class_name, method, self._cache_hook(cache))
+
+    def disable(self) -> None:
+        """Restaura os métodos originais (os valores acumulados são mantidos)"""
+        while self._originals:
+            owner, name, raw = self._originals.pop()
+            setattr(owner, name, raw)
+
+    def reset(self) -> None:
+        """Zera os valores (os invólucros instalados continuam valendo)"""
+        for name in self.counters:
+            self.counters[name] = 0
+        self.caches.clear()
+        self.phases.clear()
+
+    def _install(self, module_name: str, class_name: str, method: str, after: Callable) -> None:
+        owner = getattr(importlib.import_module(module_name), class_name)
+        self._originals.append((owner, method, owner.__dict__[method]))
+        setattr(owner, method, _wrap(owner, method, after))
+
+    def _counter_hook(self, counter: str, increment: Callable) -> Callable:
+        counters = self.counters
+
+        def after(result, args):
+            counters[counter] += increment(result, args)
+        return after
+
+    def _cache_hook(self, cache: str) -> Callable:
+        def after(result, args):
+            self.record_cache(cache, hits=int(result is not None), misses=int(result is None))
+        return after
+
+    def record_cache(self, name: str, hits: int = 0, misses: int = 0) -> None:
+        """Acumula acertos/faltas de um cache (também para caches sem gancho)"""
+        totals = self.caches.setdefault(name, [0, 0])
+        totals[0] += hits
+        totals[1] += misses
+
+    @contextmanager
+    def phase(self, name: str):
+        """Mede o tempo de parede de uma fase (sempre ativo: custo de dois relógios)"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = self.phases.get(name, 0.0) + time.perf_counter() - start
+
+    def summary(self) -> str:
+        """Tabela de fim de execução"""
+        lines = ["", "📏 INSTRUMENTAÇÃO", "=" * 50]
+
+        if self.phases:
+            lines.append("Fases (tempo de parede):")
+            for name, seconds in self.phases.items():
+                lines.append(f"  {name:<36} {seconds:10.3f} s")
+
+        if self.enabled or any(self.counters.values()):
+            lines.append("Contadores:")
+            for name in COUNTER_NAMES:
+                lines.append(f"  {COUNTER_LABELS[name]:<36} {self.counters[name]:>12,}")
+
+        if self.caches:
+            lines.append("Caches (acertos / faltas / taxa):")
+            for name, (hits, misses) in self.caches.items():
+                lookups = hits + misses
+                rate = hits / lookups if lookups else 0.0
+                lines.append(f"  {name:<24} {hits:>10,} / {misses:>10,} / {rate:6.1%}")
+
+        return "\n".join(lines)
+
+
+# Instância do processo (usada por main.py)
+instrumentation = Instrumentation()
+
+
+class Profiler:
+    """cProfile + tracemalloc em volta de um bloco; grava o arquivo .stats de pstats"""
+
+    def __init__(self, output_path: str, top: int = 15):
+        self.output_path = Path(output_path)
+        self.top = top
+        self.profile: Optional[cProfile.Profile] = None
+        self.current_memory = 0
+        self.peak_memory = 0
+        self.top_allocations: List[tracemalloc.Statistic] = []
+
+    def __enter__(self) -> "Profiler":
+        tracemalloc.start()
+        self.profile = cProfile.Profile()
+        self.profile.enable()
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> bool:
+        self.profile.disable()
+        self.current_memory, self.peak_memory = tracemalloc.get_traced_memory()
+        self.top_allocations = tracemalloc.take_snapshot().statistics("lineno")[:self.top]
+        tracemalloc.stop()
+
+        self.output_path.parent.mkdir(parents=True, exist_ok=True)
+        self.profile.dump_stats(str(self.output_path))
+        return False
+
+    def summary(self) -> str:
+        """Funções mais caras (tempo cumulativo) e maiores alocações"""
+        stream = io.StringIO()
+        pstats.Stats(self.profile, stream=stream).sort_stats("cumulative").print_stats(self.top)
+
+        lines = [
+            "", "🔬 PERFIL", "=" * 50,
+            f"Estatísticas salvas em {self.output_path} (abrir com pstats/snakeviz)",
+            f"Memória: pico {self.peak_memory / 1024 ** 2:.1f} MiB, final {self.current_memory / 1024 ** 2:.1f} MiB",
+            "Maiores alocações:",
+        ]
+        for statistic in self.top_allocations:
+            frame = statistic.traceback[0]
+            lines.append(f"  {statistic.size / 1024:10.1f} KiB  {frame.filename}:{frame.lineno}")
+        lines.append(stream.getvalue().rstrip())
+        return "\n".join(lines)
@@ -0,0 +1,192 @@
+"""
+Testes para as espécies imutáveis e o estado por batalha
+"""
+
+import copy
+import pytest
+import random
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# Adiciona o diretório raiz ao path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from pokemon_elite_four.core.pokemon import Pokemon, PokemonStats, PokemonType
+from pokemon_elite_four.core.battle_state import BattleState, SpeciesSpec
+from pokemon_elite_four.core.battle_system import BattleSystem, BattleResult
+from pokemon_elite_four.core.smart_battle_system import SmartBattleSystem, MoveStrategy, MovePolicyCache
+from pokemon_elite_four.core.elite_four import EliteFour
+from pokemon_elite_four.core.moves import MoveSet, get_move_by_name
+
+
+@pytest.fixture
+def elite_four():
+    return EliteFour()
+
+
+class TestSpeciesSpec:
+    """Testes para a camada imutável de espécies"""
+
+    def test_spec_is_frozen_and_cached(self):
+        """Testa que a especificação é imutável e reaproveitada"""
+        pokemon = Pokemon("Charizard", 6, PokemonType.FIRE, PokemonType.FLYING, PokemonStats(78, 84, 78, 109, 85, 100))
+
+        spec = pokemon.spec
+        assert pokemon.spec is spec
+        assert spec.max_hp == pokemon.max_hp and spec.speed == pokemon.speed
+        with pytest.raises(AttributeError):
+            spec.level = 60
+
+    def test_spec_follows_facade_changes(self):
+        """Testa que nível e movimentos novos geram outra especificação"""
+        pokemon = Pokemon("Charizard", 6, PokemonType.FIRE, PokemonType.FLYING, PokemonStats(78, 84, 78, 109, 85, 100))
+        spec = pokemon.spec
+
+        pokemon.level = 60
+        assert pokemon.spec is not spec
+        assert pokemon.spec.attack == pokemon.attack
+
+        pokemon.move_set = MoveSet([get_move_by_name("Surf")])
+        assert [move.name for move in pokemon.spec.moves] == ["Surf"]
+
+    def test_deepcopy_keeps_spec_usable(self):
+        """Testa cópia profunda (usada pelos workers) de um Pokémon com especificação"""
+        pokemon = Pokemon("Blastoise", 9, PokemonType.WATER, None, PokemonStats(79, 83, 100, 85, 105, 78))
+        spec = pokemon.spec
+
+        clone = copy.deepcopy(pokemon)
+        assert clone.spec == spec
+        assert isinstance(clone.spec, SpeciesSpec)
+
+
+class TestBattleState:
+    """Testes para o estado mutável de uma batalha"""
+
+    def test_fainted_bitmask_and_switch(self, elite_four):
+        """Testa desmaios e troca automática pela bitmask"""
+        state = BattleState.from_team(elite_four.get_member_by_name("Lorelei").pokemon_team)
+
+        assert state.take_damage(0, 10_000)
+        assert state.active_fainted and state.fainted == 0b1
+        assert state.auto_switch() and state.active == 1
+
+        for slot in range(1, len(state.specs)):
+            state.take_damage(slot, 10_000)
+        assert state.is_defeated
+        assert state.alive_count == 0
+        assert not state.auto_switch()
+
+    def test_team_battle_does_not_touch_team(self, elite_four):
+        """Testa que a batalha entre equipes não altera os Pokémon compartilhados"""
+        team1 = elite_four.get_member_by_name("Bruno").pokemon_team
+        team2 = elite_four.get_member_by_name("Agatha").pokemon_team
+        before = [(p.current_hp, p.max_hp) for p in team1.pokemon + team2.pokemon]
+
+        log = BattleSystem(rng=random.Random(1)).battle_teams(team1, team2)
+
+        assert [(p.current_hp, p.max_hp) for p in team1.pokemon + team2.pokemon] == before
+        state1, state2 = log.final_states
+        loser = state1 if log.battle_result == BattleResult.LOSS else state2
+        assert loser.is_defeated
+
+    def test_mirror_match_uses_independent_sides(self, elite_four):
+        """Testa que uma equipe contra ela mesma tem dois lados independentes"""
+        team = elite_four.get_member_by_name("Lance").pokemon_team
+
+        log = BattleSystem(rng=random.Random(2)).battle_teams(team, team)
+
+        state1, state2 = log.final_states
+        assert state1.is_defeated != state2.is_defeated
+        assert log.battle_result in (BattleResult.WIN, BattleResult.LOSS)
+
+    def test_pokemon_battle_writes_back_hp(self):
+        """Testa que o 1x1 da fachada continua refletindo o HP nos objetos"""
+        pokemon1 = Pokemon("Blastoise", 9, PokemonType.WATER, None, PokemonStats(79, 83, 100, 85, 105, 78))
+        pokemon2 = Pokemon("Arcanine", 59, PokemonType.FIRE, None, PokemonStats(90, 110, 80, 100, 80, 95))
+
+        log = BattleSystem(rng=random.Random(3)).battle_pokemon(pokemon1, pokemon2)
+
+        state1, state2 = log.final_states
+        assert pokemon1.current_hp == state1.hp[0] and pokemon2.current_hp == state2.hp[0]
+        assert pokemon1.is_fainted or pokemon2.is_fainted
+
+    def test_concurrent_battles_match_serial(self, elite_four):
+        """Testa batalhas em threads sobre as mesmas equipes"""
+        members = elite_four.get_all_members()
+
+        def run(seed):
+            system = SmartBattleSystem(rng=random.Random(seed))
+            results = []
+            for member in members:
+                log = system.battle_teams_smart(members[0].pokemon_team, member.pokemon_team, turn_sink="none")
+                results.append((log.battle_result, log.total_turns))
+            return results
+
+        serial = [run(seed) for seed in range(8)]
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            threaded = list(executor.map(run, range(8)))
+
+        assert threaded == serial
+
+
+class TestMovePolicyCache:
+    """Testes para a tabela de escolhas das estratégias determinísticas"""
+
+    def test_policy_matches_selection_and_is_cached(self, elite_four):
+        """Testa que a consulta repete select_optimal_move e reaproveita a entrada"""
+        system = SmartBattleSystem(rng=random.Random(0), policy_cache=MovePolicyCache())
+        attacker = elite_four.get_member_by_name("Lance").pokemon_team.pokemon[0].spec
+        defender = elite_four.get_member_by_name("Lorelei").pokemon_team.pokemon[0].spec
+
+        choice = system.policy_choice(attacker, defender, MoveStrategy.BALANCED)
+        expected = system.select_optimal_move(attacker, defender, list(attacker.moves), MoveStrategy.BALANCED)
+
+        assert choice.move is expected.move
+        assert system.policy_choice(attacker, defender, MoveStrategy.BALANCED) is choice
+        assert system.policy_cache.stats()["hits"] == 1
+
+    def test_keys_use_spec_identity(self):
+        """Testa que outro spec com os mesmos dados não reaproveita a entrada"""
+        cache = MovePolicyCache()
+        pokemon = Pokemon("Charizard", 6, PokemonType.FIRE, PokemonType.FLYING, PokemonStats(78, 84, 78, 109, 85, 100))
+        system = SmartBattleSystem(policy_cache=cache)
+        spec = pokemon.spec
+        system.policy_choice(spec, spec, MoveStrategy.HIGHEST_DAMAGE)
+
+        pokemon.level = 60
+        assert cache.get(pokemon.spec, pokemon.spec, MoveStrategy.HIGHEST_DAMAGE) is None
+        assert cache.get(spec, spec, MoveStrategy.TYPE_EFFECTIVE) is None
+
+    def test_bounded_size(self, elite_four):
+        """Testa que a tabela é esvaziada ao atingir o limite"""
+        system = SmartBattleSystem(policy_cache=MovePolicyCache(max_size=4))
+        specs = [pokemon.spec for pokemon in elite_four.get_member_by_name("Bruno").pokemon_team.pokemon]
+
+        system.precompute_policies(specs, specs, [MoveStrategy.BALANCED, MoveStrategy.RANDOM])
+
+        assert len(system.policy_cache) <= 4
+
+    def test_precomputed_table_does_not_change_battles(self, elite_four):
+        """Testa resultados iguais com a tabela vazia e preenchida em lote"""
+        members = elite_four.get_all_members()
+        specs = [pokemon.spec for member in members for pokemon in member.pokemon_team.pokemon]
+
+        def run(cache, prefill):
+            system = SmartBattleSystem(rng=random.Random(4), policy_cache=cache)
+            if prefill:
+                assert system.precompute_policies(specs, specs) == len(specs) ** 2 * 4
+            results = []
+            for member in members:
+                for strategy in MoveStrategy:
+                    log = system.battle_teams_smart(
+                        members[0].pokemon_team, member.pokemon_team, strategy, turn_sink="none"
+                    )
+                    results.append((log.battle_result, log.total_turns))
+            return results
+
+        assert run(MovePolicyCache(), False) == run(MovePolicyCache(), True)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
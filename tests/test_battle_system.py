@@ -3,14 +3,22 @@ Testes para o sistema de batalhas
 """
 
 import pytest
+import random
 import sys
 from pathlib import Path
 
 # Adiciona o diretório raiz ao path
 sys.path.append(str(Path(__file__).parent.parent))
 
-from pokemon_elite_four.core.pokemon import Pokemon, PokemonStats
-from pokemon_elite_four.core.battle_system import BattleSystem, TypeEffectiveness
+import numpy as np
+
+from pokemon_elite_four.core.pokemon import (
+    Pokemon, PokemonStats, PokemonType, TYPE_ORDER, NO_TYPE_INDEX, type_index
+)
+from pokemon_elite_four.core.battle_system import (
+    BattleSystem, TypeEffectiveness, TurnCounterSink, TurnLogSink
+)
+from pokemon_elite_four.core.elite_four import EliteFour
 from pokemon_elite_four.core.moves import Move, MoveCategory
 
 
@@ -68,6 +76,69 @@ class TestTypeEffectiveness:
         assert effectiveness == 1.0
 
 
+class TestTypeEffectivenessTables:
+    """Testes para as tabelas indexadas de efetividade"""
+    
+    def test_table_shapes(self):
+        """Testa dimensões das tabelas"""
+        assert TypeEffectiveness.EFFECTIVENESS_TABLE.shape == (17, 17)
+        assert TypeEffectiveness.DUAL_TYPE_TABLE.shape == (18, 18, 18)
+    
+    def test_table_matches_matrix(self):
+        """Testa que a tabela reproduz a matriz original"""
+        matrix = TypeEffectiveness.EFFECTIVENESS_MATRIX
+        for attack_type in TYPE_ORDER:
+            for defender_type in TYPE_ORDER:
+                expected = matrix.get(attack_type, {}).get(defender_type, 1.0)
+                table_value = TypeEffectiveness.EFFECTIVENESS_TABLE[
+                    type_index(attack_type), type_index(defender_type)
+                ]
+                assert table_value == expected
+    
+    def test_dual_type_lookup(self):
+        """Testa consulta indexada para Pokémon de dois tipos"""
+        # Elétrico contra Água/Voador = 4x
+        effectiveness = TypeEffectiveness.get_effectiveness_by_index(
+            type_index(PokemonType.ELECTRIC),
+            type_index(PokemonType.WATER),
+            type_index(PokemonType.FLYING)
+        )
+        assert effectiveness == 4.0
+        
+        # Sem segundo tipo = multiplicador neutro
+        effectiveness = TypeEffectiveness.get_effectiveness_by_index(
+            type_index(PokemonType.WATER), type_index(PokemonType.FIRE), NO_TYPE_INDEX
+        )
+        assert effectiveness == 2.0
+    
+    def test_effectiveness_against_pokemon(self):
+        """Testa caminho rápido contra um Pokémon"""
+        gyarados = Pokemon(
+            "Gyarados", 130, PokemonType.WATER, PokemonType.FLYING,
+            PokemonStats(95, 125, 79, 60, 100, 81), 50
+        )
+        effectiveness = TypeEffectiveness.get_effectiveness_against(
+            PokemonType.ELECTRIC, gyarados
+        )
+        assert effectiveness == TypeEffectiveness.get_effectiveness(
+            PokemonType.ELECTRIC, gyarados.get_types()
+        )
+    
+    def test_vectorized_lookup(self):
+        """Testa API vetorizada contra a consulta escalar"""
+        attack = np.array([type_index(t) for t in TYPE_ORDER])
+        type1 = np.roll(attack, 3)
+        type2 = np.roll(attack, 7)
+        
+        result = TypeEffectiveness.get_effectiveness_array(attack, type1, type2)
+        
+        for i, attack_type in enumerate(TYPE_ORDER):
+            expected = TypeEffectiveness.get_effectiveness(
+                attack_type, [TYPE_ORDER[type1[i]], TYPE_ORDER[type2[i]]]
+            )
+            assert result[i] == expected
+
+
 class TestBattleSystem:
     """Testes para o sistema de batalhas"""
     
@@ -238,5 +309,62 @@ class TestBattleSystem:
         assert result == pokemon2
 
 
+class TestTurnSinks:
+    """Testes para os modos de registro de turnos"""
+    
+    def run_battle(self, turn_sink, seed=5):
+        members = EliteFour().get_all_members()
+        battle_system = BattleSystem(rng=random.Random(seed))
+        return battle_system.battle_teams(
+            members[0].pokemon_team, members[1].pokemon_team, turn_sink=turn_sink
+        )
+    
+    def test_full_log_is_default(self):
+        """Testa que o log completo continua sendo o padrão"""
+        default = self.run_battle("full")
+        
+        assert len(default.turns) > 0
+        assert default.turn_sink is None
+    
+    def test_modes_do_not_change_outcome(self):
+        """Testa que o modo de registro não altera o resultado"""
+        full = self.run_battle("full")
+        silent = self.run_battle("none")
+        counters = self.run_battle("counters")
+        
+        assert silent.turns == []
+        assert (silent.battle_result, silent.total_turns) == (full.battle_result, full.total_turns)
+        assert counters.battle_result == full.battle_result
+        assert counters.turn_sink.attacks == len(full.turns)
+        assert counters.turn_sink.total_damage == sum(t.damage_dealt for t in full.turns)
+    
+    def test_counter_sink_accumulates_across_battles(self):
+        """Testa contadores compartilhados entre batalhas"""
+        sink = TurnCounterSink()
+        self.run_battle(sink, seed=1)
+        first_attacks = sink.attacks
+        self.run_battle(sink, seed=2)
+        
+        assert sink.attacks > first_attacks > 0
+        assert sink.as_dict()["attacks"] == sink.attacks
+        
+        sink.reset()
+        assert sink.total_damage == 0
+    
+    def test_callback_sink(self):
+        """Testa repasse de turnos para função do usuário"""
+        received = []
+        log = self.run_battle(received.append)
+        full = self.run_battle("full")
+        
+        assert log.turns == []
+        assert [t.damage_dealt for t in received] == [t.damage_dealt for t in full.turns]
+    
+    def test_invalid_mode(self):
+        """Testa erro para modo desconhecido"""
+        with pytest.raises(ValueError):
+            self.run_battle("verbose")
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -0,0 +1,120 @@
+"""
+Testes para geradores injetáveis e números aleatórios comuns (CRN)
+"""
+
+import numpy as np
+import pytest
+import random
+import sys
+from pathlib import Path
+
+# Adiciona o diretório raiz ao path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from pokemon_elite_four.core.pokemon import Pokemon, PokemonTeam, PokemonStats, PokemonType
+from pokemon_elite_four.core.elite_four import EliteFour
+from pokemon_elite_four.core.rng import CommonRandomNumbers
+from pokemon_elite_four.analysis.team_optimizer import TeamOptimizer
+from pokemon_elite_four.analysis.advanced_team_optimizer import AdvancedTeamOptimizer
+
+
+TYPES = [PokemonType.WATER, PokemonType.FIRE, PokemonType.GRASS, PokemonType.ELECTRIC,
+         PokemonType.PSYCHIC, PokemonType.DRAGON, PokemonType.ICE, PokemonType.GROUND]
+
+
+@pytest.fixture
+def database():
+    return [
+        Pokemon(f"Pokemon{i}", i, TYPES[i - 1], None, PokemonStats(70 + i, 80, 75, 90, 80, 60 + 5 * i))
+        for i in range(1, 9)
+    ]
+
+
+def team_win_rate(optimizer, team):
+    for pokemon in team.pokemon:
+        pokemon.level = 60
+    wins, battles = optimizer._simulate_against_elite_four(team)
+    return wins / battles
+
+
+class TestCommonRandomNumbers:
+    """Testes para os fluxos comuns e o gerador por instância"""
+
+    def test_streams_replay(self):
+        """Testa que a mesma chave repete a sequência e chaves diferentes divergem"""
+        crn = CommonRandomNumbers(11)
+
+        first = [crn.stream(0, 1).random() for _ in range(3)]
+        assert first == [crn.stream(0, 1).random() for _ in range(3)]
+        assert crn.stream(0, 1).random() != crn.stream(1, 0).random()
+        assert CommonRandomNumbers(11).seed_for(2, 3) == crn.seed_for(2, 3)
+
+    def test_optimizer_does_not_touch_global_random(self, database):
+        """Testa que um otimizador com semente não consome o `random` global"""
+        random.seed(5)
+        expected = random.random()
+
+        random.seed(5)
+        optimizer = TeamOptimizer(database, EliteFour(), population_size=4, seed=1)
+        optimizer.battles_per_member = 1
+        optimizer.calculate_team_fitness(optimizer.create_random_team())
+
+        assert random.random() == expected
+
+    def test_seeded_optimizer_is_reproducible(self, database):
+        """Testa populações e fitness idênticos para a mesma semente"""
+        def run(seed):
+            optimizer = TeamOptimizer(database, EliteFour(), population_size=4, seed=seed)
+            optimizer.battles_per_member = 1
+            population = optimizer.create_initial_population()
+            return [
+                ([p.pokemon_id for p in team.pokemon], optimizer.calculate_team_fitness(team))
+                for team in population
+            ]
+
+        assert run(3) == run(3)
+
+    def test_same_team_same_outcome_under_crn(self, database):
+        """Testa que a mesma equipe reavaliada com CRN repete o resultado"""
+        optimizer = TeamOptimizer(database, EliteFour(), seed=2, common_random_numbers=True)
+
+        first = team_win_rate(optimizer, PokemonTeam(database[:6]))
+        second = team_win_rate(optimizer, PokemonTeam(database[:6]))
+
+        assert first == second
+        assert optimizer.battle_system.rng is optimizer.rng
+
+    def test_crn_reduces_comparison_variance(self, database):
+        """Testa menor variância da diferença entre duas equipes com CRN"""
+        team_a = database[:6]
+        team_b = database[:5] + [database[7]]
+
+        def differences(common_random_numbers):
+            values = []
+            for seed in range(6):
+                optimizer = TeamOptimizer(
+                    database, EliteFour(), seed=seed, common_random_numbers=common_random_numbers
+                )
+                values.append(
+                    team_win_rate(optimizer, PokemonTeam(team_a)) - team_win_rate(optimizer, PokemonTeam(team_b))
+                )
+            return np.var(values)
+
+        assert differences(True) < differences(False)
+
+    def test_advanced_crn_independent_of_generation(self, database):
+        """Testa que no modo CRN a fitness não depende da semente da geração"""
+        def fitness(generation_seed):
+            optimizer = AdvancedTeamOptimizer(
+                database, EliteFour(), population_size=2, seed=4, common_random_numbers=True
+            )
+            optimizer.simulations_per_strategy = 1
+            team = PokemonTeam(database[:6])
+            optimizer.evaluate_population([team], generation_seed=generation_seed)
+            return team.fitness
+
+        assert fitness(1) == fitness(2)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
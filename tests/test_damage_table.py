@@ -0,0 +1,153 @@
+"""
+Testes para a tabela de dano por confronto
+"""
+
+import pytest
+import random
+import sys
+from pathlib import Path
+
+# Adiciona o diretório raiz ao path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from pokemon_elite_four.core.pokemon import Pokemon, PokemonTeam, PokemonStats, PokemonType
+from pokemon_elite_four.core.battle_system import BattleSystem, TypeEffectiveness
+from pokemon_elite_four.core.smart_battle_system import SmartBattleSystem, MoveStrategy, MovePolicyCache
+from pokemon_elite_four.core.moves import MoveSet, get_move_by_name
+from pokemon_elite_four.core.damage_table import DamageTable, DamageRow, VARIATION_MIN, VARIATION_MAX
+
+
+def create_pokemon(name, pokemon_id, type1, type2, stats, moves, level=50):
+    pokemon = Pokemon(name, pokemon_id, type1, type2, PokemonStats(*stats), level)
+    pokemon.move_set = MoveSet([get_move_by_name(m) for m in moves])
+    return pokemon
+
+
+@pytest.fixture
+def pokemon_pair():
+    blastoise = create_pokemon(
+        "Blastoise", 9, PokemonType.WATER, None, (79, 83, 100, 85, 105, 78), ["Surf", "Bite", "Ice Beam"]
+    )
+    golem = create_pokemon(
+        "Golem", 76, PokemonType.ROCK, PokemonType.GROUND, (80, 110, 130, 55, 65, 45), ["Earthquake", "Rock Slide"]
+    )
+    return blastoise, golem
+
+
+@pytest.fixture
+def teams(pokemon_pair):
+    blastoise, golem = pokemon_pair
+    jolteon = create_pokemon(
+        "Jolteon", 135, PokemonType.ELECTRIC, None, (65, 65, 60, 110, 95, 130), ["Thunderbolt", "Quick Attack"]
+    )
+    arcanine = create_pokemon(
+        "Arcanine", 59, PokemonType.FIRE, None, (90, 110, 80, 100, 80, 95), ["Flamethrower", "Bite"]
+    )
+    return PokemonTeam([blastoise, jolteon]), PokemonTeam([golem, arcanine])
+
+
+class TestDamageRow:
+    """Testes para os termos fixos de um movimento"""
+
+    def test_roll_matches_scalar_damage(self, pokemon_pair):
+        """Testa que a linha reproduz _calculate_damage com a mesma variação"""
+        attacker, defender = (pokemon.spec for pokemon in pokemon_pair)
+        for move in attacker.moves:
+            row = DamageRow(attacker, defender, move)
+            effectiveness = TypeEffectiveness.get_effectiveness_against(move.move_type, defender)
+            assert row.effectiveness == effectiveness
+
+            for critical in (False, True):
+                for seed in range(50):
+                    expected = BattleSystem(rng=random.Random(seed))._calculate_damage(
+                        attacker, defender, move, critical, effectiveness
+                    )
+                    variation = random.Random(seed).uniform(0.85, 1.0)
+                    assert row.roll(critical, variation) == expected
+
+    def test_lookup_matches_roll(self, pokemon_pair):
+        """Testa a distribuição discretizada contra a conta direta, inclusive nos limiares"""
+        attacker, defender = (pokemon.spec for pokemon in pokemon_pair)
+        rng = random.Random(3)
+        for move in attacker.moves:
+            row = DamageRow(attacker, defender, move)
+            for critical in (False, True):
+                _, thresholds = row.thresholds(critical)
+                variations = [rng.uniform(VARIATION_MIN, VARIATION_MAX) for _ in range(2000)]
+                variations += [VARIATION_MIN, VARIATION_MAX, *thresholds]
+                for variation in variations:
+                    assert row.lookup(critical, variation) == row.roll(critical, variation)
+
+    def test_distribution_sums_to_one(self, pokemon_pair):
+        """Testa probabilidades e dano esperado dentro da faixa"""
+        attacker, defender = (pokemon.spec for pokemon in pokemon_pair)
+        for move in attacker.moves:
+            row = DamageRow(attacker, defender, move)
+            for critical in (False, True):
+                distribution = row.distribution(critical)
+                assert sum(probability for _, probability in distribution) == pytest.approx(1.0)
+                assert distribution[0][0] == row.roll(critical, VARIATION_MIN)
+                assert distribution[-1][0] == row.roll(critical, VARIATION_MAX)
+            assert 0 < row.expected_damage() <= row.roll(True, VARIATION_MAX)
+
+
+class TestDamageTable:
+    """Testes para o cache de confrontos"""
+
+    def test_shares_rows_between_equal_species(self, pokemon_pair):
+        """Testa chaves por valor: specs iguais de objetos diferentes reaproveitam a entrada"""
+        blastoise, golem = pokemon_pair
+        table = DamageTable()
+        entry = table.matchup(blastoise.spec, golem.spec)
+
+        clone = create_pokemon(
+            "Blastoise", 9, PokemonType.WATER, None, (79, 83, 100, 85, 105, 78), ["Surf", "Bite", "Ice Beam"]
+        )
+        assert clone.spec is not blastoise.spec
+        assert table.matchup(clone.spec, golem.spec) is entry
+        assert table.stats()["misses"] == 1 and table.stats()["hits"] == 1
+
+        # Mudança de nível gera outra chave
+        clone.level = 60
+        assert table.matchup(clone.spec, golem.spec) is not entry
+
+    def test_row_for_rejects_foreign_moves(self, pokemon_pair):
+        """Testa que movimentos fora da tabela voltam None (caminho escalar)"""
+        blastoise, golem = pokemon_pair
+        entry = DamageTable().matchup(blastoise.spec, golem.spec)
+        assert entry.row_for(blastoise.spec.moves[0]).move is blastoise.spec.moves[0]
+        assert entry.row_for(get_move_by_name("Tackle")) is None
+
+    def test_bounded_size(self, teams):
+        """Testa que a tabela é esvaziada ao atingir o limite"""
+        table = DamageTable(max_size=2)
+        specs = [pokemon.spec for team in teams for pokemon in team.pokemon]
+        for attacker in specs:
+            for defender in specs:
+                table.matchup(attacker, defender)
+                assert len(table) <= 2
+
+    def test_battles_independent_of_table_state(self, teams):
+        """Testa resultados idênticos com tabela vazia, aquecida e limitada"""
+        def run(table, smart=False):
+            if smart:
+                system = SmartBattleSystem(rng=random.Random(9), policy_cache=MovePolicyCache(), damage_table=table)
+                battle = lambda: system.battle_teams_smart(*teams, MoveStrategy.RANDOM, MoveStrategy.BALANCED)
+            else:
+                system = BattleSystem(rng=random.Random(9), damage_table=table)
+                battle = lambda: system.battle_teams(*teams)
+            logs = [battle() for _ in range(20)]
+            return [
+                [(turn.damage_dealt, turn.critical_hit, turn.effectiveness, turn.move_used.name) for turn in log.turns]
+                for log in logs
+            ]
+
+        for smart in (False, True):
+            warm = DamageTable()
+            expected = run(warm, smart)
+            assert run(warm, smart) == expected
+            assert run(DamageTable(max_size=1), smart) == expected
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -11,6 +11,8 @@ from pathlib import Path
 sys.path.append(str(Path(__file__).parent.parent))
 
 from pokemon_elite_four.analysis.data_processor import DataProcessor
+from pokemon_elite_four.analysis.team_metrics import TeamMetrics, species_profile
+from pokemon_elite_four.core.pokemon import Pokemon, PokemonStats, PokemonType
 
 
 class TestDataProcessor:
@@ -209,5 +211,52 @@ class TestDataProcessor:
             assert len(strong_data) == 2
 
 
+def make_pokemon(name, type1, type2, stats):
+    return Pokemon(name, 0, type1, type2, PokemonStats(*stats))
+
+
+@pytest.fixture
+def team():
+    return [
+        make_pokemon("Venusaur", PokemonType.GRASS, PokemonType.POISON, (80, 82, 83, 100, 100, 80)),
+        make_pokemon("Charizard", PokemonType.FIRE, PokemonType.FLYING, (78, 84, 78, 109, 85, 100)),
+        make_pokemon("Parasect", PokemonType.BUG, PokemonType.GRASS, (60, 95, 80, 60, 80, 30)),
+        make_pokemon("Lapras", PokemonType.WATER, PokemonType.ICE, (130, 85, 80, 85, 95, 60)),
+    ]
+
+
+class TestTeamMetrics:
+    """Testes para os perfis por espécie e a redução por equipe"""
+
+    def test_profile_matches_metrics(self, team):
+        """Testa o vetor de métricas contra a fórmula original"""
+        pokemon = team[1]
+        metrics = DataProcessor().calculate_pokemon_metrics(pokemon)
+
+        assert metrics["total_stats"] == pokemon.stats.total
+        assert metrics["balance"] == 1 - (abs(pokemon.attack - pokemon.defense) +
+                                          abs(pokemon.sp_attack - pokemon.sp_defense)) / pokemon.stats.total
+        assert metrics["power_category"] == "Alto"
+        assert species_profile(pokemon) is species_profile(make_pokemon("Outro", PokemonType.FIRE, PokemonType.FLYING,
+                                                                         (78, 84, 78, 109, 85, 100)))
+
+    def test_weaknesses_per_member_type(self, team):
+        """Testa que cada tipo do membro conta separadamente (Bug/Grass aparece 2x contra Fire)"""
+        weaknesses = DataProcessor().create_team_analysis(team)["weaknesses"]
+
+        assert weaknesses["Fire"].count("Parasect") == 2
+        assert "Lapras" in weaknesses["Electric"]
+        # Tipos analisados isoladamente: Fire é fraco a Ground mesmo com Flying
+        assert "Charizard" in weaknesses["Ground"]
+
+    def test_team_reduction(self, team):
+        """Testa médias e contagem de tipos da equipe contra os perfis"""
+        metrics = TeamMetrics.from_pokemon(team)
+        efficiencies = [species_profile(pokemon).as_dict()["efficiency"] for pokemon in team]
+
+        assert metrics.mean("efficiency") == pytest.approx(sum(efficiencies) / len(team))
+        assert metrics.unique_types == len(metrics.type_coverage())
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -0,0 +1,106 @@
+"""
+Testes para os avaliadores de população
+"""
+
+import pickle
+import pytest
+import sys
+from pathlib import Path
+
+# Adiciona o diretório raiz ao path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from pokemon_elite_four.core.pokemon import Pokemon, PokemonTeam, PokemonStats, PokemonType
+from pokemon_elite_four.core.elite_four import EliteFour
+from pokemon_elite_four.analysis.advanced_team_optimizer import AdvancedTeamOptimizer
+from pokemon_elite_four.analysis.evaluators import (
+    EvaluationTask, describe_team, make_evaluator, evaluate_task
+)
+
+
+TYPES = [PokemonType.WATER, PokemonType.FIRE, PokemonType.GRASS, PokemonType.ELECTRIC,
+         PokemonType.PSYCHIC, PokemonType.DRAGON, PokemonType.ICE, PokemonType.GROUND]
+
+
+@pytest.fixture
+def database():
+    return [
+        Pokemon(f"Pokemon{i}", i, TYPES[i - 1], None, PokemonStats(70 + i, 80, 75, 90, 80, 60 + 5 * i))
+        for i in range(1, 9)
+    ]
+
+
+def create_optimizer(database, **kwargs):
+    optimizer = AdvancedTeamOptimizer(database, EliteFour(), population_size=4, **kwargs)
+    optimizer.simulations_per_strategy = 1
+    return optimizer
+
+
+class TestEvaluators:
+    """Testes para avaliação serial, por threads e por processos"""
+
+    def test_descriptor_is_compact_and_picklable(self, database):
+        """Testa descritor (id, nível) serializável"""
+        team = PokemonTeam(database[:3])
+        descriptor = describe_team(team)
+
+        assert descriptor == ((1, 50), (2, 50), (3, 50))
+        assert pickle.loads(pickle.dumps(EvaluationTask(descriptor, 1))).descriptor == descriptor
+
+    def test_task_does_not_touch_original_pokemon(self, database):
+        """Testa que a avaliação não altera os Pokémon originais"""
+        optimizer = create_optimizer(database)
+        context = optimizer._evaluation_context()
+
+        evaluate_task(context, EvaluationTask(((1, 60), (2, 60)), seed=3))
+
+        assert database[0].level == 50
+        assert database[0].current_hp == database[0].max_hp
+
+    def test_build_team_shares_species(self, database):
+        """Testa reuso dos Pokémon do contexto e uma cópia por (espécie, nível) diferente"""
+        context = create_optimizer(database)._evaluation_context()
+
+        team = context.build_team(((1, 50), (2, 60)))
+        assert team.pokemon[0] is database[0]
+        assert team.pokemon[1] is not database[1] and team.pokemon[1].level == 60
+        assert database[1].level == 50
+
+        again = context.build_team(((2, 60), (1, 50)))
+        assert again.pokemon[0] is team.pokemon[1]
+        assert again.pokemon[0].spec is team.pokemon[1].spec
+
+    @pytest.mark.parametrize("kind", ["thread", "process"])
+    def test_same_fitness_as_serial(self, database, kind):
+        """Testa resultados idênticos para qualquer avaliador com a mesma semente"""
+        teams = [PokemonTeam(database[i:i + 6]) for i in range(3)]
+
+        serial = create_optimizer(database)
+        serial.evaluate_population(teams, generation_seed=42)
+        expected = [team.fitness for team in teams]
+
+        pooled = create_optimizer(database, evaluator=make_evaluator(kind, 2))
+        pooled.evaluate_population(teams, generation_seed=42)
+        pooled.evaluator.close()
+
+        assert [team.fitness for team in teams] == expected
+
+    def test_throughput_reported(self, database):
+        """Testa registro de throughput por geração"""
+        optimizer = create_optimizer(database)
+        teams = [PokemonTeam(database[:6]), PokemonTeam(database[:6])]
+
+        throughput = optimizer.evaluate_population(teams, generation_seed=1)
+
+        assert throughput["teams_evaluated"] == 1  # equipe repetida avaliada uma vez
+        assert throughput["battles"] == 5 * 4
+        assert optimizer.throughput_history == [throughput]
+
+    def test_invalid_evaluator(self):
+        """Testa erro para avaliador desconhecido"""
+        with pytest.raises(ValueError):
+            make_evaluator("gpu")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,104 @@
+"""
+Testes para o solucionador exato de confrontos 1x1
+"""
+
+import pytest
+import random
+import sys
+from pathlib import Path
+
+# Adiciona o diretório raiz ao path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from pokemon_elite_four.core.pokemon import Pokemon, PokemonStats, PokemonType
+from pokemon_elite_four.core.battle_system import BattleSystem, BattleResult
+from pokemon_elite_four.core.moves import MoveSet, get_move_by_name
+from pokemon_elite_four.core.exact_solver import ExactDuelSolver
+from pokemon_elite_four.analysis.matchup_atlas import MatchupAtlas
+
+
+def create_pokemon(name, pokemon_id, type1, stats, moves, level=50):
+    pokemon = Pokemon(name, pokemon_id, type1, None, PokemonStats(*stats), level)
+    pokemon.move_set = MoveSet([get_move_by_name(m) for m in moves])
+    return pokemon
+
+
+@pytest.fixture
+def blastoise():
+    return create_pokemon("Blastoise", 9, PokemonType.WATER, (79, 83, 100, 85, 105, 78), ["Surf", "Bite"])
+
+
+@pytest.fixture
+def arcanine():
+    return create_pokemon("Arcanine", 59, PokemonType.FIRE, (90, 110, 80, 100, 80, 95), ["Flamethrower", "Bite"])
+
+
+def monte_carlo(pokemon1, pokemon2, battles=4000, seed=5):
+    battle_system = BattleSystem(rng=random.Random(seed))
+    wins = turns = 0
+    for _ in range(battles):
+        pokemon1.restore_full_health()
+        pokemon2.restore_full_health()
+        log = battle_system.battle_pokemon(pokemon1, pokemon2, turn_sink="none")
+        wins += log.battle_result == BattleResult.WIN
+        turns += log.total_turns
+    return wins / battles, turns / battles
+
+
+class TestExactDuelSolver:
+    """Testes para as probabilidades exatas"""
+
+    def test_probabilities_sum_to_one(self, blastoise, arcanine):
+        """Testa que vitória + derrota cobrem todos os desfechos"""
+        solution = ExactDuelSolver().solve(blastoise, arcanine)
+
+        assert solution.win_probability + solution.loss_probability == pytest.approx(1.0)
+        assert solution.draw_probability == 0.0
+        assert solution.expected_turns > 0
+
+    def test_agrees_with_scalar_engine(self, blastoise, arcanine):
+        """Testa contra batalhas amostradas do motor escalar"""
+        solution = ExactDuelSolver().solve(arcanine, blastoise)
+        win_rate, mean_turns = monte_carlo(arcanine, blastoise)
+
+        assert solution.win_probability == pytest.approx(win_rate, abs=0.03)
+        assert solution.expected_turns == pytest.approx(mean_turns, rel=0.05)
+
+    def test_symmetry(self, blastoise, arcanine):
+        """Testa que trocar os lados inverte vitória e derrota"""
+        forward = ExactDuelSolver().solve(blastoise, arcanine)
+        backward = ExactDuelSolver().solve(arcanine, blastoise)
+
+        assert forward.win_probability == pytest.approx(backward.loss_probability)
+        assert forward.expected_turns == pytest.approx(backward.expected_turns)
+        assert forward.expected_damage_dealt == pytest.approx(backward.expected_damage_taken)
+
+    def test_fainted_pokemon(self, blastoise, arcanine):
+        """Testa confronto com um Pokémon já desmaiado"""
+        arcanine.current_hp = 0
+        solution = ExactDuelSolver().solve(blastoise, arcanine)
+
+        assert solution.win_probability == 1.0
+        assert solution.expected_turns == 0.0
+
+    def test_turn_limit_counts_as_win(self, blastoise, arcanine):
+        """Testa que o limite de turnos é vitória de pokemon1, como no motor"""
+        solution = ExactDuelSolver(max_turns=1).solve(blastoise, arcanine)
+
+        assert solution.timeout_probability > 0
+        assert solution.win_probability >= solution.timeout_probability
+
+    def test_exact_atlas(self, blastoise, arcanine, tmp_path):
+        """Testa o atlas preenchido pelo solucionador exato"""
+        roster = [blastoise, arcanine]
+        atlas = MatchupAtlas(cache_dir=tmp_path, method="exact").build(roster, roster)
+
+        expected = ExactDuelSolver().solve(blastoise, arcanine)
+        assert atlas.win_probability(blastoise, arcanine) == pytest.approx(expected.win_probability)
+
+        with pytest.raises(ValueError):
+            MatchupAtlas(cache_dir=tmp_path, method="quantum")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
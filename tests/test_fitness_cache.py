@@ -0,0 +1,119 @@
+"""
+Testes para o cache de fitness dos otimizadores
+"""
+
+import pytest
+import sys
+from pathlib import Path
+
+# Adiciona o diretório raiz ao path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from pokemon_elite_four.core.pokemon import Pokemon, PokemonTeam, PokemonStats, PokemonType
+from pokemon_elite_four.core.elite_four import EliteFour
+from pokemon_elite_four.analysis.fitness_cache import TeamFitnessCache, FitnessEntry
+from pokemon_elite_four.analysis.team_optimizer import TeamOptimizer
+from pokemon_elite_four.analysis.advanced_team_optimizer import AdvancedTeamOptimizer
+
+
+def create_pokemon(pokemon_id, level=50):
+    """Cria Pokémon simples com id dado"""
+    return Pokemon(
+        f"Pokemon{pokemon_id}", pokemon_id, PokemonType.NORMAL, None,
+        PokemonStats(80, 80, 80, 80, 80, 80), level
+    )
+
+
+class TestTeamFitnessCache:
+    """Testes para o cache LRU de fitness"""
+
+    def test_signature_ignores_order(self):
+        """Testa assinatura canônica independente da ordem"""
+        cache = TeamFitnessCache()
+        team1 = PokemonTeam([create_pokemon(1), create_pokemon(2)])
+        team2 = PokemonTeam([create_pokemon(2), create_pokemon(1)])
+
+        assert cache.team_signature(team1, ("scalar",)) == cache.team_signature(team2, ("scalar",))
+        assert cache.team_signature(team1, ("scalar",)) != cache.team_signature(team1, ("smart",))
+
+    def test_signature_includes_levels(self):
+        """Testa que níveis diferentes geram assinaturas diferentes"""
+        cache = TeamFitnessCache()
+        team1 = PokemonTeam([create_pokemon(1, level=50)])
+        team2 = PokemonTeam([create_pokemon(1, level=60)])
+
+        assert cache.team_signature(team1) != cache.team_signature(team2)
+
+    def test_hits_misses_and_eviction(self):
+        """Testa contadores e descarte do menos usado"""
+        cache = TeamFitnessCache(max_size=2)
+        cache.put("a", FitnessEntry(1, 2, 0.1))
+        cache.put("b", FitnessEntry(1, 2, 0.1))
+
+        assert cache.get("a") is not None  # "b" passa a ser o menos usado
+        cache.put("c", FitnessEntry(0, 2, 0.1))
+
+        assert "b" not in cache
+        assert "a" in cache and "c" in cache
+        assert cache.get("b") is None
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+        assert cache.stats()["evictions"] == 1
+
+    def test_refine_accumulates_samples(self):
+        """Testa refinamento com novas amostras"""
+        cache = TeamFitnessCache()
+        cache.put("team", FitnessEntry(wins=3, battles=10, static_score=0.2))
+
+        entry = cache.refine("team", wins=7, battles=10)
+
+        assert entry.battles == 20
+        assert entry.win_rate == 0.5
+        assert cache.refine("missing", 1, 1) is None
+
+
+class TestOptimizerCaching:
+    """Testes de integração do cache com os otimizadores"""
+
+    @pytest.fixture
+    def database(self):
+        return [create_pokemon(i) for i in range(1, 9)]
+
+    def test_team_optimizer_reuses_fitness(self, database):
+        """Testa que reavaliar a mesma equipe não simula de novo"""
+        optimizer = TeamOptimizer(database, EliteFour())
+        team = PokemonTeam(database[:6])
+
+        first = optimizer.calculate_team_fitness(team)
+        second = optimizer.calculate_team_fitness(PokemonTeam(list(reversed(database[:6]))))
+
+        assert first == second
+        assert optimizer.fitness_cache.hits == 1
+        assert optimizer.fitness_cache.misses == 1
+
+    def test_refine_limit_adds_samples(self, database):
+        """Testa refinamento até o limite de amostras"""
+        optimizer = TeamOptimizer(database, EliteFour(), fitness_refine_limit=50)
+        team = PokemonTeam(database[:6])
+
+        optimizer.calculate_team_fitness(team)
+        optimizer.calculate_team_fitness(team)
+        optimizer.calculate_team_fitness(team)
+
+        signature = optimizer.fitness_cache.team_signature(team, optimizer._fitness_config())
+        assert optimizer.fitness_cache.get(signature).battles == 50
+
+    def test_shared_cache_between_optimizers(self, database):
+        """Testa cache compartilhado sem colisão entre motores"""
+        cache = TeamFitnessCache()
+        team = PokemonTeam(database[:6])
+
+        TeamOptimizer(database, EliteFour(), fitness_cache=cache).calculate_team_fitness(team)
+        AdvancedTeamOptimizer(database, EliteFour(), fitness_cache=cache).calculate_advanced_fitness(team)
+
+        assert len(cache) == 2
+        assert cache.hits == 0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
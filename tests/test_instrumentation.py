@@ -0,0 +1,115 @@
+"""
+Testes para os contadores de instrumentação e o perfil de execução
+"""
+
+import pstats
+import pytest
+import random
+import sys
+from pathlib import Path
+
+# Adiciona o diretório raiz ao path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from pokemon_elite_four.core.battle_system import BattleSystem, TypeEffectiveness, TurnCounterSink
+from pokemon_elite_four.core.smart_battle_system import SmartBattleSystem, MovePolicyCache
+from pokemon_elite_four.core.elite_four import EliteFour
+from pokemon_elite_four.core.damage_table import DamageTable
+from pokemon_elite_four.utils.instrumentation import Instrumentation, Profiler
+
+
+@pytest.fixture
+def instrumentation():
+    instance = Instrumentation()
+    yield instance
+    instance.disable()
+
+
+@pytest.fixture
+def teams():
+    elite_four = EliteFour()
+    return (
+        elite_four.get_member_by_name("Lance").pokemon_team,
+        elite_four.get_member_by_name("Bruno").pokemon_team,
+    )
+
+
+class TestInstrumentation:
+    """Testes para os contadores instalados sob demanda"""
+
+    def test_disabled_leaves_methods_untouched(self, instrumentation):
+        """Testa que habilitar e desabilitar restaura exatamente os métodos originais"""
+        battle_teams = BattleSystem.__dict__["battle_teams"]
+        lookup = TypeEffectiveness.__dict__["get_effectiveness_against"]
+
+        instrumentation.enable()
+        assert BattleSystem.__dict__["battle_teams"] is not battle_teams
+        assert isinstance(TypeEffectiveness.__dict__["get_effectiveness_against"], classmethod)
+
+        instrumentation.disable()
+        assert BattleSystem.__dict__["battle_teams"] is battle_teams
+        assert TypeEffectiveness.__dict__["get_effectiveness_against"] is lookup
+        assert not instrumentation.enabled
+
+    def test_counts_match_turn_sink(self, instrumentation, teams):
+        """Testa batalhas, cálculos de dano e consultas contra o destino de contadores"""
+        sink = TurnCounterSink()
+        damage_table = DamageTable()
+        instrumentation.enable()
+
+        log = BattleSystem(rng=random.Random(7), damage_table=damage_table).battle_teams(*teams, turn_sink=sink)
+
+        counters = instrumentation.counters
+        assert counters["battles"] == 1
+        assert counters["damage_calculations"] == sink.hits
+        # Efetividade consultada uma vez por linha da tabela, não por golpe
+        rows = sum(len(entry.rows) for entry in damage_table._entries.values())
+        assert counters["type_lookups"] == rows
+        assert instrumentation.caches["damage_table"][1] == len(damage_table)
+        assert log.battle_result is not None
+
+    def test_counters_do_not_change_results(self, instrumentation, teams):
+        """Testa resultados idênticos com e sem contadores"""
+        def run():
+            system = SmartBattleSystem(rng=random.Random(3), policy_cache=MovePolicyCache())
+            return [system.battle_teams_smart(*teams, turn_sink="none").total_turns for _ in range(5)]
+
+        expected = run()
+        instrumentation.enable()
+        assert run() == expected
+        assert instrumentation.counters["battles"] == 5
+        assert instrumentation.caches["move_policy"][0] > 0
+
+    def test_phases_and_summary(self, instrumentation):
+        """Testa tempos de fase e a tabela final"""
+        with instrumentation.phase("dados"):
+            pass
+        with instrumentation.phase("dados"):
+            pass
+        instrumentation.record_cache("externo", hits=3, misses=1)
+
+        summary = instrumentation.summary()
+        assert list(instrumentation.phases) == ["dados"]
+        assert "externo" in summary and "75.0%" in summary
+
+        instrumentation.reset()
+        assert not instrumentation.phases and not instrumentation.caches
+
+
+class TestProfiler:
+    """Testes para o perfil com cProfile e tracemalloc"""
+
+    def test_writes_stats_file(self, tmp_path, teams):
+        """Testa o arquivo de estatísticas e o resumo"""
+        output = tmp_path / "perfil" / "run.stats"
+        with Profiler(str(output), top=5) as profiler:
+            BattleSystem(rng=random.Random(1)).battle_teams(*teams, turn_sink="none")
+
+        assert output.exists()
+        assert pstats.Stats(str(output)).total_calls > 0
+        assert profiler.peak_memory > 0
+        assert "battle_teams" in profiler.summary()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
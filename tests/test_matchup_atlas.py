@@ -0,0 +1,113 @@
+"""
+Testes para o atlas de confrontos 1x1
+"""
+
+import pytest
+import random
+import sys
+from pathlib import Path
+
+# Adiciona o diretório raiz ao path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from pokemon_elite_four.core.pokemon import Pokemon, PokemonTeam, PokemonStats, PokemonType
+from pokemon_elite_four.core.battle_system import BattleSystem, BattleResult
+from pokemon_elite_four.core.moves import MoveSet, get_move_by_name
+from pokemon_elite_four.analysis import matchup_atlas
+from pokemon_elite_four.analysis.matchup_atlas import MatchupAtlas
+from pokemon_elite_four.analysis.data_processor import DataProcessor
+
+
+def create_pokemon(name, pokemon_id, type1, stats, moves, level=50):
+    pokemon = Pokemon(name, pokemon_id, type1, None, PokemonStats(*stats), level)
+    pokemon.move_set = MoveSet([get_move_by_name(m) for m in moves])
+    return pokemon
+
+
+@pytest.fixture
+def roster():
+    return [
+        create_pokemon("Blastoise", 9, PokemonType.WATER, (79, 83, 100, 85, 105, 78), ["Surf", "Bite"]),
+        create_pokemon("Arcanine", 59, PokemonType.FIRE, (90, 110, 80, 100, 80, 95), ["Flamethrower", "Bite"]),
+        create_pokemon("Jolteon", 135, PokemonType.ELECTRIC, (65, 65, 60, 110, 95, 130), ["Thunderbolt"]),
+    ]
+
+
+class TestMatchupAtlas:
+    """Testes para construção, cache e consultas do atlas"""
+
+    def test_build_and_lookup(self, roster, tmp_path):
+        """Testa dimensões e faixas das métricas"""
+        atlas = MatchupAtlas(cache_dir=tmp_path, samples=200).build(roster, roster)
+
+        assert atlas.build_stats["computed_pairs"] == 9
+        metrics = atlas.lookup(roster[0], roster[1])
+        assert 0.0 <= metrics["win_probability"] <= 1.0
+        assert metrics["expected_damage"] > 0
+        # Água contra Fogo deve ser vantajoso
+        assert atlas.win_probability(roster[0], roster[1]) > atlas.win_probability(roster[1], roster[0])
+
+    def test_reuses_cache_from_disk(self, roster, tmp_path):
+        """Testa que uma segunda construção não simula nada"""
+        first = MatchupAtlas(cache_dir=tmp_path, samples=200).build(roster, roster)
+        second = MatchupAtlas(cache_dir=tmp_path, samples=200).build(roster, roster)
+
+        assert second.build_stats["computed_pairs"] == 0
+        assert second.lookup(roster[2], roster[0]) == first.lookup(roster[2], roster[0])
+
+    def test_incremental_rebuild(self, roster, tmp_path):
+        """Testa que só as células de um Pokémon alterado são recalculadas"""
+        MatchupAtlas(cache_dir=tmp_path, samples=200).build(roster, roster)
+
+        roster[2].level = 55  # nova linha e nova coluna
+        atlas = MatchupAtlas(cache_dir=tmp_path, samples=200).build(roster, roster)
+
+        assert atlas.build_stats["computed_pairs"] == 5
+        assert atlas.build_stats["reused_pairs"] == 4
+
+    def test_engine_version_invalidates(self, roster, tmp_path, monkeypatch):
+        """Testa reconstrução completa quando a versão do motor muda"""
+        MatchupAtlas(cache_dir=tmp_path, samples=200).build(roster, roster)
+
+        monkeypatch.setattr(matchup_atlas, "ENGINE_VERSION", matchup_atlas.ENGINE_VERSION + 1)
+        atlas = MatchupAtlas(cache_dir=tmp_path, samples=200).build(roster, roster)
+
+        assert atlas.build_stats["computed_pairs"] == 9
+
+    def test_parallel_build_matches_serial(self, roster, tmp_path):
+        """Testa que o build paralelo gera os mesmos valores"""
+        serial = MatchupAtlas(cache_dir=tmp_path / "serial", samples=200).build(roster, roster)
+        pooled = MatchupAtlas(cache_dir=tmp_path / "pooled", samples=200, n_workers=2).build(roster, roster)
+
+        for attacker in roster:
+            for defender in roster:
+                assert serial.lookup(attacker, defender) == pooled.lookup(attacker, defender)
+
+    def test_agrees_with_scalar_engine(self, roster, tmp_path):
+        """Testa a probabilidade tabelada contra batalhas 1x1 do motor escalar"""
+        atlas = MatchupAtlas(cache_dir=tmp_path, samples=4000).build(roster, roster)
+
+        battle_system = BattleSystem(rng=random.Random(3))
+        wins = 0
+        for _ in range(2000):
+            roster[1].restore_full_health()
+            roster[2].restore_full_health()
+            log = battle_system.battle_pokemon(roster[1], roster[2], turn_sink="none")
+            wins += log.battle_result == BattleResult.WIN
+
+        assert atlas.win_probability(roster[1], roster[2]) == pytest.approx(wins / 2000, abs=0.05)
+
+    def test_find_best_counters_with_atlas(self, roster, tmp_path):
+        """Testa DataProcessor.find_best_counters lendo do atlas"""
+        atlas = MatchupAtlas(cache_dir=tmp_path, samples=200).build(roster, roster)
+
+        counters = DataProcessor().find_best_counters(roster[1], roster, top_n=2, atlas=atlas)
+
+        expected = sorted(
+            (atlas.win_probability(p, roster[1]) for p in (roster[0], roster[2])), reverse=True
+        )
+        assert [score for _, score in counters] == expected
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,112 @@
+"""
+Testes para simulações fragmentadas e fluxos aleatórios reprodutíveis
+"""
+
+import pytest
+import random
+import sys
+from pathlib import Path
+
+# Adiciona o diretório raiz ao path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from pokemon_elite_four.core.pokemon import Pokemon, PokemonTeam, PokemonStats, PokemonType
+from pokemon_elite_four.core.battle_system import BattleSystem
+from pokemon_elite_four.core.moves import MoveSet, get_move_by_name
+from pokemon_elite_four.core.parallel import ParallelSimulator, SimulationTotals, merge_totals
+from pokemon_elite_four.core.rng import derive_seed, derive_seeds
+
+
+def create_team(specs, level=50):
+    """Cria equipe a partir de (nome, id, tipo1, tipo2, stats, movimentos)"""
+    members = []
+    for name, pokemon_id, type1, type2, stats, moves in specs:
+        pokemon = Pokemon(name, pokemon_id, type1, type2, PokemonStats(*stats), level)
+        pokemon.move_set = MoveSet([get_move_by_name(m) for m in moves])
+        members.append(pokemon)
+    return PokemonTeam(members)
+
+
+@pytest.fixture
+def teams():
+    """Duas equipes pequenas e equilibradas"""
+    team1 = create_team([
+        ("Blastoise", 9, PokemonType.WATER, None, (79, 83, 100, 85, 105, 78), ["Surf", "Bite"]),
+        ("Jolteon", 135, PokemonType.ELECTRIC, None, (65, 65, 60, 110, 95, 130), ["Thunderbolt", "Quick Attack"]),
+    ])
+    team2 = create_team([
+        ("Arcanine", 59, PokemonType.FIRE, None, (90, 110, 80, 100, 80, 95), ["Flamethrower", "Bite"]),
+        ("Golem", 76, PokemonType.ROCK, PokemonType.GROUND, (80, 110, 130, 55, 65, 45), ["Earthquake", "Rock Slide"]),
+    ])
+    return team1, team2
+
+
+class TestSeedDerivation:
+    """Testes para derivação de sementes"""
+
+    def test_derive_seed_is_deterministic(self):
+        """Testa que a mesma entrada gera a mesma semente"""
+        assert derive_seed(42, 3) == derive_seed(42, 3)
+        assert derive_seeds(42, 4)[3] == derive_seed(42, 3)
+
+    def test_streams_are_distinct(self):
+        """Testa que fluxos e sementes mestres diferentes não colidem"""
+        seeds = derive_seeds(42, 100)
+        assert len(set(seeds)) == 100
+        assert derive_seed(43, 0) != derive_seed(42, 0)
+
+
+class TestParallelSimulator:
+    """Testes para o simulador fragmentado"""
+
+    def test_shard_plan_independent_of_workers(self, teams):
+        """Testa que o plano de fragmentos não depende do número de workers"""
+        team1, team2 = teams
+        serial = ParallelSimulator(1).plan_shards(team1, team2, 600, seed=5)
+        pooled = ParallelSimulator(4).plan_shards(team1, team2, 600, seed=5)
+
+        assert [s.num_battles for s in serial] == [250, 250, 100]
+        assert [s.seed for s in serial] == [s.seed for s in pooled]
+
+    def test_same_seed_same_result_any_workers(self, teams):
+        """Testa resultados idênticos para 1 e 2 workers com a mesma semente"""
+        team1, team2 = teams
+        serial = ParallelSimulator(1).simulate(team1, team2, 520, seed=7)
+        pooled = ParallelSimulator(2).simulate(team1, team2, 520, seed=7)
+
+        assert serial == pooled
+        assert serial.battles == 520
+        assert serial.wins + serial.losses + serial.draws == 520
+
+    def test_vectorized_shards(self, teams):
+        """Testa fragmentos com o motor vetorizado"""
+        team1, team2 = teams
+        first = ParallelSimulator(1).simulate(team1, team2, 300, seed=9, engine="vectorized")
+        second = ParallelSimulator(1).simulate(team1, team2, 300, seed=9, engine="vectorized")
+
+        assert first == second
+        assert first.total_damage_dealt > 0
+
+    def test_merge_totals(self):
+        """Testa combinação de contagens"""
+        merged = merge_totals([
+            SimulationTotals(battles=2, wins=1, losses=1, total_turns=5),
+            SimulationTotals(battles=2, wins=2, total_turns=3)
+        ])
+
+        assert merged == SimulationTotals(battles=4, wins=3, losses=1, total_turns=8)
+        assert merged.as_rates()["win_rate"] == 0.75
+
+    def test_simulate_battle_with_seed(self, teams):
+        """Testa simulate_battle reprodutível com semente explícita"""
+        team1, team2 = teams
+        battle_system = BattleSystem(rng=random.Random(1))
+
+        first = battle_system.simulate_battle(team1, team2, 100, seed=11)
+        second = battle_system.simulate_battle(team1, team2, 100, seed=11, n_workers=2)
+
+        assert first == second
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -9,7 +9,8 @@ from pathlib import Path
 # Adiciona o diretório raiz ao path
 sys.path.append(str(Path(__file__).parent.parent))
 
-from pokemon_elite_four.core.pokemon import Pokemon, PokemonTeam, PokemonStats
+from pokemon_elite_four.core.pokemon import Pokemon, PokemonTeam, PokemonStats, PokemonType
+from pokemon_elite_four.core.moves import get_moveset_registry, create_realistic_moveset
 
 
 class TestPokemonStats:
@@ -127,6 +128,38 @@ class TestPokemon:
         assert pokemon.current_hp == pokemon.max_hp
         assert not pokemon.is_fainted()
     
+    def test_stat_cache_invalidated_on_level_change(self):
+        """Testa que estatísticas em cache acompanham mudanças de nível"""
+        stats = PokemonStats(100, 80, 70, 60, 50, 90)
+        pokemon = Pokemon("Test", 1, "Normal", None, stats, 50)
+        
+        speed_at_50 = pokemon.speed
+        pokemon.level = 60
+        
+        assert pokemon.speed == stats.get_stat_at_level("speed", 60)
+        assert pokemon.speed > speed_at_50
+        assert pokemon.max_hp == stats.get_stat_at_level("hp", 60)
+    
+    def test_stat_cache_invalidated_on_stats_change(self):
+        """Testa invalidação ao trocar ou alterar as estatísticas base"""
+        pokemon = Pokemon("Test", 1, "Normal", None, PokemonStats(50, 50, 50, 50, 50, 50), 50)
+        attack_before = pokemon.attack
+        
+        pokemon.stats = PokemonStats(50, 120, 50, 50, 50, 50)
+        assert pokemon.attack > attack_before
+        
+        pokemon.stats.attack = 50
+        pokemon.invalidate_stat_cache()
+        assert pokemon.attack == attack_before
+    
+    def test_pokemon_uses_slots(self):
+        """Testa que Pokemon e PokemonStats não alocam __dict__"""
+        stats = PokemonStats(50, 50, 50, 50, 50, 50)
+        pokemon = Pokemon("Test", 1, "Normal", None, stats, 50)
+        
+        assert not hasattr(stats, "__dict__")
+        assert not hasattr(pokemon, "__dict__")
+    
     def test_pokemon_types(self):
         """Testa sistema de tipos"""
         stats = PokemonStats(78, 84, 78, 109, 85, 100)
@@ -221,5 +254,42 @@ class TestPokemonTeam:
         assert team_stats["total_hp"] == pokemon1.max_hp + pokemon2.max_hp
 
 
+
+class TestMovesetRegistry:
+    """Testes para o registro de movesets imutáveis"""
+    
+    def test_pokemon_share_move_tuple(self):
+        """Testa que Pokémon da mesma espécie compartilham a tupla de movimentos"""
+        first = Pokemon("Charizard", 6, PokemonType.FIRE)
+        second = Pokemon("Charizard", 6, PokemonType.FIRE)
+        
+        assert isinstance(first.move_set.moves, tuple)
+        assert first.move_set.moves is second.move_set.moves
+        assert first.move_set is not second.move_set
+    
+    def test_pp_is_per_instance(self):
+        """Testa que o PP gasto por um Pokémon não afeta outro"""
+        first = Pokemon("Charizard", 6, PokemonType.FIRE)
+        second = Pokemon("Charizard", 6, PokemonType.FIRE)
+        
+        assert first.move_set.use_move(0)
+        assert first.move_set.current_pp[0] == first.move_set.moves[0].pp - 1
+        assert second.move_set.current_pp[0] == second.move_set.moves[0].pp
+        
+        first.move_set.restore_pp()
+        assert first.move_set.current_pp[0] == first.move_set.moves[0].pp
+    
+    def test_registry_built_once(self):
+        """Testa que o registro não é reconstruído a cada moveset"""
+        registry = get_moveset_registry()
+        movesets = registry.movesets
+        
+        create_realistic_moveset("Charizard")
+        create_realistic_moveset("Unknown")
+        
+        assert get_moveset_registry() is registry
+        assert registry.movesets is movesets
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -0,0 +1,169 @@
+"""
+Testes para a base de dados colunar de Pokémon
+"""
+
+import numpy as np
+import pytest
+import random
+import subprocess
+import sys
+from pathlib import Path
+
+# Adiciona o diretório raiz ao path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from pokemon_elite_four.core.pokemon import PokemonType, STAT_NAMES
+from pokemon_elite_four.core.pokemon_database import PokemonDatabase, DATABASE_SCHEMA_VERSION
+from pokemon_elite_four.core import pokemon_database
+from pokemon_elite_four.analysis.data_processor import DataProcessor
+
+
+DATA_DIR = Path(__file__).parent.parent / "data" / "processed"
+
+
+@pytest.fixture
+def processor():
+    processor = DataProcessor(DATA_DIR)
+    processor.load_pokemon_data("pokemon_processed.csv")
+    return processor
+
+
+@pytest.fixture
+def database(processor):
+    return processor.create_pokemon_database(level=50)
+
+
+class TestPokemonDatabase:
+    """Testes para colunas, índices e visões Pokemon"""
+
+    def test_views_match_row_construction(self, processor, database):
+        """Testa que as visões equivalem aos Pokémon criados linha a linha"""
+        expected = [processor.create_pokemon_from_data(row, 50) for _, row in processor.pokemon_data.iterrows()]
+
+        assert len(database) == len(expected)
+        for pokemon, reference in zip(database, expected):
+            assert (pokemon.name, pokemon.pokemon_id, pokemon.type1, pokemon.type2) == \
+                (reference.name, reference.pokemon_id, reference.type1, reference.type2)
+            assert pokemon.stats == reference.stats
+            assert [m.name for m in pokemon.move_set.moves] == [m.name for m in reference.move_set.moves]
+
+    def test_views_are_stable(self, database):
+        """Testa que a mesma linha devolve sempre o mesmo objeto"""
+        assert database[3] is database[3]
+        assert database[-1] is database[len(database) - 1]
+        assert database[3] in database
+        assert random.Random(1).sample(database, 6)[0] in database
+
+    def test_indexes(self, processor, database):
+        """Testa buscas por id, nome, tipo e estatística"""
+        assert database.by_id(25).name == "Pikachu"
+        assert processor.get_pokemon_by_name("pikachu", database) is database.by_id(25)
+        assert database.by_name("MissingNo") is None
+
+        dragons = processor.get_pokemon_by_type(PokemonType.DRAGON, database)
+        assert dragons == [p for p in database if p.has_type(PokemonType.DRAGON)]
+
+        top_speed = processor.get_top_pokemon_by_stat("speed", database, top_n=5)
+        assert top_speed == processor.get_top_pokemon_by_stat("speed", list(database), top_n=5)
+
+    @pytest.mark.parametrize("level", [5, 50, 60, 100])
+    def test_stats_at_level(self, database, level):
+        """Testa o escalonamento vetorizado contra a fórmula escalar"""
+        scaled = database.stats_at_level(level)
+
+        for row, pokemon in enumerate(database):
+            assert tuple(scaled[row]) == tuple(pokemon.stats.get_stat_at_level(s, level) for s in STAT_NAMES)
+
+    def test_stats_per_row_level(self, database):
+        """Testa um nível diferente por linha"""
+        rows = np.array([0, 1, 2])
+        scaled = database.stats_at_level(np.array([10, 60, 100]), rows=rows)
+
+        assert scaled[1, 0] == database[1].stats.get_stat_at_level("hp", 60)
+        assert scaled[2, 5] == database[2].stats.get_stat_at_level("speed", 100)
+
+    def test_from_pokemon_keeps_objects(self, database):
+        """Testa construção a partir de objetos Pokemon existentes"""
+        members = list(database)[:10]
+        subset = PokemonDatabase.from_pokemon(members)
+
+        assert subset[4] is members[4]
+        assert subset.by_name(members[2].name) is members[2]
+
+        with pytest.raises(ValueError):
+            subset.top_by_stat("luck")
+
+
+
+class TestDatabaseCache:
+    """Testes para o cache binário da base de dados"""
+
+    def test_cached_load_matches_csv(self, tmp_path):
+        """Testa que a base lida do cache é igual à do CSV"""
+        parsed = DataProcessor(DATA_DIR).load_pokemon_database(cache_dir=tmp_path, level=60)
+        cached = DataProcessor(DATA_DIR).load_pokemon_database(cache_dir=tmp_path, level=60)
+
+        assert (tmp_path / "pokemon_processed.npz").exists()
+        assert cached.names == parsed.names
+        assert np.array_equal(cached.base_stats, parsed.base_stats)
+        assert np.array_equal(cached.type2, parsed.type2)
+        assert cached.by_name("Dragonite").level == 60
+
+    def test_cache_hit_skips_parsing(self, tmp_path):
+        """Testa que o CSV não é lido de novo quando o hash confere"""
+        DataProcessor(DATA_DIR).load_pokemon_database(cache_dir=tmp_path)
+
+        processor = DataProcessor(DATA_DIR)
+        processor.load_pokemon_database(cache_dir=tmp_path)
+
+        assert processor.pokemon_data is None
+
+    def test_changed_csv_is_reparsed(self, tmp_path):
+        """Testa invalidação pelo hash do arquivo de origem"""
+        source = tmp_path / "pokemon.csv"
+        source.write_text((DATA_DIR / "pokemon_processed.csv").read_text(encoding="utf-8"), encoding="utf-8")
+        processor = DataProcessor(tmp_path)
+        processor.load_pokemon_database("pokemon.csv", cache_dir=tmp_path / "cache")
+
+        lines = source.read_text(encoding="utf-8").splitlines()
+        source.write_text("\n".join(lines[:11]) + "\n", encoding="utf-8")
+        database = DataProcessor(tmp_path).load_pokemon_database("pokemon.csv", cache_dir=tmp_path / "cache")
+
+        assert len(database) == 10
+
+    def test_schema_version_invalidates(self, tmp_path, monkeypatch):
+        """Testa que outra versão do esquema descarta o cache"""
+        DataProcessor(DATA_DIR).load_pokemon_database(cache_dir=tmp_path)
+
+        monkeypatch.setattr(pokemon_database, "DATABASE_SCHEMA_VERSION", DATABASE_SCHEMA_VERSION + 1)
+        assert PokemonDatabase.load(tmp_path / "pokemon_processed.npz") is None
+
+    def test_validation(self, processor):
+        """Testa rejeição de ids repetidos e colunas ausentes"""
+        data = processor.pokemon_data
+
+        with pytest.raises(ValueError):
+            PokemonDatabase.from_dataframe(data.iloc[[0, 0]])
+        with pytest.raises(ValueError):
+            PokemonDatabase.from_dataframe(data.drop(columns=["speed"]))
+
+    def test_cache_hit_does_not_import_pandas(self, tmp_path):
+        """Testa que a partida com cache quente não carrega pandas"""
+        DataProcessor(DATA_DIR).load_pokemon_database(cache_dir=tmp_path)
+
+        code = (
+            "import sys; import pokemon_elite_four\n"
+            "from pokemon_elite_four.core.pokemon_database import load_pokemon_database\n"
+            f"load_pokemon_database({str(DATA_DIR / 'pokemon_processed.csv')!r}, cache_dir={str(tmp_path)!r})\n"
+            "print('pandas' in sys.modules)"
+        )
+        completed = subprocess.run(
+            [sys.executable, "-c", code], cwd=Path(__file__).parent.parent,
+            capture_output=True, text=True, check=True
+        )
+
+        assert completed.stdout.strip() == "False"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
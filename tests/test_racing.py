@@ -0,0 +1,132 @@
+"""
+Testes para a avaliação sequencial (racing) com intervalos de confiança
+"""
+
+import pytest
+import random
+import sys
+from pathlib import Path
+
+# Adiciona o diretório raiz ao path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from pokemon_elite_four.core.pokemon import Pokemon, PokemonTeam, PokemonStats, PokemonType
+from pokemon_elite_four.core.battle_system import BattleSystem
+from pokemon_elite_four.core.elite_four import EliteFour
+from pokemon_elite_four.core.racing import RacingConfig, wilson_interval, race_win_rate
+from pokemon_elite_four.core.rng import derive_seed
+from pokemon_elite_four.analysis.team_optimizer import TeamOptimizer
+
+
+TYPES = [PokemonType.WATER, PokemonType.FIRE, PokemonType.GRASS, PokemonType.ELECTRIC,
+         PokemonType.PSYCHIC, PokemonType.DRAGON, PokemonType.ICE, PokemonType.GROUND]
+
+
+@pytest.fixture
+def database():
+    return [
+        Pokemon(f"Pokemon{i}", i, TYPES[i - 1], None, PokemonStats(70 + i, 80, 75, 90, 80, 60 + 5 * i))
+        for i in range(1, 9)
+    ]
+
+
+class TestWilsonInterval:
+    """Testes para o intervalo de Wilson"""
+
+    def test_contains_estimate_and_shrinks(self):
+        """Testa que o intervalo contém a taxa e encolhe com mais batalhas"""
+        low, high = wilson_interval(30, 100)
+        assert low < 0.3 < high
+
+        narrow_low, narrow_high = wilson_interval(300, 1000)
+        assert narrow_high - narrow_low < high - low
+
+    def test_extremes(self):
+        """Testa limites em 0 e 1 vitórias e sem batalhas"""
+        assert wilson_interval(0, 0) == (0.0, 1.0)
+        assert wilson_interval(0, 20)[0] == 0.0
+        assert wilson_interval(20, 20)[1] == 1.0
+
+    def test_invalid_config(self):
+        """Testa validação da precisão-alvo"""
+        with pytest.raises(ValueError):
+            RacingConfig(target_precision=0.0)
+
+
+class TestRacing:
+    """Testes para as corridas de avaliação"""
+
+    def test_stops_at_precision(self):
+        """Testa parada ao atingir a meia-largura alvo"""
+        config = RacingConfig(target_precision=0.1, max_rounds=100)
+        estimate = race_win_rate(lambda _: (10, 10), config)
+
+        assert estimate.stop_reason == "precision"
+        assert estimate.half_width <= 0.1
+        assert estimate.battles < 1000
+
+    def test_drops_hopeless_candidate(self):
+        """Testa descarte quando o limite superior não alcança o corte"""
+        config = RacingConfig(target_precision=0.01, max_rounds=100)
+        estimate = race_win_rate(lambda _: (0, 4), config, can_qualify=lambda high: high >= 0.5)
+
+        assert estimate.stop_reason == "dropped"
+        assert estimate.high < 0.5
+        assert estimate.battles <= 12
+
+    def test_budget_limit(self):
+        """Testa que max_rounds limita o total de rodadas"""
+        config = RacingConfig(target_precision=0.01, max_rounds=3)
+        rounds = []
+        estimate = race_win_rate(lambda index: rounds.append(index) or (2, 4), config, first_round=5)
+
+        assert estimate.stop_reason == "budget"
+        assert rounds == [5, 6, 7]
+
+    def test_sequential_simulate_battle(self, database):
+        """Testa simulate_battle com precisão-alvo e intervalo no resultado"""
+        team1 = PokemonTeam(database[:3])
+        team2 = PokemonTeam(database[3:6])
+        battle_system = BattleSystem(rng=random.Random(1))
+
+        stats = battle_system.simulate_battle(team1, team2, 2000, target_precision=0.1)
+
+        assert stats["num_simulations"] < 2000
+        assert stats["win_rate_ci_low"] <= stats["win_rate"] <= stats["win_rate_ci_high"]
+        assert (stats["win_rate_ci_high"] - stats["win_rate_ci_low"]) / 2 <= 0.1
+
+    @pytest.mark.parametrize("engine", ["scalar", "vectorized"])
+    def test_sequential_sums_batch_totals(self, database, engine):
+        """Testa que o modo sequencial soma as contagens inteiras de cada lote"""
+        team1 = PokemonTeam(database[:3])
+        team2 = PokemonTeam(database[3:6])
+        battle_system = BattleSystem()
+        batch = BattleSystem.SEQUENTIAL_BATCH_SIZES[engine]
+
+        stats = battle_system.simulate_battle(team1, team2, 2 * batch, engine=engine, seed=7, target_precision=0.0)
+        totals = [
+            battle_system._simulate_totals(team1, team2, batch, engine, 1, derive_seed(7, index))
+            for index in range(2)
+        ]
+
+        assert stats["num_simulations"] == 2 * batch
+        assert stats["win_rate"] == sum(t.wins for t in totals) / (2 * batch)
+        assert stats["avg_turns"] == sum(t.total_turns for t in totals) / (2 * batch)
+
+    def test_optimizer_exposes_intervals(self, database):
+        """Testa intervalos e estatísticas de racing no resultado da otimização"""
+        optimizer = TeamOptimizer(
+            database, EliteFour(), population_size=4, max_generations=2, elite_size=2,
+            seed=3, racing=RacingConfig(target_precision=0.15, max_rounds=5)
+        )
+
+        result = optimizer.optimize_team()
+
+        assert set(result.confidence_intervals) >= {"overall"} | set(result.team_performance)
+        for low, high in result.confidence_intervals.values():
+            assert 0.0 <= low <= high <= 1.0
+        assert sum(result.racing_stats.values()) == result.cache_stats["misses"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,97 @@
+"""
+Testes para a pontuação estática em lote do otimizador avançado
+"""
+
+import pytest
+import random
+import sys
+from pathlib import Path
+
+# Adiciona o diretório raiz ao path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from pokemon_elite_four.core.pokemon import Pokemon, PokemonTeam, PokemonStats, PokemonType
+from pokemon_elite_four.core.elite_four import EliteFour
+from pokemon_elite_four.core.moves import create_realistic_moveset
+from pokemon_elite_four.analysis.static_scorer import StaticScorer, is_resistant, is_weak
+from pokemon_elite_four.analysis.advanced_team_optimizer import AdvancedTeamOptimizer
+
+
+SPECIES = [
+    ("Charizard", 6, PokemonType.FIRE, PokemonType.FLYING, (78, 84, 78, 109, 85, 100)),
+    ("Blastoise", 9, PokemonType.WATER, None, (79, 83, 100, 85, 105, 78)),
+    ("Venusaur", 3, PokemonType.GRASS, PokemonType.POISON, (80, 82, 83, 100, 100, 80)),
+    ("Pikachu", 25, PokemonType.ELECTRIC, None, (35, 55, 40, 50, 50, 90)),
+    ("Alakazam", 65, PokemonType.PSYCHIC, None, (55, 50, 45, 135, 95, 120)),
+    ("Gengar", 94, PokemonType.GHOST, PokemonType.POISON, (60, 65, 60, 130, 75, 110)),
+    ("Dragonite", 149, PokemonType.DRAGON, PokemonType.FLYING, (91, 134, 95, 100, 100, 80)),
+    ("Lapras", 131, PokemonType.WATER, PokemonType.ICE, (130, 85, 80, 85, 95, 60)),
+    ("Snorlax", 143, PokemonType.NORMAL, None, (160, 110, 65, 65, 110, 30)),
+    ("Magnemite", 81, PokemonType.ELECTRIC, PokemonType.STEEL, (25, 35, 70, 95, 55, 45)),
+]
+
+
+@pytest.fixture
+def pool():
+    pokemon = []
+    for name, pokemon_id, type1, type2, stats in SPECIES:
+        member = Pokemon(name, pokemon_id, type1, type2, PokemonStats(*stats))
+        member.move_set = create_realistic_moveset(name)
+        pokemon.append(member)
+    return pokemon
+
+
+def reference_score(optimizer, team):
+    """Soma ponderada dos métodos por equipe"""
+    return (
+        optimizer._calculate_type_coverage_score(team) * 0.20 +
+        optimizer._calculate_stat_balance_score(team) * 0.15 +
+        optimizer._calculate_strategy_diversity_score(team) * 0.10 +
+        optimizer._calculate_resistance_score(team) * 0.05
+    )
+
+
+class TestStaticScorer:
+    """Testes para os termos estáticos vetorizados"""
+
+    def test_matches_per_team_methods(self, pool):
+        """Testa valores idênticos aos métodos por equipe em equipes de vários tamanhos"""
+        optimizer = AdvancedTeamOptimizer(pool, EliteFour())
+        rng = random.Random(0)
+        teams = [PokemonTeam(rng.sample(pool, rng.choice([1, 3, 6]))) for _ in range(200)]
+
+        scores = optimizer.static_scorer.score_teams(teams)
+
+        assert scores.tolist() == [reference_score(optimizer, team) for team in teams]
+
+    def test_terms_for_row_matrix(self, pool):
+        """Testa os termos sem pesos para uma matriz de linhas"""
+        scorer = StaticScorer(pool)
+        rows = scorer.team_rows([PokemonTeam(pool[:2]), PokemonTeam([pool[8], pool[8]])])
+
+        terms = scorer.terms(rows)
+
+        assert rows.shape == (2, 2)
+        assert terms["type"][1] == pytest.approx(1 / 18 * 0.6)
+        assert terms["balance"][1] == 1.0  # Membros iguais: nenhuma variação
+        assert set(terms) == {"type", "balance", "strategy", "resistance"}
+
+    def test_empty_and_unregistered_members(self, pool):
+        """Testa equipe vazia e registro sob demanda de novos membros"""
+        scorer = StaticScorer()
+        scores = scorer.score_teams([PokemonTeam([]), PokemonTeam(pool[:3])])
+
+        assert scores[0] == 0.0
+        assert len(scorer) == 3
+
+    def test_resistance_tables(self, pool):
+        """Testa as tabelas simplificadas de resistência e fraqueza"""
+        dragonite, lapras = pool[6], pool[7]
+
+        assert is_weak(dragonite, PokemonType.ICE)
+        assert is_resistant(lapras, PokemonType.ICE)
+        assert not is_resistant(dragonite, PokemonType.GHOST)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,191 @@
+"""
+Testes para a pré-triagem por modelo substituto
+"""
+
+import pytest
+import random
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Adiciona o diretório raiz ao path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from pokemon_elite_four.core.pokemon import Pokemon, PokemonTeam, PokemonStats, PokemonType
+from pokemon_elite_four.core.elite_four import EliteFour
+from pokemon_elite_four.analysis.surrogate import SurrogateConfig, FitnessSurrogate, TeamFeaturizer, RidgeModel
+from pokemon_elite_four.analysis.team_optimizer import TeamOptimizer
+from pokemon_elite_four.analysis.advanced_team_optimizer import AdvancedTeamOptimizer
+
+
+TYPES = [PokemonType.WATER, PokemonType.FIRE, PokemonType.GRASS, PokemonType.ELECTRIC,
+         PokemonType.PSYCHIC, PokemonType.DRAGON, PokemonType.ICE, PokemonType.GROUND,
+         PokemonType.ROCK, PokemonType.FLYING]
+
+
+@pytest.fixture
+def database():
+    return [
+        Pokemon(
+            f"Pokemon{i}", i, TYPES[i - 1], None,
+            PokemonStats(60 + 3 * i, 70 + 4 * i, 75, 70 + 2 * i, 80, 60 + 5 * i)
+        )
+        for i in range(1, 11)
+    ]
+
+
+@pytest.fixture
+def opponents():
+    return [member.pokemon_team for member in EliteFour().get_all_members()]
+
+
+def random_teams(database, count, seed=0):
+    rng = random.Random(seed)
+    return [PokemonTeam(rng.sample(database, 6)) for _ in range(count)]
+
+
+class TestTeamFeaturizer:
+    """Testes para as features das equipes"""
+
+    def test_shape_and_order_invariance(self, database, opponents):
+        """Testa uma linha por equipe, independente da ordem dos membros"""
+        featurizer = TeamFeaturizer(opponents)
+        teams = random_teams(database, 5)
+        features = featurizer.transform(teams)
+
+        assert features.shape[0] == 5
+        assert np.all(np.isfinite(features))
+
+        reversed_team = PokemonTeam(teams[0].pokemon[::-1])
+        np.testing.assert_allclose(featurizer.transform([reversed_team])[0], features[0])
+        assert len(featurizer.species_array()) <= len(database)
+
+
+class TestFitnessSurrogate:
+    """Testes para o treino, a triagem e as medidas de acerto"""
+
+    def test_invalid_config(self):
+        """Testa a validação da configuração"""
+        with pytest.raises(ValueError):
+            SurrogateConfig(simulate_fraction=0.0)
+        with pytest.raises(ValueError):
+            SurrogateConfig(model="svm")
+
+    @pytest.mark.parametrize("model", ["ridge", "random_forest"])
+    def test_learns_and_screens(self, database, opponents, model):
+        """Testa que o modelo aprende um alvo das features e simula só a fração pedida"""
+        config = SurrogateConfig(simulate_fraction=0.25, min_samples=20, model=model)
+        surrogate = FitnessSurrogate(config, opponents, seed=1)
+        teams = random_teams(database, 60)
+
+        # Alvo sintético: soma das velocidades base
+        target = [sum(p.stats.speed for p in team.pokemon) / 1000 for team in teams]
+        surrogate.observe(teams[:40], target[:40])
+        assert not surrogate.ready
+        surrogate.fit()
+        assert surrogate.ready
+
+        selected, predictions = surrogate.screen(teams[40:], battles_per_team=10)
+        assert len(selected) == 5
+        assert np.corrcoef(predictions, target[40:])[0, 1] > 0.8
+
+        surrogate.observe([teams[40 + i] for i in selected], [target[40 + i] for i in selected],
+                          [predictions[i] for i in selected])
+        stats = surrogate.stats()
+        assert stats["teams_skipped"] == 15
+        assert stats["simulations_saved"] == 150
+        assert stats["teams_simulated"] == 45
+        assert stats["mae"] < 0.05
+
+    def test_ridge_matches_least_squares(self):
+        """Testa a regressão ridge sem regularização contra mínimos quadrados"""
+        rng = np.random.default_rng(0)
+        X = rng.normal(size=(50, 4))
+        y = X @ np.array([1.0, -2.0, 0.5, 0.0]) + 3.0
+        model = RidgeModel(alpha=0.0).fit(X, y)
+        np.testing.assert_allclose(model.predict(X), y, atol=1e-9)
+
+
+class TestOptimizerSurrogate:
+    """Testes para a pré-triagem dentro dos otimizadores"""
+
+    def test_team_optimizer_skips_simulations(self, database):
+        """Testa economia de simulações e estatísticas no resultado"""
+        optimizer = TeamOptimizer(
+            database, EliteFour(), population_size=12, max_generations=4, elite_size=2, seed=5,
+            surrogate=SurrogateConfig(simulate_fraction=0.5, min_samples=6, model="ridge")
+        )
+        result = optimizer.optimize_team()
+
+        stats = result.surrogate_stats
+        assert stats["generations_screened"] > 0
+        assert stats["simulations_saved"] == stats["teams_skipped"] * optimizer.battles_per_member * 5
+        assert len(result.best_team.pokemon) == 6
+
+    def test_team_optimizer_simulates_only_screened_teams(self, database):
+        """Testa que seleção e escolha final usam o fitness previsto e todo time simulado entra no treino"""
+        optimizer = TeamOptimizer(
+            database, EliteFour(), population_size=12, max_generations=4, elite_size=2, seed=5,
+            surrogate=SurrogateConfig(simulate_fraction=0.3, min_samples=6, model="ridge")
+        )
+        simulated = []
+        simulate = optimizer._simulate_against_elite_four
+
+        def counting(team, *args, **kwargs):
+            simulated.append(team)
+            return simulate(team, *args, **kwargs)
+        optimizer._simulate_against_elite_four = counting
+
+        result = optimizer.optimize_team()
+
+        stats = result.surrogate_stats
+        assert stats["teams_skipped"] > 0
+        assert stats["teams_simulated"] == len(simulated) == len(optimizer.fitness_cache)
+        assert stats["teams_skipped"] == len(optimizer.surrogate._skipped)
+        signature = optimizer.fitness_cache.team_signature(result.best_team, optimizer._fitness_config())
+        assert signature in optimizer.fitness_cache
+
+    def test_advanced_best_team_is_simulated(self, database):
+        """Testa que a melhor equipe reportada saiu da simulação, não da previsão"""
+        optimizer = AdvancedTeamOptimizer(
+            database, EliteFour(), population_size=12, max_generations=4, elite_size=2, seed=5,
+            surrogate=SurrogateConfig(simulate_fraction=0.5, min_samples=6, model="ridge")
+        )
+        optimizer.simulations_per_strategy = 1
+        result = optimizer.optimize_team_advanced()
+
+        assert result.surrogate_stats["teams_skipped"] > 0
+        signature = optimizer.fitness_cache.team_signature(result.best_team, optimizer._fitness_config())
+        assert signature in optimizer.fitness_cache
+
+
+    def test_advanced_carried_predicted_team_counts_once(self, database):
+        """Testa que uma equipe prevista levada como elite à geração seguinte não conta duas vezes"""
+        optimizer = AdvancedTeamOptimizer(
+            database, EliteFour(), population_size=12, seed=5,
+            surrogate=SurrogateConfig(simulate_fraction=0.25, min_samples=6, model="ridge")
+        )
+        optimizer.simulations_per_strategy = 1
+        battles_per_team = len(optimizer.move_strategies) * len(optimizer.elite_four.get_all_members())
+
+        optimizer.evaluate_population(random_teams(database, 12, seed=1), 1)
+        generation = random_teams(database, 12, seed=2)
+        optimizer.evaluate_population(generation, 2)
+        carried = [team for team in generation if team.fitness_predicted]
+        assert carried
+        skipped = optimizer.surrogate.stats()["teams_skipped"]
+
+        # Só as previstas voltam: cada uma é simulada agora ou pulada de novo, sem somar à economia
+        optimizer.evaluate_population(carried, 3)
+        stats = optimizer.surrogate.stats()
+        still_predicted = {
+            optimizer.fitness_cache.team_signature(team, optimizer._fitness_config())
+            for team in carried if team.fitness_predicted
+        }
+        assert stats["teams_skipped"] == len(still_predicted) <= skipped
+        assert stats["simulations_saved"] == stats["teams_skipped"] * battles_per_team
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
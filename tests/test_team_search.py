@@ -0,0 +1,136 @@
+"""
+Testes para a busca de equipes (beam search e branch-and-bound)
+"""
+
+import pytest
+import itertools
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Adiciona o diretório raiz ao path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from pokemon_elite_four.core.pokemon import Pokemon, PokemonTeam, PokemonStats, PokemonType
+from pokemon_elite_four.core.elite_four import EliteFour
+from pokemon_elite_four.analysis.team_search import TeamSearch, member_matchup_matrix
+
+
+def create_species(count):
+    return [
+        Pokemon(f"Pokemon{i}", i, PokemonType.NORMAL, None, PokemonStats(60, 70, 70, 70, 70, 60 + i))
+        for i in range(1, count + 1)
+    ]
+
+
+@pytest.fixture
+def instance():
+    """16 espécies x 5 membros com scores aleatórios"""
+    rng = np.random.default_rng(7)
+    return create_species(16), rng.uniform(0.0, 1.0, size=(16, 5))
+
+
+def brute_force(search):
+    return max(search.score_rows(rows) for rows in itertools.combinations(range(len(search.species)), 6))
+
+
+class TestTeamSearch:
+    """Testes para o score, os limites e as buscas"""
+
+    def test_score_definition(self, instance):
+        """Testa o score contra a fórmula: peso * (melhor contador e média da equipe)"""
+        species, matrix = instance
+        search = TeamSearch(species, matrix, best_weight=0.4)
+        team = species[:6]
+        values = matrix[:6]
+        expected = np.mean(0.4 * values.max(axis=0) + 0.6 * values.mean(axis=0))
+
+        assert search.score_team(PokemonTeam(team)) == pytest.approx(expected)
+
+    @pytest.mark.parametrize("best_weight", [0.0, 0.3, 0.9, 1.0])
+    def test_branch_and_bound_is_optimal(self, instance, best_weight):
+        """Testa o ótimo provado contra a enumeração completa"""
+        species, matrix = instance
+        search = TeamSearch(species, matrix, best_weight=best_weight)
+        optimum = brute_force(search)
+
+        for beam_width in (0, 4):
+            result = search.branch_and_bound(beam_width=beam_width)
+            assert result.proven_optimal
+            assert result.best_score == pytest.approx(optimum)
+            assert search.score_team(result.best_team) == pytest.approx(result.best_score)
+            assert len({id(p) for p in result.best_team.pokemon}) == 6
+
+    def test_bounds_are_admissible(self, instance):
+        """Testa que todo limite reportado cobre o ótimo, mesmo com orçamento curto"""
+        species, matrix = instance
+        search = TeamSearch(species, matrix)
+        optimum = brute_force(search)
+        assert search.root_bound() >= optimum - 1e-12
+
+        for result in (search.beam_search(beam_width=2), search.branch_and_bound(max_nodes=3, beam_width=0)):
+            assert result.best_score <= optimum + 1e-12
+            assert result.upper_bound >= optimum - 1e-12
+            assert 0.0 <= result.prune_rate <= 1.0
+
+    def test_gap_tolerance_bound(self):
+        """Testa que, com tolerância, o limite cobre o ótimo e o score fica dentro dela"""
+        rng = np.random.default_rng(0)
+        species = create_species(12)
+        for _ in range(100):
+            search = TeamSearch(species, rng.uniform(0.0, 1.0, size=(12, 4)), team_size=3)
+            optimum = max(search.score_rows(rows) for rows in itertools.combinations(range(12), 3))
+
+            result = search.branch_and_bound(gap_tolerance=0.05, beam_width=0)
+            assert result.upper_bound >= optimum - 1e-12
+            assert result.best_score >= optimum - 0.05 - 1e-12
+            if result.proven_optimal:
+                assert result.best_score == pytest.approx(optimum)
+
+    def test_member_scores(self, instance):
+        """Testa o detalhamento por membro: a média dos membros é o score"""
+        species, matrix = instance
+        names = ["A", "B", "C", "D", "E"]
+        result = TeamSearch(species, matrix, names).search("bnb")
+        assert list(result.member_scores) == names
+        assert np.mean(list(result.member_scores.values())) == pytest.approx(result.best_score)
+
+    def test_invalid_arguments(self, instance):
+        """Testa a validação das entradas"""
+        species, matrix = instance
+        with pytest.raises(ValueError):
+            TeamSearch(species[:-1], matrix)
+        with pytest.raises(ValueError):
+            TeamSearch(species, matrix, team_size=17)
+        with pytest.raises(ValueError):
+            TeamSearch(species, matrix, best_weight=1.5)
+        with pytest.raises(ValueError):
+            TeamSearch(species, matrix, member_weights=[1.0, -1.0, 0.0, 0.0, 0.0])
+        with pytest.raises(ValueError):
+            TeamSearch(species, matrix).search("ga")
+
+
+class TestMemberMatchupMatrix:
+    """Testes para a matriz espécie x membro"""
+
+    def test_mean_over_member_team(self):
+        """Testa a média das probabilidades 1x1 contra o time de cada membro"""
+        class FakeAtlas:
+            def win_probability(self, pokemon, opponent):
+                return (pokemon.pokemon_id * opponent.stats.speed) % 7 / 7
+
+        species = create_species(4)
+        elite_four = EliteFour()
+        matrix = member_matchup_matrix(FakeAtlas(), species, elite_four)
+
+        members = elite_four.get_all_members()
+        assert matrix.shape == (4, len(members))
+        for j, member in enumerate(members):
+            opponents = member.pokemon_team.pokemon
+            expected = np.mean([FakeAtlas().win_probability(species[2], o) for o in opponents])
+            assert matrix[2, j] == pytest.approx(expected)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,193 @@
+"""
+Testes para o motor vetorizado de Monte Carlo
+"""
+
+import pytest
+import random
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Adiciona o diretório raiz ao path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from pokemon_elite_four.core.pokemon import Pokemon, PokemonTeam, PokemonStats, PokemonType
+from pokemon_elite_four.core.battle_system import BattleSystem, TypeEffectiveness
+from pokemon_elite_four.core.moves import MoveSet, get_move_by_name
+from pokemon_elite_four.core.vectorized_battle import (
+    VectorizedBattleEngine, compile_team, compile_pokemon, build_matchup_tables, check_statistical_equivalence,
+    resolve_attacks, _damaging_moves
+)
+
+
+def create_team(specs, level=50):
+    """Cria equipe a partir de (nome, id, tipo1, tipo2, stats, movimentos)"""
+    members = []
+    for name, pokemon_id, type1, type2, stats, moves in specs:
+        pokemon = Pokemon(name, pokemon_id, type1, type2, PokemonStats(*stats), level)
+        pokemon.move_set = MoveSet([get_move_by_name(m) for m in moves])
+        members.append(pokemon)
+    return PokemonTeam(members)
+
+
+@pytest.fixture
+def teams():
+    """Duas equipes pequenas e equilibradas"""
+    team1 = create_team([
+        ("Blastoise", 9, PokemonType.WATER, None, (79, 83, 100, 85, 105, 78), ["Surf", "Bite", "Growl"]),
+        ("Jolteon", 135, PokemonType.ELECTRIC, None, (65, 65, 60, 110, 95, 130), ["Thunderbolt", "Quick Attack"]),
+    ])
+    team2 = create_team([
+        ("Arcanine", 59, PokemonType.FIRE, None, (90, 110, 80, 100, 80, 95), ["Flamethrower", "Bite"]),
+        ("Golem", 76, PokemonType.ROCK, PokemonType.GROUND, (80, 110, 130, 55, 65, 45), ["Earthquake", "Rock Slide"]),
+    ])
+    return team1, team2
+
+
+class TestVectorizedBattleEngine:
+    """Testes para o motor vetorizado"""
+
+    def test_matchup_tables_match_scalar_formula(self, teams):
+        """Testa que o dano base tabelado segue a fórmula escalar"""
+        team1, team2 = teams
+        tables = build_matchup_tables(compile_team(team1), compile_team(team2))
+
+        attacker = team1.pokemon[0]
+        defender = team2.pokemon[1]
+        move = get_move_by_name("Surf")
+
+        expected = ((2 * attacker.level + 10) * move.power * attacker.sp_attack
+                    / defender.sp_defense / 50) + 2
+        expected *= TypeEffectiveness.get_effectiveness_against(move.move_type, defender)
+
+        assert tables.base_damage[0, 1, 0] == expected
+        assert tables.max_damage[1] == defender.max_hp * 4
+
+    def test_simulate_returns_rates(self, teams):
+        """Testa formato e consistência das estatísticas"""
+        team1, team2 = teams
+        engine = VectorizedBattleEngine(rng=np.random.default_rng(7))
+
+        stats = engine.simulate(team1, team2, 500)
+
+        assert set(stats) == {"win_rate", "loss_rate", "draw_rate", "avg_turns"}
+        assert stats["win_rate"] + stats["loss_rate"] + stats["draw_rate"] == pytest.approx(1.0)
+        assert 2 <= stats["avg_turns"] <= 3  # Cada confronto derruba exatamente um Pokémon
+
+    def test_same_seed_reproducible(self, teams):
+        """Testa reprodutibilidade com a mesma semente"""
+        team1, team2 = teams
+        first = VectorizedBattleEngine(rng=np.random.default_rng(3)).simulate(team1, team2, 300)
+        second = VectorizedBattleEngine(rng=np.random.default_rng(3)).simulate(team1, team2, 300)
+
+        assert first == second
+
+    def test_simulate_battle_engine_option(self, teams):
+        """Testa seleção do motor em BattleSystem.simulate_battle"""
+        team1, team2 = teams
+        battle_system = BattleSystem(simulation_engine="vectorized")
+
+        stats = battle_system.simulate_battle(team1, team2, 200)
+        assert 0.0 <= stats["win_rate"] <= 1.0
+
+        with pytest.raises(ValueError):
+            battle_system.simulate_battle(team1, team2, 10, engine="gpu")
+
+    def test_statistical_equivalence_with_scalar(self, teams):
+        """Testa equivalência estatística contra o motor escalar"""
+        team1, team2 = teams
+        random.seed(11)
+
+        report = check_statistical_equivalence(
+            team1, team2, 600,
+            engine=VectorizedBattleEngine(rng=np.random.default_rng(11)),
+            alpha=0.001
+        )
+
+        assert report["equivalent"]
+
+    def test_team_without_damaging_moves(self):
+        """Testa erro para Pokémon sem movimentos de dano"""
+        team = create_team([
+            ("Ditto", 132, PokemonType.NORMAL, None, (48, 48, 48, 48, 48, 48), ["Growl"]),
+        ])
+
+        with pytest.raises(ValueError):
+            compile_team(team)
+
+
+class ScriptedRandom:
+    """Gerador que devolve sorteios pré-definidos (mesma API usada por BattleSystem)"""
+
+    def __init__(self, values):
+        self.values = list(values)
+
+    def random(self):
+        return self.values.pop(0)
+
+    def uniform(self, a, b):
+        return a + (b - a) * self.random()
+
+
+class TestAttackBatch:
+    """Testes para a API de dano em lote"""
+
+    def test_matches_scalar_bit_for_bit(self, teams):
+        """Testa dano, acerto, crítico e efetividade contra o caminho escalar com os mesmos sorteios"""
+        members = teams[0].pokemon + teams[1].pokemon
+        compiled = compile_pokemon(members)
+        rng = np.random.default_rng(11)
+        size = 2000
+        attacker_index = rng.integers(0, len(members), size)
+        defender_index = rng.integers(0, len(members), size)
+        move_index = (rng.random(size) * compiled.num_moves[attacker_index]).astype(np.intp)
+        draws = rng.random((3, size))
+
+        batch = resolve_attacks(compiled, compiled, attacker_index, defender_index, move_index, draws=draws)
+
+        for k in range(size):
+            attacker = members[attacker_index[k]]
+            defender = members[defender_index[k]]
+            move = _damaging_moves(attacker)[move_index[k]]
+            system = BattleSystem(rng=ScriptedRandom(draws[:, k]))
+
+            hit = system.does_move_hit(move, attacker, defender)
+            assert batch.hit[k] == hit
+            if not hit:
+                assert batch.damage[k] == 0
+                continue
+            critical = system.is_critical_hit(attacker, move)
+            assert batch.critical[k] == critical
+            assert batch.damage[k] == system.calculate_damage(attacker, defender, move, critical)
+            assert batch.effectiveness[k] == TypeEffectiveness.get_effectiveness_against(move.move_type, defender)
+
+    def test_broadcasts_indices_and_clamps(self, teams):
+        """Testa broadcasting dos índices e o limite mínimo de 1 de dano"""
+        compiled1, compiled2 = compile_team(teams[0]), compile_team(teams[1])
+        draws = np.zeros((3, 2, 2))
+
+        batch = resolve_attacks(
+            compiled1, compiled2, np.array([[0], [1]]), np.array([[0, 1]]), 0, draws=draws
+        )
+
+        assert batch.damage.shape == (2, 2)
+        assert batch.hit.all()
+        # Thunderbolt (Jolteon) contra Golem: imune, mas o mínimo é 1
+        assert batch.effectiveness[1, 1] == 0.0
+        assert batch.damage[1, 1] == 1
+
+    def test_rng_draws_are_reproducible(self, teams):
+        """Testa sorteios internos com gerador explícito"""
+        compiled = compile_team(teams[0])
+        index = np.zeros(100, dtype=np.intp)
+
+        first = resolve_attacks(compiled, compiled, index, index, index, rng=np.random.default_rng(5))
+        second = resolve_attacks(compiled, compiled, index, index, index, rng=np.random.default_rng(5))
+
+        assert np.array_equal(first.damage, second.damage)
+        assert np.array_equal(first.critical, second.critical)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])